@@ -35,6 +35,7 @@ from docs.auxil.kwargs_insertion import (
     media_write_timeout_deprecation_methods,
 )
 from docs.auxil.link_code import LINE_NUMBERS
+from telegram._utils.sparse import SparseAttribute
 
 ADMONITION_INSERTER = AdmonitionInserter()
 
@@ -69,6 +70,8 @@ def autodoc_skip_member(app, what, name, obj, skip, options):
 
     if name == "filter" and obj.__module__ == "telegram.ext.filters" and not included_in_obj:
         return True  # return True to exclude from docs.
+    if isinstance(obj, SparseAttribute):
+        return True  # These are documented in the "Attributes" section of the class docstring
     return None
 
 
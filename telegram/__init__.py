@@ -160,6 +160,7 @@ __all__ = (
     "MessageOriginUser",
     "MessageReactionCountUpdated",
     "MessageReactionUpdated",
+    "MessageTemplate",
     "OrderInfo",
     "PassportData",
     "PassportElementError",
@@ -231,202 +232,418 @@ __all__ = (
 )
 
 
-from . import _version, constants, error, helpers, request, warnings
-from ._birthdate import Birthdate
-from ._bot import Bot
-from ._botcommand import BotCommand
-from ._botcommandscope import (
-    BotCommandScope,
-    BotCommandScopeAllChatAdministrators,
-    BotCommandScopeAllGroupChats,
-    BotCommandScopeAllPrivateChats,
-    BotCommandScopeChat,
-    BotCommandScopeChatAdministrators,
-    BotCommandScopeChatMember,
-    BotCommandScopeDefault,
-)
-from ._botdescription import BotDescription, BotShortDescription
-from ._botname import BotName
-from ._business import (
-    BusinessConnection,
-    BusinessIntro,
-    BusinessLocation,
-    BusinessMessagesDeleted,
-    BusinessOpeningHours,
-    BusinessOpeningHoursInterval,
-)
-from ._callbackquery import CallbackQuery
-from ._chat import Chat
-from ._chatadministratorrights import ChatAdministratorRights
-from ._chatboost import (
-    ChatBoost,
-    ChatBoostAdded,
-    ChatBoostRemoved,
-    ChatBoostSource,
-    ChatBoostSourceGiftCode,
-    ChatBoostSourceGiveaway,
-    ChatBoostSourcePremium,
-    ChatBoostUpdated,
-    UserChatBoosts,
-)
-from ._chatinvitelink import ChatInviteLink
-from ._chatjoinrequest import ChatJoinRequest
-from ._chatlocation import ChatLocation
-from ._chatmember import (
-    ChatMember,
-    ChatMemberAdministrator,
-    ChatMemberBanned,
-    ChatMemberLeft,
-    ChatMemberMember,
-    ChatMemberOwner,
-    ChatMemberRestricted,
-)
-from ._chatmemberupdated import ChatMemberUpdated
-from ._chatpermissions import ChatPermissions
-from ._choseninlineresult import ChosenInlineResult
-from ._dice import Dice
-from ._files.animation import Animation
-from ._files.audio import Audio
-from ._files.chatphoto import ChatPhoto
-from ._files.contact import Contact
-from ._files.document import Document
-from ._files.file import File
-from ._files.inputfile import InputFile
-from ._files.inputmedia import (
-    InputMedia,
-    InputMediaAnimation,
-    InputMediaAudio,
-    InputMediaDocument,
-    InputMediaPhoto,
-    InputMediaVideo,
-)
-from ._files.inputsticker import InputSticker
-from ._files.location import Location
-from ._files.photosize import PhotoSize
-from ._files.sticker import MaskPosition, Sticker, StickerSet
-from ._files.venue import Venue
-from ._files.video import Video
-from ._files.videonote import VideoNote
-from ._files.voice import Voice
-from ._forcereply import ForceReply
-from ._forumtopic import (
-    ForumTopic,
-    ForumTopicClosed,
-    ForumTopicCreated,
-    ForumTopicEdited,
-    ForumTopicReopened,
-    GeneralForumTopicHidden,
-    GeneralForumTopicUnhidden,
-)
-from ._games.callbackgame import CallbackGame
-from ._games.game import Game
-from ._games.gamehighscore import GameHighScore
-from ._giveaway import Giveaway, GiveawayCompleted, GiveawayCreated, GiveawayWinners
-from ._inline.inlinekeyboardbutton import InlineKeyboardButton
-from ._inline.inlinekeyboardmarkup import InlineKeyboardMarkup
-from ._inline.inlinequery import InlineQuery
-from ._inline.inlinequeryresult import InlineQueryResult
-from ._inline.inlinequeryresultarticle import InlineQueryResultArticle
-from ._inline.inlinequeryresultaudio import InlineQueryResultAudio
-from ._inline.inlinequeryresultcachedaudio import InlineQueryResultCachedAudio
-from ._inline.inlinequeryresultcacheddocument import InlineQueryResultCachedDocument
-from ._inline.inlinequeryresultcachedgif import InlineQueryResultCachedGif
-from ._inline.inlinequeryresultcachedmpeg4gif import InlineQueryResultCachedMpeg4Gif
-from ._inline.inlinequeryresultcachedphoto import InlineQueryResultCachedPhoto
-from ._inline.inlinequeryresultcachedsticker import InlineQueryResultCachedSticker
-from ._inline.inlinequeryresultcachedvideo import InlineQueryResultCachedVideo
-from ._inline.inlinequeryresultcachedvoice import InlineQueryResultCachedVoice
-from ._inline.inlinequeryresultcontact import InlineQueryResultContact
-from ._inline.inlinequeryresultdocument import InlineQueryResultDocument
-from ._inline.inlinequeryresultgame import InlineQueryResultGame
-from ._inline.inlinequeryresultgif import InlineQueryResultGif
-from ._inline.inlinequeryresultlocation import InlineQueryResultLocation
-from ._inline.inlinequeryresultmpeg4gif import InlineQueryResultMpeg4Gif
-from ._inline.inlinequeryresultphoto import InlineQueryResultPhoto
-from ._inline.inlinequeryresultsbutton import InlineQueryResultsButton
-from ._inline.inlinequeryresultvenue import InlineQueryResultVenue
-from ._inline.inlinequeryresultvideo import InlineQueryResultVideo
-from ._inline.inlinequeryresultvoice import InlineQueryResultVoice
-from ._inline.inputcontactmessagecontent import InputContactMessageContent
-from ._inline.inputinvoicemessagecontent import InputInvoiceMessageContent
-from ._inline.inputlocationmessagecontent import InputLocationMessageContent
-from ._inline.inputmessagecontent import InputMessageContent
-from ._inline.inputtextmessagecontent import InputTextMessageContent
-from ._inline.inputvenuemessagecontent import InputVenueMessageContent
-from ._keyboardbutton import KeyboardButton
-from ._keyboardbuttonpolltype import KeyboardButtonPollType
-from ._keyboardbuttonrequest import KeyboardButtonRequestChat, KeyboardButtonRequestUsers
-from ._linkpreviewoptions import LinkPreviewOptions
-from ._loginurl import LoginUrl
-from ._menubutton import MenuButton, MenuButtonCommands, MenuButtonDefault, MenuButtonWebApp
-from ._message import InaccessibleMessage, MaybeInaccessibleMessage, Message
-from ._messageautodeletetimerchanged import MessageAutoDeleteTimerChanged
-from ._messageentity import MessageEntity
-from ._messageid import MessageId
-from ._messageorigin import (
-    MessageOrigin,
-    MessageOriginChannel,
-    MessageOriginChat,
-    MessageOriginHiddenUser,
-    MessageOriginUser,
-)
-from ._messagereactionupdated import MessageReactionCountUpdated, MessageReactionUpdated
-from ._passport.credentials import (
-    Credentials,
-    DataCredentials,
-    EncryptedCredentials,
-    FileCredentials,
-    SecureData,
-    SecureValue,
-)
-from ._passport.data import IdDocumentData, PersonalDetails, ResidentialAddress
-from ._passport.encryptedpassportelement import EncryptedPassportElement
-from ._passport.passportdata import PassportData
-from ._passport.passportelementerrors import (
-    PassportElementError,
-    PassportElementErrorDataField,
-    PassportElementErrorFile,
-    PassportElementErrorFiles,
-    PassportElementErrorFrontSide,
-    PassportElementErrorReverseSide,
-    PassportElementErrorSelfie,
-    PassportElementErrorTranslationFile,
-    PassportElementErrorTranslationFiles,
-    PassportElementErrorUnspecified,
-)
-from ._passport.passportfile import PassportFile
-from ._payment.invoice import Invoice
-from ._payment.labeledprice import LabeledPrice
-from ._payment.orderinfo import OrderInfo
-from ._payment.precheckoutquery import PreCheckoutQuery
-from ._payment.shippingaddress import ShippingAddress
-from ._payment.shippingoption import ShippingOption
-from ._payment.shippingquery import ShippingQuery
-from ._payment.successfulpayment import SuccessfulPayment
-from ._poll import Poll, PollAnswer, PollOption
-from ._proximityalerttriggered import ProximityAlertTriggered
-from ._reaction import ReactionCount, ReactionType, ReactionTypeCustomEmoji, ReactionTypeEmoji
-from ._reply import ExternalReplyInfo, ReplyParameters, TextQuote
-from ._replykeyboardmarkup import ReplyKeyboardMarkup
-from ._replykeyboardremove import ReplyKeyboardRemove
-from ._sentwebappmessage import SentWebAppMessage
-from ._shared import ChatShared, SharedUser, UsersShared
-from ._story import Story
-from ._switchinlinequerychosenchat import SwitchInlineQueryChosenChat
-from ._telegramobject import TelegramObject
-from ._update import Update
-from ._user import User
-from ._userprofilephotos import UserProfilePhotos
-from ._videochat import (
-    VideoChatEnded,
-    VideoChatParticipantsInvited,
-    VideoChatScheduled,
-    VideoChatStarted,
+from typing import TYPE_CHECKING
+
+from . import _version, constants
+from ._utils.lazyimport import lazy_namespace
+
+# The classes are only imported once they are accessed to keep `import telegram` fast. The
+# imports below are for the benefit of type checkers and IDEs only.
+if TYPE_CHECKING:
+    from . import error, helpers, request, warnings
+    from ._birthdate import Birthdate
+    from ._bot import Bot
+    from ._botcommand import BotCommand
+    from ._botcommandscope import (
+        BotCommandScope,
+        BotCommandScopeAllChatAdministrators,
+        BotCommandScopeAllGroupChats,
+        BotCommandScopeAllPrivateChats,
+        BotCommandScopeChat,
+        BotCommandScopeChatAdministrators,
+        BotCommandScopeChatMember,
+        BotCommandScopeDefault,
+    )
+    from ._botdescription import BotDescription, BotShortDescription
+    from ._botname import BotName
+    from ._business import (
+        BusinessConnection,
+        BusinessIntro,
+        BusinessLocation,
+        BusinessMessagesDeleted,
+        BusinessOpeningHours,
+        BusinessOpeningHoursInterval,
+    )
+    from ._callbackquery import CallbackQuery
+    from ._chat import Chat
+    from ._chatadministratorrights import ChatAdministratorRights
+    from ._chatboost import (
+        ChatBoost,
+        ChatBoostAdded,
+        ChatBoostRemoved,
+        ChatBoostSource,
+        ChatBoostSourceGiftCode,
+        ChatBoostSourceGiveaway,
+        ChatBoostSourcePremium,
+        ChatBoostUpdated,
+        UserChatBoosts,
+    )
+    from ._chatinvitelink import ChatInviteLink
+    from ._chatjoinrequest import ChatJoinRequest
+    from ._chatlocation import ChatLocation
+    from ._chatmember import (
+        ChatMember,
+        ChatMemberAdministrator,
+        ChatMemberBanned,
+        ChatMemberLeft,
+        ChatMemberMember,
+        ChatMemberOwner,
+        ChatMemberRestricted,
+    )
+    from ._chatmemberupdated import ChatMemberUpdated
+    from ._chatpermissions import ChatPermissions
+    from ._choseninlineresult import ChosenInlineResult
+    from ._dice import Dice
+    from ._files.animation import Animation
+    from ._files.audio import Audio
+    from ._files.chatphoto import ChatPhoto
+    from ._files.contact import Contact
+    from ._files.document import Document
+    from ._files.file import File
+    from ._files.inputfile import InputFile
+    from ._files.inputmedia import (
+        InputMedia,
+        InputMediaAnimation,
+        InputMediaAudio,
+        InputMediaDocument,
+        InputMediaPhoto,
+        InputMediaVideo,
+    )
+    from ._files.inputsticker import InputSticker
+    from ._files.location import Location
+    from ._files.photosize import PhotoSize
+    from ._files.sticker import MaskPosition, Sticker, StickerSet
+    from ._files.venue import Venue
+    from ._files.video import Video
+    from ._files.videonote import VideoNote
+    from ._files.voice import Voice
+    from ._forcereply import ForceReply
+    from ._forumtopic import (
+        ForumTopic,
+        ForumTopicClosed,
+        ForumTopicCreated,
+        ForumTopicEdited,
+        ForumTopicReopened,
+        GeneralForumTopicHidden,
+        GeneralForumTopicUnhidden,
+    )
+    from ._games.callbackgame import CallbackGame
+    from ._games.game import Game
+    from ._games.gamehighscore import GameHighScore
+    from ._giveaway import Giveaway, GiveawayCompleted, GiveawayCreated, GiveawayWinners
+    from ._inline.inlinekeyboardbutton import InlineKeyboardButton
+    from ._inline.inlinekeyboardmarkup import InlineKeyboardMarkup
+    from ._inline.inlinequery import InlineQuery
+    from ._inline.inlinequeryresult import InlineQueryResult
+    from ._inline.inlinequeryresultarticle import InlineQueryResultArticle
+    from ._inline.inlinequeryresultaudio import InlineQueryResultAudio
+    from ._inline.inlinequeryresultcachedaudio import InlineQueryResultCachedAudio
+    from ._inline.inlinequeryresultcacheddocument import InlineQueryResultCachedDocument
+    from ._inline.inlinequeryresultcachedgif import InlineQueryResultCachedGif
+    from ._inline.inlinequeryresultcachedmpeg4gif import InlineQueryResultCachedMpeg4Gif
+    from ._inline.inlinequeryresultcachedphoto import InlineQueryResultCachedPhoto
+    from ._inline.inlinequeryresultcachedsticker import InlineQueryResultCachedSticker
+    from ._inline.inlinequeryresultcachedvideo import InlineQueryResultCachedVideo
+    from ._inline.inlinequeryresultcachedvoice import InlineQueryResultCachedVoice
+    from ._inline.inlinequeryresultcontact import InlineQueryResultContact
+    from ._inline.inlinequeryresultdocument import InlineQueryResultDocument
+    from ._inline.inlinequeryresultgame import InlineQueryResultGame
+    from ._inline.inlinequeryresultgif import InlineQueryResultGif
+    from ._inline.inlinequeryresultlocation import InlineQueryResultLocation
+    from ._inline.inlinequeryresultmpeg4gif import InlineQueryResultMpeg4Gif
+    from ._inline.inlinequeryresultphoto import InlineQueryResultPhoto
+    from ._inline.inlinequeryresultsbutton import InlineQueryResultsButton
+    from ._inline.inlinequeryresultvenue import InlineQueryResultVenue
+    from ._inline.inlinequeryresultvideo import InlineQueryResultVideo
+    from ._inline.inlinequeryresultvoice import InlineQueryResultVoice
+    from ._inline.inputcontactmessagecontent import InputContactMessageContent
+    from ._inline.inputinvoicemessagecontent import InputInvoiceMessageContent
+    from ._inline.inputlocationmessagecontent import InputLocationMessageContent
+    from ._inline.inputmessagecontent import InputMessageContent
+    from ._inline.inputtextmessagecontent import InputTextMessageContent
+    from ._inline.inputvenuemessagecontent import InputVenueMessageContent
+    from ._keyboardbutton import KeyboardButton
+    from ._keyboardbuttonpolltype import KeyboardButtonPollType
+    from ._keyboardbuttonrequest import KeyboardButtonRequestChat, KeyboardButtonRequestUsers
+    from ._linkpreviewoptions import LinkPreviewOptions
+    from ._loginurl import LoginUrl
+    from ._menubutton import MenuButton, MenuButtonCommands, MenuButtonDefault, MenuButtonWebApp
+    from ._message import InaccessibleMessage, MaybeInaccessibleMessage, Message
+    from ._messageautodeletetimerchanged import MessageAutoDeleteTimerChanged
+    from ._messageentity import MessageEntity
+    from ._messageid import MessageId
+    from ._messageorigin import (
+        MessageOrigin,
+        MessageOriginChannel,
+        MessageOriginChat,
+        MessageOriginHiddenUser,
+        MessageOriginUser,
+    )
+    from ._messagereactionupdated import MessageReactionCountUpdated, MessageReactionUpdated
+    from ._messagetemplate import MessageTemplate
+    from ._passport.credentials import (
+        Credentials,
+        DataCredentials,
+        EncryptedCredentials,
+        FileCredentials,
+        SecureData,
+        SecureValue,
+    )
+    from ._passport.data import IdDocumentData, PersonalDetails, ResidentialAddress
+    from ._passport.encryptedpassportelement import EncryptedPassportElement
+    from ._passport.passportdata import PassportData
+    from ._passport.passportelementerrors import (
+        PassportElementError,
+        PassportElementErrorDataField,
+        PassportElementErrorFile,
+        PassportElementErrorFiles,
+        PassportElementErrorFrontSide,
+        PassportElementErrorReverseSide,
+        PassportElementErrorSelfie,
+        PassportElementErrorTranslationFile,
+        PassportElementErrorTranslationFiles,
+        PassportElementErrorUnspecified,
+    )
+    from ._passport.passportfile import PassportFile
+    from ._payment.invoice import Invoice
+    from ._payment.labeledprice import LabeledPrice
+    from ._payment.orderinfo import OrderInfo
+    from ._payment.precheckoutquery import PreCheckoutQuery
+    from ._payment.shippingaddress import ShippingAddress
+    from ._payment.shippingoption import ShippingOption
+    from ._payment.shippingquery import ShippingQuery
+    from ._payment.successfulpayment import SuccessfulPayment
+    from ._poll import Poll, PollAnswer, PollOption
+    from ._proximityalerttriggered import ProximityAlertTriggered
+    from ._reaction import ReactionCount, ReactionType, ReactionTypeCustomEmoji, ReactionTypeEmoji
+    from ._reply import ExternalReplyInfo, ReplyParameters, TextQuote
+    from ._replykeyboardmarkup import ReplyKeyboardMarkup
+    from ._replykeyboardremove import ReplyKeyboardRemove
+    from ._sentwebappmessage import SentWebAppMessage
+    from ._shared import ChatShared, SharedUser, UsersShared
+    from ._story import Story
+    from ._switchinlinequerychosenchat import SwitchInlineQueryChosenChat
+    from ._telegramobject import TelegramObject
+    from ._update import Update
+    from ._user import User
+    from ._userprofilephotos import UserProfilePhotos
+    from ._videochat import (
+        VideoChatEnded,
+        VideoChatParticipantsInvited,
+        VideoChatScheduled,
+        VideoChatStarted,
+    )
+    from ._webappdata import WebAppData
+    from ._webappinfo import WebAppInfo
+    from ._webhookinfo import WebhookInfo
+    from ._writeaccessallowed import WriteAccessAllowed
+
+__getattr__, __dir__ = lazy_namespace(
+    __name__,
+    {
+        "Animation": "._files.animation",
+        "Audio": "._files.audio",
+        "Birthdate": "._birthdate",
+        "Bot": "._bot",
+        "BotCommand": "._botcommand",
+        "BotCommandScope": "._botcommandscope",
+        "BotCommandScopeAllChatAdministrators": "._botcommandscope",
+        "BotCommandScopeAllGroupChats": "._botcommandscope",
+        "BotCommandScopeAllPrivateChats": "._botcommandscope",
+        "BotCommandScopeChat": "._botcommandscope",
+        "BotCommandScopeChatAdministrators": "._botcommandscope",
+        "BotCommandScopeChatMember": "._botcommandscope",
+        "BotCommandScopeDefault": "._botcommandscope",
+        "BotDescription": "._botdescription",
+        "BotName": "._botname",
+        "BotShortDescription": "._botdescription",
+        "BusinessConnection": "._business",
+        "BusinessIntro": "._business",
+        "BusinessLocation": "._business",
+        "BusinessMessagesDeleted": "._business",
+        "BusinessOpeningHours": "._business",
+        "BusinessOpeningHoursInterval": "._business",
+        "CallbackGame": "._games.callbackgame",
+        "CallbackQuery": "._callbackquery",
+        "Chat": "._chat",
+        "ChatAdministratorRights": "._chatadministratorrights",
+        "ChatBoost": "._chatboost",
+        "ChatBoostAdded": "._chatboost",
+        "ChatBoostRemoved": "._chatboost",
+        "ChatBoostSource": "._chatboost",
+        "ChatBoostSourceGiftCode": "._chatboost",
+        "ChatBoostSourceGiveaway": "._chatboost",
+        "ChatBoostSourcePremium": "._chatboost",
+        "ChatBoostUpdated": "._chatboost",
+        "ChatInviteLink": "._chatinvitelink",
+        "ChatJoinRequest": "._chatjoinrequest",
+        "ChatLocation": "._chatlocation",
+        "ChatMember": "._chatmember",
+        "ChatMemberAdministrator": "._chatmember",
+        "ChatMemberBanned": "._chatmember",
+        "ChatMemberLeft": "._chatmember",
+        "ChatMemberMember": "._chatmember",
+        "ChatMemberOwner": "._chatmember",
+        "ChatMemberRestricted": "._chatmember",
+        "ChatMemberUpdated": "._chatmemberupdated",
+        "ChatPermissions": "._chatpermissions",
+        "ChatPhoto": "._files.chatphoto",
+        "ChatShared": "._shared",
+        "ChosenInlineResult": "._choseninlineresult",
+        "Contact": "._files.contact",
+        "Credentials": "._passport.credentials",
+        "DataCredentials": "._passport.credentials",
+        "Dice": "._dice",
+        "Document": "._files.document",
+        "EncryptedCredentials": "._passport.credentials",
+        "EncryptedPassportElement": "._passport.encryptedpassportelement",
+        "ExternalReplyInfo": "._reply",
+        "File": "._files.file",
+        "FileCredentials": "._passport.credentials",
+        "ForceReply": "._forcereply",
+        "ForumTopic": "._forumtopic",
+        "ForumTopicClosed": "._forumtopic",
+        "ForumTopicCreated": "._forumtopic",
+        "ForumTopicEdited": "._forumtopic",
+        "ForumTopicReopened": "._forumtopic",
+        "Game": "._games.game",
+        "GameHighScore": "._games.gamehighscore",
+        "GeneralForumTopicHidden": "._forumtopic",
+        "GeneralForumTopicUnhidden": "._forumtopic",
+        "Giveaway": "._giveaway",
+        "GiveawayCompleted": "._giveaway",
+        "GiveawayCreated": "._giveaway",
+        "GiveawayWinners": "._giveaway",
+        "IdDocumentData": "._passport.data",
+        "InaccessibleMessage": "._message",
+        "InlineKeyboardButton": "._inline.inlinekeyboardbutton",
+        "InlineKeyboardMarkup": "._inline.inlinekeyboardmarkup",
+        "InlineQuery": "._inline.inlinequery",
+        "InlineQueryResult": "._inline.inlinequeryresult",
+        "InlineQueryResultArticle": "._inline.inlinequeryresultarticle",
+        "InlineQueryResultAudio": "._inline.inlinequeryresultaudio",
+        "InlineQueryResultCachedAudio": "._inline.inlinequeryresultcachedaudio",
+        "InlineQueryResultCachedDocument": "._inline.inlinequeryresultcacheddocument",
+        "InlineQueryResultCachedGif": "._inline.inlinequeryresultcachedgif",
+        "InlineQueryResultCachedMpeg4Gif": "._inline.inlinequeryresultcachedmpeg4gif",
+        "InlineQueryResultCachedPhoto": "._inline.inlinequeryresultcachedphoto",
+        "InlineQueryResultCachedSticker": "._inline.inlinequeryresultcachedsticker",
+        "InlineQueryResultCachedVideo": "._inline.inlinequeryresultcachedvideo",
+        "InlineQueryResultCachedVoice": "._inline.inlinequeryresultcachedvoice",
+        "InlineQueryResultContact": "._inline.inlinequeryresultcontact",
+        "InlineQueryResultDocument": "._inline.inlinequeryresultdocument",
+        "InlineQueryResultGame": "._inline.inlinequeryresultgame",
+        "InlineQueryResultGif": "._inline.inlinequeryresultgif",
+        "InlineQueryResultLocation": "._inline.inlinequeryresultlocation",
+        "InlineQueryResultMpeg4Gif": "._inline.inlinequeryresultmpeg4gif",
+        "InlineQueryResultPhoto": "._inline.inlinequeryresultphoto",
+        "InlineQueryResultVenue": "._inline.inlinequeryresultvenue",
+        "InlineQueryResultVideo": "._inline.inlinequeryresultvideo",
+        "InlineQueryResultVoice": "._inline.inlinequeryresultvoice",
+        "InlineQueryResultsButton": "._inline.inlinequeryresultsbutton",
+        "InputContactMessageContent": "._inline.inputcontactmessagecontent",
+        "InputFile": "._files.inputfile",
+        "InputInvoiceMessageContent": "._inline.inputinvoicemessagecontent",
+        "InputLocationMessageContent": "._inline.inputlocationmessagecontent",
+        "InputMedia": "._files.inputmedia",
+        "InputMediaAnimation": "._files.inputmedia",
+        "InputMediaAudio": "._files.inputmedia",
+        "InputMediaDocument": "._files.inputmedia",
+        "InputMediaPhoto": "._files.inputmedia",
+        "InputMediaVideo": "._files.inputmedia",
+        "InputMessageContent": "._inline.inputmessagecontent",
+        "InputSticker": "._files.inputsticker",
+        "InputTextMessageContent": "._inline.inputtextmessagecontent",
+        "InputVenueMessageContent": "._inline.inputvenuemessagecontent",
+        "Invoice": "._payment.invoice",
+        "KeyboardButton": "._keyboardbutton",
+        "KeyboardButtonPollType": "._keyboardbuttonpolltype",
+        "KeyboardButtonRequestChat": "._keyboardbuttonrequest",
+        "KeyboardButtonRequestUsers": "._keyboardbuttonrequest",
+        "LabeledPrice": "._payment.labeledprice",
+        "LinkPreviewOptions": "._linkpreviewoptions",
+        "Location": "._files.location",
+        "LoginUrl": "._loginurl",
+        "MaskPosition": "._files.sticker",
+        "MaybeInaccessibleMessage": "._message",
+        "MenuButton": "._menubutton",
+        "MenuButtonCommands": "._menubutton",
+        "MenuButtonDefault": "._menubutton",
+        "MenuButtonWebApp": "._menubutton",
+        "Message": "._message",
+        "MessageAutoDeleteTimerChanged": "._messageautodeletetimerchanged",
+        "MessageEntity": "._messageentity",
+        "MessageId": "._messageid",
+        "MessageOrigin": "._messageorigin",
+        "MessageOriginChannel": "._messageorigin",
+        "MessageOriginChat": "._messageorigin",
+        "MessageOriginHiddenUser": "._messageorigin",
+        "MessageOriginUser": "._messageorigin",
+        "MessageReactionCountUpdated": "._messagereactionupdated",
+        "MessageReactionUpdated": "._messagereactionupdated",
+        "MessageTemplate": "._messagetemplate",
+        "OrderInfo": "._payment.orderinfo",
+        "PassportData": "._passport.passportdata",
+        "PassportElementError": "._passport.passportelementerrors",
+        "PassportElementErrorDataField": "._passport.passportelementerrors",
+        "PassportElementErrorFile": "._passport.passportelementerrors",
+        "PassportElementErrorFiles": "._passport.passportelementerrors",
+        "PassportElementErrorFrontSide": "._passport.passportelementerrors",
+        "PassportElementErrorReverseSide": "._passport.passportelementerrors",
+        "PassportElementErrorSelfie": "._passport.passportelementerrors",
+        "PassportElementErrorTranslationFile": "._passport.passportelementerrors",
+        "PassportElementErrorTranslationFiles": "._passport.passportelementerrors",
+        "PassportElementErrorUnspecified": "._passport.passportelementerrors",
+        "PassportFile": "._passport.passportfile",
+        "PersonalDetails": "._passport.data",
+        "PhotoSize": "._files.photosize",
+        "Poll": "._poll",
+        "PollAnswer": "._poll",
+        "PollOption": "._poll",
+        "PreCheckoutQuery": "._payment.precheckoutquery",
+        "ProximityAlertTriggered": "._proximityalerttriggered",
+        "ReactionCount": "._reaction",
+        "ReactionType": "._reaction",
+        "ReactionTypeCustomEmoji": "._reaction",
+        "ReactionTypeEmoji": "._reaction",
+        "ReplyKeyboardMarkup": "._replykeyboardmarkup",
+        "ReplyKeyboardRemove": "._replykeyboardremove",
+        "ReplyParameters": "._reply",
+        "ResidentialAddress": "._passport.data",
+        "SecureData": "._passport.credentials",
+        "SecureValue": "._passport.credentials",
+        "SentWebAppMessage": "._sentwebappmessage",
+        "SharedUser": "._shared",
+        "ShippingAddress": "._payment.shippingaddress",
+        "ShippingOption": "._payment.shippingoption",
+        "ShippingQuery": "._payment.shippingquery",
+        "Sticker": "._files.sticker",
+        "StickerSet": "._files.sticker",
+        "Story": "._story",
+        "SuccessfulPayment": "._payment.successfulpayment",
+        "SwitchInlineQueryChosenChat": "._switchinlinequerychosenchat",
+        "TelegramObject": "._telegramobject",
+        "TextQuote": "._reply",
+        "Update": "._update",
+        "User": "._user",
+        "UserChatBoosts": "._chatboost",
+        "UserProfilePhotos": "._userprofilephotos",
+        "UsersShared": "._shared",
+        "Venue": "._files.venue",
+        "Video": "._files.video",
+        "VideoChatEnded": "._videochat",
+        "VideoChatParticipantsInvited": "._videochat",
+        "VideoChatScheduled": "._videochat",
+        "VideoChatStarted": "._videochat",
+        "VideoNote": "._files.videonote",
+        "Voice": "._files.voice",
+        "WebAppData": "._webappdata",
+        "WebAppInfo": "._webappinfo",
+        "WebhookInfo": "._webhookinfo",
+        "WriteAccessAllowed": "._writeaccessallowed",
+    },
+    submodules=("error", "helpers", "request", "warnings"),
 )
-from ._webappdata import WebAppData
-from ._webappinfo import WebAppInfo
-from ._webhookinfo import WebhookInfo
-from ._writeaccessallowed import WriteAccessAllowed
 
 #: :obj:`str`: The version of the `python-telegram-bot` library as string.
 #: To get detailed information about the version number, please use :data:`__version_info__`
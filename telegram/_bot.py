@@ -84,6 +84,7 @@ from telegram._inline.inlinequeryresultsbutton import InlineQueryResultsButton
 from telegram._menubutton import MenuButton
 from telegram._message import Message
 from telegram._messageid import MessageId
+from telegram._messagetemplate import _CAPTURE_REQUEST, MessageTemplate, _CapturedRequest
 from telegram._poll import Poll
 from telegram._reaction import ReactionType, ReactionTypeCustomEmoji, ReactionTypeEmoji
 from telegram._reply import ReplyParameters
@@ -612,6 +613,10 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         # Drop any None values because Telegram doesn't handle them well
         data = {key: value for key, value in data.items() if value is not None}
 
+        if _CAPTURE_REQUEST.get():
+            # MessageTemplate.create only needs the prepared parameters
+            raise _CapturedRequest(endpoint, data)
+
         return await self._do_post(
             endpoint=endpoint,
             data=data,
@@ -630,12 +635,17 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         write_timeout: ODVInput[float] = DEFAULT_NONE,
         connect_timeout: ODVInput[float] = DEFAULT_NONE,
         pool_timeout: ODVInput[float] = DEFAULT_NONE,
+        template: Optional[RequestData] = None,
     ) -> Union[bool, JSONDict, List[JSONDict]]:
         # This also converts datetimes into timestamps.
         # We don't do this earlier so that _insert_defaults (see above) has a chance to convert
         # to the default timezone in case this is called by ExtBot
-        request_data = RequestData(
-            parameters=[RequestParameter.from_input(key, value) for key, value in data.items()],
+        parameters = [RequestParameter.from_input(key, value) for key, value in data.items()]
+        # For a MessageTemplate, `data` only holds the parameters that differ between the chats
+        request_data = (
+            RequestData(parameters=parameters)
+            if template is None
+            else template.with_parameters(parameters)
         )
 
         request = self._request[0] if endpoint == "getUpdates" else self._request[1]
@@ -655,6 +665,70 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
 
         return result
 
+    def _create_message_template(
+        self, endpoint: str, data: JSONDict, api_kwargs: Optional[JSONDict] = None
+    ) -> MessageTemplate:
+        """Builds the template for MessageTemplate.create from the parameters that _post received.
+        `api_kwargs` are passed along with every send. ExtBot overrides this to move the
+        rate_limit_args out of the parameters.
+        """
+        data.pop("chat_id", None)
+        request_data = RequestData(
+            parameters=[RequestParameter.from_input(key, value) for key, value in data.items()]
+        )
+        if request_data.contains_files:
+            raise ValueError(
+                "Templates can't upload files. Upload the file once and pass its `file_id`."
+            )
+        # Copying encodes the parameters, so that this doesn't happen on every send
+        return MessageTemplate(self, endpoint, request_data.with_parameters([]), api_kwargs)
+
+    async def _send_message_template(
+        self,
+        endpoint: str,
+        data: JSONDict,
+        template: RequestData,
+        *,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+    ) -> Any:
+        """Sends a MessageTemplate. `data` contains the parameters that differ between the chats.
+        Like _post, but without the preparations that were already done for the template.
+        """
+        self._insert_defaults(data)
+        result = await self._do_post(
+            endpoint,
+            {key: value for key, value in data.items() if value is not None},
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+            template=template,
+        )
+        if endpoint == "copyMessage":
+            return MessageId.de_json(result, self)  # type: ignore[arg-type]
+        if isinstance(result, list):
+            return tuple(self._de_json_message(message) for message in result)
+        if isinstance(result, dict):
+            return self._de_json_message(result)
+        return result
+
+    def _de_json_message(self, data: JSONDict) -> Message:
+        """Parses a message returned by a bot method. If `lazy_messages` is enabled in the
+        defaults of ExtBot, the message is parsed lazily, see `Message._de_json_lazy`.
+        """
+        # We don't use `isinstance(self, ExtBot)` here so that this works
+        # in `python-telegram-bot-raw` as well
+        defaults = getattr(self, "defaults", None)
+        if defaults is not None and defaults.lazy_messages:
+            # pylint: disable-next=protected-access
+            message = Message._de_json_lazy(data, self)
+        else:
+            message = Message.de_json(data, self)
+        return message  # type: ignore[return-value]
+
     async def _send_message(
         self,
         endpoint: str,
@@ -741,7 +815,7 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         if result is True:
             return result
 
-        return Message.de_json(result, self)
+        return self._de_json_message(result)
 
     async def initialize(self) -> None:
         """Initialize resources used by this class. Currently calls :meth:`get_me` to
@@ -2567,7 +2641,7 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
             api_kwargs=api_kwargs,
         )
 
-        return Message.de_list(result, self)
+        return tuple(self._de_json_message(message) for message in result or ())
 
     async def send_location(
         self,
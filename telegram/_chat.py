@@ -19,6 +19,7 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an object that represents a Telegram Chat."""
 from datetime import datetime
+from functools import partial
 from html import escape
 from typing import TYPE_CHECKING, Final, Optional, Sequence, Tuple, Union
 
@@ -632,7 +633,21 @@ class Chat(TelegramObject):
 
     @classmethod
     def de_json(cls, data: Optional[JSONDict], bot: "Bot") -> Optional["Chat"]:
-        """See :meth:`telegram.TelegramObject.de_json`."""
+        """See :meth:`telegram.TelegramObject.de_json`.
+
+        .. versionchanged:: NEXT.VERSION
+            If :paramref:`bot` has an :attr:`~telegram.ext.ExtBot.intern_cache`, instances built
+            from identical data are shared.
+        """
+        intern_cache = getattr(bot, "intern_cache", None)
+        if intern_cache is None or not data:
+            return cls._de_json(data=data, bot=bot)
+        return intern_cache.get_or_create(cls, data, partial(cls._de_json, data=data, bot=bot))
+
+    @classmethod
+    def _de_json(
+        cls, data: Optional[JSONDict], bot: "Bot", api_kwargs: Optional[JSONDict] = None
+    ) -> Optional["Chat"]:
         data = cls._parse_data(data)
 
         if not data:
@@ -665,7 +680,7 @@ class Chat(TelegramObject):
             data.get("business_opening_hours"), bot
         )
 
-        api_kwargs = {}
+        api_kwargs = api_kwargs or {}
         # This is a deprecated field that TG still returns for backwards compatibility
         # Let's filter it out to speed up the de-json process
         if "all_members_are_administrators" in data:
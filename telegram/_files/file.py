@@ -17,11 +17,15 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an object that represents a Telegram File."""
+import asyncio
+import contextlib
+import os
 import shutil
 import urllib.parse as urllib_parse
 from base64 import b64decode
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO, Optional
+from typing import TYPE_CHECKING, AsyncGenerator, BinaryIO, Optional
+from uuid import uuid4
 
 from telegram._passport.credentials import decrypt
 from telegram._telegramobject import TelegramObject
@@ -117,6 +121,23 @@ class File(TelegramObject):
     def _prepare_decrypt(self, buf: bytes) -> bytes:
         return decrypt(b64decode(self._credentials.secret), b64decode(self._credentials.hash), buf)
 
+    def _retrieve_stream(
+        self,
+        read_timeout: ODVInput[float],
+        write_timeout: ODVInput[float],
+        connect_timeout: ODVInput[float],
+        pool_timeout: ODVInput[float],
+    ) -> AsyncGenerator[bytes, None]:
+        # The callers must close the generator explicitly with `aclose`, such that the
+        # connection is released right away even if processing a chunk fails
+        return self.get_bot().request.retrieve_stream(
+            self._get_encoded_url(),
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+        )
+
     async def download_to_drive(
         self,
         custom_path: Optional[FilePathInput] = None,
@@ -152,6 +173,16 @@ class File(TelegramObject):
             * This method was previously called ``download``. It was split into
               :meth:`download_to_drive` and :meth:`download_to_memory`.
 
+        .. versionchanged:: NEXT.VERSION
+            Unless the file is encrypted, the contents are written to the drive chunk by chunk as
+            they are received instead of being loaded into memory as a whole first. The file
+            operations no longer block the event loop. The contents are written to a temporary
+            file in the same directory, which replaces the target file only once the download
+            succeeded. If the download fails, an existing file at the target path is left as is.
+            If the target path is a symbolic link, the file it points to is replaced. The
+            permissions of a replaced file are kept, but not its owner, and hard links to it
+            keep pointing to the old contents.
+
         Args:
             custom_path (:class:`pathlib.Path` | :obj:`str` , optional): The path where the file
                 will be saved to. If not specified, will be saved in the current working directory
@@ -203,16 +234,44 @@ class File(TelegramObject):
         else:
             filename = Path.cwd() / self.file_id
 
-        buf = await self.get_bot().request.retrieve(
-            url,
-            read_timeout=read_timeout,
-            write_timeout=write_timeout,
-            connect_timeout=connect_timeout,
-            pool_timeout=pool_timeout,
-        )
+        # File operations are done in a worker thread so that they don't block the event loop
+        loop = asyncio.get_running_loop()
         if self._credentials:
-            buf = self._prepare_decrypt(buf)
-        filename.write_bytes(buf)
+            # Encrypted files can only be decrypted as a whole
+            buf = await self.get_bot().request.retrieve(
+                url,
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            )
+            await loop.run_in_executor(None, filename.write_bytes, self._prepare_decrypt(buf))
+            return filename
+
+        # The contents are written chunk by chunk as they are received. They go to a temporary
+        # file next to the target, which replaces the target only once the download succeeded,
+        # so that a failed download neither leaves a partial file behind nor destroys an
+        # existing one. Symbolic links are resolved, so that we write through them like `open`
+        target = await loop.run_in_executor(None, filename.resolve)
+        temp_filename = target.with_name(f".{target.name}.{uuid4().hex}.part")
+        file = await loop.run_in_executor(None, temp_filename.open, "xb")
+        try:
+            stream = self._retrieve_stream(
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            )
+            try:
+                async for chunk in stream:
+                    await loop.run_in_executor(None, file.write, chunk)
+            finally:
+                await stream.aclose()
+            await loop.run_in_executor(None, file.close)
+            await loop.run_in_executor(None, _replace_file, temp_filename, target)
+        except BaseException:
+            await loop.run_in_executor(None, _discard_file, file, temp_filename)
+            raise
         return filename
 
     async def download_to_memory(
@@ -237,6 +296,15 @@ class File(TelegramObject):
 
         .. versionadded:: 20.0
 
+        .. versionchanged:: NEXT.VERSION
+            Unless the file is encrypted, the contents are written to :paramref:`out` chunk by
+            chunk as they are received.
+
+        Warning:
+            If the download fails, the chunks received until then have already been written to
+            :paramref:`out`. Before retrying, reset :paramref:`out` to the position it had before
+            the call, e.g. with :meth:`~io.IOBase.seek` and :meth:`~io.IOBase.truncate`.
+
         Args:
             out (:obj:`io.BufferedIOBase`): A file-like object. Must be opened for writing in
                 binary mode.
@@ -260,7 +328,7 @@ class File(TelegramObject):
         path = Path(self.file_path) if local_file else None
         if local_file:
             buf = path.read_bytes()
-        else:
+        elif self._credentials:
             buf = await self.get_bot().request.retrieve(
                 url,
                 read_timeout=read_timeout,
@@ -268,6 +336,19 @@ class File(TelegramObject):
                 connect_timeout=connect_timeout,
                 pool_timeout=pool_timeout,
             )
+        else:
+            stream = self._retrieve_stream(
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            )
+            try:
+                async for chunk in stream:
+                    out.write(chunk)
+            finally:
+                await stream.aclose()
+            return
         if self._credentials:
             buf = self._prepare_decrypt(buf)
         out.write(buf)
@@ -283,6 +364,11 @@ class File(TelegramObject):
     ) -> bytearray:
         """Download this file and return it as a bytearray.
 
+        .. versionchanged:: NEXT.VERSION
+            Unless the file is encrypted, the contents are appended to the bytearray chunk by
+            chunk as they are received. If the download fails, the chunks appended until then
+            are removed again, such that :paramref:`buf` is left unchanged.
+
         Args:
             buf (:obj:`bytearray`, optional): Extend the given bytearray with the downloaded data.
 
@@ -318,6 +404,23 @@ class File(TelegramObject):
 
         if is_local_file(self.file_path):
             bytes_data = Path(self.file_path).read_bytes()
+        elif not self._credentials:
+            size = len(buf)
+            stream = self._retrieve_stream(
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            )
+            try:
+                async for chunk in stream:
+                    buf.extend(chunk)
+            except BaseException:
+                del buf[size:]
+                raise
+            finally:
+                await stream.aclose()
+            return buf
         else:
             bytes_data = await self.get_bot().request.retrieve(
                 self._get_encoded_url(),
@@ -339,3 +442,18 @@ class File(TelegramObject):
             credentials (:class:`telegram.FileCredentials`): The credentials.
         """
         self._credentials = credentials
+
+
+def _replace_file(source: Path, target: Path) -> None:
+    """Moves :paramref:`source` to :paramref:`target`, keeping the permissions of an existing
+    target.
+    """
+    with contextlib.suppress(FileNotFoundError):
+        shutil.copymode(target, source)
+    os.replace(source, target)
+
+
+def _discard_file(file: BinaryIO, path: Path) -> None:
+    """Closes and removes a file that was only partially written."""
+    file.close()
+    path.unlink(missing_ok=True)
@@ -19,10 +19,11 @@
 """This module contains an object that represents a Telegram InputFile."""
 
 import mimetypes
-from typing import IO, Optional, Union
+from pathlib import Path
+from typing import IO, Optional, Union, cast
 from uuid import uuid4
 
-from telegram._utils.files import load_file
+from telegram._utils.files import LazyFileReader, guess_file_name, load_file
 from telegram._utils.types import FieldTuple
 
 _DEFAULT_MIME_TYPE = "application/octet-stream"
@@ -39,8 +40,8 @@ class InputFile:
           in addition.
 
     Args:
-        obj (:term:`file object` | :obj:`bytes` | :obj:`str`): An open file descriptor or the files
-            content as bytes or string.
+        obj (:term:`file object` | :obj:`bytes` | :obj:`str` | :class:`pathlib.Path`): An open
+            file descriptor, the files content as bytes or string or the path of a local file.
 
             Note:
                 If :paramref:`obj` is a string, it will be encoded as bytes via
@@ -48,13 +49,38 @@ class InputFile:
 
             .. versionchanged:: 20.0
                 Accept string input.
+            .. versionchanged:: NEXT.VERSION
+                Accept :class:`pathlib.Path` input.
         filename (:obj:`str`, optional): Filename for this InputFile.
         attach (:obj:`bool`, optional): Pass :obj:`True` if the parameter this file belongs to in
             the request to Telegram should point to the multipart data via an ``attach://`` URI.
             Defaults to `False`.
+        read_file_handle (:obj:`bool`, optional): If :obj:`True` and :paramref:`obj` is a file
+            handle or a path, the data will be read on initialization of this object.
+            If :obj:`False`, a file handle will be passed on to the networking backend, which
+            reads and uploads the contents chunk by chunk. This keeps the memory usage bounded
+            regardless of the file size. In that case, a file handle passed as :paramref:`obj` has
+            to be opened in binary mode and must stay open until the file was sent. For a path,
+            the file is opened only while it is uploaded. Defaults to :obj:`True`.
+
+            Tip:
+                If you upload large files, e.g. through a
+                :wiki:`local Bot API server <Local-Bot-API-Server>`, pass
+                ``InputFile(path, read_file_handle=False)`` or an open file together with
+                ``read_file_handle=False``. Note that custom implementations of
+                :class:`telegram.request.BaseRequest` have to be able to handle file handles in
+                :attr:`field_tuple` for this to work. For this reason, paths that are passed
+                directly to the methods of :class:`telegram.Bot` are read up front.
+
+            .. versionadded:: NEXT.VERSION
 
     Attributes:
-        input_file_content (:obj:`bytes`): The binary content of the file to send.
+        input_file_content (:obj:`bytes` | :term:`file object`): The binary content of the file to
+            send or the file handle to read it from, if :paramref:`read_file_handle` was
+            :obj:`False`.
+
+            .. versionchanged:: NEXT.VERSION
+                Can be a file handle.
         attach_name (:obj:`str`): Optional. If present, the parameter this file belongs to in
             the request to Telegram should point to the multipart data via a an URI of the form
             ``attach://<attach_name>`` URI.
@@ -67,17 +93,26 @@ class InputFile:
 
     def __init__(
         self,
-        obj: Union[IO[bytes], bytes, str],
+        obj: Union[IO[bytes], bytes, str, Path],
         filename: Optional[str] = None,
         attach: bool = False,
+        read_file_handle: bool = True,
     ):
         if isinstance(obj, bytes):
-            self.input_file_content: bytes = obj
+            self.input_file_content: Union[bytes, IO[bytes]] = obj
         elif isinstance(obj, str):
             self.input_file_content = obj.encode("utf-8")
-        else:
+        elif isinstance(obj, Path):
+            self.input_file_content = (
+                obj.read_bytes() if read_file_handle else cast(IO[bytes], LazyFileReader(obj))
+            )
+            filename = filename or obj.name
+        elif read_file_handle:
             reported_filename, self.input_file_content = load_file(obj)
             filename = filename or reported_filename
+        else:
+            self.input_file_content = obj
+            filename = filename or guess_file_name(obj)
 
         self.attach_name: Optional[str] = "attached" + uuid4().hex if attach else None
 
@@ -95,7 +130,7 @@ class InputFile:
         """Field tuple representing the contents of the file for upload to the Telegram servers.
 
         Returns:
-            Tuple[:obj:`str`, :obj:`bytes`, :obj:`str`]:
+            Tuple[:obj:`str`, :obj:`bytes` | :term:`file object`, :obj:`str`]:
         """
         return self.filename, self.input_file_content, self.mimetype
 
@@ -22,7 +22,21 @@
 import datetime
 import re
 from html import escape
-from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, TypedDict, Union
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Final,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
 
 from telegram._chat import Chat
 from telegram._chatboost import ChatBoostAdded
@@ -64,6 +78,7 @@ from telegram._user import User
 from telegram._utils.argumentparsing import parse_sequence_arg
 from telegram._utils.datetime import extract_tzinfo_from_defaults, from_timestamp
 from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
+from telegram._utils.sparse import SparseAttribute
 from telegram._utils.types import (
     CorrectOptionID,
     FileInput,
@@ -114,6 +129,60 @@ class _ReplyKwargs(TypedDict):
     reply_parameters: ReplyParameters
 
 
+class _EntityCache:
+    """Caches the UTF-16 encoding of the text (or caption) of a message, the texts of its
+    entities and the formatted versions of the text. Messages are immutable, so these only need
+    to be computed once. The text and entities the cache was built for are kept to detect changes
+    of unfrozen messages.
+    """
+
+    __slots__ = ("entities", "entity_texts", "formatted", "text", "utf_16_text")
+
+    def __init__(self, text: str, entities: Tuple[MessageEntity, ...]):
+        self.text: str = text
+        self.entities: Tuple[MessageEntity, ...] = entities
+        self.utf_16_text: bytes = text.encode("utf-16-le")
+        self.entity_texts: Optional[Dict[MessageEntity, str]] = None
+        self.formatted: Dict[Tuple[str, bool], Optional[str]] = {}
+
+    def parse_entity(self, entity: MessageEntity) -> str:
+        return self.utf_16_text[entity.offset * 2 : (entity.offset + entity.length) * 2].decode(
+            "utf-16-le"
+        )
+
+    def parse_entities(self) -> Dict[MessageEntity, str]:
+        if self.entity_texts is None:
+            # The text is only encoded once for all entities
+            utf_16_text = self.utf_16_text
+            self.entity_texts = {
+                entity: utf_16_text[
+                    entity.offset * 2 : (entity.offset + entity.length) * 2
+                ].decode("utf-16-le")
+                for entity in self.entities
+            }
+        return self.entity_texts
+
+
+# Attributes of lazy messages whose values in the data are used as they are, such that they can
+# be set without parsing the whole message
+_LAZY_SCALAR_ATTRIBUTES: Final[FrozenSet[str]] = frozenset(
+    (
+        "author_signature",
+        "business_connection_id",
+        "caption",
+        "has_protected_content",
+        "is_topic_message",
+        "media_group_id",
+        "message_thread_id",
+        "text",
+    )
+)
+# Values of the slots of a message for which the data has no value and the keys of the data that
+# are stored in `_sparse_values`. Filled on first use, see `Message._parse_lazy_attribute`
+_LAZY_EMPTY_VALUES: Dict[str, object] = {}
+_LAZY_SPARSE_KEYS: Set[str] = set()
+
+
 class MaybeInaccessibleMessage(TelegramObject):
     """Base class for Telegram Message Objects.
 
@@ -868,85 +937,92 @@ class Message(MaybeInaccessibleMessage):
     # fmt: on
     __slots__ = (
         "_effective_attachment",
+        "_lazy_data",
+        "_sparse_values",
         "animation",
         "audio",
         "author_signature",
-        "boost_added",
         "business_connection_id",
         "caption",
         "caption_entities",
-        "channel_chat_created",
-        "chat_shared",
-        "connected_website",
         "contact",
-        "delete_chat_photo",
-        "dice",
         "document",
         "edit_date",
         "entities",
         "external_reply",
-        "forum_topic_closed",
-        "forum_topic_created",
-        "forum_topic_edited",
-        "forum_topic_reopened",
         "forward_origin",
         "from_user",
-        "game",
-        "general_forum_topic_hidden",
-        "general_forum_topic_unhidden",
-        "giveaway",
-        "giveaway_completed",
-        "giveaway_created",
-        "giveaway_winners",
-        "group_chat_created",
-        "has_media_spoiler",
         "has_protected_content",
-        "invoice",
-        "is_automatic_forward",
-        "is_from_offline",
         "is_topic_message",
-        "left_chat_member",
         "link_preview_options",
         "location",
         "media_group_id",
-        "message_auto_delete_timer_changed",
         "message_thread_id",
-        "migrate_from_chat_id",
-        "migrate_to_chat_id",
-        "new_chat_members",
-        "new_chat_photo",
-        "new_chat_title",
-        "passport_data",
         "photo",
-        "pinned_message",
-        "poll",
-        "proximity_alert_triggered",
         "quote",
         "reply_markup",
         "reply_to_message",
-        "reply_to_story",
-        "sender_boost_count",
-        "sender_business_bot",
         "sender_chat",
         "sticker",
-        "story",
-        "successful_payment",
-        "supergroup_chat_created",
         "text",
-        "users_shared",
-        "venue",
         "via_bot",
         "video",
-        "video_chat_ended",
-        "video_chat_participants_invited",
-        "video_chat_scheduled",
-        "video_chat_started",
         "video_note",
         "voice",
-        "web_app_data",
-        "write_access_allowed",
     )
 
+    if not TYPE_CHECKING:
+        # Attributes that are only set for few messages, e.g. service messages. These are stored
+        # in a shared mapping instead of dedicated slots to reduce the memory footprint. The type
+        # checker only needs to see the annotated assignments in __init__.
+        boost_added = SparseAttribute()
+        channel_chat_created = SparseAttribute(False)
+        chat_shared = SparseAttribute()
+        connected_website = SparseAttribute()
+        delete_chat_photo = SparseAttribute(False)
+        dice = SparseAttribute()
+        forum_topic_closed = SparseAttribute()
+        forum_topic_created = SparseAttribute()
+        forum_topic_edited = SparseAttribute()
+        forum_topic_reopened = SparseAttribute()
+        game = SparseAttribute()
+        general_forum_topic_hidden = SparseAttribute()
+        general_forum_topic_unhidden = SparseAttribute()
+        giveaway = SparseAttribute()
+        giveaway_completed = SparseAttribute()
+        giveaway_created = SparseAttribute()
+        giveaway_winners = SparseAttribute()
+        group_chat_created = SparseAttribute(False)
+        has_media_spoiler = SparseAttribute()
+        invoice = SparseAttribute()
+        is_automatic_forward = SparseAttribute()
+        is_from_offline = SparseAttribute()
+        left_chat_member = SparseAttribute()
+        message_auto_delete_timer_changed = SparseAttribute()
+        migrate_from_chat_id = SparseAttribute()
+        migrate_to_chat_id = SparseAttribute()
+        new_chat_members = SparseAttribute(())
+        new_chat_photo = SparseAttribute(())
+        new_chat_title = SparseAttribute()
+        passport_data = SparseAttribute()
+        pinned_message = SparseAttribute()
+        poll = SparseAttribute()
+        proximity_alert_triggered = SparseAttribute()
+        reply_to_story = SparseAttribute()
+        sender_boost_count = SparseAttribute()
+        sender_business_bot = SparseAttribute()
+        story = SparseAttribute()
+        successful_payment = SparseAttribute()
+        supergroup_chat_created = SparseAttribute(False)
+        users_shared = SparseAttribute()
+        venue = SparseAttribute()
+        video_chat_ended = SparseAttribute()
+        video_chat_participants_invited = SparseAttribute()
+        video_chat_scheduled = SparseAttribute()
+        video_chat_started = SparseAttribute()
+        web_app_data = SparseAttribute()
+        write_access_allowed = SparseAttribute()
+
     def __init__(
         self,
         message_id: int,
@@ -1035,6 +1111,8 @@ class Message(MaybeInaccessibleMessage):
         super().__init__(chat=chat, message_id=message_id, date=date, api_kwargs=api_kwargs)
 
         with self._unfrozen():
+            self._sparse_values: Optional[Dict[str, object]] = None
+            self._lazy_data: Optional[JSONDict] = None
             # Required
             self.message_id: int = message_id
             # Optionals
@@ -1290,6 +1368,133 @@ class Message(MaybeInaccessibleMessage):
             data=data, bot=bot, api_kwargs=api_kwargs
         )
 
+    @classmethod
+    def _de_json_lazy(cls, data: Optional[JSONDict], bot: "Bot") -> Optional["Message"]:
+        """Like :meth:`de_json`, but only :attr:`message_id`, :attr:`date` and :attr:`chat` are
+        parsed right away. All other attributes are parsed on first access. Attributes that have
+        no value in the data or a value that needs no conversion, as well as :attr:`from_user`,
+        are set individually. Accessing any other attribute parses the whole message. Used for
+        the messages returned by bot methods if :attr:`telegram.ext.Defaults.lazy_messages` is
+        enabled and for the messages of lazy updates.
+        """
+        data = cls._parse_data(data)
+
+        if not data:
+            return None
+
+        date = data["date"]
+        message = cls.__new__(cls)
+        MaybeInaccessibleMessage.__init__(
+            message,
+            chat=Chat.de_json(data["chat"], bot),  # type: ignore[arg-type]
+            message_id=data["message_id"],
+            date=(
+                ZERO_DATE
+                if date == 0
+                else from_timestamp(date, tzinfo=extract_tzinfo_from_defaults(bot))
+            ),
+        )
+        # All other slots stay empty, such that `__getattr__` is called on access. This includes
+        # `api_kwargs`, which can only be determined by parsing the data
+        with message._unfrozen():
+            del message.api_kwargs
+        message._lazy_data = data
+        message.set_bot(bot)
+        return message
+
+    if not TYPE_CHECKING:
+        # Only defined at runtime so that type checkers still complain about unknown attributes
+
+        def __getattr__(self, name: str) -> object:
+            # This is only called if the regular lookup fails, i.e. for attributes of lazy
+            # messages that were not parsed yet
+            try:
+                lazy_data = object.__getattribute__(self, "_lazy_data")
+            except AttributeError:  # e.g. objects unpickled from older versions
+                lazy_data = None
+            if not lazy_data:
+                raise AttributeError(
+                    f"'{self.__class__.__name__}' object has no attribute '{name}'"
+                )
+
+            if not self._parse_lazy_attribute(lazy_data, name):
+                self._materialize()
+            return object.__getattribute__(self, name)
+
+    def _parse_lazy_attribute(self, lazy_data: JSONDict, name: str) -> bool:
+        """Sets a single attribute of a lazy message, if that's possible without parsing the
+        whole message. This way, e.g. filters checking for the presence of attributes don't parse
+        the messages that they reject.
+
+        Returns:
+            :obj:`bool`: Whether the attribute was set.
+        """
+        if not _LAZY_EMPTY_VALUES:
+            empty = Message(message_id=0, date=ZERO_DATE, chat=Chat(id=0, type=Chat.PRIVATE))
+            _LAZY_EMPTY_VALUES.update(
+                (slot, object.__getattribute__(empty, slot))
+                for slot in Message.__slots__
+                if slot != "_lazy_data"
+            )
+            _LAZY_SPARSE_KEYS.update(
+                key for key, value in vars(Message).items() if isinstance(value, SparseAttribute)
+            )
+
+        if name not in _LAZY_EMPTY_VALUES:
+            return False
+
+        key = "from" if name == "from_user" else name
+        if name == "_sparse_values":
+            if not _LAZY_SPARSE_KEYS.isdisjoint(lazy_data):
+                return False
+            value = None
+        elif key not in lazy_data:
+            value = _LAZY_EMPTY_VALUES[name]
+        elif name == "from_user":
+            value = User.de_json(lazy_data[key], self._bot)  # type: ignore[arg-type]
+        elif name in _LAZY_SCALAR_ATTRIBUTES:
+            value = lazy_data[key]
+        else:
+            return False
+
+        with self._unfrozen():
+            setattr(self, name, value)
+        return True
+
+    def _materialize(self) -> None:
+        """Parses all attributes of a lazy message that were not parsed yet."""
+        lazy_data: Optional[JSONDict] = getattr(self, "_lazy_data", None)
+        if not lazy_data:
+            return
+
+        self._lazy_data = None
+        message = cast(Message, Message.de_json(lazy_data, self._bot))  # type: ignore[arg-type]
+        with self._unfrozen():
+            # message_id, date and chat were already parsed by _de_json_lazy. Attributes that
+            # were set by _parse_lazy_attribute are kept, such that they are not replaced by
+            # equal, but different objects
+            for name in Message.__slots__:
+                if name == "_lazy_data":
+                    continue
+                try:
+                    object.__getattribute__(self, name)
+                except AttributeError:
+                    setattr(self, name, object.__getattribute__(message, name))
+            self.api_kwargs = message.api_kwargs
+
+    def _get_attrs_names(self, include_private: bool) -> Iterable[str]:
+        """Override to parse all attributes of lazy messages first. This makes sure that
+        :meth:`to_dict`, :meth:`__repr__` and pickling work the same as for regular messages.
+        """
+        self._materialize()
+        return super()._get_attrs_names(include_private=include_private)
+
+    def __deepcopy__(self, memodict: Dict[int, object]) -> "Message":
+        """See :meth:`telegram.TelegramObject.__deepcopy__`."""
+        # Must happen before the bot is temporarily removed by super().__deepcopy__
+        self._materialize()
+        return super().__deepcopy__(memodict)
+
     @property
     def effective_attachment(
         self,
@@ -4184,9 +4389,7 @@ class Message(MaybeInaccessibleMessage):
         if not self.text:
             raise RuntimeError("This Message has no 'text'.")
 
-        entity_text = self.text.encode("utf-16-le")
-        entity_text = entity_text[entity.offset * 2 : (entity.offset + entity.length) * 2]
-        return entity_text.decode("utf-16-le")
+        return self._get_entity_cache(caption=False).parse_entity(entity)
 
     def parse_caption_entity(self, entity: MessageEntity) -> str:
         """Returns the text from a given :class:`telegram.MessageEntity`.
@@ -4210,9 +4413,7 @@ class Message(MaybeInaccessibleMessage):
         if not self.caption:
             raise RuntimeError("This Message has no 'caption'.")
 
-        entity_text = self.caption.encode("utf-16-le")
-        entity_text = entity_text[entity.offset * 2 : (entity.offset + entity.length) * 2]
-        return entity_text.decode("utf-16-le")
+        return self._get_entity_cache(caption=True).parse_entity(entity)
 
     def parse_entities(self, types: Optional[List[str]] = None) -> Dict[MessageEntity, str]:
         """
@@ -4240,8 +4441,18 @@ class Message(MaybeInaccessibleMessage):
         if types is None:
             types = MessageEntity.ALL_TYPES
 
+        if not self.text:
+            # Raises the appropriate exception if any entity is selected
+            return {
+                entity: self.parse_entity(entity)
+                for entity in self.entities
+                if entity.type in types
+            }
+
         return {
-            entity: self.parse_entity(entity) for entity in self.entities if entity.type in types
+            entity: text
+            for entity, text in self._get_entity_cache(caption=False).parse_entities().items()
+            if entity.type in types
         }
 
     def parse_caption_entities(
@@ -4272,12 +4483,70 @@ class Message(MaybeInaccessibleMessage):
         if types is None:
             types = MessageEntity.ALL_TYPES
 
+        if not self.caption:
+            # Raises the appropriate exception if any entity is selected
+            return {
+                entity: self.parse_caption_entity(entity)
+                for entity in self.caption_entities
+                if entity.type in types
+            }
+
         return {
-            entity: self.parse_caption_entity(entity)
-            for entity in self.caption_entities
+            entity: text
+            for entity, text in self._get_entity_cache(caption=True).parse_entities().items()
             if entity.type in types
         }
 
+    def _get_entity_cache(self, caption: bool) -> _EntityCache:
+        """Returns the :class:`_EntityCache` for :attr:`caption` or :attr:`text`, which must
+        not be empty. The cache is kept in the mapping of the rarely set attributes, such that it
+        doesn't take up memory for messages that are never formatted and isn't part of the state
+        used for pickling, copying and comparing.
+        """
+        key = "_caption_entity_cache" if caption else "_text_entity_cache"
+        text, entities = (
+            (self.caption, self.caption_entities) if caption else (self.text, self.entities)
+        )
+        values = getattr(self, "_sparse_values", None)
+        cache = values.get(key) if values else None
+        if cache is None or cache.text is not text or cache.entities is not entities:
+            cache = _EntityCache(cast(str, text), entities)
+            if values is None:
+                values = self._sparse_values = {}
+            values[key] = cache
+        return cache
+
+    def _format(self, caption: bool, markup: str, urled: bool) -> str:
+        """Returns the text or caption formatted with the given markup. The result is computed
+        only once per message.
+
+        Args:
+            caption (:obj:`bool`): Whether to format :attr:`caption` instead of :attr:`text`.
+            markup (:obj:`str`): One of ``"html"``, ``"markdown"`` and ``"markdown_v2"``.
+            urled (:obj:`bool`): Whether to format :attr:`telegram.MessageEntity.URL` as links.
+        """
+        text = self.caption if caption else self.text
+        cache = self._get_entity_cache(caption=caption) if text else None
+        if cache is not None and (markup, urled) in cache.formatted:
+            return cache.formatted[(markup, urled)]
+
+        entities = self.parse_caption_entities() if caption else self.parse_entities()
+        utf_16_text = cache.utf_16_text if cache is not None else None
+        if markup == "html":
+            formatted = self._parse_html(text, entities, urled=urled, utf_16_text=utf_16_text)
+        else:
+            formatted = self._parse_markdown(
+                text,
+                entities,
+                urled=urled,
+                version=1 if markup == "markdown" else 2,
+                utf_16_text=utf_16_text,
+            )
+
+        if cache is not None:
+            cache.formatted[(markup, urled)] = formatted
+        return formatted
+
     @classmethod
     def _parse_html(
         cls,
@@ -4285,11 +4554,13 @@ class Message(MaybeInaccessibleMessage):
         entities: Dict[MessageEntity, str],
         urled: bool = False,
         offset: int = 0,
+        utf_16_text: Optional[bytes] = None,
     ) -> Optional[str]:
         if message_text is None:
             return None
 
-        utf_16_text = message_text.encode("utf-16-le")
+        if utf_16_text is None:
+            utf_16_text = message_text.encode("utf-16-le")
         html_text = ""
         last_offset = 0
 
@@ -4386,7 +4657,7 @@ class Message(MaybeInaccessibleMessage):
             :obj:`str`: Message text with entities formatted as HTML.
 
         """
-        return self._parse_html(self.text, self.parse_entities(), urled=False)
+        return self._format(caption=False, markup="html", urled=False)
 
     @property
     def text_html_urled(self) -> str:
@@ -4411,7 +4682,7 @@ class Message(MaybeInaccessibleMessage):
             :obj:`str`: Message text with entities formatted as HTML.
 
         """
-        return self._parse_html(self.text, self.parse_entities(), urled=True)
+        return self._format(caption=False, markup="html", urled=True)
 
     @property
     def caption_html(self) -> str:
@@ -4436,7 +4707,7 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message caption with caption entities formatted as HTML.
         """
-        return self._parse_html(self.caption, self.parse_caption_entities(), urled=False)
+        return self._format(caption=True, markup="html", urled=False)
 
     @property
     def caption_html_urled(self) -> str:
@@ -4461,7 +4732,7 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message caption with caption entities formatted as HTML.
         """
-        return self._parse_html(self.caption, self.parse_caption_entities(), urled=True)
+        return self._format(caption=True, markup="html", urled=True)
 
     @classmethod
     def _parse_markdown(
@@ -4471,6 +4742,7 @@ class Message(MaybeInaccessibleMessage):
         urled: bool = False,
         version: MarkdownVersion = 1,
         offset: int = 0,
+        utf_16_text: Optional[bytes] = None,
     ) -> Optional[str]:
         if version == 1:
             for entity_type in (
@@ -4487,7 +4759,8 @@ class Message(MaybeInaccessibleMessage):
         if message_text is None:
             return None
 
-        utf_16_text = message_text.encode("utf-16-le")
+        if utf_16_text is None:
+            utf_16_text = message_text.encode("utf-16-le")
         markdown_text = ""
         last_offset = 0
 
@@ -4624,7 +4897,7 @@ class Message(MaybeInaccessibleMessage):
                 blockquote or nested entities.
 
         """
-        return self._parse_markdown(self.text, self.parse_entities(), urled=False)
+        return self._format(caption=False, markup="markdown", urled=False)
 
     @property
     def text_markdown_v2(self) -> str:
@@ -4649,7 +4922,7 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message text with entities formatted as Markdown.
         """
-        return self._parse_markdown(self.text, self.parse_entities(), urled=False, version=2)
+        return self._format(caption=False, markup="markdown_v2", urled=False)
 
     @property
     def text_markdown_urled(self) -> str:
@@ -4681,7 +4954,7 @@ class Message(MaybeInaccessibleMessage):
                 blockquote or nested entities.
 
         """
-        return self._parse_markdown(self.text, self.parse_entities(), urled=True)
+        return self._format(caption=False, markup="markdown", urled=True)
 
     @property
     def text_markdown_v2_urled(self) -> str:
@@ -4706,7 +4979,7 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message text with entities formatted as Markdown.
         """
-        return self._parse_markdown(self.text, self.parse_entities(), urled=True, version=2)
+        return self._format(caption=False, markup="markdown_v2", urled=True)
 
     @property
     def caption_markdown(self) -> str:
@@ -4736,7 +5009,7 @@ class Message(MaybeInaccessibleMessage):
                 blockquote or nested entities.
 
         """
-        return self._parse_markdown(self.caption, self.parse_caption_entities(), urled=False)
+        return self._format(caption=True, markup="markdown", urled=False)
 
     @property
     def caption_markdown_v2(self) -> str:
@@ -4761,9 +5034,7 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message caption with caption entities formatted as Markdown.
         """
-        return self._parse_markdown(
-            self.caption, self.parse_caption_entities(), urled=False, version=2
-        )
+        return self._format(caption=True, markup="markdown_v2", urled=False)
 
     @property
     def caption_markdown_urled(self) -> str:
@@ -4795,7 +5066,7 @@ class Message(MaybeInaccessibleMessage):
                 blockquote or nested entities.
 
         """
-        return self._parse_markdown(self.caption, self.parse_caption_entities(), urled=True)
+        return self._format(caption=True, markup="markdown", urled=True)
 
     @property
     def caption_markdown_v2_urled(self) -> str:
@@ -4820,6 +5091,4 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message caption with caption entities formatted as Markdown.
         """
-        return self._parse_markdown(
-            self.caption, self.parse_caption_entities(), urled=True, version=2
-        )
+        return self._format(caption=True, markup="markdown_v2", urled=True)
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the MessageTemplate class."""
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional, Union
+
+from telegram._utils.defaultvalue import DEFAULT_NONE
+from telegram._utils.repr import build_repr_with_selected_attrs
+from telegram._utils.types import JSONDict, ODVInput
+
+if TYPE_CHECKING:
+    from telegram import Bot
+    from telegram.request import RequestData
+
+# Set while MessageTemplate.create calls a bot method, see Bot._post
+_CAPTURE_REQUEST: ContextVar[bool] = ContextVar("_CAPTURE_REQUEST", default=False)
+
+
+class _CapturedRequest(Exception):
+    """Raised by Bot._post instead of making the request while _CAPTURE_REQUEST is set."""
+
+    __slots__ = ("data", "endpoint")
+
+    def __init__(self, endpoint: str, data: JSONDict):
+        super().__init__(endpoint)
+        self.endpoint: str = endpoint
+        self.data: JSONDict = data
+
+
+class MessageTemplate:
+    """A message whose parameters are prepared once, so that it can be sent to many chats
+    efficiently.
+
+    When calling a method like :meth:`telegram.Bot.send_message`, the bot inserts the default
+    values, converts all arguments to their JSON representation and encodes them. If the same
+    message, e.g. with the same text, entities and
+    :class:`~telegram.InlineKeyboardMarkup`, is sent to thousands of chats, this is repeated for
+    every chat, although only the ``chat_id`` changes. A template does this work once in
+    :meth:`create` and :meth:`send` then only encodes the ``chat_id``. Apart from that,
+    :meth:`send` behaves like the bot method that the template was created with, including
+    rate limiting and the handling of errors.
+
+    Example:
+        .. code-block:: python
+
+            template = await MessageTemplate.create(
+                bot.send_message, text="We have a new feature!", reply_markup=keyboard
+            )
+            for chat_id in chat_ids:
+                await template.send(chat_id)
+
+    Note:
+        * Templates can only be created for bot methods that send messages to a chat
+          identified by the ``chat_id`` parameter, e.g. :meth:`~telegram.Bot.send_message`,
+          :meth:`~telegram.Bot.send_photo` or :meth:`~telegram.Bot.copy_message`.
+        * Files can't be uploaded by templates. Upload them once and pass the ``file_id``
+          instead.
+        * The defaults of :class:`telegram.ext.Defaults` and the ``rate_limit_args`` of
+          :class:`telegram.ext.ExtBot` are applied when the template is created.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        bot (:class:`telegram.Bot`): The bot that sends the message.
+        endpoint (:obj:`str`): The name of the Bot API method, e.g. ``"sendMessage"``.
+        request_data (:class:`telegram.request.RequestData`): The prepared parameters.
+        api_kwargs (:obj:`dict`, optional): Arbitrary keyword arguments passed along with every
+            call of :meth:`send`.
+
+    Attributes:
+        bot (:class:`telegram.Bot`): The bot that sends the message.
+        endpoint (:obj:`str`): The name of the Bot API method.
+    """
+
+    __slots__ = ("_api_kwargs", "_request_data", "bot", "endpoint")
+
+    def __init__(
+        self,
+        bot: "Bot",
+        endpoint: str,
+        request_data: "RequestData",
+        api_kwargs: Optional[JSONDict] = None,
+    ):
+        self.bot: Bot = bot
+        self.endpoint: str = endpoint
+        self._request_data: RequestData = request_data
+        self._api_kwargs: JSONDict = api_kwargs or {}
+
+    def __repr__(self) -> str:
+        """Give a string representation of the template in the form
+        ``MessageTemplate[endpoint=...]``.
+
+        As this class doesn't implement :meth:`object.__str__`, the default implementation
+        will be used, which is equivalent to :meth:`__repr__`.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(self, endpoint=self.endpoint)
+
+    @classmethod
+    async def create(
+        cls, method: Callable[..., Awaitable[Any]], /, **kwargs: Any
+    ) -> "MessageTemplate":
+        """Prepares the parameters for calling :paramref:`method` with the given keyword
+        arguments. No request is made.
+
+        Args:
+            method (:term:`coroutine function`): A method of a :class:`telegram.Bot` that sends
+                messages, e.g. ``bot.send_message``.
+            **kwargs: The arguments to call :paramref:`method` with, except for ``chat_id``.
+
+        Returns:
+            :class:`MessageTemplate`
+
+        Raises:
+            :exc:`TypeError`: If :paramref:`method` is not a method of a bot.
+            :exc:`ValueError`: If :paramref:`method` doesn't send messages, ``chat_id`` was passed
+                or files would have to be uploaded.
+        """
+        # pylint: disable=import-outside-toplevel
+        from telegram import Bot
+
+        bot = getattr(method, "__self__", None)
+        if not isinstance(bot, Bot):
+            raise TypeError("`method` must be a method of a bot, e.g. `bot.send_message`.")
+        if "chat_id" in kwargs:
+            raise ValueError("The `chat_id` is passed to `MessageTemplate.send`.")
+
+        token = _CAPTURE_REQUEST.set(True)
+        try:
+            await method(chat_id=0, **kwargs)
+        except _CapturedRequest as exc:
+            captured = exc
+        else:
+            raise ValueError(f"`{method.__name__}` can't be used for a template.")
+        finally:
+            _CAPTURE_REQUEST.reset(token)
+
+        endpoint = captured.endpoint
+        if not endpoint.startswith("send") and endpoint not in ("copyMessage", "forwardMessage"):
+            raise ValueError(f"`{method.__name__}` doesn't send messages.")
+        return bot._create_message_template(  # pylint: disable=protected-access
+            endpoint, captured.data
+        )
+
+    async def send(
+        self,
+        chat_id: Union[int, str],
+        *,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+        api_kwargs: Optional[JSONDict] = None,
+    ) -> Any:
+        """Sends the message to a chat.
+
+        Args:
+            chat_id (:obj:`int` | :obj:`str`): Unique identifier for the target chat or username
+                of the target channel (in the format ``@channelusername``).
+
+        Keyword Args:
+            read_timeout (:obj:`float` | :obj:`None`, optional): See
+                :paramref:`telegram.request.BaseRequest.post.read_timeout`.
+            write_timeout (:obj:`float` | :obj:`None`, optional): See
+                :paramref:`telegram.request.BaseRequest.post.write_timeout`.
+            connect_timeout (:obj:`float` | :obj:`None`, optional): See
+                :paramref:`telegram.request.BaseRequest.post.connect_timeout`.
+            pool_timeout (:obj:`float` | :obj:`None`, optional): See
+                :paramref:`telegram.request.BaseRequest.post.pool_timeout`.
+            api_kwargs (:obj:`dict`, optional): Further parameters that differ between the chats,
+                e.g. ``{"message_thread_id": 42}``. They are added to or replace the parameters
+                of the template.
+
+        Returns:
+            The same as the bot method the template was created with, e.g. a
+            :class:`telegram.Message` for :meth:`telegram.Bot.send_message`.
+
+        Raises:
+            :class:`telegram.error.TelegramError`
+        """
+        data: JSONDict = {"chat_id": chat_id, **self._api_kwargs}
+        if api_kwargs:
+            data.update(api_kwargs)
+        return await self.bot._send_message_template(  # pylint: disable=protected-access
+            self.endpoint,
+            data,
+            self._request_data,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+        )
@@ -19,8 +19,8 @@
 """Base class for Telegram Objects."""
 import contextlib
 import datetime
+import enum
 import inspect
-import json
 from collections.abc import Sized
 from contextlib import contextmanager
 from copy import deepcopy
@@ -31,11 +31,12 @@ from typing import (
     Any,
     ClassVar,
     Dict,
+    FrozenSet,
+    Iterable,
     Iterator,
     List,
     Mapping,
     Optional,
-    Set,
     Tuple,
     Type,
     TypeVar,
@@ -43,8 +44,10 @@ from typing import (
     cast,
 )
 
+from telegram._utils.copying import FrozenSharingMemo
 from telegram._utils.datetime import to_timestamp
 from telegram._utils.defaultvalue import DefaultValue
+from telegram._utils.sparse import SPARSE_VALUES_SLOT, SparseAttribute
 from telegram._utils.types import JSONDict
 from telegram._utils.warnings import warn
 
@@ -93,13 +96,11 @@ class TelegramObject:
 
     __slots__ = ("_bot", "_frozen", "_id_attrs", "api_kwargs")
 
-    # Used to cache the names of the parameters of the __init__ method of the class
-    # Must be a private attribute to avoid name clashes between subclasses
-    __INIT_PARAMS: ClassVar[Set[str]] = set()
-    # Used to check if __INIT_PARAMS has been set for the current class. Unfortunately, we can't
-    # just check if `__INIT_PARAMS is None`, since subclasses use the parent class' __INIT_PARAMS
-    # unless it's overridden
-    __INIT_PARAMS_CHECK: Optional[Type["TelegramObject"]] = None
+    # Used to cache the names of the parameters of the __init__ method of the classes.
+    # Must be keyed by class, since subclasses must not reuse the parameters of their parent
+    __INIT_PARAMS: ClassVar[Dict[type, FrozenSet[str]]] = {}
+    # Used to cache the names of the slots of the classes. See _get_slot_names
+    __SLOT_NAMES: ClassVar[Dict[type, Tuple[Tuple[str, ...], Tuple[str, ...]]]] = {}
 
     def __init__(self, *, api_kwargs: Optional[JSONDict] = None) -> None:
         # Setting _frozen to `False` here means that classes without arguments still need to
@@ -356,6 +357,12 @@ class TelegramObject:
         Returns:
             :obj:`telegram.TelegramObject`: The copied object.
         """
+        if isinstance(memodict, FrozenSharingMemo) and self._is_immutable():
+            # See telegram._utils.copying.deepcopy_sharing_frozen. copy.deepcopy doesn't memoize
+            # objects that are returned as is, so we do it here to avoid checking them again
+            memodict[id(self)] = self
+            return self
+
         bot = self._bot  # Save bot so we can set it after copying
         self.set_bot(None)  # set to None so it is not deepcopied
         cls = self.__class__
@@ -391,6 +398,18 @@ class TelegramObject:
         self.set_bot(bot)
         return result
 
+    def _is_immutable(self) -> bool:
+        """Whether this object is frozen and all of its attributes are immutable, i.e. whether
+        copies of this object may share it with the original. The bot is not taken into account,
+        as it is shared by :meth:`__deepcopy__` anyway.
+        """
+        if not self._frozen:
+            return False
+        for key in self._get_attrs_names(include_private=True):
+            if key != "_bot" and not _is_immutable_value(getattr(self, key, None)):
+                return False
+        return True
+
     @staticmethod
     def _parse_data(data: Optional[JSONDict]) -> Optional[JSONDict]:
         """Should be called by subclasses that override de_json to ensure that the input
@@ -399,6 +418,20 @@ class TelegramObject:
         """
         return None if data is None else data.copy()
 
+    @classmethod
+    def _get_init_params(cls) -> FrozenSet[str]:
+        """Returns the names of the arguments of ``__init__`` that :meth:`_de_json` can pass
+        entries of the JSON data to. Computed once per class and cached afterwards.
+        """
+        if (params := cls.__INIT_PARAMS.get(cls)) is None:
+            params = cls.__INIT_PARAMS[cls] = frozenset(
+                name
+                for name, param in inspect.signature(cls).parameters.items()
+                if name != "api_kwargs"
+                and param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+            )
+        return params
+
     @classmethod
     def _de_json(
         cls: Type[Tele_co],
@@ -409,22 +442,17 @@ class TelegramObject:
         if data is None:
             return None
 
-        # try-except is significantly faster in case we already have a correct argument set
-        try:
+        params = cls.__INIT_PARAMS.get(cls) or cls._get_init_params()
+        if params.issuperset(data):
+            # All keys are known, so we can pass the data directly
             obj = cls(**data, api_kwargs=api_kwargs)
-        except TypeError as exc:
-            if "__init__() got an unexpected keyword argument" not in str(exc):
-                raise exc
-
-            if cls.__INIT_PARAMS_CHECK is not cls:
-                signature = inspect.signature(cls)
-                cls.__INIT_PARAMS = set(signature.parameters.keys())
-                cls.__INIT_PARAMS_CHECK = cls
-
+        else:
+            # Unknown keys are moved to api_kwargs. Splitting the data upfront is considerably
+            # faster than letting __init__ raise a TypeError and retrying.
             api_kwargs = api_kwargs or {}
             existing_kwargs: JSONDict = {}
             for key, value in data.items():
-                (existing_kwargs if key in cls.__INIT_PARAMS else api_kwargs)[key] = value
+                (existing_kwargs if key in params else api_kwargs)[key] = value
 
             obj = cls(api_kwargs=api_kwargs, **existing_kwargs)
 
@@ -512,7 +540,36 @@ class TelegramObject:
             elif getattr(self, key, True) is None:
                 setattr(self, key, api_kwargs.pop(key))
 
-    def _get_attrs_names(self, include_private: bool) -> Iterator[str]:
+    @classmethod
+    def _get_slot_names(cls) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Returns the names of the slots of this class and its superclasses. The first tuple
+        contains all names, the second one only the names of the public slots.
+
+        The names are computed once per class and then cached, as walking the MRO on every call
+        of :meth:`to_dict` and :meth:`__getstate__` is comparatively expensive.
+        """
+        # We want to get all attributes for the class, using cls.__slots__ only includes the
+        # attributes used by that class itself, and not its superclass(es). Hence, we get its MRO
+        # and then get their attributes. The `[:-1]` slice excludes the `object` class.
+        # dict.fromkeys removes duplicates, e.g. for subclasses that don't define __slots__
+        names = dict.fromkeys(s for c in cls.__mro__[:-1] for s in c.__slots__)  # type: ignore
+        # Attributes stored via SparseAttribute are listed instead of the slot storing them
+        if SPARSE_VALUES_SLOT in names:
+            del names[SPARSE_VALUES_SLOT]
+            names.update(
+                dict.fromkeys(
+                    name
+                    for c in cls.__mro__[:-1]
+                    for name, value in vars(c).items()
+                    if isinstance(value, SparseAttribute)
+                )
+            )
+        all_slots = tuple(names)
+        slot_names = (all_slots, tuple(s for s in all_slots if not s.startswith("_")))
+        cls.__SLOT_NAMES[cls] = slot_names
+        return slot_names
+
+    def _get_attrs_names(self, include_private: bool) -> Iterable[str]:
         """
         Returns the names of the attributes of this object. This is used to determine which
         attributes should be serialized when pickling the object.
@@ -521,20 +578,17 @@ class TelegramObject:
             include_private (:obj:`bool`): Whether to include private attributes.
 
         Returns:
-            Iterator[:obj:`str`]: An iterator over the names of the attributes of this object.
+            Iterable[:obj:`str`]: An iterable over the names of the attributes of this object.
         """
-        # We want to get all attributes for the class, using self.__slots__ only includes the
-        # attributes used by that class itself, and not its superclass(es). Hence, we get its MRO
-        # and then get their attributes. The `[:-1]` slice excludes the `object` class
-        all_slots = (s for c in self.__class__.__mro__[:-1] for s in c.__slots__)  # type: ignore
-        # chain the class's slots with the user defined subclass __dict__ (class has no slots)
-        all_attrs = (
-            chain(all_slots, self.__dict__.keys()) if hasattr(self, "__dict__") else all_slots
-        )
+        all_slots, public_slots = self.__SLOT_NAMES.get(self.__class__) or self._get_slot_names()
+
+        if not hasattr(self, "__dict__"):
+            return all_slots if include_private else public_slots
 
+        # chain the class's slots with the user defined subclass __dict__ (class has no slots)
         if include_private:
-            return all_attrs
-        return (attr for attr in all_attrs if not attr.startswith("_"))
+            return chain(all_slots, self.__dict__.keys())
+        return chain(public_slots, (attr for attr in self.__dict__ if not attr.startswith("_")))
 
     def _get_attrs(
         self,
@@ -561,11 +615,9 @@ class TelegramObject:
         data = {}
 
         for key in self._get_attrs_names(include_private=include_private):
-            value = (
-                DefaultValue.get_value(getattr(self, key, None))
-                if convert_default_vault
-                else getattr(self, key, None)
-            )
+            value = getattr(self, key, None)
+            if convert_default_vault and isinstance(value, DefaultValue):
+                value = value.value
 
             if value is not None:
                 if recursive and hasattr(value, "to_dict"):
@@ -587,10 +639,18 @@ class TelegramObject:
         .. versionchanged:: 20.0
             Now includes all entries of :attr:`api_kwargs`.
 
+        .. versionchanged:: NEXT.VERSION
+            Uses the codec returned by :func:`telegram.request.get_json_codec`.
+
         Returns:
             :obj:`str`
         """
-        return json.dumps(self.to_dict())
+        # Imported here to avoid a circular import
+        from telegram.request._jsoncodec import (  # pylint: disable=import-outside-toplevel
+            get_json_codec,
+        )
+
+        return get_json_codec().dumps(self.to_dict())
 
     def to_dict(self, recursive: bool = True) -> JSONDict:
         """Gives representation of object as :obj:`dict`.
@@ -610,17 +670,21 @@ class TelegramObject:
         Returns:
             :obj:`dict`
         """
-        out = self._get_attrs(recursive=recursive)
-
-        # Now we should convert TGObjects to dicts inside objects such as sequences, and convert
-        # datetimes to timestamps. This mostly eliminates the need for subclasses to override
-        # `to_dict`
-        pop_keys: Set[str] = set()
-        for key, value in out.items():
-            if isinstance(value, (tuple, list)):
+        # This is a single pass version of `_get_attrs(recursive=recursive)` that also converts
+        # TGObjects inside sequences to dicts and datetimes to timestamps. This mostly eliminates
+        # the need for subclasses to override `to_dict`
+        out: JSONDict = {}
+        for key in self._get_attrs_names(include_private=False):
+            value = getattr(self, key, None)
+            if isinstance(value, DefaultValue):
+                value = value.value
+
+            if value is None:
+                if not recursive:
+                    out[key] = value
+            elif isinstance(value, (tuple, list)):
                 if not value:
-                    # not popping directly to avoid changing the dict size during iteration
-                    pop_keys.add(key)
+                    # Attributes whose values are empty sequences are not included
                     continue
 
                 val = []  # empty list to append our converted values to
@@ -638,15 +702,18 @@ class TelegramObject:
                     else:  # if it's not a TGObject, just append it. E.g. [TGObject, 2]
                         val.append(item)
                 out[key] = val
-
             elif isinstance(value, datetime.datetime):
                 out[key] = to_timestamp(value)
+            elif recursive and hasattr(value, "to_dict"):
+                out[key] = value.to_dict(recursive=True)
+            else:
+                out[key] = value
 
-        for key in pop_keys:
-            out.pop(key)
+        if recursive and out.get("from_user"):
+            out["from"] = out.pop("from_user", None)
 
         # Effectively "unpack" api_kwargs into `out`:
-        out.update(out.pop("api_kwargs", {}))  # type: ignore[call-overload]
+        out.update(out.pop("api_kwargs", {}))
         return out
 
     def get_bot(self) -> "Bot":
@@ -676,3 +743,35 @@ class TelegramObject:
             bot (:class:`telegram.Bot` | :obj:`None`): The bot instance.
         """
         self._bot = bot
+
+
+# Values of these types can't be changed and hence don't need to be copied
+_IMMUTABLE_TYPES: Tuple[type, ...] = (
+    str,
+    int,
+    float,
+    bytes,
+    type(None),
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    datetime.tzinfo,
+    enum.Enum,
+    DefaultValue,
+)
+
+
+def _is_immutable_value(value: object) -> bool:
+    """Checks if the value can be shared between an object and its copy, see
+    :meth:`TelegramObject._is_immutable`.
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, TelegramObject):
+        return value._is_immutable()  # pylint: disable=protected-access
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_immutable_value(item) for item in value)
+    if isinstance(value, MappingProxyType):
+        # api_kwargs
+        return all(_is_immutable_value(item) for item in value.values())
+    return False
@@ -18,7 +18,7 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an object that represents a Telegram Update."""
 
-from typing import TYPE_CHECKING, Final, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, Final, Iterable, List, Optional, Type, Union, cast
 
 from telegram import constants
 from telegram._business import BusinessConnection, BusinessMessagesDeleted
@@ -270,6 +270,8 @@ class Update(TelegramObject):
         "_effective_message",
         "_effective_sender",
         "_effective_user",
+        "_lazy_data",
+        "_raw_payload",
         "business_connection",
         "business_message",
         "callback_query",
@@ -449,6 +451,8 @@ class Update(TelegramObject):
         self._effective_sender: Optional[Union["User", "Chat"]] = None
         self._effective_chat: Optional[Chat] = None
         self._effective_message: Optional[Message] = None
+        self._lazy_data: Optional[JSONDict] = None
+        self._raw_payload: Optional[Union[JSONDict, bytes]] = None
 
         self._id_attrs = (self.update_id,)
 
@@ -730,43 +734,192 @@ class Update(TelegramObject):
 
     @classmethod
     def de_json(cls, data: Optional[JSONDict], bot: "Bot") -> Optional["Update"]:
-        """See :meth:`telegram.TelegramObject.de_json`."""
+        """See :meth:`telegram.TelegramObject.de_json`.
+
+        If :paramref:`bot` has lazy updates enabled (see
+        :paramref:`telegram.ext.ExtBot.lazy_updates`), only :attr:`update_id` is parsed right
+        away. The attribute holding the content of the update is parsed on first access. If it
+        is a :class:`telegram.Message`, only its :attr:`~telegram.Message.message_id`,
+        :attr:`~telegram.Message.date` and :attr:`~telegram.Message.chat` are parsed then and
+        the remaining attributes are parsed once they are needed.
+
+        If :paramref:`bot` keeps the raw payloads of updates (see
+        :paramref:`telegram.ext.ExtBot.keep_raw_payloads`), :paramref:`data` is stored on the
+        update such that :meth:`to_dict` and :meth:`to_json` can return it without serializing
+        the update again.
+
+        .. versionchanged:: NEXT.VERSION
+            Added support for lazy updates and for keeping the raw payload.
+        """
+        raw_data = data
         data = cls._parse_data(data)
 
         if not data:
             return None
 
-        data["message"] = Message.de_json(data.get("message"), bot)
-        data["edited_message"] = Message.de_json(data.get("edited_message"), bot)
-        data["inline_query"] = InlineQuery.de_json(data.get("inline_query"), bot)
-        data["chosen_inline_result"] = ChosenInlineResult.de_json(
-            data.get("chosen_inline_result"), bot
-        )
-        data["callback_query"] = CallbackQuery.de_json(data.get("callback_query"), bot)
-        data["shipping_query"] = ShippingQuery.de_json(data.get("shipping_query"), bot)
-        data["pre_checkout_query"] = PreCheckoutQuery.de_json(data.get("pre_checkout_query"), bot)
-        data["channel_post"] = Message.de_json(data.get("channel_post"), bot)
-        data["edited_channel_post"] = Message.de_json(data.get("edited_channel_post"), bot)
-        data["poll"] = Poll.de_json(data.get("poll"), bot)
-        data["poll_answer"] = PollAnswer.de_json(data.get("poll_answer"), bot)
-        data["my_chat_member"] = ChatMemberUpdated.de_json(data.get("my_chat_member"), bot)
-        data["chat_member"] = ChatMemberUpdated.de_json(data.get("chat_member"), bot)
-        data["chat_join_request"] = ChatJoinRequest.de_json(data.get("chat_join_request"), bot)
-        data["chat_boost"] = ChatBoostUpdated.de_json(data.get("chat_boost"), bot)
-        data["removed_chat_boost"] = ChatBoostRemoved.de_json(data.get("removed_chat_boost"), bot)
-        data["message_reaction"] = MessageReactionUpdated.de_json(
-            data.get("message_reaction"), bot
-        )
-        data["message_reaction_count"] = MessageReactionCountUpdated.de_json(
-            data.get("message_reaction_count"), bot
-        )
-        data["business_connection"] = BusinessConnection.de_json(
-            data.get("business_connection"), bot
-        )
-        data["business_message"] = Message.de_json(data.get("business_message"), bot)
-        data["edited_business_message"] = Message.de_json(data.get("edited_business_message"), bot)
-        data["deleted_business_messages"] = BusinessMessagesDeleted.de_json(
-            data.get("deleted_business_messages"), bot
-        )
+        # We don't use `isinstance(bot, ExtBot)` here so that this works
+        # in `python-telegram-bot-raw` as well
+        if getattr(bot, "lazy_updates", False):
+            lazy_data = {key: data.pop(key) for key in _UPDATE_KINDS.keys() & data.keys()}
+            update = super().de_json(data=data, bot=bot)
+            if update and lazy_data:
+                with update._unfrozen():
+                    for key in lazy_data:
+                        # Removing the value makes sure that `__getattr__` is called on access
+                        delattr(update, key)
+                    update._lazy_data = lazy_data  # pylint: disable=protected-access
+        else:
+            for key, kind_class in _UPDATE_KINDS.items():
+                data[key] = kind_class.de_json(data.get(key), bot)
+
+            update = super().de_json(data=data, bot=bot)
+
+        if update and getattr(bot, "keep_raw_payloads", False):
+            # `_parse_data` copied the input, so `raw_data` is still unaltered
+            update._set_raw_payload(raw_data)  # pylint: disable=protected-access,no-member
+        return update
+
+    def _set_raw_payload(self, payload: Optional[Union[JSONDict, bytes]]) -> None:
+        """Sets the payload that :meth:`to_dict` and :meth:`to_json` return. Must be called with
+        :obj:`None` if the update is changed after it was parsed.
+
+        Args:
+            payload (:obj:`dict` | :obj:`bytes`): The data as received from Telegram, either as
+                parsed JSON or as UTF-8 encoded JSON.
+        """
+        self._raw_payload = payload
+
+    def to_dict(self, recursive: bool = True) -> JSONDict:
+        """See :meth:`telegram.TelegramObject.to_dict`.
+
+        If the raw payload of the update was kept (see
+        :paramref:`telegram.ext.ExtBot.keep_raw_payloads`), a copy of it is returned instead of
+        serializing the update again.
+
+        .. versionchanged:: NEXT.VERSION
+            Returns a copy of the raw payload, if available.
+        """
+        raw_payload = getattr(self, "_raw_payload", None)
+        if not recursive or raw_payload is None:
+            return super().to_dict(recursive=recursive)
+
+        if isinstance(raw_payload, bytes):
+            # Imported here to avoid a circular import
+            from telegram.request._jsoncodec import (  # pylint: disable=import-outside-toplevel
+                get_json_codec,
+            )
+
+            return get_json_codec().loads(raw_payload)
+        return cast(JSONDict, _copy_json(raw_payload))
 
-        return super().de_json(data=data, bot=bot)
+    def to_json(self) -> str:
+        """See :meth:`telegram.TelegramObject.to_json`.
+
+        If the raw payload of the update was kept (see
+        :paramref:`telegram.ext.ExtBot.keep_raw_payloads`), it is encoded directly instead of
+        serializing the update again.
+
+        .. versionchanged:: NEXT.VERSION
+            Encodes the raw payload, if available.
+        """
+        raw_payload = getattr(self, "_raw_payload", None)
+        if isinstance(raw_payload, bytes):
+            return raw_payload.decode("utf-8")
+        if raw_payload is not None:
+            # Imported here to avoid a circular import
+            from telegram.request._jsoncodec import (  # pylint: disable=import-outside-toplevel
+                get_json_codec,
+            )
+
+            return get_json_codec().dumps(raw_payload)
+        return super().to_json()
+
+    if not TYPE_CHECKING:
+        # Only defined at runtime so that type checkers still complain about unknown attributes
+
+        def __getattr__(self, name: str) -> object:
+            # This is only called if the regular lookup fails, i.e. for attributes of lazy updates
+            # that were not parsed yet
+            try:
+                lazy_data = object.__getattribute__(self, "_lazy_data")
+            except AttributeError:  # e.g. objects unpickled from older versions
+                lazy_data = None
+            if not lazy_data or name not in lazy_data:
+                raise AttributeError(
+                    f"'{self.__class__.__name__}' object has no attribute '{name}'"
+                )
+
+            self._materialize(name)
+            return object.__getattribute__(self, name)
+
+    def _materialize(self, *names: str) -> None:
+        """Parses the attributes of a lazy update that were not accessed yet. If no names are
+        passed, all of them are parsed.
+        """
+        lazy_data: Optional[JSONDict] = getattr(self, "_lazy_data", None)
+        if not lazy_data:
+            return
+
+        for name in names or tuple(lazy_data):
+            kind_class = _UPDATE_KINDS[name]
+            # Messages are parsed lazily as well, such that e.g. filters rejecting the update
+            # don't parse the whole message
+            de_json = Message._de_json_lazy if kind_class is Message else kind_class.de_json
+            value = de_json(lazy_data.get(name), self._bot)  # type: ignore[arg-type]
+            with self._unfrozen():
+                setattr(self, name, value)
+            lazy_data.pop(name)
+
+        if not lazy_data:
+            self._lazy_data = None
+
+    def _get_attrs_names(self, include_private: bool) -> Iterable[str]:
+        """Override to parse all attributes of lazy updates first. This makes sure that
+        :meth:`to_dict`, :meth:`__repr__` and pickling work the same as for regular updates.
+        """
+        self._materialize()
+        return super()._get_attrs_names(include_private=include_private)
+
+    def __deepcopy__(self, memodict: Dict[int, object]) -> "Update":
+        """See :meth:`telegram.TelegramObject.__deepcopy__`."""
+        # Must happen before the bot is temporarily removed by super().__deepcopy__
+        self._materialize()
+        return super().__deepcopy__(memodict)
+
+
+def _copy_json(obj: object) -> object:
+    """Copies parsed JSON data. Faster than :func:`copy.deepcopy`, as only dicts and lists need
+    to be copied.
+    """
+    if isinstance(obj, dict):
+        return {key: _copy_json(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_copy_json(value) for value in obj]
+    return obj
+
+
+# Maps the optional attributes of `Update` to the classes that are used to parse them.
+_UPDATE_KINDS: Final[Dict[str, Type[TelegramObject]]] = {
+    Update.MESSAGE: Message,
+    Update.EDITED_MESSAGE: Message,
+    Update.INLINE_QUERY: InlineQuery,
+    Update.CHOSEN_INLINE_RESULT: ChosenInlineResult,
+    Update.CALLBACK_QUERY: CallbackQuery,
+    Update.SHIPPING_QUERY: ShippingQuery,
+    Update.PRE_CHECKOUT_QUERY: PreCheckoutQuery,
+    Update.CHANNEL_POST: Message,
+    Update.EDITED_CHANNEL_POST: Message,
+    Update.POLL: Poll,
+    Update.POLL_ANSWER: PollAnswer,
+    Update.MY_CHAT_MEMBER: ChatMemberUpdated,
+    Update.CHAT_MEMBER: ChatMemberUpdated,
+    Update.CHAT_JOIN_REQUEST: ChatJoinRequest,
+    Update.CHAT_BOOST: ChatBoostUpdated,
+    Update.REMOVED_CHAT_BOOST: ChatBoostRemoved,
+    Update.MESSAGE_REACTION: MessageReactionUpdated,
+    Update.MESSAGE_REACTION_COUNT: MessageReactionCountUpdated,
+    Update.BUSINESS_CONNECTION: BusinessConnection,
+    Update.BUSINESS_MESSAGE: Message,
+    Update.EDITED_BUSINESS_MESSAGE: Message,
+    Update.DELETED_BUSINESS_MESSAGES: BusinessMessagesDeleted,
+}
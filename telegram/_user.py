@@ -19,6 +19,7 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an object that represents a Telegram User."""
 from datetime import datetime
+from functools import partial
 from typing import TYPE_CHECKING, Optional, Sequence, Tuple, Union
 
 from telegram._inline.inlinekeyboardbutton import InlineKeyboardButton
@@ -33,6 +34,7 @@ if TYPE_CHECKING:
     from telegram import (
         Animation,
         Audio,
+        Bot,
         Contact,
         Document,
         InlineKeyboardMarkup,
@@ -180,6 +182,19 @@ class User(TelegramObject):
 
         self._freeze()
 
+    @classmethod
+    def de_json(cls, data: Optional[JSONDict], bot: "Bot") -> Optional["User"]:
+        """See :meth:`telegram.TelegramObject.de_json`.
+
+        .. versionchanged:: NEXT.VERSION
+            If :paramref:`bot` has an :attr:`~telegram.ext.ExtBot.intern_cache`, instances built
+            from identical data are shared.
+        """
+        intern_cache = getattr(bot, "intern_cache", None)
+        if intern_cache is None or not data:
+            return super().de_json(data=data, bot=bot)
+        return intern_cache.get_or_create(cls, data, partial(super().de_json, data=data, bot=bot))
+
     @property
     def name(self) -> str:
         """:obj:`str`: Convenience property. If available, returns the user's :attr:`username`
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains helper functions related to copying objects.
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+from copy import deepcopy
+from typing import Dict, TypeVar
+
+_T = TypeVar("_T")
+
+
+class FrozenSharingMemo(Dict[int, object]):
+    """The memo dictionary passed through :func:`copy.deepcopy` by
+    :func:`deepcopy_sharing_frozen`. :meth:`telegram.TelegramObject.__deepcopy__` checks for this
+    type to decide whether immutable objects may be shared instead of copied.
+    """
+
+    __slots__ = ()
+
+
+def deepcopy_sharing_frozen(obj: _T) -> _T:
+    """Like :func:`copy.deepcopy`, but frozen :class:`telegram.TelegramObject` instances that
+    contain only immutable data are shared between the original and the copy instead of being
+    rebuilt. As these objects can't be changed, this is not observable by the user, but saves
+    a lot of time for large amounts of data.
+
+    Args:
+        obj: The object to copy.
+
+    Returns:
+        The copy.
+    """
+    return deepcopy(obj, FrozenSharingMemo())
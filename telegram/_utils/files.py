@@ -27,7 +27,8 @@ Warning:
     user. Changes to this module are not considered breaking changes and may not be documented in
     the changelog.
 """
-
+import io
+import os
 from pathlib import Path
 from typing import IO, TYPE_CHECKING, Any, Optional, Tuple, Type, TypeVar, Union, cast, overload
 
@@ -61,12 +62,74 @@ def load_file(
     except AttributeError:
         return None, cast(Union[bytes, "InputFile", str, Path], obj)
 
+    return guess_file_name(cast(IO[bytes], obj)), contents
+
+
+def guess_file_name(obj: IO[bytes]) -> Optional[str]:
+    """Returns the name of the file the file handle belongs to, if available."""
     if hasattr(obj, "name") and not isinstance(obj.name, int):
-        filename = Path(obj.name).name
-    else:
-        filename = None
+        return Path(obj.name).name
+    return None
+
+
+class LazyFileReader(io.RawIOBase):
+    """Read-only binary file object for a path that opens the file only when it is read and
+    closes it again once the end of the file was reached. Used to stream uploads from paths
+    without keeping file handles open between the creation of an :class:`telegram.InputFile` and
+    the upload.
+
+    Args:
+        path (:obj:`str` | :class:`pathlib.Path`): The path of the file.
+    """
+
+    __slots__ = ("_file", "_position", "path")
+
+    def __init__(self, path: FilePathInput):
+        super().__init__()
+        self.path: Path = Path(path)
+        self._file: Optional[IO[bytes]] = None
+        self._position: int = 0
+
+    @property
+    def name(self) -> str:
+        return str(self.path)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self.path.stat().st_size
+        self._position = offset
+        return offset
+
+    def readinto(self, buffer: Any) -> int:
+        if self._file is None:
+            self._file = self.path.open("rb")
+        self._file.seek(self._position)
+        size = self._file.readinto(buffer)  # type: ignore[attr-defined]
+        self._position += size
+        if not size:
+            # The file is opened again if it is read after seeking back, e.g. for a retry
+            self._close_file()
+        return size
+
+    def close(self) -> None:
+        self._close_file()
+        super().close()
 
-    return filename, contents
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
 
 def is_local_file(obj: Optional[FilePathInput]) -> bool:
@@ -101,7 +164,8 @@ def parse_file_input(  # pylint: disable=too-many-return-statements
         * if ``local_mode`` is ``True``, adds the ``file://`` prefix. If the input is a relative
         path of a local file, computes the absolute path and adds the ``file://`` prefix.
         * if ``local_mode`` is ``False``, loads the file as binary data and builds an
-          :class:`InputFile` from that
+          :class:`InputFile` from that. The file is not streamed, as the networking backend that
+          will send it is not known here and custom backends may only handle :obj:`bytes`.
 
       Returns the input unchanged, otherwise.
     * :class:`pathlib.Path` objects are treated the same way as strings.
@@ -138,7 +202,7 @@ def parse_file_input(  # pylint: disable=too-many-return-statements
             path = Path(file_input)
             if local_mode:
                 return path.absolute().as_uri()
-            return InputFile(path.open(mode="rb"), filename=filename, attach=attach)
+            return InputFile(path, filename=filename, attach=attach)
 
         return file_input
     if isinstance(file_input, bytes):
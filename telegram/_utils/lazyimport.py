@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains helper functions for resolving the public names of a package lazily.
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import importlib
+import sys
+from typing import Any, Callable, Collection, List, Mapping, Tuple
+
+
+def lazy_namespace(
+    package: str, attributes: Mapping[str, str], submodules: Collection[str] = ()
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Builds the module level ``__getattr__`` and ``__dir__`` functions (:pep:`562`) for a
+    package whose public names are imported only once they are accessed.
+
+    Importing all classes of :mod:`telegram` on start up takes a noticeable amount of time, most
+    of which is spent in modules that a given program never uses. With this, e.g.
+    ``from telegram import Update`` only imports the modules needed for :class:`telegram.Update`.
+    The resolved value is stored in the namespace of the package, such that subsequent lookups
+    don't go through ``__getattr__`` anymore.
+
+    Args:
+        package (:obj:`str`): The name of the package, i.e. ``__name__`` of its ``__init__``.
+        attributes (Mapping[:obj:`str`, :obj:`str`]): Maps each lazily resolved name to the
+            module defining it, relative to :paramref:`package`.
+        submodules (Collection[:obj:`str`], optional): Names of public submodules of
+            :paramref:`package` that are imported on first access.
+
+    Returns:
+        Tuple[Callable, Callable]: The ``__getattr__`` and ``__dir__`` functions.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            value = importlib.import_module(f".{name}", package)
+        else:
+            try:
+                module = attributes[name]
+            except KeyError:
+                raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+            value = getattr(importlib.import_module(module, package), name)
+
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted({*vars(sys.modules[package]), *attributes, *submodules})
+
+    return __getattr__, __dir__
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a descriptor for attributes of Telegram objects that are rarely set.
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+from typing import Any, Dict, Optional, Type
+
+SPARSE_VALUES_SLOT = "_sparse_values"
+
+
+class SparseAttribute:
+    """Data descriptor that stores the value of an attribute in the dictionary
+    ``_sparse_values`` of the instance instead of a dedicated slot. The dictionary is only
+    created once a value other than the default is set.
+
+    Every slot costs 8 bytes per instance, no matter if it's set or not. For classes that have
+    many attributes of which only a few are usually set (e.g. :class:`telegram.Message`), storing
+    the rarely set ones in a shared overflow mapping considerably reduces the memory footprint,
+    while access to the attributes stays the same for the user. Classes using this descriptor
+    must define a ``_sparse_values`` slot.
+
+    Args:
+        default (:obj:`object`, optional): The value returned if the attribute is not set.
+            Defaults to :obj:`None`. Must be immutable.
+    """
+
+    __slots__ = ("default", "name")
+
+    def __init__(self, default: object = None):
+        self.default: object = default
+        self.name: str = ""
+
+    def __set_name__(self, owner: Type[object], name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Optional[object], owner: Optional[Type[object]] = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            values: Optional[Dict[str, object]] = getattr(instance, SPARSE_VALUES_SLOT)
+        except AttributeError:
+            # Instance created via __new__, e.g. while unpickling or copying
+            return self.default
+        if values is None:
+            return self.default
+        return values.get(self.name, self.default)
+
+    def __set__(self, instance: object, value: object) -> None:
+        values: Optional[Dict[str, object]] = getattr(instance, SPARSE_VALUES_SLOT, None)
+        # Empty tuples are what sequence attributes are set to if no value is passed
+        if value is self.default or value is None or (isinstance(value, tuple) and not value):
+            if values:
+                values.pop(self.name, None)
+            return
+        if values is None:
+            values = {}
+            object.__setattr__(instance, SPARSE_VALUES_SLOT, values)
+        values[self.name] = value
+
+    def __delete__(self, instance: object) -> None:
+        values: Optional[Dict[str, object]] = getattr(instance, SPARSE_VALUES_SLOT, None)
+        if not values or self.name not in values:
+            raise AttributeError(self.name)
+        del values[self.name]
@@ -27,6 +27,8 @@ __all__ = (
     "BasePersistence",
     "BaseRateLimiter",
     "BaseUpdateProcessor",
+    "BroadcastResult",
+    "Broadcaster",
     "BusinessConnectionHandler",
     "BusinessMessagesDeletedHandler",
     "CallbackContext",
@@ -43,6 +45,7 @@ __all__ = (
     "DictPersistence",
     "ExtBot",
     "InlineQueryHandler",
+    "InternCache",
     "InvalidCallbackData",
     "Job",
     "JobQueue",
@@ -54,6 +57,8 @@ __all__ = (
     "PollHandler",
     "PreCheckoutQueryHandler",
     "PrefixHandler",
+    "PriorityRateLimiter",
+    "ResponseCache",
     "ShippingQueryHandler",
     "SimpleUpdateProcessor",
     "StringCommandHandler",
@@ -63,40 +68,103 @@ __all__ = (
     "filters",
 )
 
-from . import filters
-from ._aioratelimiter import AIORateLimiter
-from ._application import Application, ApplicationHandlerStop
-from ._applicationbuilder import ApplicationBuilder
-from ._basepersistence import BasePersistence, PersistenceInput
-from ._baseratelimiter import BaseRateLimiter
-from ._baseupdateprocessor import BaseUpdateProcessor, SimpleUpdateProcessor
-from ._callbackcontext import CallbackContext
-from ._callbackdatacache import CallbackDataCache, InvalidCallbackData
-from ._contexttypes import ContextTypes
-from ._defaults import Defaults
-from ._dictpersistence import DictPersistence
-from ._extbot import ExtBot
-from ._handlers.basehandler import BaseHandler
-from ._handlers.businessconnectionhandler import BusinessConnectionHandler
-from ._handlers.businessmessagesdeletedhandler import BusinessMessagesDeletedHandler
-from ._handlers.callbackqueryhandler import CallbackQueryHandler
-from ._handlers.chatboosthandler import ChatBoostHandler
-from ._handlers.chatjoinrequesthandler import ChatJoinRequestHandler
-from ._handlers.chatmemberhandler import ChatMemberHandler
-from ._handlers.choseninlineresulthandler import ChosenInlineResultHandler
-from ._handlers.commandhandler import CommandHandler
-from ._handlers.conversationhandler import ConversationHandler
-from ._handlers.inlinequeryhandler import InlineQueryHandler
-from ._handlers.messagehandler import MessageHandler
-from ._handlers.messagereactionhandler import MessageReactionHandler
-from ._handlers.pollanswerhandler import PollAnswerHandler
-from ._handlers.pollhandler import PollHandler
-from ._handlers.precheckoutqueryhandler import PreCheckoutQueryHandler
-from ._handlers.prefixhandler import PrefixHandler
-from ._handlers.shippingqueryhandler import ShippingQueryHandler
-from ._handlers.stringcommandhandler import StringCommandHandler
-from ._handlers.stringregexhandler import StringRegexHandler
-from ._handlers.typehandler import TypeHandler
-from ._jobqueue import Job, JobQueue
-from ._picklepersistence import PicklePersistence
-from ._updater import Updater
+from typing import TYPE_CHECKING
+
+from telegram._utils.lazyimport import lazy_namespace
+
+# See the comment in telegram/__init__.py
+if TYPE_CHECKING:
+    from . import filters
+    from ._aioratelimiter import AIORateLimiter
+    from ._application import Application, ApplicationHandlerStop
+    from ._applicationbuilder import ApplicationBuilder
+    from ._basepersistence import BasePersistence, PersistenceInput
+    from ._baseratelimiter import BaseRateLimiter
+    from ._baseupdateprocessor import BaseUpdateProcessor, SimpleUpdateProcessor
+    from ._broadcaster import Broadcaster, BroadcastResult
+    from ._callbackcontext import CallbackContext
+    from ._callbackdatacache import CallbackDataCache, InvalidCallbackData
+    from ._contexttypes import ContextTypes
+    from ._defaults import Defaults
+    from ._dictpersistence import DictPersistence
+    from ._extbot import ExtBot
+    from ._handlers.basehandler import BaseHandler
+    from ._handlers.businessconnectionhandler import BusinessConnectionHandler
+    from ._handlers.businessmessagesdeletedhandler import BusinessMessagesDeletedHandler
+    from ._handlers.callbackqueryhandler import CallbackQueryHandler
+    from ._handlers.chatboosthandler import ChatBoostHandler
+    from ._handlers.chatjoinrequesthandler import ChatJoinRequestHandler
+    from ._handlers.chatmemberhandler import ChatMemberHandler
+    from ._handlers.choseninlineresulthandler import ChosenInlineResultHandler
+    from ._handlers.commandhandler import CommandHandler
+    from ._handlers.conversationhandler import ConversationHandler
+    from ._handlers.inlinequeryhandler import InlineQueryHandler
+    from ._handlers.messagehandler import MessageHandler
+    from ._handlers.messagereactionhandler import MessageReactionHandler
+    from ._handlers.pollanswerhandler import PollAnswerHandler
+    from ._handlers.pollhandler import PollHandler
+    from ._handlers.precheckoutqueryhandler import PreCheckoutQueryHandler
+    from ._handlers.prefixhandler import PrefixHandler
+    from ._handlers.shippingqueryhandler import ShippingQueryHandler
+    from ._handlers.stringcommandhandler import StringCommandHandler
+    from ._handlers.stringregexhandler import StringRegexHandler
+    from ._handlers.typehandler import TypeHandler
+    from ._interncache import InternCache
+    from ._jobqueue import Job, JobQueue
+    from ._picklepersistence import PicklePersistence
+    from ._priorityratelimiter import PriorityRateLimiter
+    from ._responsecache import ResponseCache
+    from ._updater import Updater
+
+__getattr__, __dir__ = lazy_namespace(
+    __name__,
+    {
+        "AIORateLimiter": "._aioratelimiter",
+        "Application": "._application",
+        "ApplicationBuilder": "._applicationbuilder",
+        "ApplicationHandlerStop": "._application",
+        "BaseHandler": "._handlers.basehandler",
+        "BasePersistence": "._basepersistence",
+        "BaseRateLimiter": "._baseratelimiter",
+        "BaseUpdateProcessor": "._baseupdateprocessor",
+        "BroadcastResult": "._broadcaster",
+        "Broadcaster": "._broadcaster",
+        "BusinessConnectionHandler": "._handlers.businessconnectionhandler",
+        "BusinessMessagesDeletedHandler": "._handlers.businessmessagesdeletedhandler",
+        "CallbackContext": "._callbackcontext",
+        "CallbackDataCache": "._callbackdatacache",
+        "CallbackQueryHandler": "._handlers.callbackqueryhandler",
+        "ChatBoostHandler": "._handlers.chatboosthandler",
+        "ChatJoinRequestHandler": "._handlers.chatjoinrequesthandler",
+        "ChatMemberHandler": "._handlers.chatmemberhandler",
+        "ChosenInlineResultHandler": "._handlers.choseninlineresulthandler",
+        "CommandHandler": "._handlers.commandhandler",
+        "ContextTypes": "._contexttypes",
+        "ConversationHandler": "._handlers.conversationhandler",
+        "Defaults": "._defaults",
+        "DictPersistence": "._dictpersistence",
+        "ExtBot": "._extbot",
+        "InlineQueryHandler": "._handlers.inlinequeryhandler",
+        "InternCache": "._interncache",
+        "InvalidCallbackData": "._callbackdatacache",
+        "Job": "._jobqueue",
+        "JobQueue": "._jobqueue",
+        "MessageHandler": "._handlers.messagehandler",
+        "MessageReactionHandler": "._handlers.messagereactionhandler",
+        "PersistenceInput": "._basepersistence",
+        "PicklePersistence": "._picklepersistence",
+        "PollAnswerHandler": "._handlers.pollanswerhandler",
+        "PollHandler": "._handlers.pollhandler",
+        "PreCheckoutQueryHandler": "._handlers.precheckoutqueryhandler",
+        "PrefixHandler": "._handlers.prefixhandler",
+        "PriorityRateLimiter": "._priorityratelimiter",
+        "ResponseCache": "._responsecache",
+        "ShippingQueryHandler": "._handlers.shippingqueryhandler",
+        "SimpleUpdateProcessor": "._baseupdateprocessor",
+        "StringCommandHandler": "._handlers.stringcommandhandler",
+        "StringRegexHandler": "._handlers.stringregexhandler",
+        "TypeHandler": "._handlers.typehandler",
+        "Updater": "._updater",
+    },
+    submodules=("filters",),
+)
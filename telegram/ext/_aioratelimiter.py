@@ -48,6 +48,36 @@ else:
         yield None
 
 
+
+def start_cooldown(
+    cooldowns: Dict[Union[str, int], float], chat_id: Union[str, int], duration: float
+) -> int:
+    """Halts the requests for the chat for ``duration`` seconds by updating ``cooldowns``, which
+    maps chat ids to the loop time when they may be used again. Returns the number of chats that
+    are cooling down.
+    """
+    now = asyncio.get_running_loop().time()
+    # Drop the cooldowns that have expired, so that only the active ones are counted
+    for key, until in cooldowns.copy().items():
+        if until <= now:
+            del cooldowns[key]
+    cooldowns[chat_id] = max(cooldowns.get(chat_id, now), now + duration)
+    return len(cooldowns)
+
+
+async def wait_for_cooldown(
+    cooldowns: Dict[Union[str, int], float], chat_id: Union[str, int]
+) -> None:
+    """Waits until the cooldown of the chat started by ``start_cooldown`` is over."""
+    loop = asyncio.get_running_loop()
+    # The cooldown may be extended while we wait, so we check again after sleeping
+    while (until := cooldowns.get(chat_id)) is not None:
+        if until <= loop.time():
+            cooldowns.pop(chat_id, None)
+            return
+        await asyncio.sleep(until - loop.time())
+
+
 _LOGGER = get_logger(__name__, class_name="AIORateLimiter")
 
 
@@ -82,10 +112,12 @@ class AIORateLimiter(BaseRateLimiter[int]):
           exceeding the rate limit.
         * As channels can't be differentiated from supergroups by the ``@username`` or integer
           ``chat_id``, this also applies the group related rate limits to channels.
-        * A :exc:`~telegram.error.RetryAfter` exception will halt *all* requests for
-          :attr:`~telegram.error.RetryAfter.retry_after` + 0.1 seconds. This may be stricter than
-          necessary in some cases, e.g. the bot may hit a rate limit in one group but might still
-          be allowed to send messages in another group.
+        * A :exc:`~telegram.error.RetryAfter` exception for a request with a ``chat_id`` halts
+          only the requests for that chat for :attr:`~telegram.error.RetryAfter.retry_after` + 0.1
+          seconds, as the bot may hit a rate limit in one group but might still be allowed to send
+          messages in another group. If :paramref:`global_cooldown_threshold` chats are cooling
+          down at the same time, or if the request has no ``chat_id``, *all* requests are halted
+          instead.
 
     Note:
         This class is to be understood as minimal effort reference implementation.
@@ -113,11 +145,20 @@ class AIORateLimiter(BaseRateLimiter[int]):
         max_retries (:obj:`int`): The maximum number of retries to be made in case of a
             :exc:`~telegram.error.RetryAfter` exception.
             If set to 0, no retries will be made. Defaults to ``0``.
+        global_cooldown_threshold (:obj:`int`): The number of chats that may cool down after a
+            :exc:`~telegram.error.RetryAfter` exception at the same time before *all* requests are
+            halted, as the bot is then most likely hitting the overall rate limit. If set to 1,
+            every :exc:`~telegram.error.RetryAfter` exception halts all requests. Defaults to
+            ``5``.
+
+            .. versionadded:: NEXT.VERSION
 
     """
 
     __slots__ = (
         "_base_limiter",
+        "_cooldowns",
+        "_global_cooldown_threshold",
         "_group_limiters",
         "_group_max_rate",
         "_group_time_period",
@@ -132,6 +173,7 @@ class AIORateLimiter(BaseRateLimiter[int]):
         group_max_rate: float = 20,
         group_time_period: float = 60,
         max_retries: int = 0,
+        global_cooldown_threshold: int = 5,
     ) -> None:
         if not AIO_LIMITER_AVAILABLE:
             raise RuntimeError(
@@ -156,6 +198,9 @@ class AIORateLimiter(BaseRateLimiter[int]):
         self._max_retries: int = max_retries
         self._retry_after_event = asyncio.Event()
         self._retry_after_event.set()
+        # Maps the chat ids that hit a RetryAfter to the loop time when they may be used again
+        self._cooldowns: Dict[Union[str, int], float] = {}
+        self._global_cooldown_threshold: int = global_cooldown_threshold
 
     async def initialize(self) -> None:
         """Does nothing."""
@@ -186,6 +231,7 @@ class AIORateLimiter(BaseRateLimiter[int]):
     async def _run_request(
         self,
         chat: bool,
+        chat_id: Optional[Union[str, int]],
         group: Union[str, int, bool],
         callback: Callable[..., Coroutine[Any, Any, Union[bool, JSONDict, List[JSONDict]]]],
         args: Any,
@@ -196,6 +242,10 @@ class AIORateLimiter(BaseRateLimiter[int]):
             self._get_group_limiter(group) if group and self._group_max_rate else null_context()
         )
 
+        if chat_id is not None and self._cooldowns:
+            # In case a retry_after was hit for this chat, we wait before using up the capacity
+            await wait_for_cooldown(self._cooldowns, chat_id)
+
         async with group_context, base_context:
             # In case a retry_after was hit, we wait with processing the request
             await self._retry_after_event.wait()
@@ -243,7 +293,12 @@ class AIORateLimiter(BaseRateLimiter[int]):
         for i in range(max_retries + 1):
             try:
                 return await self._run_request(
-                    chat=chat, group=group, callback=callback, args=args, kwargs=kwargs
+                    chat=chat,
+                    chat_id=chat_id,
+                    group=group,
+                    callback=callback,
+                    args=args,
+                    kwargs=kwargs,
                 )
             except RetryAfter as exc:
                 if i == max_retries:
@@ -253,11 +308,23 @@ class AIORateLimiter(BaseRateLimiter[int]):
                     raise exc
 
                 sleep = exc.retry_after + 0.1
-                _LOGGER.info("Rate limit hit. Retrying after %f seconds", sleep)
-                # Make sure we don't allow other requests to be processed
-                self._retry_after_event.clear()
-                await asyncio.sleep(sleep)
-            finally:
-                # Allow other requests to be processed
-                self._retry_after_event.set()
+                # Without a chat, we can't tell what the rate limit applies to
+                if (
+                    not chat
+                    or start_cooldown(self._cooldowns, chat_id, sleep)
+                    >= self._global_cooldown_threshold
+                ):
+                    _LOGGER.info("Rate limit hit. Retrying after %f seconds", sleep)
+                    # Make sure we don't allow other requests to be processed
+                    self._retry_after_event.clear()
+                    try:
+                        await asyncio.sleep(sleep)
+                    finally:
+                        # Allow other requests to be processed
+                        self._retry_after_event.set()
+                else:
+                    _LOGGER.info(
+                        "Rate limit hit for chat %s. Retrying after %f seconds", chat_id, sleep
+                    )
+                    await asyncio.sleep(sleep)
         return None  # type: ignore[return-value]
@@ -52,6 +52,7 @@ from typing import (
 )
 
 from telegram._update import Update
+from telegram._utils.copying import deepcopy_sharing_frozen
 from telegram._utils.defaultvalue import (
     DEFAULT_80,
     DEFAULT_IP,
@@ -1234,6 +1235,10 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
             Persistence is now updated in an interval set by
             :attr:`telegram.ext.BasePersistence.update_interval`.
 
+        .. versionchanged:: NEXT.VERSION
+            Passes the update to :meth:`telegram.ext.ResponseCache.process_update`, if
+            :attr:`telegram.ext.ExtBot.response_cache` is set.
+
         Args:
             update (:class:`telegram.Update` | :obj:`object` | \
                 :class:`telegram.error.TelegramError`): The update to process.
@@ -1244,6 +1249,9 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         # Processing updates before initialize() is a problem e.g. if persistence is used
         self._check_initialized()
 
+        if isinstance(self.bot, ExtBot) and self.bot.response_cache is not None:
+            self.bot.response_cache.process_update(update)
+
         context = None
         any_blocking = False  # Flag which is set to True if any handler specifies block=True
 
@@ -1609,6 +1617,7 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         Note:
             Any data is deep copied with :func:`copy.deepcopy` before handing it over to the
             persistence in order to avoid race conditions, so all persisted data must be copyable.
+            See also :paramref:`telegram.ext.BasePersistence.share_frozen_objects`.
 
         .. seealso:: :attr:`telegram.ext.BasePersistence.update_interval`,
             :meth:`mark_data_for_update_persistence`
@@ -1623,6 +1632,9 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         _LOGGER.debug("Starting next run of updating the persistence.")
 
         coroutines: Set[Coroutine] = set()
+        copy_data: Callable[[Any], Any] = deepcopy
+        if self.persistence.share_frozen_objects:
+            copy_data = deepcopy_sharing_frozen
 
         # Mypy doesn't know that persistence.set_bot (see above) already checks that
         # self.bot is an instance of ExtBot if callback_data should be stored ...
@@ -1631,14 +1643,14 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         ):
             coroutines.add(
                 self.persistence.update_callback_data(
-                    deepcopy(
+                    copy_data(
                         self.bot.callback_data_cache.persistence_data  # type: ignore[attr-defined]
                     )
                 )
             )
 
         if self.persistence.store_data.bot_data:
-            coroutines.add(self.persistence.update_bot_data(deepcopy(self.bot_data)))
+            coroutines.add(self.persistence.update_bot_data(copy_data(self.bot_data)))
 
         if self.persistence.store_data.chat_data:
             update_ids = self._chat_ids_to_be_updated_in_persistence
@@ -1651,7 +1663,7 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
 
             for chat_id in update_ids:
                 coroutines.add(
-                    self.persistence.update_chat_data(chat_id, deepcopy(self.chat_data[chat_id]))
+                    self.persistence.update_chat_data(chat_id, copy_data(self.chat_data[chat_id]))
                 )
             for chat_id in delete_ids:
                 coroutines.add(self.persistence.drop_chat_data(chat_id))
@@ -1667,7 +1679,7 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
 
             for user_id in update_ids:
                 coroutines.add(
-                    self.persistence.update_user_data(user_id, deepcopy(self.user_data[user_id]))
+                    self.persistence.update_user_data(user_id, copy_data(self.user_data[user_id]))
                 )
             for user_id in delete_ids:
                 coroutines.add(self.persistence.drop_user_data(user_id))
@@ -52,7 +52,13 @@ from telegram.warnings import PTBDeprecationWarning
 
 if TYPE_CHECKING:
     from telegram import Update
-    from telegram.ext import BasePersistence, BaseRateLimiter, CallbackContext, Defaults
+    from telegram.ext import (
+        BasePersistence,
+        BaseRateLimiter,
+        CallbackContext,
+        Defaults,
+        ResponseCache,
+    )
     from telegram.ext._utils.types import RLARGS
 
 # Type hinting is a bit complicated here because we try to get to a sane level of
@@ -72,6 +78,7 @@ _BOT_CHECKS = [
     ("request", "request instance"),
     ("get_updates_request", "get_updates_request instance"),
     ("connection_pool_size", "connection_pool_size"),
+    ("max_connection_pool_size", "max_connection_pool_size"),
     ("proxy", "proxy"),
     ("socket_options", "socket_options"),
     ("pool_timeout", "pool_timeout"),
@@ -96,6 +103,11 @@ _BOT_CHECKS = [
     ("private_key", "private_key"),
     ("rate_limiter", "rate_limiter instance"),
     ("local_mode", "local_mode setting"),
+    ("lazy_updates", "lazy_updates setting"),
+    ("keep_raw_payloads", "keep_raw_payloads setting"),
+    ("intern_objects", "intern_objects setting"),
+    ("coalesce_requests", "coalesce_requests setting"),
+    ("response_cache", "response_cache instance"),
 ]
 
 _TWO_ARGS_REQ = "The parameter `{}` may only be set, if no {} was set."
@@ -137,6 +149,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_base_file_url",
         "_base_url",
         "_bot",
+        "_coalesce_requests",
         "_connect_timeout",
         "_connection_pool_size",
         "_context_types",
@@ -151,8 +164,12 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_get_updates_socket_options",
         "_get_updates_write_timeout",
         "_http_version",
+        "_intern_objects",
         "_job_queue",
+        "_keep_raw_payloads",
+        "_lazy_updates",
         "_local_mode",
+        "_max_connection_pool_size",
         "_media_write_timeout",
         "_persistence",
         "_pool_timeout",
@@ -165,6 +182,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_rate_limiter",
         "_read_timeout",
         "_request",
+        "_response_cache",
         "_socket_options",
         "_token",
         "_update_processor",
@@ -178,6 +196,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._base_url: DVType[str] = DefaultValue("https://api.telegram.org/bot")
         self._base_file_url: DVType[str] = DefaultValue("https://api.telegram.org/file/bot")
         self._connection_pool_size: DVInput[int] = DEFAULT_NONE
+        self._max_connection_pool_size: DVInput[int] = DEFAULT_NONE
         self._proxy: DVInput[Union[str, httpx.Proxy, httpx.URL]] = DEFAULT_NONE
         self._socket_options: DVInput[Collection[SocketOpt]] = DEFAULT_NONE
         self._connect_timeout: ODVInput[float] = DEFAULT_NONE
@@ -200,6 +219,11 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._defaults: ODVInput[Defaults] = DEFAULT_NONE
         self._arbitrary_callback_data: Union[DefaultValue[bool], int] = DEFAULT_FALSE
         self._local_mode: DVType[bool] = DEFAULT_FALSE
+        self._lazy_updates: DVType[bool] = DEFAULT_FALSE
+        self._keep_raw_payloads: DVType[bool] = DEFAULT_FALSE
+        self._intern_objects: Union[DefaultValue[bool], int] = DEFAULT_FALSE
+        self._coalesce_requests: DVType[bool] = DEFAULT_FALSE
+        self._response_cache: ODVInput[ResponseCache] = DEFAULT_NONE
         self._bot: DVInput[Bot] = DEFAULT_NONE
         self._update_queue: DVType[Queue[Union[Update, object]]] = DefaultValue(Queue())
 
@@ -231,11 +255,13 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
 
         proxy = DefaultValue.get_value(getattr(self, f"{prefix}proxy"))
         socket_options = DefaultValue.get_value(getattr(self, f"{prefix}socket_options"))
+        max_connection_pool_size: Optional[int] = None
         if get_updates:
             connection_pool_size = (
                 DefaultValue.get_value(getattr(self, f"{prefix}connection_pool_size")) or 1
             )
         else:
+            max_connection_pool_size = DefaultValue.get_value(self._max_connection_pool_size)
             connection_pool_size = (
                 DefaultValue.get_value(getattr(self, f"{prefix}connection_pool_size")) or 256
             )
@@ -263,6 +289,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             http_version=http_version,  # type: ignore[arg-type]
             socket_options=socket_options,
             **effective_timeouts,
+            max_connection_pool_size=max_connection_pool_size,
         )
 
     def _build_ext_bot(self) -> ExtBot:
@@ -281,6 +308,11 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             get_updates_request=self._build_request(get_updates=True),
             rate_limiter=DefaultValue.get_value(self._rate_limiter),
             local_mode=DefaultValue.get_value(self._local_mode),
+            lazy_updates=DefaultValue.get_value(self._lazy_updates),
+            keep_raw_payloads=DefaultValue.get_value(self._keep_raw_payloads),
+            intern_objects=DefaultValue.get_value(self._intern_objects),
+            coalesce_requests=DefaultValue.get_value(self._coalesce_requests),
+            response_cache=DefaultValue.get_value(self._response_cache),
         )
 
     def _bot_check(self, name: str) -> None:
@@ -296,7 +328,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
     ) -> Application[BT, CCT, UD, CD, BD, JQ]:
         """Builds a :class:`telegram.ext.Application` with the provided arguments.
 
-        Calls :meth:`telegram.ext.JobQueue.set_application` and
+        Calls :meth:`telegram.ext.JobQueue.set_application`,
         :meth:`telegram.ext.BasePersistence.set_bot` if appropriate.
 
         Returns:
@@ -444,6 +476,9 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         if not isinstance(getattr(self, f"_{prefix}connection_pool_size"), DefaultValue):
             raise RuntimeError(_TWO_ARGS_REQ.format(name, "connection_pool_size"))
 
+        if not get_updates and not isinstance(self._max_connection_pool_size, DefaultValue):
+            raise RuntimeError(_TWO_ARGS_REQ.format(name, "max_connection_pool_size"))
+
         if not isinstance(getattr(self, f"_{prefix}proxy"), DefaultValue):
             raise RuntimeError(_TWO_ARGS_REQ.format(name, "proxy"))
 
@@ -513,6 +548,33 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._connection_pool_size = connection_pool_size
         return self
 
+    def max_connection_pool_size(self: BuilderType, max_connection_pool_size: int) -> BuilderType:
+        """Sets the maximal size of an adaptive connection pool for the
+        :paramref:`~telegram.request.HTTPXRequest.max_connection_pool_size` parameter of
+        :attr:`telegram.Bot.request`. If this is set, :meth:`connection_pool_size` is the
+        minimal size of the pool.
+
+        Tip:
+            This allows the pool to follow the load caused by
+            :meth:`concurrent_updates` instead of having to choose a fixed size up front.
+
+        Note:
+            :meth:`connection_pool_size` still defaults to ``256``, so you'll have to set it
+            explicitly if the pool should start smaller, e.g.
+            ``builder.connection_pool_size(8).max_connection_pool_size(256)``.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            max_connection_pool_size (:obj:`int`): The maximal size of the connection pool.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._request_param_check(name="max_connection_pool_size", get_updates=False)
+        self._max_connection_pool_size = max_connection_pool_size
+        return self
+
     def proxy_url(self: BuilderType, proxy_url: str) -> BuilderType:
         """Legacy name for :meth:`proxy`, kept for backward compatibility.
 
@@ -1038,6 +1100,122 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._local_mode = local_mode
         return self
 
+    def lazy_updates(self: BuilderType, lazy_updates: bool) -> BuilderType:
+        """Specifies the value for :paramref:`~telegram.ext.ExtBot.lazy_updates` for the
+        :attr:`telegram.ext.Application.bot`.
+        If not called, will default to :obj:`False`.
+
+        Tip:
+            Lazy updates are useful if many of the incoming updates are not handled by any
+            handler, as the content of these updates is never parsed.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            lazy_updates (:obj:`bool`): Whether the bot should parse updates lazily.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("lazy_updates")
+        self._updater_check("lazy_updates")
+        self._lazy_updates = lazy_updates
+        return self
+
+    def keep_raw_payloads(self: BuilderType, keep_raw_payloads: bool) -> BuilderType:
+        """Specifies the value for :paramref:`~telegram.ext.ExtBot.keep_raw_payloads` for the
+        :attr:`telegram.ext.Application.bot`.
+        If not called, will default to :obj:`False`.
+
+        Tip:
+            Keeping the raw payloads is useful if updates are archived or forwarded as JSON, as
+            :meth:`telegram.Update.to_json` then doesn't need to serialize the update again. In
+            exchange, the received data is kept in memory as long as the update.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            keep_raw_payloads (:obj:`bool`): Whether the bot should keep the raw payloads of
+                updates.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("keep_raw_payloads")
+        self._updater_check("keep_raw_payloads")
+        self._keep_raw_payloads = keep_raw_payloads
+        return self
+
+    def intern_objects(self: BuilderType, intern_objects: Union[bool, int]) -> BuilderType:
+        """Specifies the value for :paramref:`~telegram.ext.ExtBot.intern_objects` for the
+        :attr:`telegram.ext.Application.bot`.
+        If not called, will default to :obj:`False`.
+
+        Tip:
+            Interning is useful if the same users and chats send many updates, e.g. in busy
+            groups. The hit rate can be checked via :attr:`telegram.ext.ExtBot.intern_cache`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            intern_objects (:obj:`bool` | :obj:`int`): If :obj:`True` is passed, the default cache
+                size of ``1024`` will be used. Pass an integer to specify a different cache size.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("intern_objects")
+        self._updater_check("intern_objects")
+        self._intern_objects = intern_objects
+        return self
+
+    def coalesce_requests(self: BuilderType, coalesce_requests: bool) -> BuilderType:
+        """Specifies the value for :paramref:`~telegram.ext.ExtBot.coalesce_requests` for the
+        :attr:`telegram.ext.Application.bot`.
+        If not called, will default to :obj:`False`.
+
+        Tip:
+            Coalescing requests is useful if many handlers fetch the same data at the same time,
+            e.g. :meth:`~telegram.Bot.get_chat_member` for the sender of each message in a busy
+            group.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            coalesce_requests (:obj:`bool`): Whether concurrent identical calls of read-only bot
+                methods should share a single request.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("coalesce_requests")
+        self._updater_check("coalesce_requests")
+        self._coalesce_requests = coalesce_requests
+        return self
+
+    def response_cache(self: BuilderType, response_cache: "ResponseCache") -> BuilderType:
+        """Sets a :class:`telegram.ext.ResponseCache` to be used for the
+        :paramref:`~telegram.ext.ExtBot.response_cache` of the
+        :attr:`telegram.ext.Application.bot`.
+
+        Tip:
+            Caching is useful e.g. if permission checks call
+            :meth:`~telegram.Bot.get_chat_member` for many incoming messages. The hit rate can be
+            checked via :attr:`telegram.ext.ResponseCache.hits`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            response_cache (:class:`telegram.ext.ResponseCache`): The cache.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("response_cache")
+        self._updater_check("response_cache")
+        self._response_cache = response_cache
+        return self
+
     def bot(
         self: "ApplicationBuilder[BT, CCT, UD, CD, BD, JQ]",
         bot: InBT,
@@ -131,6 +131,15 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
             seconds.
 
             .. versionadded:: 20.0
+        share_frozen_objects (:obj:`bool`, optional): Before handing data over to the
+            persistence, the :class:`~telegram.ext.Application` copies it with
+            :func:`copy.deepcopy`. If this is :obj:`True`, frozen
+            :class:`telegram.TelegramObject` instances that contain only immutable data are
+            shared between the data and its copy instead of being copied. This considerably
+            speeds up copying data that contains many such objects, e.g. stored
+            :class:`telegram.Message` objects. Defaults to :obj:`False`.
+
+            .. versionadded:: NEXT.VERSION
     Attributes:
         store_data (:class:`~telegram.ext.PersistenceInput`): Specifies which kinds of data will
             be saved by this persistence instance.
@@ -138,6 +147,7 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
     """
 
     __slots__ = (
+        "_share_frozen_objects",
         "_update_interval",
         "bot",
         "store_data",
@@ -147,9 +157,12 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
         self,
         store_data: Optional[PersistenceInput] = None,
         update_interval: float = 60,
+        *,
+        share_frozen_objects: bool = False,
     ):
         self.store_data: PersistenceInput = store_data or PersistenceInput()
         self._update_interval: float = update_interval
+        self._share_frozen_objects: bool = share_frozen_objects
 
         self.bot: Bot = None  # type: ignore[assignment]
 
@@ -168,6 +181,16 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
             "You can not assign a new value to update_interval after initialization."
         )
 
+    @property
+    def share_frozen_objects(self) -> bool:
+        """:obj:`bool`: Whether immutable :class:`telegram.TelegramObject` instances are shared
+        instead of copied when the :class:`~telegram.ext.Application` copies the data before
+        handing it over to the persistence.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._share_frozen_objects
+
     def set_bot(self, bot: Bot) -> None:
         """Set the Bot to be used by this persistence instance.
 
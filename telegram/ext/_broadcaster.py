@@ -0,0 +1,420 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the Broadcaster class, which sends a message to many chats."""
+import asyncio
+import inspect
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    final,
+)
+
+from telegram._utils.logging import get_logger
+from telegram._utils.types import JSONDict
+from telegram.error import BadRequest, ChatMigrated, Forbidden, NetworkError, RetryAfter
+
+_LOGGER = get_logger(__name__, class_name="Broadcaster")
+
+ChatID = Union[int, str]
+
+
+@final
+@dataclass(repr=True, eq=False, order=False, frozen=True)
+class BroadcastResult:
+    """Describes the outcome of sending a broadcast to a single chat, see :class:`Broadcaster`.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        chat_id (:obj:`int` | :obj:`str`): The chat id as passed to the :class:`Broadcaster`.
+        status (:obj:`str`): One of :attr:`SENT`, :attr:`FORBIDDEN` and :attr:`FAILED`.
+        attempts (:obj:`int`): The number of times the message was tried to be sent.
+        result (:obj:`object`): The return value of the send callback, e.g. a
+            :class:`telegram.Message`. :obj:`None`, unless the status is :attr:`SENT`.
+        error (:exc:`Exception` | :obj:`None`): The exception raised by the last attempt, if
+            the message could not be sent.
+        new_chat_id (:obj:`int` | :obj:`None`): The id of the supergroup that the chat was
+            migrated to, if the send callback raised :exc:`telegram.error.ChatMigrated`.
+
+    Attributes:
+        chat_id (:obj:`int` | :obj:`str`): The chat id as passed to the :class:`Broadcaster`.
+        status (:obj:`str`): One of :attr:`SENT`, :attr:`FORBIDDEN` and :attr:`FAILED`.
+        attempts (:obj:`int`): The number of times the message was tried to be sent.
+        result (:obj:`object`): The return value of the send callback, if any.
+        error (:exc:`Exception` | :obj:`None`): The exception raised by the last attempt, if
+            any.
+        new_chat_id (:obj:`int` | :obj:`None`): The id of the supergroup that the chat was
+            migrated to, if any.
+    """
+
+    __slots__ = ("attempts", "chat_id", "error", "new_chat_id", "result", "status")
+
+    SENT: ClassVar[str] = "sent"
+    """:obj:`str`: The message was sent."""
+    FORBIDDEN: ClassVar[str] = "forbidden"
+    """:obj:`str`: The bot may not send messages to the chat, e.g. because the user blocked the
+    bot or the bot was removed from the group. See :exc:`telegram.error.Forbidden`."""
+    FAILED: ClassVar[str] = "failed"
+    """:obj:`str`: The message could not be sent for another reason."""
+
+    chat_id: ChatID
+    status: str
+    attempts: int
+    result: object
+    error: Optional[Exception]
+    new_chat_id: Optional[int]
+
+
+class Broadcaster:
+    """Sends the same message to many chats, e.g. for announcements.
+
+    The message is sent by calling :paramref:`send` for every chat id. At most
+    :paramref:`max_concurrency` messages are sent at the same time and at most
+    :paramref:`max_rate` messages are sent per second, which keeps the bot within the
+    `limits of Telegram <https://core.telegram.org/bots/faq#my-bot-is-hitting-limits-how-do-i\
+-avoid-this>`_. Errors are handled as follows:
+
+    * :exc:`~telegram.error.RetryAfter` pauses *all* sends for the requested time. Afterwards,
+      the message is sent to the chat again.
+    * :exc:`~telegram.error.ChatMigrated` makes the message be sent to the new supergroup. This
+      does not count as retry.
+    * :exc:`~telegram.error.Forbidden` is recorded as :attr:`BroadcastResult.FORBIDDEN` without
+      retrying.
+    * :exc:`~telegram.error.NetworkError`, including :exc:`~telegram.error.TimedOut` but
+      excluding :exc:`~telegram.error.BadRequest`, is retried after an exponentially growing
+      delay.
+    * All other exceptions are recorded as :attr:`BroadcastResult.FAILED` without retrying.
+
+    The outcome for every chat is passed to :paramref:`result_callback`, e.g. to mark users that
+    blocked the bot in a database.
+
+    Example:
+        .. code-block:: python
+
+            async def send(chat_id):
+                return await bot.send_message(chat_id, "We have a new feature!")
+
+            broadcaster = Broadcaster(send, chat_ids, progress_callback=print)
+            await broadcaster.run()
+
+    A broadcast can be stopped via :meth:`stop` and resumed later by passing the
+    :attr:`checkpoint` of the stopped broadcast to a new :class:`Broadcaster` with the same chat
+    ids in the same order. The checkpoint only covers chats whose outcome is known, so that no
+    chat is skipped. :attr:`checkpoint` can also be stored regularly, e.g. from
+    :paramref:`progress_callback`, to resume a broadcast after a crash.
+
+    Note:
+        * If the bot uses a :class:`~telegram.ext.BaseRateLimiter`, e.g.
+          :class:`~telegram.ext.AIORateLimiter`, it applies in addition to the limits of this
+          class. Consider passing ``max_rate=0`` in that case.
+        * A message may be delivered more than once if a request timed out after Telegram
+          received it. Pass ``max_retries=0`` if this is not acceptable.
+        * Every chat id should be contained only once in :paramref:`chat_ids`.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        send (Callable[[:obj:`int` | :obj:`str`], :term:`awaitable`]): A coroutine function that
+            sends the message to the chat with the given id, e.g. by calling
+            :meth:`telegram.Bot.send_message`. The return value is stored in
+            :attr:`BroadcastResult.result`.
+        chat_ids (Iterable[:obj:`int` | :obj:`str`] | AsyncIterable[:obj:`int` | :obj:`str`]):
+            The ids of the chats to send the message to. Iterated only once and lazily, so this
+            may e.g. be an async generator reading from a database.
+        max_concurrency (:obj:`int`, optional): The maximum number of messages to send
+            concurrently. Defaults to ``8``.
+        max_rate (:obj:`float`, optional): The maximum number of messages to send per second,
+            including retries. ``0`` disables the limit. Defaults to ``25``, which leaves some
+            room below the global limit of ``30`` messages per second for other requests of the
+            bot.
+        max_retries (:obj:`int`, optional): The maximum number of retries per chat in case of
+            :exc:`~telegram.error.RetryAfter` and network errors. Defaults to ``3``.
+        retry_interval (:obj:`float`, optional): The delay in seconds before the first retry
+            after a network error. The delay is doubled for every further retry. Defaults to
+            ``1``.
+        result_callback (Callable[[:class:`BroadcastResult`], :obj:`None` | :term:`awaitable`],\
+            optional): Called with the outcome for every chat.
+        progress_callback (Callable[[:class:`Broadcaster`], :obj:`None` | :term:`awaitable`],\
+            optional): Called at most every :paramref:`progress_interval` seconds while the
+            broadcast runs and once when it ends.
+        progress_interval (:obj:`float`, optional): See :paramref:`progress_callback`. Defaults
+            to ``5``.
+        checkpoint (Mapping[:obj:`str`, :obj:`object`], optional): The :attr:`checkpoint` of a
+            previous broadcast to the same chat ids, which should be resumed.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`max_concurrency` is not positive or
+            :paramref:`max_rate`, :paramref:`max_retries` or :paramref:`retry_interval` are
+            negative.
+    """
+
+    __slots__ = (
+        "_chat_ids",
+        "_completed",
+        "_counts",
+        "_in_flight",
+        "_interval",
+        "_iterator",
+        "_iterator_lock",
+        "_last_progress",
+        "_max_concurrency",
+        "_max_retries",
+        "_next_index",
+        "_next_slot",
+        "_paused_until",
+        "_position",
+        "_progress_callback",
+        "_progress_interval",
+        "_result_callback",
+        "_retry_interval",
+        "_running",
+        "_send",
+        "_stopped",
+    )
+
+    def __init__(
+        self,
+        send: Callable[[ChatID], Awaitable[object]],
+        chat_ids: Union[Iterable[ChatID], AsyncIterable[ChatID]],
+        max_concurrency: int = 8,
+        max_rate: float = 25,
+        max_retries: int = 3,
+        retry_interval: float = 1,
+        result_callback: Optional[Callable[[BroadcastResult], Optional[Awaitable[Any]]]] = None,
+        progress_callback: Optional[Callable[["Broadcaster"], Optional[Awaitable[Any]]]] = None,
+        progress_interval: float = 5,
+        checkpoint: Optional[Mapping[str, Any]] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be a positive integer.")
+        if max_rate < 0 or max_retries < 0 or retry_interval < 0:
+            raise ValueError(
+                "`max_rate`, `max_retries` and `retry_interval` must not be negative."
+            )
+
+        self._send: Callable[[ChatID], Awaitable[object]] = send
+        self._chat_ids: Union[Iterable[ChatID], AsyncIterable[ChatID]] = chat_ids
+        self._max_concurrency: int = max_concurrency
+        self._interval: float = 1 / max_rate if max_rate else 0
+        self._max_retries: int = max_retries
+        self._retry_interval: float = retry_interval
+        self._result_callback = result_callback
+        self._progress_callback = progress_callback
+        self._progress_interval: float = progress_interval
+
+        # All chats before _position and the ones in _completed have a known outcome. Chats are
+        # finished out of order, so we keep the latter until the gap before them is closed.
+        checkpoint = checkpoint or {}
+        self._position: int = checkpoint.get("position", 0)
+        self._completed: Set[int] = set(checkpoint.get("completed", ()))
+        self._counts: Dict[str, int] = dict.fromkeys(
+            (BroadcastResult.SENT, BroadcastResult.FORBIDDEN, BroadcastResult.FAILED), 0
+        )
+        self._counts.update(checkpoint.get("counts", {}))
+
+        self._iterator: Optional[Union[Iterator[ChatID], AsyncIterator[ChatID]]] = None
+        self._iterator_lock = asyncio.Lock()
+        self._next_index: int = 0
+        self._in_flight: int = 0
+        self._next_slot: float = 0
+        self._paused_until: float = 0
+        self._last_progress: float = 0
+        self._running: bool = False
+        self._stopped: bool = False
+
+    @property
+    def counts(self) -> Mapping[str, int]:
+        """Mapping[:obj:`str`, :obj:`int`]: The number of chats per
+        :attr:`BroadcastResult.status`, including the ones from the :paramref:`checkpoint`."""
+        return MappingProxyType(self._counts)
+
+    @property
+    def done(self) -> int:
+        """:obj:`int`: The number of chats whose outcome is known."""
+        return sum(self._counts.values())
+
+    @property
+    def in_flight(self) -> int:
+        """:obj:`int`: The number of chats that the message is currently being sent to."""
+        return self._in_flight
+
+    @property
+    def running(self) -> bool:
+        """:obj:`bool`: Whether :meth:`run` is currently running."""
+        return self._running
+
+    @property
+    def checkpoint(self) -> JSONDict:
+        """:obj:`dict`: A JSON serializable snapshot of the progress, which can be passed as
+        :paramref:`~Broadcaster.checkpoint` to resume the broadcast. The chat ids themselves are
+        not included, only their positions in :paramref:`~Broadcaster.chat_ids`."""
+        return {
+            "position": self._position,
+            "completed": sorted(self._completed),
+            "counts": dict(self._counts),
+        }
+
+    def stop(self) -> None:
+        """Stops the broadcast. No more messages are sent, but :meth:`run` waits for the
+        messages that are currently being sent."""
+        self._stopped = True
+
+    async def run(self) -> None:
+        """Sends the message to all chats that don't have a known outcome yet. Returns once all
+        chats are done or after :meth:`stop` was called.
+
+        Raises:
+            :exc:`RuntimeError`: If the broadcast is already running.
+            :exc:`Exception`: Exceptions raised by iterating over
+                :paramref:`~Broadcaster.chat_ids` or by the callbacks. In that case, the messages
+                currently being sent are cancelled.
+        """
+        if self._running:
+            raise RuntimeError("This Broadcaster is already running.")
+        self._running = True
+        self._stopped = False
+        self._iterator = (
+            self._chat_ids.__aiter__()
+            if isinstance(self._chat_ids, AsyncIterable)
+            else iter(self._chat_ids)
+        )
+        self._next_index = 0
+        workers = [asyncio.create_task(self._worker()) for _ in range(self._max_concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._running = False
+        await self._report_progress(force=True)
+
+    async def _next_chat(self) -> Optional[Tuple[int, ChatID]]:
+        # Iterators can't be advanced concurrently
+        async with self._iterator_lock:
+            while not self._stopped:
+                try:
+                    if isinstance(self._iterator, Iterator):
+                        chat_id = next(self._iterator)
+                    else:
+                        chat_id = await self._iterator.__anext__()  # type: ignore[union-attr]
+                except (StopIteration, StopAsyncIteration):
+                    return None
+                index = self._next_index
+                self._next_index += 1
+                if index >= self._position and index not in self._completed:
+                    return index, chat_id
+            return None
+
+    async def _worker(self) -> None:
+        while (item := await self._next_chat()) is not None:
+            index, chat_id = item
+            self._in_flight += 1
+            try:
+                result = await self._send_to(chat_id)
+            finally:
+                self._in_flight -= 1
+            self._record(index, result)
+            if self._result_callback is not None:
+                await _maybe_await(self._result_callback(result))
+            await self._report_progress()
+
+    async def _wait_for_slot(self) -> None:
+        loop = asyncio.get_running_loop()
+        while (delay := max(self._paused_until, self._next_slot) - loop.time()) > 0:
+            await asyncio.sleep(delay)
+        if self._interval:
+            self._next_slot = max(loop.time(), self._next_slot) + self._interval
+
+    async def _send_to(self, chat_id: ChatID) -> BroadcastResult:
+        target = chat_id
+        new_chat_id: Optional[int] = None
+        attempts = retries = 0
+
+        def outcome(
+            status: str, result: object = None, error: Optional[Exception] = None
+        ) -> BroadcastResult:
+            return BroadcastResult(chat_id, status, attempts, result, error, new_chat_id)
+
+        while True:
+            await self._wait_for_slot()
+            attempts += 1
+            try:
+                result = await self._send(target)
+            except ChatMigrated as exc:
+                # A migrated group can only be migrated once
+                if new_chat_id is not None:
+                    return outcome(BroadcastResult.FAILED, error=exc)
+                new_chat_id = target = exc.new_chat_id
+                continue
+            except Forbidden as exc:
+                return outcome(BroadcastResult.FORBIDDEN, error=exc)
+            except (RetryAfter, NetworkError) as exc:
+                if isinstance(exc, BadRequest) or retries >= self._max_retries:
+                    return outcome(BroadcastResult.FAILED, error=exc)
+                retries += 1
+                if isinstance(exc, RetryAfter):
+                    delay = exc.retry_after + 0.1
+                    _LOGGER.info("Flood control exceeded. Pausing broadcast for %f seconds", delay)
+                    self._paused_until = max(
+                        self._paused_until, asyncio.get_running_loop().time() + delay
+                    )
+                else:
+                    _LOGGER.debug("Retrying to send to chat %s after %r", chat_id, exc)
+                    await asyncio.sleep(self._retry_interval * 2 ** (retries - 1))
+                continue
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                _LOGGER.debug("Failed to send to chat %s", chat_id, exc_info=exc)
+                return outcome(BroadcastResult.FAILED, error=exc)
+            return outcome(BroadcastResult.SENT, result=result)
+
+    def _record(self, index: int, result: BroadcastResult) -> None:
+        self._counts[result.status] += 1
+        self._completed.add(index)
+        while self._position in self._completed:
+            self._completed.remove(self._position)
+            self._position += 1
+
+    async def _report_progress(self, force: bool = False) -> None:
+        if self._progress_callback is None:
+            return
+        now = asyncio.get_running_loop().time()
+        if not force and now - self._last_progress < self._progress_interval:
+            return
+        self._last_progress = now
+        await _maybe_await(self._progress_callback(self))
+
+
+async def _maybe_await(value: Optional[Awaitable[Any]]) -> None:
+    if inspect.isawaitable(value):
+        await value
@@ -114,6 +114,20 @@ class Defaults:
         do_quote(:obj:`bool`, optional): |reply_quote|
 
             .. versionadded:: 20.8
+        lazy_messages (:obj:`bool`, optional): Whether the messages returned by bot methods like
+            :meth:`telegram.Bot.send_message` should be parsed lazily. If :obj:`True`, only
+            :attr:`~telegram.Message.message_id`, :attr:`~telegram.Message.date` and
+            :attr:`~telegram.Message.chat` are parsed right away and all other attributes of the
+            :class:`telegram.Message` are parsed on first access. This saves time when sending
+            many messages without using the returned messages, e.g. for broadcasts. Errors are
+            raised as usual. Defaults to :obj:`False`.
+
+            Note:
+                If :paramref:`telegram.ext.ExtBot.arbitrary_callback_data` is used, the messages
+                are parsed right away, since their :attr:`~telegram.Message.reply_markup` has to
+                be processed.
+
+            .. versionadded:: NEXT.VERSION
     """
 
     __slots__ = (
@@ -122,6 +136,7 @@ class Defaults:
         "_block",
         "_disable_notification",
         "_do_quote",
+        "_lazy_messages",
         "_link_preview_options",
         "_parse_mode",
         "_protect_content",
@@ -140,6 +155,7 @@ class Defaults:
         protect_content: Optional[bool] = None,
         link_preview_options: Optional["LinkPreviewOptions"] = None,
         do_quote: Optional[bool] = None,
+        lazy_messages: bool = False,
     ):
         self._parse_mode: Optional[str] = parse_mode
         self._disable_notification: Optional[bool] = disable_notification
@@ -147,6 +163,7 @@ class Defaults:
         self._tzinfo: datetime.tzinfo = tzinfo
         self._block: bool = block
         self._protect_content: Optional[bool] = protect_content
+        self._lazy_messages: bool = lazy_messages
 
         if disable_web_page_preview is not None and link_preview_options is not None:
             raise ValueError(
@@ -208,6 +225,7 @@ class Defaults:
                 self._tzinfo,
                 self._block,
                 self._protect_content,
+                self._lazy_messages,
             )
         )
 
@@ -375,3 +393,17 @@ class Defaults:
         .. versionadded:: 20.8
         """
         return self._do_quote
+
+    @property
+    def lazy_messages(self) -> bool:
+        """:obj:`bool`: Whether the messages returned by bot methods are parsed lazily.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._lazy_messages
+
+    @lazy_messages.setter
+    def lazy_messages(self, _: object) -> NoReturn:
+        raise AttributeError(
+            "You can not assign a new value to lazy_messages after initialization."
+        )
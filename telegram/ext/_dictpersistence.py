@@ -17,19 +17,19 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the DictPersistence class."""
-import json
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Dict, Optional, cast
 
 from telegram.ext import BasePersistence, PersistenceInput
 from telegram.ext._utils.types import CDCData, ConversationDict, ConversationKey
+from telegram.request import get_json_codec
 
 if TYPE_CHECKING:
     from telegram._utils.types import JSONDict
 
 
 class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any, Any]]):
-    """Using Python's :obj:`dict` and :mod:`json` for making your bot persistent.
+    """Using Python's :obj:`dict` and JSON for making your bot persistent.
 
     Attention:
         The interface provided by this class is intended to be accessed exclusively by
@@ -43,13 +43,17 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
           writing them to file/database.
 
         * This implementation of :class:`BasePersistence` does not handle data that cannot be
-          serialized by :func:`json.dumps`.
+          serialized by :meth:`telegram.request.JSONCodec.dumps` of the codec returned by
+          :func:`telegram.request.get_json_codec`. By default, that's :func:`json.dumps`.
 
     .. seealso:: :wiki:`Making Your Bot Persistent <Making-your-bot-persistent>`
 
     .. versionchanged:: 20.0
         The parameters and attributes ``store_*_data`` were replaced by :attr:`store_data`.
 
+    .. versionchanged:: NEXT.VERSION
+        Uses the codec returned by :func:`telegram.request.get_json_codec`.
+
     Args:
         store_data (:class:`~telegram.ext.PersistenceInput`, optional): Specifies which kinds of
             data will be saved by this persistence instance. By default, all available kinds of
@@ -125,7 +129,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
                 raise TypeError("Unable to deserialize chat_data_json. Not valid JSON") from exc
         if bot_data_json:
             try:
-                self._bot_data = json.loads(bot_data_json)
+                self._bot_data = get_json_codec().loads(bot_data_json)
                 self._bot_data_json = bot_data_json
             except (ValueError, AttributeError) as exc:
                 raise TypeError("Unable to deserialize bot_data_json. Not valid JSON") from exc
@@ -133,7 +137,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
                 raise TypeError("bot_data_json must be serialized dict")
         if callback_data_json:
             try:
-                data = json.loads(callback_data_json)
+                data = get_json_codec().loads(callback_data_json)
             except (ValueError, AttributeError) as exc:
                 raise TypeError(
                     "Unable to deserialize callback_data_json. Not valid JSON"
@@ -179,7 +183,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         """:obj:`str`: The user_data serialized as a JSON-string."""
         if self._user_data_json:
             return self._user_data_json
-        return json.dumps(self.user_data)
+        return get_json_codec().dumps(self.user_data)
 
     @property
     def chat_data(self) -> Optional[Dict[int, Dict[Any, Any]]]:
@@ -191,7 +195,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         """:obj:`str`: The chat_data serialized as a JSON-string."""
         if self._chat_data_json:
             return self._chat_data_json
-        return json.dumps(self.chat_data)
+        return get_json_codec().dumps(self.chat_data)
 
     @property
     def bot_data(self) -> Optional[Dict[Any, Any]]:
@@ -203,7 +207,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         """:obj:`str`: The bot_data serialized as a JSON-string."""
         if self._bot_data_json:
             return self._bot_data_json
-        return json.dumps(self.bot_data)
+        return get_json_codec().dumps(self.bot_data)
 
     @property
     def callback_data(self) -> Optional[CDCData]:
@@ -222,7 +226,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         """
         if self._callback_data_json:
             return self._callback_data_json
-        return json.dumps(self.callback_data)
+        return get_json_codec().dumps(self.callback_data)
 
     @property
     def conversations(self) -> Optional[Dict[str, ConversationDict]]:
@@ -236,7 +240,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
             return self._conversations_json
         if self.conversations:
             return self._encode_conversations_to_json(self.conversations)
-        return json.dumps(self.conversations)
+        return get_json_codec().dumps(self.conversations)
 
     async def get_user_data(self) -> Dict[int, Dict[object, object]]:
         """Returns the user_data created from the ``user_data_json`` or an empty :obj:`dict`.
@@ -434,8 +438,8 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         for handler, states in conversations.items():
             tmp[handler] = {}
             for key, state in states.items():
-                tmp[handler][json.dumps(key)] = state
-        return json.dumps(tmp)
+                tmp[handler][get_json_codec().dumps(key)] = state
+        return get_json_codec().dumps(tmp)
 
     @staticmethod
     def _decode_conversations_from_json(json_string: str) -> Dict[str, ConversationDict]:
@@ -448,12 +452,12 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         Returns:
             :obj:`dict`: The conversations dict after decoding
         """
-        tmp = json.loads(json_string)
+        tmp = get_json_codec().loads(json_string)
         conversations: Dict[str, ConversationDict] = {}
         for handler, states in tmp.items():
             conversations[handler] = {}
             for key, state in states.items():
-                conversations[handler][tuple(json.loads(key))] = state
+                conversations[handler][tuple(get_json_codec().loads(key))] = state
         return conversations
 
     @staticmethod
@@ -468,7 +472,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
             :obj:`dict`: The user/chat_data defaultdict after decoding
         """
         tmp: Dict[int, Dict[object, object]] = {}
-        decoded_data = json.loads(data)
+        decoded_data = get_json_codec().loads(data)
         for user, user_data in decoded_data.items():
             int_user_id = int(user)
             tmp[int_user_id] = {}
@@ -18,14 +18,19 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an object that represents a Telegram Bot with convenience extensions."""
+import asyncio
 from copy import copy
 from datetime import datetime
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Coroutine,
     Dict,
+    FrozenSet,
     Generic,
+    Hashable,
     List,
     Optional,
     Sequence,
@@ -70,6 +75,7 @@ from telegram import (
     MenuButton,
     Message,
     MessageId,
+    MessageTemplate,
     PhotoSize,
     Poll,
     ReactionType,
@@ -94,8 +100,11 @@ from telegram._utils.logging import get_logger
 from telegram._utils.repr import build_repr_with_selected_attrs
 from telegram._utils.types import CorrectOptionID, FileInput, JSONDict, ODVInput, ReplyMarkup
 from telegram.ext._callbackdatacache import CallbackDataCache
+from telegram.ext._interncache import InternCache
+from telegram.ext._responsecache import ResponseCache
 from telegram.ext._utils.types import RLARGS
-from telegram.request import BaseRequest
+from telegram.request import BaseRequest, RequestData
+from telegram.request._requestparameter import RequestParameter
 from telegram.warnings import PTBUserWarning
 
 if TYPE_CHECKING:
@@ -114,6 +123,31 @@ if TYPE_CHECKING:
     from telegram.ext import BaseRateLimiter, Defaults
 
 HandledTypes = TypeVar("HandledTypes", bound=Union[Message, CallbackQuery, Chat])
+# Endpoints that only read data and hence can be coalesced, see ExtBot.coalesce_requests
+_COALESCED_ENDPOINTS: FrozenSet[str] = frozenset(
+    {
+        "getBusinessConnection",
+        "getChat",
+        "getChatAdministrators",
+        "getChatMember",
+        "getChatMemberCount",
+        "getChatMenuButton",
+        "getCustomEmojiStickers",
+        "getFile",
+        "getForumTopicIconStickers",
+        "getGameHighScores",
+        "getMe",
+        "getMyCommands",
+        "getMyDefaultAdministratorRights",
+        "getMyDescription",
+        "getMyName",
+        "getMyShortDescription",
+        "getStickerSet",
+        "getUserChatBoosts",
+        "getUserProfilePhotos",
+        "getWebhookInfo",
+    }
+)
 KT = TypeVar("KT", bound=ReplyMarkup)
 
 
@@ -168,10 +202,71 @@ class ExtBot(Bot, Generic[RLARGS]):
             limiting the number of requests made by the bot per time interval.
 
             .. versionadded:: 20.0
+        lazy_updates (:obj:`bool`, optional): Whether :meth:`telegram.Update.de_json` should
+            parse updates lazily. If :obj:`True`, only :attr:`telegram.Update.update_id` is parsed
+            right away and the content of the update (e.g. :attr:`telegram.Update.message`) is
+            parsed on first access. Of messages, only the attributes needed e.g. by the filters
+            of the handlers are parsed, until an attribute requires parsing the whole message.
+            This saves resources for updates that are not handled.
+            Defaults to :obj:`False`.
+
+            .. versionadded:: NEXT.VERSION
+        keep_raw_payloads (:obj:`bool`, optional): Whether :meth:`telegram.Update.de_json`
+            should keep the data received from Telegram on the update. If :obj:`True`,
+            :meth:`telegram.Update.to_dict` and :meth:`telegram.Update.to_json` return that data
+            instead of serializing the update again. This trades memory for CPU time and is useful
+            e.g. for archiving or forwarding updates. Defaults to :obj:`False`.
+
+            Note:
+                If :paramref:`arbitrary_callback_data` is used, the raw payload of updates that
+                may contain callback data is discarded, as the callback data is replaced after
+                parsing.
+
+            .. versionadded:: NEXT.VERSION
+        intern_objects (:obj:`bool` | :obj:`int`, optional): Whether to share instances of
+            :class:`telegram.User` and :class:`telegram.Chat` between updates, if they were built
+            from identical data. Pass an integer to specify the maximum number of objects cached in
+            memory. Defaults to :obj:`False`.
+
+            .. seealso:: :class:`telegram.ext.InternCache`
+
+            .. versionadded:: NEXT.VERSION
+        coalesce_requests (:obj:`bool`, optional): Whether concurrent calls of read-only bot
+            methods with identical arguments should share a single request to the Bot API. If
+            :obj:`True`, a call of e.g. :meth:`~telegram.Bot.get_chat` that is made while an
+            identical call is still in progress doesn't make a request of its own, but waits for
+            the result of the pending one. This reduces the number of requests when many handlers
+            fetch the same data at the same time. Defaults to :obj:`False`.
+
+            Note:
+                * Requests are coalesced for the methods ``get_*`` except for
+                  :meth:`~telegram.Bot.get_updates`.
+                * The timeouts and ``rate_limit_args`` of the call that made the request are used
+                  for all calls sharing it. Cancelling one of the calls doesn't cancel the
+                  request for the others.
+                * Calls that are made after the request finished make a new request, i.e. no
+                  results are cached. See :paramref:`response_cache` for that.
+
+            .. versionadded:: NEXT.VERSION
+        response_cache (:class:`telegram.ext.ResponseCache`, optional): A cache for the results
+            of read-only bot methods like :meth:`~telegram.Bot.get_chat_member`. If passed, calls
+            with the same arguments reuse the result of a previous call for a limited time
+            instead of making a request to Telegram.
+
+            .. versionadded:: NEXT.VERSION
 
     """
 
-    __slots__ = ("_callback_data_cache", "_defaults", "_rate_limiter")
+    __slots__ = (
+        "_callback_data_cache",
+        "_coalesced_requests",
+        "_defaults",
+        "_intern_cache",
+        "_keep_raw_payloads",
+        "_lazy_updates",
+        "_rate_limiter",
+        "_response_cache",
+    )
 
     _LOGGER = get_logger(__name__, class_name="ExtBot")
 
@@ -191,6 +286,12 @@ class ExtBot(Bot, Generic[RLARGS]):
         defaults: Optional["Defaults"] = None,
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
+        *,
+        lazy_updates: bool = False,
+        keep_raw_payloads: bool = False,
+        intern_objects: Union[bool, int] = False,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
     ): ...
 
     @overload
@@ -207,6 +308,12 @@ class ExtBot(Bot, Generic[RLARGS]):
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
         rate_limiter: Optional["BaseRateLimiter[RLARGS]"] = None,
+        *,
+        lazy_updates: bool = False,
+        keep_raw_payloads: bool = False,
+        intern_objects: Union[bool, int] = False,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
     ): ...
 
     def __init__(
@@ -222,6 +329,12 @@ class ExtBot(Bot, Generic[RLARGS]):
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
         rate_limiter: Optional["BaseRateLimiter[RLARGS]"] = None,
+        *,
+        lazy_updates: bool = False,
+        keep_raw_payloads: bool = False,
+        intern_objects: Union[bool, int] = False,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
     ):
         super().__init__(
             token=token,
@@ -236,6 +349,19 @@ class ExtBot(Bot, Generic[RLARGS]):
         with self._unfrozen():
             self._defaults: Optional[Defaults] = defaults
             self._rate_limiter: Optional[BaseRateLimiter] = rate_limiter
+            self._lazy_updates: bool = lazy_updates
+            self._keep_raw_payloads: bool = keep_raw_payloads
+            self._intern_cache: Optional[InternCache] = None
+            if intern_objects is not False:
+                self._intern_cache = (
+                    InternCache()
+                    if isinstance(intern_objects, bool)
+                    else InternCache(maxsize=intern_objects)
+                )
+            self._coalesced_requests: Optional[
+                Dict[Hashable, asyncio.Task[Union[bool, JSONDict, List[JSONDict]]]]
+            ] = ({} if coalesce_requests else None)
+            self._response_cache: Optional[ResponseCache] = response_cache
             self._callback_data_cache: Optional[CallbackDataCache] = None
 
             # set up callback_data
@@ -334,9 +460,11 @@ class ExtBot(Bot, Generic[RLARGS]):
         write_timeout: ODVInput[float] = DEFAULT_NONE,
         connect_timeout: ODVInput[float] = DEFAULT_NONE,
         pool_timeout: ODVInput[float] = DEFAULT_NONE,
+        template: Optional[RequestData] = None,
     ) -> Union[bool, JSONDict, List[JSONDict]]:
         """Order of method calls is: Bot.some_method -> Bot._post -> Bot._do_post.
-        So we can override Bot._do_post to add rate limiting.
+        So we can override Bot._do_post to add rate limiting as well as caching and coalescing
+        of requests.
         """
         rate_limit_args = self._extract_rl_kwargs(data)
         if not self.rate_limiter and rate_limit_args is not None:
@@ -344,6 +472,71 @@ class ExtBot(Bot, Generic[RLARGS]):
                 "`rate_limit_args` can only be used if a `ExtBot.rate_limiter` is set."
             )
 
+        post = partial(
+            self._do_rate_limited_post,
+            endpoint=endpoint,
+            data=data,
+            rate_limit_args=rate_limit_args,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+            template=template,
+        )
+        coalesce = self._coalesced_requests is not None and endpoint in _COALESCED_ENDPOINTS
+        cache = self._response_cache
+        if cache is not None and not cache.caches(endpoint):
+            cache = None
+        # Templates are only used for sending messages, which is never coalesced or cached
+        if template is not None or (not coalesce and cache is None):
+            return await post()
+
+        # The parameters are compared in the form in which they are sent to Telegram
+        parameters = RequestData(
+            parameters=[RequestParameter.from_input(key, value) for key, value in data.items()]
+        ).json_parameters
+        if coalesce:
+            post = partial(self._do_coalesced_post, endpoint, parameters, post)
+        if cache is not None:
+            return await cache.get_or_fetch(endpoint, parameters, post)
+        return await post()
+
+    async def _do_coalesced_post(
+        self,
+        endpoint: str,
+        parameters: Dict[str, str],
+        post: Callable[[], Coroutine[Any, Any, Union[bool, JSONDict, List[JSONDict]]]],
+    ) -> Union[bool, JSONDict, List[JSONDict]]:
+        key = (endpoint, frozenset(parameters.items()))
+        task = self._coalesced_requests.get(key)  # type: ignore[union-attr]
+        if task is None:
+            task = asyncio.create_task(post())
+            self._coalesced_requests[key] = task  # type: ignore[index]
+            task.add_done_callback(lambda _: self._finish_coalesced_request(key))
+        else:
+            self._LOGGER.debug("Coalescing call to `%s` with pending identical call", endpoint)
+
+        # Shielding the task ensures that cancelling one caller doesn't affect the others
+        return await asyncio.shield(task)
+
+    def _finish_coalesced_request(self, key: Hashable) -> None:
+        task = self._coalesced_requests.pop(key)  # type: ignore[union-attr]
+        # Mark the exception as retrieved, in case all callers were cancelled in the meantime
+        if not task.cancelled():
+            task.exception()
+
+    async def _do_rate_limited_post(
+        self,
+        endpoint: str,
+        data: JSONDict,
+        rate_limit_args: Optional[RLARGS],
+        *,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+        template: Optional[RequestData] = None,
+    ) -> Union[bool, JSONDict, List[JSONDict]]:
         # getting updates should not be rate limited!
         if endpoint == "getUpdates" or not self.rate_limiter:
             return await super()._do_post(
@@ -353,14 +546,17 @@ class ExtBot(Bot, Generic[RLARGS]):
                 connect_timeout=connect_timeout,
                 pool_timeout=pool_timeout,
                 read_timeout=read_timeout,
+                template=template,
             )
 
-        kwargs = {
+        kwargs: Dict[str, Any] = {
             "read_timeout": read_timeout,
             "write_timeout": write_timeout,
             "connect_timeout": connect_timeout,
             "pool_timeout": pool_timeout,
         }
+        if template is not None:
+            kwargs["template"] = template
         self._LOGGER.debug(
             "Passing request through rate limiter of type %s with rate_limit_args %s",
             type(self.rate_limiter),
@@ -390,6 +586,52 @@ class ExtBot(Bot, Generic[RLARGS]):
         # This is a property because the rate limiter shouldn't be changed at runtime
         return self._rate_limiter
 
+    @property
+    def lazy_updates(self) -> bool:
+        """:obj:`bool`: Whether updates are parsed lazily. See
+        :paramref:`~telegram.ext.ExtBot.lazy_updates`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._lazy_updates
+
+    @property
+    def keep_raw_payloads(self) -> bool:
+        """:obj:`bool`: Whether the raw payloads of updates are kept. See
+        :paramref:`~telegram.ext.ExtBot.keep_raw_payloads`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._keep_raw_payloads
+
+    @property
+    def coalesce_requests(self) -> bool:
+        """:obj:`bool`: Whether concurrent identical calls of read-only methods share a single
+        request. See :paramref:`~telegram.ext.ExtBot.coalesce_requests`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._coalesced_requests is not None
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """:class:`telegram.ext.ResponseCache`: Optional. The cache for the results of read-only
+        bot methods. See :paramref:`~telegram.ext.ExtBot.response_cache`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._response_cache
+
+    @property
+    def intern_cache(self) -> Optional[InternCache]:
+        """:class:`telegram.ext.InternCache`: Optional. The cache used for sharing instances of
+        :class:`telegram.User` and :class:`telegram.Chat` between updates. See
+        :paramref:`~telegram.ext.ExtBot.intern_objects`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._intern_cache
+
     def _merge_lpo_defaults(
         self, lpo: ODVInput[LinkPreviewOptions]
     ) -> Optional[LinkPreviewOptions]:
@@ -524,6 +766,13 @@ class ExtBot(Bot, Generic[RLARGS]):
         # * Messages where the reply_to_message is sent by the bot
         # * Messages where via_bot is the bot
         # Finally there is effective_chat.pinned message, but that's only returned in get_chat
+        if self.callback_data_cache is None:
+            return
+
+        if update.callback_query or update.effective_message:
+            # The raw payload would still contain the callback data as sent by Telegram
+            update._set_raw_payload(None)  # pylint: disable=protected-access
+
         if update.callback_query:
             self._insert_callback_data(update.callback_query)
         # elif instead of if, as effective_message includes callback_query.message
@@ -559,6 +808,40 @@ class ExtBot(Bot, Generic[RLARGS]):
 
         return obj
 
+    def _create_message_template(
+        self, endpoint: str, data: JSONDict, api_kwargs: Optional[JSONDict] = None
+    ) -> MessageTemplate:
+        # The rate_limit_args must not be sent to Telegram, but passed along with every send
+        rate_limit_args = self._extract_rl_kwargs(data)
+        return super()._create_message_template(
+            endpoint, data, self._merge_api_rl_kwargs(api_kwargs, rate_limit_args)
+        )
+
+    async def _send_message_template(
+        self,
+        endpoint: str,
+        data: JSONDict,
+        template: RequestData,
+        *,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+    ) -> Any:
+        # Like in _send_message, the callback data of the returned message is inserted
+        result = await super()._send_message_template(
+            endpoint,
+            data,
+            template,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+        )
+        if isinstance(result, Message):
+            self._insert_callback_data(result)
+        return result
+
     async def _send_message(
         self,
         endpoint: str,
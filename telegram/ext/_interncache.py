@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the InternCache class."""
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple, Type, TypeVar
+
+from telegram._utils.types import JSONDict
+
+_T = TypeVar("_T")
+
+
+class InternCache:
+    """A cache that allows :class:`telegram.ext.ExtBot` to share instances of
+    :class:`telegram.User` and :class:`telegram.Chat` between updates. When the same user or chat
+    is encountered again with exactly the same data, :meth:`telegram.User.de_json` and
+    :meth:`telegram.Chat.de_json` return the already existing object instead of building a new
+    one. This reduces the number of allocations as well as the memory held by updates that are
+    queued or by messages stored e.g. in :attr:`telegram.ext.CallbackContext.chat_data`.
+
+    If necessary, will drop the least recently used items.
+
+    Caution:
+        The shared objects are frozen, just like any other object received from Telegram. Do not
+        unfreeze and modify them, as this would affect all updates that reference them.
+
+    Note:
+        Only payloads that consist of hashable values are interned. E.g. chats returned by
+        :meth:`telegram.Bot.get_chat` usually contain nested objects and are built as usual.
+
+    .. seealso:: :paramref:`telegram.ext.ExtBot.intern_objects`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        maxsize (:obj:`int`, optional): Maximum number of objects in the cache. Defaults to
+            ``1024``.
+    """
+
+    __slots__ = ("_cache", "_evictions", "_hits", "_maxsize", "_misses")
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("`maxsize` must be a positive integer.")
+
+        self._maxsize: int = maxsize
+        self._cache: OrderedDict[Tuple[type, Hashable], object] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def __len__(self) -> int:
+        """Returns the number of objects currently in the cache.
+
+        Returns:
+            :obj:`int`
+        """
+        return len(self._cache)
+
+    @property
+    def maxsize(self) -> int:
+        """:obj:`int`: The maximum number of objects in the cache."""
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """:obj:`int`: The number of times an existing object was returned."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """:obj:`int`: The number of times a new object had to be built and was added to the
+        cache.
+        """
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """:obj:`int`: The number of objects that were dropped because the cache was full."""
+        return self._evictions
+
+    def get_or_create(
+        self, cls: Type[_T], data: JSONDict, factory: Callable[[], Optional[_T]]
+    ) -> Optional[_T]:
+        """Returns the cached object of type :paramref:`cls` for the given data or builds it
+        by calling :paramref:`factory` and adds it to the cache.
+
+        Warning:
+            This method is not intended to be called by users directly.
+
+        Args:
+            cls (:obj:`type`): The class of the object.
+            data (Dict[:obj:`str`, ...]): The JSON data the object is built from.
+            factory (Callable[[], :obj:`object`]): Builds the object from :paramref:`data`.
+
+        Returns:
+            The shared object.
+        """
+        try:
+            key = (cls, frozenset(data.items()))
+            obj = self._cache.get(key)
+        except TypeError:
+            # The payload contains nested data and is not interned
+            return factory()
+
+        if obj is not None:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return obj  # type: ignore[return-value]
+
+        self._misses += 1
+        new_obj = factory()
+        if new_obj is not None:
+            self._cache[key] = new_obj
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+        return new_obj
+
+    def clear(self) -> None:
+        """Removes all objects from the cache. The counters are not reset."""
+        self._cache.clear()
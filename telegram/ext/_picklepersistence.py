@@ -167,6 +167,13 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             wait between two consecutive runs of updating the persistence. Defaults to 60 seconds.
 
             .. versionadded:: 20.0
+        share_frozen_objects (:obj:`bool`, optional): Whether immutable
+            :class:`telegram.TelegramObject` instances are shared instead of copied when the
+            :class:`~telegram.ext.Application` copies the data before handing it over to the
+            persistence. See :paramref:`telegram.ext.BasePersistence.share_frozen_objects`.
+            Defaults to :obj:`False`.
+
+            .. versionadded:: NEXT.VERSION
     Attributes:
         filepath (:obj:`str` | :obj:`pathlib.Path`): The filepath for storing the pickle files.
             When :attr:`single_file` is :obj:`False` this will be used as a prefix.
@@ -205,6 +212,8 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         single_file: bool = True,
         on_flush: bool = False,
         update_interval: float = 60,
+        *,
+        share_frozen_objects: bool = False,
     ): ...
 
     @overload
@@ -216,6 +225,8 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         on_flush: bool = False,
         update_interval: float = 60,
         context_types: Optional[ContextTypes[Any, UD, CD, BD]] = None,
+        *,
+        share_frozen_objects: bool = False,
     ): ...
 
     def __init__(
@@ -226,8 +237,14 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         on_flush: bool = False,
         update_interval: float = 60,
         context_types: Optional[ContextTypes[Any, UD, CD, BD]] = None,
+        *,
+        share_frozen_objects: bool = False,
     ):
-        super().__init__(store_data=store_data, update_interval=update_interval)
+        super().__init__(
+            store_data=store_data,
+            update_interval=update_interval,
+            share_frozen_objects=share_frozen_objects,
+        )
         self.filepath: Path = Path(filepath)
         self.single_file: Optional[bool] = single_file
         self.on_flush: Optional[bool] = on_flush
@@ -0,0 +1,453 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains an implementation of the BaseRateLimiter class that shares the overall
+rate limit between lanes of different priority.
+"""
+import asyncio
+import contextlib
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    Final,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
+
+try:
+    from aiolimiter import AsyncLimiter
+
+    AIO_LIMITER_AVAILABLE = True
+except ImportError:
+    AIO_LIMITER_AVAILABLE = False
+
+from telegram._utils.logging import get_logger
+from telegram._utils.types import JSONDict
+from telegram.error import RetryAfter
+from telegram.ext._aioratelimiter import null_context, start_cooldown, wait_for_cooldown
+from telegram.ext._baseratelimiter import BaseRateLimiter
+
+_LOGGER = get_logger(__name__, class_name="PriorityRateLimiter")
+
+
+class PriorityRateLimiter(BaseRateLimiter[str]):
+    """
+    Implementation of :class:`~telegram.ext.BaseRateLimiter` that applies the same limits as
+    :class:`~telegram.ext.AIORateLimiter`, but sorts the requests into lanes of different
+    priority. When the overall rate limit is exhausted, e.g. by a broadcast, the waiting requests
+    are let through in the order given by their lanes, such that e.g. direct replies to users
+    don't have to wait for the broadcast to finish.
+
+    Important:
+        If you want to use this class, you must install PTB with the optional requirement
+        ``rate-limiter``, i.e.
+
+        .. code-block:: bash
+
+           pip install "python-telegram-bot[rate-limiter]"
+
+    The lane of a request is determined by
+
+    1. the :paramref:`~telegram.ext.BaseRateLimiter.process_request.rate_limit_args` passed to
+       the method of :class:`~telegram.ext.ExtBot`, e.g.
+       ``await bot.send_message(chat_id, text, rate_limit_args=PriorityRateLimiter.LOW)``,
+    2. the lane that :paramref:`endpoint_lanes` specifies for the endpoint of the request,
+    3. :paramref:`default_lane`.
+
+    By default, the capacity is shared in a weighted fair manner: If requests are waiting in
+    several lanes, each lane gets a share of the overall rate proportional to its weight, so that
+    no lane is starved. With :paramref:`strict_priority`, requests of a lane are only let through
+    if no request of a lane with higher priority is waiting.
+
+    Example:
+        .. code-block:: python
+
+            rate_limiter = PriorityRateLimiter(
+                endpoint_lanes={"answerCallbackQuery": PriorityRateLimiter.HIGH}
+            )
+            application = ApplicationBuilder().token("TOKEN").rate_limiter(rate_limiter).build()
+
+            # Somewhere in the code that sends a broadcast
+            await bot.send_message(chat_id, text, rate_limit_args=PriorityRateLimiter.LOW)
+
+    Note:
+        * Like for :class:`~telegram.ext.AIORateLimiter`, the overall rate limit is only applied
+          to requests that have a ``chat_id`` parameter. A :exc:`~telegram.error.RetryAfter`
+          exception halts only the requests for the same chat for
+          :attr:`~telegram.error.RetryAfter.retry_after` + 0.1 seconds, unless
+          :paramref:`global_cooldown_threshold` chats are cooling down at the same time or the
+          request has no ``chat_id``, in which case *all* requests are halted.
+        * The lanes only affect the order in which waiting requests are let through. The group
+          rate limits are applied before a request enters its lane.
+
+    .. seealso:: :wiki:`Avoiding Flood Limits <Avoiding-flood-limits>`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        lanes (Mapping[:obj:`str`, :obj:`float`], optional): The names of the lanes mapped to
+            their weights, ordered from highest to lowest priority. The weights are ignored if
+            :paramref:`strict_priority` is :obj:`True`. Defaults to
+            ``{"high": 4, "normal": 2, "low": 1}``.
+        default_lane (:obj:`str`, optional): The lane of requests for which neither
+            ``rate_limit_args`` nor :paramref:`endpoint_lanes` specify a lane. Defaults to
+            :attr:`NORMAL`.
+        endpoint_lanes (Mapping[:obj:`str`, :obj:`str`], optional): Maps names of Bot API
+            methods, e.g. ``"answerCallbackQuery"``, to the lane of their requests.
+        strict_priority (:obj:`bool`, optional): Whether to always let the requests of the lane
+            with the highest priority through first. Defaults to :obj:`False`.
+        overall_max_rate (:obj:`float`): See :paramref:`telegram.ext.AIORateLimiter.\
+            overall_max_rate`. Defaults to ``30``.
+        overall_time_period (:obj:`float`): See :paramref:`telegram.ext.AIORateLimiter.\
+            overall_time_period`. Defaults to ``1``.
+        group_max_rate (:obj:`float`): See :paramref:`telegram.ext.AIORateLimiter.\
+            group_max_rate`. Defaults to ``20``.
+        group_time_period (:obj:`float`): See :paramref:`telegram.ext.AIORateLimiter.\
+            group_time_period`. Defaults to ``60``.
+        max_retries (:obj:`int`): See :paramref:`telegram.ext.AIORateLimiter.max_retries`.
+            Defaults to ``0``.
+        global_cooldown_threshold (:obj:`int`): See :paramref:`telegram.ext.AIORateLimiter.\
+            global_cooldown_threshold`. Defaults to ``5``.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`default_lane` or a value of :paramref:`endpoint_lanes`
+            is not one of the :paramref:`lanes` or if a weight is not positive.
+    """
+
+    HIGH: Final[str] = "high"
+    """:obj:`str`: The lane with the highest priority in the default lanes."""
+    NORMAL: Final[str] = "normal"
+    """:obj:`str`: The default lane."""
+    LOW: Final[str] = "low"
+    """:obj:`str`: The lane with the lowest priority in the default lanes."""
+
+    __slots__ = (
+        "_base_limiter",
+        "_cooldowns",
+        "_default_lane",
+        "_dispatcher",
+        "_endpoint_lanes",
+        "_global_cooldown_threshold",
+        "_group_limiters",
+        "_group_max_rate",
+        "_group_time_period",
+        "_max_retries",
+        "_passes",
+        "_queues",
+        "_retry_after_event",
+        "_strict_priority",
+        "_virtual_time",
+        "_weights",
+    )
+
+    def __init__(
+        self,
+        lanes: Optional[Mapping[str, float]] = None,
+        default_lane: str = NORMAL,
+        endpoint_lanes: Optional[Mapping[str, str]] = None,
+        strict_priority: bool = False,
+        overall_max_rate: float = 30,
+        overall_time_period: float = 1,
+        group_max_rate: float = 20,
+        group_time_period: float = 60,
+        max_retries: int = 0,
+        global_cooldown_threshold: int = 5,
+    ) -> None:
+        if not AIO_LIMITER_AVAILABLE:
+            raise RuntimeError(
+                "To use `PriorityRateLimiter`, PTB must be installed via `pip install "
+                '"python-telegram-bot[rate-limiter]"`.'
+            )
+
+        self._weights: Dict[str, float] = dict(
+            lanes or {self.HIGH: 4, self.NORMAL: 2, self.LOW: 1}
+        )
+        self._endpoint_lanes: Dict[str, str] = dict(endpoint_lanes or {})
+        for lane in (default_lane, *self._endpoint_lanes.values()):
+            if lane not in self._weights:
+                raise ValueError(f"`{lane}` is not one of the lanes {list(self._weights)}.")
+        if any(weight <= 0 for weight in self._weights.values()):
+            raise ValueError("The weights of the lanes must be positive.")
+        self._default_lane: str = default_lane
+        self._strict_priority: bool = strict_priority
+
+        if overall_max_rate and overall_time_period:
+            self._base_limiter: Optional[AsyncLimiter] = AsyncLimiter(
+                max_rate=overall_max_rate, time_period=overall_time_period
+            )
+        else:
+            self._base_limiter = None
+
+        if group_max_rate and group_time_period:
+            self._group_max_rate: float = group_max_rate
+            self._group_time_period: float = group_time_period
+        else:
+            self._group_max_rate = 0
+            self._group_time_period = 0
+
+        self._group_limiters: Dict[Union[str, int], AsyncLimiter] = {}
+        self._max_retries: int = max_retries
+        self._retry_after_event = asyncio.Event()
+        self._retry_after_event.set()
+        # See AIORateLimiter._cooldowns
+        self._cooldowns: Dict[Union[str, int], float] = {}
+        self._global_cooldown_threshold: int = global_cooldown_threshold
+
+        # The requests waiting for the overall limiter, one queue per lane in order of priority
+        self._queues: Dict[str, Deque[asyncio.Future]] = {lane: deque() for lane in self._weights}
+        # Stride scheduling: Each lane is served in the order of its pass, which grows by
+        # 1 / weight for every request let through
+        self._passes: Dict[str, float] = dict.fromkeys(self._weights, 0.0)
+        self._virtual_time: float = 0.0
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    async def initialize(self) -> None:
+        """Does nothing."""
+
+    async def shutdown(self) -> None:
+        """Cancels all requests that are waiting for the overall rate limit."""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._dispatcher
+            self._dispatcher = None
+        for queue in self._queues.values():
+            while queue:
+                queue.popleft().cancel()
+
+    @property
+    def queue_depths(self) -> Dict[str, int]:
+        """Dict[:obj:`str`, :obj:`int`]: The number of requests per lane that are currently
+        waiting for the overall rate limit.
+        """
+        return {
+            lane: sum(not future.done() for future in queue)
+            for lane, queue in self._queues.items()
+        }
+
+    def get_lane(self, endpoint: str, rate_limit_args: Optional[str]) -> str:
+        """Returns the lane of a request.
+
+        Args:
+            endpoint (:obj:`str`): The endpoint that the request is made for.
+            rate_limit_args (:obj:`str` | :obj:`None`): The lane passed to the method of
+                :class:`~telegram.ext.ExtBot`, if any.
+
+        Returns:
+            :obj:`str`: The name of the lane.
+
+        Raises:
+            :exc:`ValueError`: If :paramref:`rate_limit_args` is not one of the lanes.
+        """
+        if rate_limit_args is None:
+            return self._endpoint_lanes.get(endpoint, self._default_lane)
+        if rate_limit_args not in self._weights:
+            raise ValueError(
+                f"`{rate_limit_args}` is not one of the lanes {list(self._weights)}."
+            )
+        return rate_limit_args
+
+    def _get_group_limiter(self, group_id: Union[str, int, bool]) -> "AsyncLimiter":
+        # See AIORateLimiter._get_group_limiter
+        if len(self._group_limiters) > 512:
+            for key, limiter in self._group_limiters.copy().items():
+                if key == group_id:
+                    continue
+                if limiter.has_capacity(limiter.max_rate):
+                    del self._group_limiters[key]
+
+        if group_id not in self._group_limiters:
+            self._group_limiters[group_id] = AsyncLimiter(
+                max_rate=self._group_max_rate,
+                time_period=self._group_time_period,
+            )
+        return self._group_limiters[group_id]
+
+    def _next_lane(self) -> Optional[str]:
+        """Returns the lane whose first waiting request should be let through next."""
+        candidates = []
+        for lane, queue in self._queues.items():
+            # Drop requests that were cancelled while waiting
+            while queue and queue[0].done():
+                queue.popleft()
+            if queue:
+                candidates.append(lane)
+
+        if not candidates:
+            return None
+        if self._strict_priority:
+            return candidates[0]
+        # min returns the first of several lanes with the same pass, i.e. the one with the
+        # highest priority
+        return min(candidates, key=self._passes.__getitem__)
+
+    async def _acquire(self, lane: str) -> None:
+        """Waits until the request may be made according to the overall rate limit."""
+        limiter = self._base_limiter
+        if limiter is None:
+            return
+        if (
+            self._retry_after_event.is_set()
+            and self._next_lane() is None
+            and limiter.has_capacity()
+        ):
+            # Nobody is waiting, so there is no need to go through the queue
+            await limiter.acquire()
+            return
+
+        queue = self._queues[lane]
+        if not queue:
+            # A lane that was idle must not catch up on the capacity it didn't use
+            self._passes[lane] = max(self._passes[lane], self._virtual_time)
+        future = asyncio.get_running_loop().create_future()
+        queue.append(future)
+        if self._dispatcher is None:
+            self._dispatcher = asyncio.create_task(self._dispatch(limiter))
+        await future
+
+    async def _dispatch(self, limiter: "AsyncLimiter") -> None:
+        """Lets the waiting requests through one at a time as capacity becomes available."""
+        try:
+            while self._next_lane() is not None:
+                await self._retry_after_event.wait()
+                await limiter.acquire()
+                # The lane is determined only now, so that requests that arrived while waiting
+                # for capacity are taken into account
+                lane = self._next_lane()
+                if lane is None:
+                    break
+                self._virtual_time = self._passes[lane]
+                self._passes[lane] += 1 / self._weights[lane]
+                self._queues[lane].popleft().set_result(None)
+        finally:
+            self._dispatcher = None
+
+    async def _run_request(
+        self,
+        chat: bool,
+        chat_id: Optional[Union[str, int]],
+        group: Union[str, int, bool],
+        lane: str,
+        callback: Callable[..., Coroutine[Any, Any, Union[bool, JSONDict, List[JSONDict]]]],
+        args: Any,
+        kwargs: Dict[str, Any],
+    ) -> Union[bool, JSONDict, List[JSONDict]]:
+        group_context = (
+            self._get_group_limiter(group) if group and self._group_max_rate else null_context()
+        )
+
+        if chat_id is not None and self._cooldowns:
+            # In case a retry_after was hit for this chat, we wait before using up the capacity
+            await wait_for_cooldown(self._cooldowns, chat_id)
+
+        async with group_context:
+            if chat:
+                await self._acquire(lane)
+            # In case a retry_after was hit, we wait with processing the request
+            await self._retry_after_event.wait()
+
+            return await callback(*args, **kwargs)
+
+    # mypy doesn't understand that the last run of the for loop raises an exception
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, Union[bool, JSONDict, List[JSONDict]]]],
+        args: Any,
+        kwargs: Dict[str, Any],
+        endpoint: str,
+        data: Dict[str, Any],
+        rate_limit_args: Optional[str],
+    ) -> Union[bool, JSONDict, List[JSONDict]]:
+        """
+        Processes a request by applying rate limiting.
+
+        See :meth:`telegram.ext.BaseRateLimiter.process_request` for detailed information on the
+        arguments.
+
+        Args:
+            rate_limit_args (:obj:`None` | :obj:`str`): If set, specifies the lane of the request.
+                Defaults to the lane given by :paramref:`PriorityRateLimiter.endpoint_lanes` or
+                :paramref:`PriorityRateLimiter.default_lane`.
+
+        Raises:
+            :exc:`ValueError`: If :paramref:`rate_limit_args` is not one of the lanes.
+        """
+        lane = self.get_lane(endpoint, rate_limit_args)
+
+        group: Union[int, str, bool] = False
+        chat: bool = False
+        chat_id = data.get("chat_id")
+        if chat_id is not None:
+            chat = True
+
+        # In case user passes integer chat id as string
+        with contextlib.suppress(ValueError, TypeError):
+            chat_id = int(chat_id)
+
+        if (isinstance(chat_id, int) and chat_id < 0) or isinstance(chat_id, str):
+            # string chat_id only works for channels and supergroups
+            # We can't really tell channels from groups though ...
+            group = chat_id
+
+        for i in range(self._max_retries + 1):
+            try:
+                return await self._run_request(
+                    chat=chat,
+                    chat_id=chat_id,
+                    group=group,
+                    lane=lane,
+                    callback=callback,
+                    args=args,
+                    kwargs=kwargs,
+                )
+            except RetryAfter as exc:
+                if i == self._max_retries:
+                    _LOGGER.exception(
+                        "Rate limit hit after maximum of %d retries",
+                        self._max_retries,
+                        exc_info=exc,
+                    )
+                    raise exc
+
+                sleep = exc.retry_after + 0.1
+                # Without a chat, we can't tell what the rate limit applies to
+                if (
+                    not chat
+                    or start_cooldown(self._cooldowns, chat_id, sleep)
+                    >= self._global_cooldown_threshold
+                ):
+                    _LOGGER.info("Rate limit hit. Retrying after %f seconds", sleep)
+                    # Make sure we don't allow other requests to be processed
+                    self._retry_after_event.clear()
+                    try:
+                        await asyncio.sleep(sleep)
+                    finally:
+                        # Allow other requests to be processed
+                        self._retry_after_event.set()
+                else:
+                    _LOGGER.info(
+                        "Rate limit hit for chat %s. Retrying after %f seconds", chat_id, sleep
+                    )
+                    await asyncio.sleep(sleep)
+        return None  # type: ignore[return-value]
@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the ResponseCache class."""
+import time
+from collections import OrderedDict
+from functools import partial
+from types import MappingProxyType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Final,
+    FrozenSet,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from telegram._message import Message
+from telegram._update import Update
+from telegram._utils.types import JSONDict
+
+_T = TypeVar("_T")
+# Attributes of service messages that indicate a change of a chat or its members
+_CHAT_CHANGING_ATTRIBUTES = (
+    "new_chat_members",
+    "left_chat_member",
+    "new_chat_title",
+    "new_chat_photo",
+    "delete_chat_photo",
+    "pinned_message",
+    "migrate_to_chat_id",
+    "migrate_from_chat_id",
+)
+
+
+class _Entry(NamedTuple):
+    expires: float
+    chat_id: Optional[str]
+    value: object
+
+
+class ResponseCache:
+    """A cache that allows :class:`telegram.ext.ExtBot` to reuse the results of read-only Bot API
+    methods such as :meth:`telegram.Bot.get_chat_member` for a limited time. Calls made with the
+    same arguments within the time to live (TTL) of the endpoint don't make a request to Telegram.
+
+    Entries that concern a chat are dropped automatically, when
+    :meth:`telegram.ext.Application.process_update` receives an update indicating that the
+    information about the chat or its members changed, see :meth:`process_update`. Otherwise,
+    results may be outdated by up to the TTL of the endpoint. If necessary, will drop the least
+    recently used items.
+
+    Note:
+        * Only the endpoints listed in :paramref:`ttls` are cached. Exceptions are never cached.
+        * The timeouts and ``rate_limit_args`` passed to the bot methods are not taken into
+          account when looking up results.
+        * Chats are matched by the ``chat_id`` passed to the bot methods. Results of calls that
+          used the username of a chat are therefore not dropped automatically.
+
+    .. seealso:: :paramref:`telegram.ext.ExtBot.response_cache`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        ttls (Mapping[:obj:`str`, :obj:`float`], optional): Maps the names of the Bot API
+            endpoints, e.g. ``"getChatMember"``, whose results should be cached to their time to
+            live in seconds. Only endpoints that merely read data may be cached. Defaults to
+            :attr:`DEFAULT_TTLS`.
+        maxsize (:obj:`int`, optional): Maximum number of results in the cache. Defaults to
+            ``1024``.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`maxsize` is not positive or :paramref:`ttls` contains
+            an endpoint that can't be cached or a non-positive time to live.
+    """
+
+    __slots__ = (
+        "_cache",
+        "_evictions",
+        "_generation",
+        "_hits",
+        "_invalidations",
+        "_maxsize",
+        "_misses",
+        "_ttls",
+    )
+
+    DEFAULT_TTLS: Final[Mapping[str, float]] = MappingProxyType(
+        {
+            "getChat": 60,
+            "getChatAdministrators": 60,
+            "getChatMember": 60,
+            "getChatMemberCount": 60,
+            # Download links are valid for at least one hour
+            "getFile": 1800,
+            "getMe": 3600,
+        }
+    )
+    """Mapping[:obj:`str`, :obj:`float`]: The endpoints cached by default and their time to live
+    in seconds."""
+
+    def __init__(self, ttls: Optional[Mapping[str, float]] = None, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("`maxsize` must be a positive integer.")
+        if ttls is None:
+            ttls = self.DEFAULT_TTLS
+        for endpoint, ttl in ttls.items():
+            if not endpoint.startswith("get") or endpoint == "getUpdates":
+                raise ValueError(f"Results of `{endpoint}` can not be cached.")
+            if ttl <= 0:
+                raise ValueError(f"The time to live of `{endpoint}` must be positive.")
+
+        self._ttls: Mapping[str, float] = MappingProxyType(dict(ttls))
+        self._maxsize: int = maxsize
+        self._cache: OrderedDict[Tuple[str, FrozenSet[Tuple[str, str]]], _Entry] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._invalidations: int = 0
+        # Incremented whenever results are dropped, see get_or_fetch
+        self._generation: int = 0
+
+    def __len__(self) -> int:
+        """Returns the number of results currently in the cache. This may include expired
+        results that were not yet removed.
+
+        Returns:
+            :obj:`int`
+        """
+        return len(self._cache)
+
+    @property
+    def ttls(self) -> Mapping[str, float]:
+        """Mapping[:obj:`str`, :obj:`float`]: The cached endpoints and their time to live in
+        seconds."""
+        return self._ttls
+
+    @property
+    def maxsize(self) -> int:
+        """:obj:`int`: The maximum number of results in the cache."""
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """:obj:`int`: The number of times a cached result was returned."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """:obj:`int`: The number of times a result had to be requested from Telegram, because
+        it was not cached or expired.
+        """
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """:obj:`int`: The number of results that were dropped because the cache was full."""
+        return self._evictions
+
+    @property
+    def invalidations(self) -> int:
+        """:obj:`int`: The number of results that were dropped by :meth:`invalidate_chat`."""
+        return self._invalidations
+
+    def caches(self, endpoint: str) -> bool:
+        """Whether results of the given endpoint are cached.
+
+        Args:
+            endpoint (:obj:`str`): The name of the Bot API endpoint.
+
+        Returns:
+            :obj:`bool`
+        """
+        return endpoint in self._ttls
+
+    async def get_or_fetch(
+        self,
+        endpoint: str,
+        parameters: Mapping[str, str],
+        fetch: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """Returns the cached result of the call to :paramref:`endpoint` with the given
+        parameters or requests it by awaiting :paramref:`fetch` and adds it to the cache.
+
+        Warning:
+            This method is not intended to be called by users directly.
+
+        Args:
+            endpoint (:obj:`str`): The name of the Bot API endpoint.
+            parameters (Mapping[:obj:`str`, :obj:`str`]): The parameters of the call, as given
+                by :attr:`telegram.request.RequestData.json_parameters`.
+            fetch (Callable[[], Awaitable]): Makes the request to Telegram.
+
+        Returns:
+            The result of the call.
+        """
+        key = (endpoint, frozenset(parameters.items()))
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry.expires > time.monotonic():
+                self._hits += 1
+                self._cache.move_to_end(key)
+                return entry.value  # type: ignore[return-value]
+            del self._cache[key]
+
+        self._misses += 1
+        generation = self._generation
+        value = await fetch()
+        if generation != self._generation:
+            # The result might already be outdated, if results were dropped in the meantime
+            return value
+
+        self._cache[key] = _Entry(
+            expires=time.monotonic() + self._ttls[endpoint],
+            chat_id=parameters.get("chat_id"),
+            value=value,
+        )
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+            self._evictions += 1
+        return value
+
+    def invalidate_chat(self, chat_id: Union[int, str]) -> None:
+        """Removes all results of calls concerning the given chat from the cache.
+
+        Args:
+            chat_id (:obj:`int` | :obj:`str`): The ``chat_id`` that was passed to the bot methods.
+        """
+        self._generation += 1
+        chat_id = str(chat_id)
+        keys = [key for key, entry in self._cache.items() if entry.chat_id == chat_id]
+        for key in keys:
+            del self._cache[key]
+        self._invalidations += len(keys)
+
+    def process_update(self, update: object) -> None:
+        """Removes the results concerning chats from the cache, if the update indicates that
+        information about the chat or its members changed. This is the case for
+
+        * :attr:`telegram.Update.chat_member` and :attr:`telegram.Update.my_chat_member`
+        * messages about new or leaving members, changed titles or photos, pinned messages and
+          migrations of the chat, in which case both the old and the new chat are affected.
+
+        This method is called by :meth:`telegram.ext.Application.process_update`. Lazy updates
+        (see :paramref:`telegram.ext.ExtBot.lazy_updates`) are checked without parsing them.
+
+        Args:
+            update (:obj:`object`): The update to process.
+        """
+        if not isinstance(update, Update):
+            return
+
+        # The kinds of lazy updates and the attributes of lazy messages that were not parsed yet
+        # are checked in the raw data, such that updates are not parsed just for the cache
+        lazy_data: JSONDict = getattr(update, "_lazy_data", None) or {}
+        chat_ids: Set[int] = set()
+        for kind in ("chat_member", "my_chat_member"):
+            if kind in lazy_data:
+                chat_ids.add(lazy_data[kind]["chat"]["id"])
+            else:
+                member_update = getattr(update, kind)
+                if member_update:
+                    chat_ids.add(member_update.chat.id)
+
+        for kind in ("message", "channel_post"):
+            message: object = lazy_data.get(kind) or getattr(update, kind)
+            if isinstance(message, Message):
+                message = getattr(message, "_lazy_data", None) or message
+            if not message:
+                continue
+
+            # The keys of the data are the same as the names of the attributes
+            get: Callable[[str], Any] = (
+                message.get if isinstance(message, dict) else partial(getattr, message)
+            )
+            if any(get(attr) for attr in _CHAT_CHANGING_ATTRIBUTES):
+                chat = get("chat")
+                chat_ids.add(chat["id"] if isinstance(chat, dict) else chat.id)
+                chat_ids.update(
+                    chat_id
+                    for chat_id in (get("migrate_to_chat_id"), get("migrate_from_chat_id"))
+                    if chat_id
+                )
+
+        for chat_id in chat_ids:
+            self.invalidate_chat(chat_id)
+
+    def clear(self) -> None:
+        """Removes all results from the cache. The counters are not reset."""
+        self._generation += 1
+        self._cache.clear()
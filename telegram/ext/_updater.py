@@ -19,6 +19,7 @@
 """This module contains the class Updater, which tries to make creating Telegram bots intuitive."""
 import asyncio
 import contextlib
+import importlib.util
 import ssl
 from pathlib import Path
 from types import TracebackType
@@ -41,17 +42,14 @@ from telegram._utils.repr import build_repr_with_selected_attrs
 from telegram._utils.types import DVType, ODVInput
 from telegram.error import InvalidToken, RetryAfter, TelegramError, TimedOut
 
-try:
-    from telegram.ext._utils.webhookhandler import WebhookAppClass, WebhookServer
-
-    WEBHOOKS_AVAILABLE = True
-except ImportError:
-    WEBHOOKS_AVAILABLE = False
+# tornado is only imported once a webhook is started, as importing it takes a while
+WEBHOOKS_AVAILABLE = importlib.util.find_spec("tornado") is not None
 
 if TYPE_CHECKING:
     from socket import socket
 
     from telegram import Bot
+    from telegram.ext._utils.webhookhandler import WebhookServer
 
 
 _UpdaterType = TypeVar("_UpdaterType", bound="Updater")  # pylint: disable=invalid-name
@@ -647,6 +645,9 @@ class Updater(AsyncContextManager["Updater"]):
         secret_token: Optional[str] = None,
         unix: Optional[Union[str, Path, "socket"]] = None,
     ) -> None:
+        # pylint: disable-next=import-outside-toplevel
+        from telegram.ext._utils.webhookhandler import WebhookAppClass, WebhookServer
+
         _LOGGER.debug("Updater thread started (webhook)")
 
         if not url_path.startswith("/"):
@@ -18,7 +18,7 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 # pylint: disable=missing-module-docstring
 import asyncio
-import json
+import logging
 from http import HTTPStatus
 from pathlib import Path
 from socket import socket
@@ -41,6 +41,7 @@ except ImportError:
 from telegram import Update
 from telegram._utils.logging import get_logger
 from telegram.ext._extbot import ExtBot
+from telegram.request import get_json_codec
 
 if TYPE_CHECKING:
     from telegram import Bot
@@ -158,10 +159,12 @@ class TelegramHandler(tornado.web.RequestHandler):
         _LOGGER.debug("Webhook triggered")
         self._validate_post()
 
-        json_string = self.request.body.decode()
-        data = json.loads(json_string)
+        data = get_json_codec().loads(self.request.body)
         self.set_status(HTTPStatus.OK)
-        _LOGGER.debug("Webhook received data: %s", json_string)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Webhook received data: %s", self.request.body.decode("utf-8", "replace")
+            )
 
         try:
             update = Update.de_json(data, self.bot)
@@ -182,8 +185,14 @@ class TelegramHandler(tornado.web.RequestHandler):
                 update.update_id,  # pylint: disable=no-member
             )
 
-            # handle arbitrary callback data, if necessary
             if isinstance(self.bot, ExtBot):
+                if self.bot.keep_raw_payloads:
+                    # The body is more compact than the parsed data and can be returned by
+                    # to_json as is
+                    # pylint: disable-next=protected-access,no-member
+                    update._set_raw_payload(self.request.body)
+
+                # handle arbitrary callback data, if necessary
                 self.bot.insert_callback_data(update)
 
             await self.update_queue.put(update)
@@ -17,8 +17,28 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains classes that handle the networking backend of ``python-telegram-bot``."""
 
+from ._adaptivetimeouts import AdaptiveTimeouts
+from ._aiohttprequest import AiohttpRequest
 from ._baserequest import BaseRequest
+from ._circuitbreaker import CircuitBreaker
+from ._hedgingpolicy import HedgingPolicy
 from ._httpxrequest import HTTPXRequest
+from ._jsoncodec import JSONCodec, get_json_codec, set_json_codec
 from ._requestdata import RequestData
+from ._requestmetrics import EndpointMetrics, RequestMetrics, RequestRecord
 
-__all__ = ("BaseRequest", "HTTPXRequest", "RequestData")
+__all__ = (
+    "AdaptiveTimeouts",
+    "AiohttpRequest",
+    "BaseRequest",
+    "CircuitBreaker",
+    "EndpointMetrics",
+    "HTTPXRequest",
+    "HedgingPolicy",
+    "JSONCodec",
+    "RequestData",
+    "RequestMetrics",
+    "RequestRecord",
+    "get_json_codec",
+    "set_json_codec",
+)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the AdaptiveTimeouts class."""
+import math
+from collections import deque
+from typing import Deque, Dict, Final, Optional
+
+
+class AdaptiveTimeouts:
+    """Derives the read timeouts of requests to the Bot API from the latencies observed per
+    endpoint. The read timeout of a request is the :paramref:`quantile` of the recent latencies
+    of its endpoint multiplied by :paramref:`factor`, limited to the range from
+    :paramref:`min_timeout` to :paramref:`max_timeout`. This way, requests to a degraded server
+    fail early instead of occupying connections and handlers for the full default timeout.
+
+    To use adaptive timeouts, assign an instance to
+    :attr:`telegram.request.BaseRequest.adaptive_timeouts`.
+
+    Note:
+        * Adaptive timeouts are only used if no read timeout was passed explicitly to the
+          bot method. Until enough latencies were observed for an endpoint, the default read
+          timeout is used.
+        * Requests that upload files, downloads of files and :meth:`telegram.Bot.get_updates`
+          always use the default timeouts, since their durations depend on the amount of data
+          or on the long polling timeout.
+        * A request that times out is recorded with its timeout as latency, since its actual
+          latency is at least that long. In addition, the timeout of an endpoint is doubled for
+          every consecutive request that timed out, until a request succeeds. Once this would
+          exceed :paramref:`max_timeout`, the default read timeout is used instead. This way,
+          the timeouts catch up if the server becomes slower than the learned timeouts.
+
+    .. seealso:: :class:`telegram.request.CircuitBreaker`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        quantile (:obj:`float`, optional): The quantile of the recent latencies to base the
+            timeout on. Must be between ``0`` and ``1``. Defaults to ``0.99``.
+        factor (:obj:`float`, optional): The factor that the quantile is multiplied with. Must be
+            at least ``1``. Defaults to ``3``.
+        min_timeout (:obj:`float`, optional): The minimal read timeout in seconds. Defaults to
+            ``1``.
+        max_timeout (:obj:`float`, optional): The maximal read timeout in seconds. Defaults to
+            ``5``.
+
+    Raises:
+        :exc:`ValueError`: If one of the arguments is out of range.
+    """
+
+    __slots__ = (
+        "_factor",
+        "_latencies",
+        "_max_timeout",
+        "_min_timeout",
+        "_quantile",
+        "_timeouts",
+    )
+
+    WINDOW_SIZE: Final[int] = 200
+    """:obj:`int`: The number of recent latencies per endpoint that the timeout is based on."""
+    MIN_SAMPLES: Final[int] = 20
+    """:obj:`int`: The number of latencies that must be observed for an endpoint before its
+    timeout is adapted."""
+
+    def __init__(
+        self,
+        quantile: float = 0.99,
+        factor: float = 3,
+        min_timeout: float = 1,
+        max_timeout: float = 5,
+    ):
+        if not 0 <= quantile <= 1:
+            raise ValueError("`quantile` must be between 0 and 1.")
+        if factor < 1:
+            raise ValueError("`factor` must be at least 1.")
+        if not 0 < min_timeout <= max_timeout:
+            raise ValueError("`min_timeout` must be positive and at most `max_timeout`.")
+
+        self._quantile: float = quantile
+        self._factor: float = factor
+        self._min_timeout: float = min_timeout
+        self._max_timeout: float = max_timeout
+        self._latencies: Dict[str, Deque[float]] = {}
+        # The number of consecutive requests per endpoint that timed out
+        self._timeouts: Dict[str, int] = {}
+
+    @property
+    def quantile(self) -> float:
+        """:obj:`float`: The quantile of the recent latencies that the timeout is based on."""
+        return self._quantile
+
+    @property
+    def factor(self) -> float:
+        """:obj:`float`: The factor that the quantile is multiplied with."""
+        return self._factor
+
+    @property
+    def min_timeout(self) -> float:
+        """:obj:`float`: The minimal read timeout in seconds."""
+        return self._min_timeout
+
+    @property
+    def max_timeout(self) -> float:
+        """:obj:`float`: The maximal read timeout in seconds."""
+        return self._max_timeout
+
+    def read_timeout(self, endpoint: str) -> Optional[float]:
+        """Returns the read timeout for a request to the given endpoint.
+
+        Args:
+            endpoint (:obj:`str`): The name of the Bot API endpoint.
+
+        Returns:
+            :obj:`float` | :obj:`None`: The read timeout in seconds or :obj:`None`, if not enough
+            latencies were observed yet or if the default read timeout should be used after
+            several consecutive timeouts.
+        """
+        latencies = self._latencies.get(endpoint)
+        if latencies is None or len(latencies) < self.MIN_SAMPLES:
+            return None
+        ordered = sorted(latencies)
+        index = max(math.ceil(self._quantile * len(ordered)) - 1, 0)
+        timeout = min(max(ordered[index] * self._factor, self._min_timeout), self._max_timeout)
+
+        timeouts = self._timeouts.get(endpoint)
+        if timeouts:
+            timeout *= 2 ** min(timeouts, 32)
+            if timeout > self._max_timeout:
+                return None
+        return timeout
+
+    def record_latency(self, endpoint: str, latency: float) -> None:
+        """Records the latency of a request that was answered by Telegram.
+
+        Warning:
+            This method is called by :class:`telegram.request.BaseRequest` and is not intended to
+            be called by users directly.
+
+        Args:
+            endpoint (:obj:`str`): The name of the Bot API endpoint.
+            latency (:obj:`float`): The time in seconds until the answer arrived.
+        """
+        self._timeouts.pop(endpoint, None)
+        self._append(endpoint, latency)
+
+    def record_timeout(self, endpoint: str, timeout: float) -> None:
+        """Records a request that was not answered by Telegram within the read timeout.
+
+        Warning:
+            This method is called by :class:`telegram.request.BaseRequest` and is not intended to
+            be called by users directly.
+
+        Args:
+            endpoint (:obj:`str`): The name of the Bot API endpoint.
+            timeout (:obj:`float`): The read timeout of the request in seconds.
+        """
+        self._timeouts[endpoint] = self._timeouts.get(endpoint, 0) + 1
+        self._append(endpoint, timeout)
+
+    def _append(self, endpoint: str, latency: float) -> None:
+        latencies = self._latencies.get(endpoint)
+        if latencies is None:
+            latencies = self._latencies[endpoint] = deque(maxlen=self.WINDOW_SIZE)
+        latencies.append(latency)
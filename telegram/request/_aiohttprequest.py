@@ -0,0 +1,348 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains methods to make POST and GET requests using the aiohttp library."""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Tuple, Union
+
+try:
+    import aiohttp
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    from aiohttp_socks import ProxyConnector
+
+    AIOHTTP_SOCKS_AVAILABLE = True
+except ImportError:
+    AIOHTTP_SOCKS_AVAILABLE = False
+
+from telegram._utils.defaultvalue import DefaultValue
+from telegram._utils.logging import get_logger
+from telegram._utils.types import ODVInput
+from telegram.error import NetworkError, TimedOut
+from telegram.request._baserequest import BaseRequest
+from telegram.request._connectionlimiter import ConnectionLimiter
+from telegram.request._requestdata import RequestData
+
+if TYPE_CHECKING:
+    from aiohttp import BaseConnector, ClientSession, ClientTimeout
+
+_LOGGER = get_logger(__name__, "AiohttpRequest")
+# Size of the chunks in which the payload of a response is handed out by `do_stream_request`
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class AiohttpRequest(BaseRequest):
+    """Implementation of :class:`~telegram.request.BaseRequest` using the library
+    `aiohttp <https://docs.aiohttp.org>`_. It can be used in place of
+    :class:`~telegram.request.HTTPXRequest`, e.g. by passing it to
+    :meth:`telegram.ext.ApplicationBuilder.request`.
+
+    Note:
+        * To use this class, PTB must be installed via
+          :command:`pip install "python-telegram-bot[aiohttp]"`.
+        * aiohttp only supports HTTP/1.1.
+        * aiohttp has no timeout for writing the request. The read timeout of requests that
+          upload files is therefore extended by the write timeout, i.e. such requests may take
+          up to :paramref:`read_timeout` + :paramref:`media_write_timeout` after the last byte
+          of the response was received.
+        * The session used by this class is created by :meth:`initialize`.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        connection_pool_size (:obj:`int`, optional): Number of connections to keep in the
+            connection pool. Defaults to ``1``.
+
+            Note:
+                Independent of the value, one additional connection will be reserved for
+                :meth:`telegram.Bot.get_updates`.
+        read_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+            amount of time (in seconds) to wait for a response from Telegram's server.
+            This value is used unless a different value is passed to :meth:`do_request`.
+            Defaults to ``5``.
+        write_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+            amount of time (in seconds) to wait for a write operation to complete (in terms of
+            a network socket; i.e. POSTing a request or uploading a file).
+            This value is used unless a different value is passed to :meth:`do_request`.
+            Defaults to ``5``.
+
+            Hint:
+                This timeout is used for all requests except for those that upload media/files.
+                For the latter, :paramref:`media_write_timeout` is used.
+        connect_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the
+            maximum amount of time (in seconds) to wait for a connection attempt to a server
+            to succeed. This value is used unless a different value is passed to
+            :meth:`do_request`. Defaults to ``5``.
+        pool_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+            amount of time (in seconds) to wait for a connection to become available.
+            This value is used unless a different value is passed to :meth:`do_request`.
+            Defaults to ``1``.
+
+            Warning:
+                With a finite pool timeout, you must expect :exc:`telegram.error.TimedOut`
+                exceptions to be thrown when more requests are made simultaneously than there are
+                connections in the connection pool!
+        proxy (:obj:`str`, optional): The URL to a proxy server, for example
+            ``'http://127.0.0.1:3128'`` or ``'socks5://127.0.0.1:3128'``. Defaults to
+            :obj:`None`.
+
+            Note:
+                * If no proxy is passed, the proxy URL is read from the environment variables
+                  ``HTTP_PROXY`` and ``HTTPS_PROXY``. See `the docs of aiohttp`_ for more info.
+                * For Socks4 and Socks5 support, additional dependencies are required. Make sure
+                  to install PTB via :command:`pip install "python-telegram-bot[aiohttp-socks]"`
+                  in this case.
+
+            .. _the docs of aiohttp: https://docs.aiohttp.org/en/stable/client_advanced.html\
+#proxy-support
+        media_write_timeout (:obj:`float` | :obj:`None`, optional): Like :paramref:`write_timeout`,
+            but used only for requests that upload media/files. This value is used unless a
+            different value is passed to :paramref:`do_request.write_timeout` of
+            :meth:`do_request`. Defaults to ``20`` seconds.
+
+    Raises:
+        :exc:`RuntimeError`: If the required optional dependencies are not installed.
+    """
+
+    __slots__ = (
+        "_connect_timeout",
+        "_connection_limiter",
+        "_media_write_timeout",
+        "_pool_timeout",
+        "_proxy",
+        "_read_timeout",
+        "_session",
+        "_write_timeout",
+    )
+
+    def __init__(
+        self,
+        connection_pool_size: int = 1,
+        read_timeout: Optional[float] = 5.0,
+        write_timeout: Optional[float] = 5.0,
+        connect_timeout: Optional[float] = 5.0,
+        pool_timeout: Optional[float] = 1.0,
+        proxy: Optional[str] = None,
+        media_write_timeout: Optional[float] = 20.0,
+    ):
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError(
+                "To use `AiohttpRequest`, PTB must be installed via `pip install "
+                '"python-telegram-bot[aiohttp]"`.'
+            )
+        if proxy is not None and proxy.startswith("socks") and not AIOHTTP_SOCKS_AVAILABLE:
+            raise RuntimeError(
+                "To use Socks proxies with `AiohttpRequest`, PTB must be installed via `pip "
+                'install "python-telegram-bot[aiohttp-socks]"`.'
+            )
+
+        self._read_timeout: Optional[float] = read_timeout
+        self._write_timeout: Optional[float] = write_timeout
+        self._connect_timeout: Optional[float] = connect_timeout
+        self._pool_timeout: Optional[float] = pool_timeout
+        self._media_write_timeout: Optional[float] = media_write_timeout
+        self._proxy: Optional[str] = proxy
+        # aiohttp has no pool timeout, so we wait for free connections ourselves
+        self._connection_limiter: ConnectionLimiter = ConnectionLimiter(
+            min_size=connection_pool_size, max_size=connection_pool_size
+        )
+        self._session: Optional[ClientSession] = None
+
+    @property
+    def read_timeout(self) -> Optional[float]:
+        """See :attr:`BaseRequest.read_timeout`.
+
+        Returns:
+            :obj:`float` | :obj:`None`: The default read timeout in seconds as passed to
+                :paramref:`AiohttpRequest.read_timeout`.
+        """
+        return self._read_timeout
+
+    @property
+    def connection_pool_size(self) -> int:
+        """:obj:`int`: The size of the connection pool."""
+        return self._connection_limiter.size
+
+    def _build_connector(self) -> "BaseConnector":
+        size = self._connection_limiter.size
+        if self._proxy is not None and self._proxy.startswith("socks"):
+            return ProxyConnector.from_url(self._proxy, limit=size)
+        return aiohttp.TCPConnector(limit=size)
+
+    async def initialize(self) -> None:
+        """See :meth:`BaseRequest.initialize`."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=self._build_connector(),
+                headers={"User-Agent": self.USER_AGENT},
+                # Read the proxy settings from the environment variables
+                trust_env=self._proxy is None,
+            )
+
+    async def shutdown(self) -> None:
+        """See :meth:`BaseRequest.shutdown`."""
+        if self._session is None or self._session.closed:
+            _LOGGER.debug("This AiohttpRequest is already shut down. Returning.")
+            return
+
+        await self._session.close()
+
+    def _build_timeout(
+        self,
+        read_timeout: ODVInput[float],
+        write_timeout: ODVInput[float],
+        connect_timeout: ODVInput[float],
+        has_files: bool,
+    ) -> "ClientTimeout":
+        # If user did not specify timeouts (for e.g. in a bot method), use the default ones when we
+        # created this instance.
+        if isinstance(read_timeout, DefaultValue):
+            read_timeout = self._read_timeout
+        if isinstance(connect_timeout, DefaultValue):
+            connect_timeout = self._connect_timeout
+        if isinstance(write_timeout, DefaultValue):
+            write_timeout = self._write_timeout if not has_files else self._media_write_timeout
+
+        # aiohttp starts waiting for the response while the body is still being written
+        if has_files and read_timeout is not None:
+            read_timeout = None if write_timeout is None else read_timeout + write_timeout
+
+        return aiohttp.ClientTimeout(
+            total=None, connect=None, sock_connect=connect_timeout, sock_read=read_timeout
+        )
+
+    def _build_request_kwargs(
+        self,
+        url: str,
+        method: str,
+        request_data: Optional[RequestData],
+        read_timeout: ODVInput[float],
+        write_timeout: ODVInput[float],
+        connect_timeout: ODVInput[float],
+    ) -> Dict[str, Any]:
+        files = request_data.multipart_data if request_data else None
+        parameters = request_data.json_parameters if request_data else None
+        data: Union[None, Dict[str, str], aiohttp.FormData] = parameters
+        if files:
+            data = aiohttp.FormData()
+            for name, value in (parameters or {}).items():
+                data.add_field(name, value)
+            for name, (filename, content, mimetype) in files.items():
+                data.add_field(name, content, filename=filename, content_type=mimetype)
+
+        return {
+            "method": method,
+            "url": url,
+            "data": data,
+            "proxy": (
+                None if self._proxy is None or self._proxy.startswith("socks") else self._proxy
+            ),
+            "timeout": self._build_timeout(
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                has_files=bool(files),
+            ),
+        }
+
+    def _get_session(self) -> "ClientSession":
+        if self._session is None or self._session.closed:
+            raise RuntimeError("This AiohttpRequest is not initialized!")
+        return self._session
+
+    @asynccontextmanager
+    async def _acquire_connection(self, pool_timeout: ODVInput[float]) -> AsyncIterator[None]:
+        if isinstance(pool_timeout, DefaultValue):
+            pool_timeout = self._pool_timeout
+        await self._connection_limiter.acquire(pool_timeout)
+        try:
+            yield
+        finally:
+            self._connection_limiter.release()
+
+    @staticmethod
+    def _convert_exception(err: Exception) -> Union[TimedOut, NetworkError]:
+        if isinstance(err, asyncio.TimeoutError):
+            return TimedOut()
+        # We include the class name for easier debugging. Especially useful if the error
+        # message of `err` is empty.
+        return NetworkError(f"aiohttp.{err.__class__.__name__}: {err}")
+
+    async def do_request(
+        self,
+        url: str,
+        method: str,
+        request_data: Optional[RequestData] = None,
+        read_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        write_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+    ) -> Tuple[int, bytes]:
+        """See :meth:`BaseRequest.do_request`."""
+        session = self._get_session()
+        kwargs = self._build_request_kwargs(
+            url=url,
+            method=method,
+            request_data=request_data,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+        )
+
+        try:
+            # pylint mistakes the type hints of `ClientSession.request` for its implementation
+            # pylint: disable-next=not-async-context-manager
+            async with self._acquire_connection(pool_timeout), session.request(**kwargs) as res:
+                return res.status, await res.read()
+        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+            raise self._convert_exception(err) from err
+
+    @asynccontextmanager
+    async def do_stream_request(
+        self,
+        url: str,
+        method: str,
+        request_data: Optional[RequestData] = None,
+        read_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        write_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+    ) -> AsyncIterator[Tuple[int, AsyncIterator[bytes]]]:
+        """See :meth:`BaseRequest.do_stream_request`."""
+        session = self._get_session()
+        kwargs = self._build_request_kwargs(
+            url=url,
+            method=method,
+            request_data=request_data,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+        )
+
+        try:
+            # pylint mistakes the type hints of `ClientSession.request` for its implementation
+            # pylint: disable-next=not-async-context-manager
+            async with self._acquire_connection(pool_timeout), session.request(**kwargs) as res:
+                yield res.status, res.content.iter_chunked(_STREAM_CHUNK_SIZE)
+        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+            raise self._convert_exception(err) from err
@@ -18,10 +18,27 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an abstract class to make POST and GET requests."""
 import abc
-import json
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from functools import partial
 from http import HTTPStatus
 from types import TracebackType
-from typing import AsyncContextManager, Final, List, Optional, Tuple, Type, TypeVar, Union, final
+from typing import (
+    AsyncContextManager,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Final,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    final,
+)
 
 from telegram._utils.defaultvalue import DEFAULT_NONE as _DEFAULT_NONE
 from telegram._utils.defaultvalue import DefaultValue
@@ -38,8 +55,14 @@ from telegram.error import (
     NetworkError,
     RetryAfter,
     TelegramError,
+    TimedOut,
 )
+from telegram.request._adaptivetimeouts import AdaptiveTimeouts
+from telegram.request._circuitbreaker import CircuitBreaker
+from telegram.request._hedgingpolicy import HedgingPolicy
+from telegram.request._jsoncodec import get_json_codec
 from telegram.request._requestdata import RequestData
+from telegram.request._requestmetrics import RequestMetrics, RequestRecord
 from telegram.warnings import PTBDeprecationWarning
 
 RT = TypeVar("RT", bound="BaseRequest")
@@ -76,8 +99,10 @@ class BaseRequest(
 
     Tip:
         JSON encoding and decoding is done with the standard library's :mod:`json` by default.
-        To use a custom library for this, you can override :meth:`parse_json_payload` and implement
-        custom logic to encode the keys of :attr:`telegram.request.RequestData.parameters`.
+        To use a custom library for this, you can register a :class:`telegram.request.JSONCodec`
+        via :func:`telegram.request.set_json_codec`. Alternatively, you can override
+        :meth:`parse_json_payload` and implement custom logic to encode the keys of
+        :attr:`telegram.request.RequestData.parameters`.
 
     .. seealso:: :wiki:`Architecture Overview <Architecture>`,
         :wiki:`Builder Pattern <Builder-Pattern>`
@@ -85,7 +110,7 @@ class BaseRequest(
     .. versionadded:: 20.0
     """
 
-    __slots__ = ()
+    __slots__ = ("_adaptive_timeouts", "_circuit_breaker", "_hedging_policy", "_metrics")
 
     USER_AGENT: Final[str] = f"python-telegram-bot v{ptb_ver} (https://python-telegram-bot.org)"
     """:obj:`str`: A description that can be used as user agent for requests made to the Bot API.
@@ -148,6 +173,64 @@ class BaseRequest(
         """
         raise NotImplementedError
 
+    @property
+    def metrics(self) -> Optional[RequestMetrics]:
+        """:class:`telegram.request.RequestMetrics` | :obj:`None`: If set, metrics about the
+        requests made by this instance are collected in this object. Defaults to :obj:`None`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        # Subclasses don't necessarily call `BaseRequest.__init__`
+        return getattr(self, "_metrics", None)
+
+    @metrics.setter
+    def metrics(self, metrics: Optional[RequestMetrics]) -> None:
+        self._metrics = metrics
+
+    @property
+    def hedging_policy(self) -> Optional[HedgingPolicy]:
+        """:class:`telegram.request.HedgingPolicy` | :obj:`None`: If set, requests to read-only
+        methods of the Bot API are hedged according to this policy. Defaults to :obj:`None`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        # Subclasses don't necessarily call `BaseRequest.__init__`
+        return getattr(self, "_hedging_policy", None)
+
+    @hedging_policy.setter
+    def hedging_policy(self, hedging_policy: Optional[HedgingPolicy]) -> None:
+        self._hedging_policy = hedging_policy
+
+    @property
+    def adaptive_timeouts(self) -> Optional[AdaptiveTimeouts]:
+        """:class:`telegram.request.AdaptiveTimeouts` | :obj:`None`: If set, the read timeouts of
+        requests that don't pass an explicit read timeout are derived from the observed
+        latencies of their endpoint. Defaults to :obj:`None`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        # Subclasses don't necessarily call `BaseRequest.__init__`
+        return getattr(self, "_adaptive_timeouts", None)
+
+    @adaptive_timeouts.setter
+    def adaptive_timeouts(self, adaptive_timeouts: Optional[AdaptiveTimeouts]) -> None:
+        self._adaptive_timeouts = adaptive_timeouts
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """:class:`telegram.request.CircuitBreaker` | :obj:`None`: If set, requests to endpoints
+        of the Bot API that failed repeatedly fail immediately for a while. Defaults to
+        :obj:`None`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        # Subclasses don't necessarily call `BaseRequest.__init__`
+        return getattr(self, "_circuit_breaker", None)
+
+    @circuit_breaker.setter
+    def circuit_breaker(self, circuit_breaker: Optional[CircuitBreaker]) -> None:
+        self._circuit_breaker = circuit_breaker
+
     @abc.abstractmethod
     async def initialize(self) -> None:
         """Initialize resources used by this class. Must be implemented by a subclass."""
@@ -258,6 +341,96 @@ class BaseRequest(
             pool_timeout=pool_timeout,
         )
 
+    @final
+    async def retrieve_stream(
+        self,
+        url: str,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+    ) -> AsyncGenerator[bytes, None]:
+        """Retrieve the contents of a file by its URL chunk by chunk. In contrast to
+        :meth:`retrieve`, the contents are not buffered in memory as a whole, if the
+        implementation supports streaming, see :meth:`do_stream_request`.
+
+        Warning:
+            This method will be called by the methods of :class:`telegram.File` and should *not*
+            be called manually.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            url (:obj:`str`): The web location we want to retrieve.
+            read_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a response from Telegram's server instead
+                of the time specified during creating of this object. Defaults to
+                :attr:`DEFAULT_NONE`.
+            write_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a write operation to complete (in terms of
+                a network socket; i.e. POSTing a request or uploading a file) instead of the time
+                specified during creating of this object. Defaults to :attr:`DEFAULT_NONE`.
+            connect_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the
+                maximum amount of time (in seconds) to wait for a connection attempt to a server
+                to succeed instead of the time specified during creating of this object. Defaults
+                to :attr:`DEFAULT_NONE`.
+            pool_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a connection to become available instead
+                of the time specified during creating of this object. Defaults to
+                :attr:`DEFAULT_NONE`.
+
+        Yields:
+            :obj:`bytes`: The next chunk of the files contents.
+
+        """
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.start_request()
+        start = time.perf_counter()
+        code: Optional[int] = None
+        received = 0
+        error: Optional[BaseException] = None
+        try:
+            async with self.do_stream_request(
+                url=url,
+                method="GET",
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            ) as (code, chunks):
+                if not HTTPStatus.OK <= code <= 299:
+                    payload = b"".join([chunk async for chunk in chunks])
+                    received = len(payload)
+                    raise self._error_from_response(code, payload)
+                async for chunk in chunks:
+                    received += len(chunk)
+                    yield chunk
+        except TelegramError as exc:
+            error = exc
+            raise exc
+        except Exception as exc:
+            error = NetworkError(f"Unknown error in HTTP implementation: {exc!r}")
+            raise error from exc
+        except GeneratorExit:
+            # The consumer stopped iterating early
+            raise
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            if metrics is not None:
+                metrics.finish_request(
+                    RequestRecord(
+                        endpoint=RequestMetrics.FILE_DOWNLOAD,
+                        duration=time.perf_counter() - start,
+                        status_code=code,
+                        error=error,
+                        bytes_sent=0,
+                        bytes_received=received,
+                    )
+                )
+
     async def _request_wrapper(
         self,
         url: str,
@@ -326,25 +499,184 @@ class BaseRequest(
             )
             write_timeout = 20
 
-        try:
-            code, payload = await self.do_request(
-                url=url,
-                method=method,
-                request_data=request_data,
-                read_timeout=read_timeout,
-                write_timeout=write_timeout,
-                connect_timeout=connect_timeout,
-                pool_timeout=pool_timeout,
+        hedging_policy = self.hedging_policy
+        metrics = self.metrics
+        adaptive_timeouts = self.adaptive_timeouts
+        circuit_breaker = self.circuit_breaker
+        endpoint = ""
+        if any(
+            obj is not None
+            for obj in (hedging_policy, metrics, adaptive_timeouts, circuit_breaker)
+        ):
+            # Files are downloaded via GET, all Bot API methods via POST
+            endpoint = url.rsplit("/", 1)[-1] if method == "POST" else RequestMetrics.FILE_DOWNLOAD
+        # The durations of uploads, downloads and long polling don't tell much about the server
+        adapt_timeout = (
+            adaptive_timeouts is not None
+            and not has_files
+            and endpoint
+            not in (RequestMetrics.FILE_DOWNLOAD, *RequestMetrics.LONG_POLLING_ENDPOINTS)
+        )
+        adapted_timeout: Optional[float] = None
+        if adapt_timeout and isinstance(read_timeout, DefaultValue):
+            adapted_timeout = adaptive_timeouts.read_timeout(  # type: ignore[union-attr]
+                endpoint
             )
-        except TelegramError as exc:
-            raise exc
+            read_timeout = adapted_timeout or read_timeout
+
+        request = partial(
+            self.do_request,
+            url=url,
+            method=method,
+            request_data=request_data,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+        )
+        if metrics is not None:
+            metrics.start_request()
+        start = time.perf_counter()
+        code: Optional[int] = None
+        payload = b""
+        error: Optional[BaseException] = None
+        try:
+            try:
+                if circuit_breaker is not None:
+                    circuit_breaker.before_request(endpoint)
+                    code, payload = await self._do_guarded_request(
+                        circuit_breaker, endpoint, request, hedging_policy
+                    )
+                else:
+                    code, payload = await self._do_request(endpoint, request, hedging_policy)
+                if adapt_timeout:
+                    adaptive_timeouts.record_latency(  # type: ignore[union-attr]
+                        endpoint, time.perf_counter() - start
+                    )
+            except TimedOut as exc:
+                # Without recording the timeout, a learned timeout that is shorter than the
+                # latency of a slowed down server would never be corrected. Pool timeouts say
+                # nothing about the server, as the request wasn't sent at all.
+                if adapted_timeout is not None and not self._was_not_sent(exc):
+                    adaptive_timeouts.record_timeout(  # type: ignore[union-attr]
+                        endpoint, adapted_timeout
+                    )
+                raise exc
+            except TelegramError as exc:
+                raise exc
+            except Exception as exc:
+                raise NetworkError(f"Unknown error in HTTP implementation: {exc!r}") from exc
+
+            if HTTPStatus.OK <= code <= 299:
+                # 200-299 range are HTTP success statuses
+                return payload
+
+            raise self._error_from_response(code, payload)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            if metrics is not None:
+                metrics.finish_request(
+                    RequestRecord(
+                        endpoint=endpoint,
+                        duration=time.perf_counter() - start,
+                        status_code=code,
+                        error=error,
+                        bytes_sent=RequestMetrics.request_size(request_data),
+                        bytes_received=len(payload),
+                    )
+                )
+
+    @staticmethod
+    def _was_not_sent(exc: BaseException) -> bool:
+        """Whether the exception shows that the request was not sent to Telegram at all, e.g.
+        because all connections in the connection pool were occupied. Such errors say nothing
+        about the server.
+        """
+        return isinstance(exc, TelegramError) and (
+            exc.message.startswith("Pool timeout") or "Request was *not* sent" in exc.message
+        )
+
+    @classmethod
+    async def _do_request(
+        cls,
+        endpoint: str,
+        request: Callable[[], Awaitable[Tuple[int, bytes]]],
+        hedging_policy: Optional[HedgingPolicy],
+    ) -> Tuple[int, bytes]:
+        if hedging_policy is not None and endpoint in hedging_policy.endpoints:
+            return await cls._do_hedged_request(hedging_policy, endpoint, request)
+        return await request()
+
+    @classmethod
+    async def _do_guarded_request(
+        cls,
+        circuit_breaker: CircuitBreaker,
+        endpoint: str,
+        request: Callable[[], Awaitable[Tuple[int, bytes]]],
+        hedging_policy: Optional[HedgingPolicy],
+    ) -> Tuple[int, bytes]:
+        """Makes the request and reports its outcome to the circuit breaker. Exceptions and
+        server errors count as failures, while all other answers show that the server is
+        reachable, even if they are errors. Requests that were not sent at all, e.g. because of
+        pool timeouts, count as neither.
+        """
+        try:
+            code, payload = await cls._do_request(endpoint, request, hedging_policy)
         except Exception as exc:
-            raise NetworkError(f"Unknown error in HTTP implementation: {exc!r}") from exc
+            if cls._was_not_sent(exc):
+                circuit_breaker.abort_request(endpoint)
+            else:
+                circuit_breaker.after_request(endpoint, failed=True)
+            raise
+        except BaseException:
+            circuit_breaker.abort_request(endpoint)
+            raise
+        circuit_breaker.after_request(endpoint, failed=code >= HTTPStatus.INTERNAL_SERVER_ERROR)
+        return code, payload
 
-        if HTTPStatus.OK <= code <= 299:
-            # 200-299 range are HTTP success statuses
-            return payload
+    @staticmethod
+    async def _do_hedged_request(
+        hedging_policy: HedgingPolicy,
+        endpoint: str,
+        request: Callable[[], Awaitable[Tuple[int, bytes]]],
+    ) -> Tuple[int, bytes]:
+        """Makes the request and, if it's not answered within the delay of the hedging policy,
+        an identical second one. Returns the first answer and cancels the other request.
+        """
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(request())
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedging_policy.delay(endpoint))
+            if not done:
+                hedging_policy.record_hedge()
+                tasks.append(asyncio.ensure_future(request()))
+
+            error: Optional[BaseException] = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Retrieve all exceptions, so that none is reported as unhandled
+                errors = {task: task.exception() for task in done}
+                for task in tasks:
+                    if task in errors and errors[task] is None:
+                        hedging_policy.record_latency(
+                            endpoint, time.perf_counter() - start, hedge_won=task is not primary
+                        )
+                        return task.result()
+                error = error or next(iter(errors.values()))
+            # Both requests failed, raise the error that occurred first
+            raise error  # type: ignore[misc]
+        finally:
+            for task in tasks:
+                task.cancel()
 
+    def _error_from_response(  # pylint: disable=too-many-return-statements
+        self, code: int, payload: bytes
+    ) -> TelegramError:
+        """Returns the exception matching an unsuccessful response of the Bot API."""
         response_data = self.parse_json_payload(payload)
 
         description = response_data.get("description")
@@ -359,38 +691,41 @@ class BaseRequest(
         if parameters:
             migrate_to_chat_id = parameters.get("migrate_to_chat_id")
             if migrate_to_chat_id:
-                raise ChatMigrated(migrate_to_chat_id)
+                return ChatMigrated(migrate_to_chat_id)
             retry_after = parameters.get("retry_after")
             if retry_after:
-                raise RetryAfter(retry_after)
+                return RetryAfter(retry_after)
 
             message += f"\nThe server response contained unknown parameters: {parameters}"
 
         if code == HTTPStatus.FORBIDDEN:  # 403
-            raise Forbidden(message)
+            return Forbidden(message)
         if code in (HTTPStatus.NOT_FOUND, HTTPStatus.UNAUTHORIZED):  # 404 and 401
             # TG returns 404 Not found for
             #   1) malformed tokens
             #   2) correct tokens but non-existing method, e.g. api.tg.org/botTOKEN/unkonwnMethod
             # 2) is relevant only for Bot.do_api_request, where we have special handing for it.
             # TG returns 401 Unauthorized for correctly formatted tokens that are not valid
-            raise InvalidToken(message)
+            return InvalidToken(message)
         if code == HTTPStatus.BAD_REQUEST:  # 400
-            raise BadRequest(message)
+            return BadRequest(message)
         if code == HTTPStatus.CONFLICT:  # 409
-            raise Conflict(message)
+            return Conflict(message)
         if code == HTTPStatus.BAD_GATEWAY:  # 502
-            raise NetworkError(description or "Bad Gateway")
-        raise NetworkError(f"{message} ({code})")
+            return NetworkError(description or "Bad Gateway")
+        return NetworkError(f"{message} ({code})")
 
     @staticmethod
     def parse_json_payload(payload: bytes) -> JSONDict:
         """Parse the JSON returned from Telegram.
 
         Tip:
-            By default, this method uses the standard library's :func:`json.loads` and
-            ``errors="replace"`` in :meth:`bytes.decode`.
-            You can override it to customize either of these behaviors.
+            By default, this method uses :meth:`telegram.request.JSONCodec.loads` of the codec
+            returned by :func:`telegram.request.get_json_codec`.
+            You can override it to customize this behavior.
+
+        .. versionchanged:: NEXT.VERSION
+            Uses the codec returned by :func:`telegram.request.get_json_codec`.
 
         Args:
             payload (:obj:`bytes`): The UTF-8 encoded JSON payload as returned by Telegram.
@@ -401,11 +736,12 @@ class BaseRequest(
         Raises:
             TelegramError: If loading the JSON data failed
         """
-        decoded_s = payload.decode("utf-8", "replace")
         try:
-            return json.loads(decoded_s)
+            return get_json_codec().loads(payload)
         except ValueError as exc:
-            _LOGGER.error('Can not load invalid JSON data: "%s"', decoded_s)
+            _LOGGER.error(
+                'Can not load invalid JSON data: "%s"', payload.decode("utf-8", "replace")
+            )
             raise TelegramError("Invalid server response") from exc
 
     @abc.abstractmethod
@@ -430,6 +766,12 @@ class BaseRequest(
             method (:obj:`str`): HTTP method (i.e. ``'POST'``, ``'GET'``, etc.).
             request_data (:class:`telegram.request.RequestData`, optional): An object containing
                 information about parameters and files to upload for the request.
+
+                .. versionchanged:: NEXT.VERSION
+                    The file contents in
+                    :attr:`~telegram.request.RequestData.multipart_data` may be file handles
+                    instead of :obj:`bytes`, see :paramref:`telegram.InputFile.read_file_handle`.
+                    These should be read in chunks while uploading.
             read_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
                 amount of time (in seconds) to wait for a response from Telegram's server instead
                 of the time specified during creating of this object. Defaults to
@@ -451,3 +793,57 @@ class BaseRequest(
             Tuple[:obj:`int`, :obj:`bytes`]: The HTTP return code & the payload part of the server
             response.
         """
+
+    @asynccontextmanager
+    async def do_stream_request(
+        self,
+        url: str,
+        method: str,
+        request_data: Optional[RequestData] = None,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+    ) -> AsyncIterator[Tuple[int, AsyncIterator[bytes]]]:
+        """Makes a request to the Bot API and gives access to the payload of the response as it
+        is received. Used by :meth:`retrieve_stream`.
+
+        The default implementation calls :meth:`do_request` and hands out the payload as a single
+        chunk. Implementations that support streaming should override this method. The chunks
+        must only be read while the context is entered.
+
+        Warning:
+            This method will be called by :meth:`retrieve_stream`. It should *not* be called
+            manually.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            url (:obj:`str`): The URL to request.
+            method (:obj:`str`): HTTP method (i.e. ``'POST'``, ``'GET'``, etc.).
+            request_data (:class:`telegram.request.RequestData`, optional): An object containing
+                information about parameters and files to upload for the request.
+            read_timeout (:obj:`float` | :obj:`None`, optional): Same as for :meth:`do_request`.
+            write_timeout (:obj:`float` | :obj:`None`, optional): Same as for :meth:`do_request`.
+            connect_timeout (:obj:`float` | :obj:`None`, optional): Same as for
+                :meth:`do_request`.
+            pool_timeout (:obj:`float` | :obj:`None`, optional): Same as for :meth:`do_request`.
+
+        Returns:
+            An asynchronous context manager that yields a tuple of the HTTP return code and an
+            asynchronous iterator over the chunks of the payload.
+        """
+        code, payload = await self.do_request(
+            url=url,
+            method=method,
+            request_data=request_data,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+        )
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield payload
+
+        yield code, chunks()
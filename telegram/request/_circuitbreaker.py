@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the CircuitBreaker class."""
+import time
+from typing import Dict, Final
+
+from telegram._utils.logging import get_logger
+from telegram.error import NetworkError
+
+_LOGGER = get_logger(__name__, "CircuitBreaker")
+
+
+class _Circuit:
+    __slots__ = ("failures", "opened_at", "probing")
+
+    def __init__(self) -> None:
+        self.failures: int = 0
+        self.opened_at: float = 0.0
+        self.probing: bool = False
+
+
+class CircuitBreaker:
+    """Stops sending requests to an endpoint of the Bot API for a while after consecutive
+    failures. Failures are exceptions raised while sending the request or waiting for the
+    answer, e.g. :class:`telegram.error.TimedOut`, and answers with a HTTP status code of
+    ``500`` or above. Errors raised before the request was sent, such as pool timeouts, are not
+    counted.
+
+    After :paramref:`failure_threshold` consecutive failures, the circuit of the endpoint
+    *opens*: requests to it fail immediately with a :class:`telegram.error.NetworkError`. After
+    :paramref:`recovery_time` seconds, a single request is let through as probe. If it succeeds,
+    the circuit *closes* again, otherwise it stays open for another :paramref:`recovery_time`.
+
+    To use a circuit breaker, assign an instance to
+    :attr:`telegram.request.BaseRequest.circuit_breaker`.
+
+    .. seealso:: :class:`telegram.request.AdaptiveTimeouts`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        failure_threshold (:obj:`int`, optional): The number of consecutive failures after which
+            the circuit opens. Defaults to ``5``.
+        recovery_time (:obj:`float`, optional): The time in seconds after which a probe is let
+            through. Defaults to ``30``.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`failure_threshold` or :paramref:`recovery_time` is not
+            positive.
+    """
+
+    __slots__ = ("_circuits", "_failure_threshold", "_recovery_time")
+
+    OPEN_MESSAGE: Final[str] = (
+        "Circuit breaker is open: Too many consecutive requests to `{}` failed. Request was "
+        "*not* sent to Telegram."
+    )
+    """:obj:`str`: The message of the :class:`telegram.error.NetworkError` raised for requests to
+    endpoints whose circuit is open. ``{}`` is replaced by the name of the endpoint."""
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30):
+        if failure_threshold < 1:
+            raise ValueError("`failure_threshold` must be a positive integer.")
+        if recovery_time <= 0:
+            raise ValueError("`recovery_time` must be positive.")
+
+        self._failure_threshold: int = failure_threshold
+        self._recovery_time: float = recovery_time
+        self._circuits: Dict[str, _Circuit] = {}
+
+    @property
+    def failure_threshold(self) -> int:
+        """:obj:`int`: The number of consecutive failures after which the circuit opens."""
+        return self._failure_threshold
+
+    @property
+    def recovery_time(self) -> float:
+        """:obj:`float`: The time in seconds after which a probe is let through."""
+        return self._recovery_time
+
+    def is_open(self, endpoint: str) -> bool:
+        """Whether the circuit of the endpoint is open, i.e. requests to it fail immediately or
+        only a probe is let through.
+
+        Args:
+            endpoint (:obj:`str`): The name of the Bot API endpoint.
+
+        Returns:
+            :obj:`bool`
+        """
+        circuit = self._circuits.get(endpoint)
+        return circuit is not None and circuit.failures >= self._failure_threshold
+
+    def before_request(self, endpoint: str) -> None:
+        """Checks whether a request to the endpoint may be sent.
+
+        Warning:
+            This method is called by :class:`telegram.request.BaseRequest` and is not intended to
+            be called by users directly.
+
+        Args:
+            endpoint (:obj:`str`): The name of the Bot API endpoint.
+
+        Raises:
+            :class:`telegram.error.NetworkError`: If the circuit of the endpoint is open.
+        """
+        if not self.is_open(endpoint):
+            return
+        circuit = self._circuits[endpoint]
+        if circuit.probing or time.monotonic() < circuit.opened_at + self._recovery_time:
+            raise NetworkError(self.OPEN_MESSAGE.format(endpoint))
+        circuit.probing = True
+
+    def after_request(self, endpoint: str, failed: bool) -> None:
+        """Records the outcome of a request allowed by :meth:`before_request`.
+
+        Warning:
+            This method is called by :class:`telegram.request.BaseRequest` and is not intended to
+            be called by users directly.
+
+        Args:
+            endpoint (:obj:`str`): The name of the Bot API endpoint.
+            failed (:obj:`bool`): Whether the request failed.
+        """
+        circuit = self._circuits.get(endpoint)
+        if not failed:
+            if circuit is not None:
+                if circuit.failures >= self._failure_threshold:
+                    _LOGGER.info("Closing the circuit of `%s`.", endpoint)
+                del self._circuits[endpoint]
+            return
+
+        if circuit is None:
+            circuit = self._circuits[endpoint] = _Circuit()
+        circuit.failures += 1
+        if circuit.failures >= self._failure_threshold and (
+            circuit.probing or circuit.failures == self._failure_threshold
+        ):
+            _LOGGER.warning(
+                "Opening the circuit of `%s` after %s consecutive failures.",
+                endpoint,
+                circuit.failures,
+            )
+            circuit.opened_at = time.monotonic()
+        circuit.probing = False
+
+    def abort_request(self, endpoint: str) -> None:
+        """Records that a request allowed by :meth:`before_request` was cancelled.
+
+        Warning:
+            This method is called by :class:`telegram.request.BaseRequest` and is not intended to
+            be called by users directly.
+
+        Args:
+            endpoint (:obj:`str`): The name of the Bot API endpoint.
+        """
+        circuit = self._circuits.get(endpoint)
+        if circuit is not None:
+            circuit.probing = False
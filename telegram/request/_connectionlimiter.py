@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a class that limits the number of concurrent requests of an
+:class:`~telegram.request.HTTPXRequest` to an adaptive connection pool size."""
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Final, Optional
+
+from telegram._utils.logging import get_logger
+from telegram.error import TimedOut
+
+_LOGGER = get_logger(__name__, "HTTPXRequest")
+
+
+class ConnectionLimiter:
+    """Limits the number of concurrent requests to a pool size that adapts to the load.
+
+    Whenever a request has waited :attr:`GROW_WAIT_TIME` seconds for a free connection, the pool
+    size grows by one up to :paramref:`max_size` and the longest waiting request is let through.
+    Short bursts are therefore served by the connections that are already open. Once per
+    :attr:`SHRINK_INTERVAL`, the pool size shrinks to the highest number of concurrent requests
+    seen since then, but not below :paramref:`min_size`.
+
+    .. versionadded:: NEXT.VERSION
+
+    Warning:
+        This class is intended to be used internally by the library and *not* by the user.
+        Changes to this class are not considered breaking changes and may not be documented in
+        the changelog.
+
+    Args:
+        min_size (:obj:`int`): The minimal and initial pool size.
+        max_size (:obj:`int`): The maximal pool size.
+    """
+
+    __slots__ = (
+        "_in_flight",
+        "_max_size",
+        "_min_size",
+        "_peak",
+        "_size",
+        "_wait_time",
+        "_waiters",
+        "_window_start",
+    )
+
+    GROW_WAIT_TIME: Final[float] = 0.05
+    SHRINK_INTERVAL: Final[float] = 30
+    # Weight of the latest wait time in the moving average of `wait_time`
+    _WAIT_TIME_WEIGHT: Final[float] = 0.1
+
+    def __init__(self, min_size: int, max_size: int):
+        self._min_size: int = min_size
+        self._max_size: int = max_size
+        self._size: int = min_size
+        self._in_flight: int = 0
+        self._peak: int = 0
+        self._window_start: float = time.monotonic()
+        self._wait_time: float = 0.0
+        self._waiters: Deque[asyncio.Future[None]] = deque()
+
+    @property
+    def size(self) -> int:
+        """:obj:`int`: The current pool size."""
+        return self._size
+
+    @property
+    def max_size(self) -> int:
+        """:obj:`int`: The maximal pool size."""
+        return self._max_size
+
+    @property
+    def in_flight(self) -> int:
+        """:obj:`int`: The number of requests currently holding a connection."""
+        return self._in_flight
+
+    @property
+    def wait_time(self) -> float:
+        """:obj:`float`: The exponential moving average of the time in seconds that requests
+        waited for a free connection."""
+        return self._wait_time
+
+    def _resize(self, size: int) -> None:
+        _LOGGER.debug("Resizing the connection pool from %s to %s", self._size, size)
+        self._size = size
+
+    def _record_wait(self, wait_time: float) -> None:
+        self._wait_time += self._WAIT_TIME_WEIGHT * (wait_time - self._wait_time)
+
+    def _grow(self) -> None:
+        # Called for every request that waited for GROW_WAIT_TIME seconds
+        if self._size >= self._max_size:
+            return
+        self._resize(self._size + 1)
+
+        # Skip waiters that were cancelled but didn't get the chance to remove themselves yet
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()
+        if self._waiters and self._in_flight < self._size:
+            self._in_flight += 1
+            self._peak = max(self._peak, self._in_flight)
+            self._waiters.popleft().set_result(None)
+
+    async def acquire(self, timeout: Optional[float]) -> None:
+        """Waits until a connection is free.
+
+        Args:
+            timeout (:obj:`float` | :obj:`None`): The maximum time to wait in seconds.
+
+        Raises:
+            :class:`telegram.error.TimedOut`: If no connection became free within
+                :paramref:`timeout`.
+        """
+        if self._in_flight < self._size and not self._waiters:
+            self._in_flight += 1
+            self._peak = max(self._peak, self._in_flight)
+            self._record_wait(0.0)
+            return
+
+        start = time.monotonic()
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._waiters.append(future)
+        if self._size < self._max_size:
+            handle = loop.call_later(self.GROW_WAIT_TIME, self._grow)
+            future.add_done_callback(lambda _: handle.cancel())
+        try:
+            await asyncio.wait_for(future, timeout)
+        except BaseException as exc:
+            if future.done() and not future.cancelled():
+                # The connection was handed to us just before the wait was aborted
+                self.release()
+            elif future in self._waiters:
+                # release() may already have dropped the cancelled future
+                self._waiters.remove(future)
+            self._record_wait(time.monotonic() - start)
+            if isinstance(exc, asyncio.TimeoutError):
+                raise TimedOut(
+                    message=(
+                        "Pool timeout: All connections in the connection pool are occupied. "
+                        "Request was *not* sent to Telegram. Consider adjusting the connection "
+                        "pool size or the pool timeout."
+                    )
+                ) from exc
+            raise
+        self._record_wait(time.monotonic() - start)
+
+    def release(self) -> None:
+        """Frees the connection acquired by :meth:`acquire`, handing it to the longest waiting
+        request, if any.
+        """
+        now = time.monotonic()
+        if now - self._window_start >= self.SHRINK_INTERVAL:
+            size = max(self._min_size, self._peak)
+            if size < self._size:
+                self._resize(size)
+            self._peak = self._in_flight
+            self._window_start = now
+
+        # Skip waiters that were cancelled but didn't get the chance to remove themselves yet
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()
+
+        if self._waiters and self._in_flight <= self._size:
+            # The number of requests in flight stays the same
+            self._waiters.popleft().set_result(None)
+        else:
+            self._in_flight -= 1
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the HedgingPolicy class."""
+import math
+from collections import deque
+from typing import Collection, Deque, Dict, Final, FrozenSet, Optional
+
+
+class HedgingPolicy:
+    """Configures hedged requests for read-only methods of the Bot API. If Telegram didn't answer
+    such a request within a delay, a second, identical request is sent, and the answer that
+    arrives first is used. The other request is cancelled. This trades a small amount of
+    additional requests for a lower tail latency, e.g. if single connections are slow.
+
+    To hedge requests, assign an instance to :attr:`telegram.request.BaseRequest.hedging_policy`.
+
+    The delay is the :paramref:`quantile` of the latencies of the recent requests to the same
+    endpoint, limited to the range from :paramref:`min_delay` to :paramref:`max_delay`. Until
+    enough latencies were observed, :paramref:`max_delay` is used.
+
+    Example:
+        .. code:: python
+
+            application.bot.request.hedging_policy = HedgingPolicy(quantile=0.95)
+
+    Note:
+        * Only methods that don't change anything may be hedged, since Telegram may process both
+          requests. Methods such as :meth:`telegram.Bot.send_message` are therefore never
+          hedged.
+        * Hedged requests bypass rate limiters such as :class:`telegram.ext.AIORateLimiter`.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        endpoints (Collection[:obj:`str`], optional): The names of the Bot API endpoints whose
+            requests may be hedged. Defaults to :attr:`DEFAULT_ENDPOINTS`.
+        quantile (:obj:`float`, optional): The quantile of the recent latencies to wait for
+            before hedging. Must be between ``0`` and ``1``. Defaults to ``0.95``.
+        min_delay (:obj:`float`, optional): The minimal delay in seconds. Defaults to
+            ``0.05``.
+        max_delay (:obj:`float`, optional): The maximal delay in seconds. Defaults to ``2``.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`endpoints` contains a method that can't be hedged, or if
+            :paramref:`quantile` or the delays are out of range.
+    """
+
+    __slots__ = (
+        "_endpoints",
+        "_hedge_wins",
+        "_hedges",
+        "_latencies",
+        "_max_delay",
+        "_min_delay",
+        "_quantile",
+    )
+
+    DEFAULT_ENDPOINTS: Final[FrozenSet[str]] = frozenset(
+        {
+            "getChat",
+            "getChatAdministrators",
+            "getChatMember",
+            "getChatMemberCount",
+            "getCustomEmojiStickers",
+            "getFile",
+            "getMe",
+            "getStickerSet",
+            "getUserProfilePhotos",
+        }
+    )
+    """FrozenSet[:obj:`str`]: The endpoints hedged by default."""
+    WINDOW_SIZE: Final[int] = 100
+    """:obj:`int`: The number of recent latencies per endpoint that the delay is based on."""
+    MIN_SAMPLES: Final[int] = 20
+    """:obj:`int`: The number of latencies that must be observed for an endpoint before the
+    delay is based on them."""
+
+    def __init__(
+        self,
+        endpoints: Optional[Collection[str]] = None,
+        quantile: float = 0.95,
+        min_delay: float = 0.05,
+        max_delay: float = 2,
+    ):
+        endpoints = self.DEFAULT_ENDPOINTS if endpoints is None else frozenset(endpoints)
+        for endpoint in endpoints:
+            if not endpoint.startswith("get") or endpoint == "getUpdates":
+                raise ValueError(f"Requests to `{endpoint}` can not be hedged.")
+        if not 0 <= quantile <= 1:
+            raise ValueError("`quantile` must be between 0 and 1.")
+        if not 0 <= min_delay <= max_delay:
+            raise ValueError("`min_delay` must be between 0 and `max_delay`.")
+
+        self._endpoints: FrozenSet[str] = endpoints
+        self._quantile: float = quantile
+        self._min_delay: float = min_delay
+        self._max_delay: float = max_delay
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._hedges: int = 0
+        self._hedge_wins: int = 0
+
+    @property
+    def endpoints(self) -> FrozenSet[str]:
+        """FrozenSet[:obj:`str`]: The endpoints whose requests may be hedged."""
+        return self._endpoints
+
+    @property
+    def quantile(self) -> float:
+        """:obj:`float`: The quantile of the recent latencies to wait for before hedging."""
+        return self._quantile
+
+    @property
+    def min_delay(self) -> float:
+        """:obj:`float`: The minimal delay in seconds."""
+        return self._min_delay
+
+    @property
+    def max_delay(self) -> float:
+        """:obj:`float`: The maximal delay in seconds."""
+        return self._max_delay
+
+    @property
+    def hedges(self) -> int:
+        """:obj:`int`: The number of hedged requests that were sent."""
+        return self._hedges
+
+    @property
+    def hedge_wins(self) -> int:
+        """:obj:`int`: The number of hedged requests that were answered before the original
+        request."""
+        return self._hedge_wins
+
+    def delay(self, endpoint: str) -> float:
+        """Returns the time to wait for an answer before hedging a request.
+
+        Args:
+            endpoint (:obj:`str`): The name of the Bot API endpoint.
+
+        Returns:
+            :obj:`float`: The delay in seconds.
+        """
+        latencies = self._latencies.get(endpoint)
+        if latencies is None or len(latencies) < self.MIN_SAMPLES:
+            return self._max_delay
+        ordered = sorted(latencies)
+        index = min(math.ceil(self._quantile * len(ordered)), len(ordered)) - 1
+        return min(max(ordered[max(index, 0)], self._min_delay), self._max_delay)
+
+    def record_hedge(self) -> None:
+        """Records that a hedged request was sent.
+
+        Warning:
+            This method is called by :class:`telegram.request.BaseRequest` and is not intended to
+            be called by users directly.
+        """
+        self._hedges += 1
+
+    def record_latency(self, endpoint: str, latency: float, hedge_won: bool = False) -> None:
+        """Records the latency of a successful request.
+
+        Warning:
+            This method is called by :class:`telegram.request.BaseRequest` and is not intended to
+            be called by users directly.
+
+        Args:
+            endpoint (:obj:`str`): The name of the Bot API endpoint.
+            latency (:obj:`float`): The time in seconds until the first answer arrived.
+            hedge_won (:obj:`bool`, optional): Whether the hedged request was answered first.
+        """
+        latencies = self._latencies.get(endpoint)
+        if latencies is None:
+            latencies = self._latencies[endpoint] = deque(maxlen=self.WINDOW_SIZE)
+        latencies.append(latency)
+        if hedge_won:
+            self._hedge_wins += 1
@@ -17,7 +17,8 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains methods to make POST and GET requests using the httpx library."""
-from typing import Collection, Optional, Tuple, Union
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Collection, Dict, Optional, Tuple, Union, cast
 
 import httpx
 
@@ -27,6 +28,7 @@ from telegram._utils.types import HTTPVersion, ODVInput, SocketOpt
 from telegram._utils.warnings import warn
 from telegram.error import NetworkError, TimedOut
 from telegram.request._baserequest import BaseRequest
+from telegram.request._connectionlimiter import ConnectionLimiter
 from telegram.request._requestdata import RequestData
 from telegram.warnings import PTBDeprecationWarning
 
@@ -36,6 +38,8 @@ from telegram.warnings import PTBDeprecationWarning
 # That also works with socks5. Just pass `--mode socks5` to mitmproxy
 
 _LOGGER = get_logger(__name__, "HTTPXRequest")
+# Size of the chunks in which the payload of a response is handed out by `do_stream_request`
+_STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class HTTPXRequest(BaseRequest):
@@ -46,7 +50,8 @@ class HTTPXRequest(BaseRequest):
 
     Args:
         connection_pool_size (:obj:`int`, optional): Number of connections to keep in the
-            connection pool. Defaults to ``1``.
+            connection pool. Defaults to ``1``. If :paramref:`max_connection_pool_size` is
+            passed, this is the minimal and initial size of the adaptive connection pool.
 
             Note:
                 Independent of the value, one additional connection will be reserved for
@@ -122,10 +127,38 @@ class HTTPXRequest(BaseRequest):
             :meth:`do_request`. Defaults to ``20`` seconds.
 
             .. versionadded:: 21.0
+        max_connection_pool_size (:obj:`int`, optional): If passed, the size of the connection
+            pool adapts to the load between :paramref:`connection_pool_size` and this value.
+            Whenever a request has waited 50 milliseconds for a free connection, the pool grows
+            by one connection. Every 30 seconds, it shrinks to the highest number of concurrent
+            requests seen in the meantime. Only available for HTTP/1.1. Defaults to :obj:`None`,
+            i.e. the pool has the fixed size :paramref:`connection_pool_size`.
+
+            Note:
+                httpx can't change the limits of a client in use, so when the pool shrinks, the
+                underlying ``httpx.AsyncClient`` is replaced by a new one. The old client and its
+                sockets are closed once the requests that are still using it are done. Requests
+                after the shrink therefore open new connections.
+
+            .. seealso:: :attr:`connection_pool_size`, :attr:`pool_wait_time`
+
+            .. versionadded:: NEXT.VERSION
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`max_connection_pool_size` is smaller than
+            :paramref:`connection_pool_size` or passed along with HTTP/2.
 
     """
 
-    __slots__ = ("_client", "_client_kwargs", "_http_version", "_media_write_timeout")
+    __slots__ = (
+        "_client",
+        "_client_kwargs",
+        "_client_usage",
+        "_connection_limiter",
+        "_http_version",
+        "_media_write_timeout",
+        "_socket_options",
+    )
 
     def __init__(
         self,
@@ -139,6 +172,7 @@ class HTTPXRequest(BaseRequest):
         socket_options: Optional[Collection[SocketOpt]] = None,
         proxy: Optional[Union[str, httpx.Proxy, httpx.URL]] = None,
         media_write_timeout: Optional[float] = 20.0,
+        max_connection_pool_size: Optional[int] = None,
     ):
         if proxy_url is not None and proxy is not None:
             raise ValueError("The parameters `proxy_url` and `proxy` are mutually exclusive.")
@@ -160,30 +194,41 @@ class HTTPXRequest(BaseRequest):
             write=write_timeout,
             pool=pool_timeout,
         )
+
+        if http_version not in ("1.1", "2", "2.0"):
+            raise ValueError("`http_version` must be either '1.1', '2.0' or '2'.")
+
+        self._connection_limiter: Optional[ConnectionLimiter] = None
+        if max_connection_pool_size is not None:
+            if max_connection_pool_size < connection_pool_size:
+                raise ValueError(
+                    "`max_connection_pool_size` must not be smaller than `connection_pool_size`."
+                )
+            if http_version != "1.1":
+                raise ValueError("`max_connection_pool_size` is only available for HTTP/1.1.")
+            self._connection_limiter = ConnectionLimiter(
+                min_size=connection_pool_size, max_size=max_connection_pool_size
+            )
+            # The limiter caps the number of connections, httpx merely enforces the upper bound
+            connection_pool_size = max_connection_pool_size
+
         limits = httpx.Limits(
             max_connections=connection_pool_size,
             max_keepalive_connections=connection_pool_size,
         )
 
-        if http_version not in ("1.1", "2", "2.0"):
-            raise ValueError("`http_version` must be either '1.1', '2.0' or '2'.")
-
         http1 = http_version == "1.1"
         http_kwargs = {"http1": http1, "http2": not http1}
-        transport = (
-            httpx.AsyncHTTPTransport(
-                socket_options=socket_options,
-            )
-            if socket_options
-            else None
-        )
+        self._socket_options: Optional[Collection[SocketOpt]] = socket_options
         self._client_kwargs = {
             "timeout": timeout,
             "proxy": proxy,
             "limits": limits,
-            "transport": transport,
             **http_kwargs,
         }
+        # The number of requests in flight per client. Only tracked for the adaptive pool, which
+        # replaces the client when it shrinks
+        self._client_usage: Dict[httpx.AsyncClient, int] = {}
 
         try:
             self._client = self._build_client()
@@ -220,8 +265,87 @@ class HTTPXRequest(BaseRequest):
         """
         return self._client.timeout.read
 
+    @property
+    def connection_pool_size(self) -> int:
+        """:obj:`int`: The current size of the connection pool. Changes over time, if
+        :paramref:`max_connection_pool_size` was passed.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        if self._connection_limiter is not None:
+            return self._connection_limiter.size
+        limits = cast(httpx.Limits, self._client_kwargs["limits"])
+        return limits.max_connections  # type: ignore[return-value]
+
+    @property
+    def max_connection_pool_size(self) -> Optional[int]:
+        """:obj:`int` | :obj:`None`: The maximal size of the connection pool as passed to
+        :paramref:`HTTPXRequest.max_connection_pool_size`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._connection_limiter.max_size if self._connection_limiter else None
+
+    @property
+    def in_flight_requests(self) -> Optional[int]:
+        """:obj:`int` | :obj:`None`: The number of requests currently holding a connection.
+        Only tracked if :paramref:`max_connection_pool_size` was passed, :obj:`None` otherwise.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._connection_limiter.in_flight if self._connection_limiter else None
+
+    @property
+    def pool_wait_time(self) -> Optional[float]:
+        """:obj:`float` | :obj:`None`: The moving average of the time in seconds that
+        requests waited for a free connection. Values above zero indicate that the pool is
+        saturated at its maximal size. Only tracked if :paramref:`max_connection_pool_size`
+        was passed, :obj:`None` otherwise.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._connection_limiter.wait_time if self._connection_limiter else None
+
+    @asynccontextmanager
+    async def _acquire_connection(
+        self, pool_timeout: Optional[float]
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        limiter = self._connection_limiter
+        if limiter is None:
+            yield self._client
+            return
+
+        await limiter.acquire(pool_timeout)
+        client = self._client
+        self._client_usage[client] = self._client_usage.get(client, 0) + 1
+        try:
+            yield client
+        finally:
+            self._client_usage[client] -= 1
+            size = limiter.size
+            limiter.release()
+            if limiter.size < size and not self._client.is_closed:
+                # httpx can't change the limits of a live client. To close the sockets that the
+                # smaller pool doesn't need anymore, we replace the client and close the old one
+                # as soon as no request uses it anymore.
+                self._client = self._build_client()
+            for old_client, usage in self._client_usage.copy().items():
+                if old_client is not self._client and not usage:
+                    del self._client_usage[old_client]
+                    await old_client.aclose()
+
     def _build_client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(**self._client_kwargs)  # type: ignore[arg-type]
+        # A transport can't be reused once its client is closed, so we create a new one each time
+        transport = (
+            httpx.AsyncHTTPTransport(
+                socket_options=self._socket_options,
+            )
+            if self._socket_options
+            else None
+        )
+        return httpx.AsyncClient(
+            transport=transport, **self._client_kwargs  # type: ignore[arg-type]
+        )
 
     async def initialize(self) -> None:
         """See :meth:`BaseRequest.initialize`."""
@@ -235,6 +359,58 @@ class HTTPXRequest(BaseRequest):
             return
 
         await self._client.aclose()
+        # Clients that were replaced by the adaptive pool but are still in use
+        for client in self._client_usage.copy():
+            await client.aclose()
+
+    def _build_timeout(
+        self,
+        read_timeout: ODVInput[float],
+        write_timeout: ODVInput[float],
+        connect_timeout: ODVInput[float],
+        pool_timeout: ODVInput[float],
+        has_files: bool,
+    ) -> httpx.Timeout:
+        # If user did not specify timeouts (for e.g. in a bot method), use the default ones when we
+        # created this instance.
+        if isinstance(read_timeout, DefaultValue):
+            read_timeout = self._client.timeout.read
+        if isinstance(connect_timeout, DefaultValue):
+            connect_timeout = self._client.timeout.connect
+        if isinstance(pool_timeout, DefaultValue):
+            pool_timeout = self._client.timeout.pool
+
+        if isinstance(write_timeout, DefaultValue):
+            write_timeout = (
+                self._client.timeout.write if not has_files else self._media_write_timeout
+            )
+
+        return httpx.Timeout(
+            connect=connect_timeout,
+            read=read_timeout,
+            write=write_timeout,
+            pool=pool_timeout,
+        )
+
+    @staticmethod
+    def _convert_exception(err: httpx.HTTPError) -> Union[TimedOut, NetworkError]:
+        if isinstance(err, httpx.TimeoutException):
+            if isinstance(err, httpx.PoolTimeout):
+                return TimedOut(
+                    message=(
+                        "Pool timeout: All connections in the connection pool are occupied. "
+                        "Request was *not* sent to Telegram. Consider adjusting the connection "
+                        "pool size or the pool timeout."
+                    )
+                )
+            return TimedOut()
+
+        # HTTPError is the base httpx exception class
+        # TODO p4: do something smart here; for now just raise NetworkError
+
+        # We include the class name for easier debugging. Especially useful if the error
+        # message of `err` is empty.
+        return NetworkError(f"httpx.{err.__class__.__name__}: {err}")
 
     async def do_request(
         self,
@@ -253,50 +429,65 @@ class HTTPXRequest(BaseRequest):
         files = request_data.multipart_data if request_data else None
         data = request_data.json_parameters if request_data else None
 
-        # If user did not specify timeouts (for e.g. in a bot method), use the default ones when we
-        # created this instance.
-        if isinstance(read_timeout, DefaultValue):
-            read_timeout = self._client.timeout.read
-        if isinstance(connect_timeout, DefaultValue):
-            connect_timeout = self._client.timeout.connect
-        if isinstance(pool_timeout, DefaultValue):
-            pool_timeout = self._client.timeout.pool
+        timeout = self._build_timeout(
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+            has_files=bool(files),
+        )
 
-        if isinstance(write_timeout, DefaultValue):
-            write_timeout = self._client.timeout.write if not files else self._media_write_timeout
+        try:
+            async with self._acquire_connection(timeout.pool) as client:
+                res = await client.request(
+                    method=method,
+                    url=url,
+                    headers={"User-Agent": self.USER_AGENT},
+                    timeout=timeout,
+                    files=files,
+                    data=data,
+                )
+        except httpx.HTTPError as err:
+            raise self._convert_exception(err) from err
 
-        timeout = httpx.Timeout(
-            connect=connect_timeout,
-            read=read_timeout,
-            write=write_timeout,
-            pool=pool_timeout,
+        return res.status_code, res.content
+
+    @asynccontextmanager
+    async def do_stream_request(
+        self,
+        url: str,
+        method: str,
+        request_data: Optional[RequestData] = None,
+        read_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        write_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+    ) -> AsyncIterator[Tuple[int, AsyncIterator[bytes]]]:
+        """See :meth:`BaseRequest.do_stream_request`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        if self._client.is_closed:
+            raise RuntimeError("This HTTPXRequest is not initialized!")
+
+        files = request_data.multipart_data if request_data else None
+        timeout = self._build_timeout(
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+            has_files=bool(files),
         )
 
         try:
-            res = await self._client.request(
+            async with self._acquire_connection(timeout.pool) as client, client.stream(
                 method=method,
                 url=url,
                 headers={"User-Agent": self.USER_AGENT},
                 timeout=timeout,
                 files=files,
-                data=data,
-            )
-        except httpx.TimeoutException as err:
-            if isinstance(err, httpx.PoolTimeout):
-                raise TimedOut(
-                    message=(
-                        "Pool timeout: All connections in the connection pool are occupied. "
-                        "Request was *not* sent to Telegram. Consider adjusting the connection "
-                        "pool size or the pool timeout."
-                    )
-                ) from err
-            raise TimedOut from err
+                data=request_data.json_parameters if request_data else None,
+            ) as res:
+                yield res.status_code, res.aiter_bytes(_STREAM_CHUNK_SIZE)
         except httpx.HTTPError as err:
-            # HTTPError must come last as its the base httpx exception class
-            # TODO p4: do something smart here; for now just raise NetworkError
-
-            # We include the class name for easier debugging. Especially useful if the error
-            # message of `err` is empty.
-            raise NetworkError(f"httpx.{err.__class__.__name__}: {err}") from err
-
-        return res.status_code, res.content
+            raise self._convert_exception(err) from err
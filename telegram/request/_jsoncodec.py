@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the codec that is used for JSON encoding and decoding throughout PTB."""
+import json
+from typing import Any, Union
+
+__all__ = ("JSONCodec", "get_json_codec", "set_json_codec")
+
+
+class JSONCodec:
+    """Encodes objects to JSON and decodes JSON data. All places where python-telegram-bot
+    works with JSON use the codec returned by :func:`get_json_codec`. This includes
+
+    * encoding the parameters of requests to the Bot API
+      (:attr:`telegram.request.RequestData.json_payload`),
+    * decoding the responses of the Bot API (:meth:`telegram.request.BaseRequest.post`),
+    * decoding updates received via webhook (:meth:`telegram.ext.Updater.start_webhook`),
+    * :meth:`telegram.TelegramObject.to_json` and
+    * :class:`telegram.ext.DictPersistence`.
+
+    This class uses the standard library's :mod:`json` module. To use a different library, e.g.
+    one that is implemented in C, subclass this class, override its methods and register the
+    codec via :func:`set_json_codec`.
+
+    Note:
+        Custom codecs must behave like :mod:`json` in the following regards:
+
+        * :meth:`dumps` must convert :obj:`int` keys of dictionaries to strings.
+          :class:`telegram.ext.DictPersistence` relies on this.
+        * :meth:`loads` must raise a :exc:`ValueError` (or a subclass thereof) for invalid
+          input.
+
+    Example:
+        .. code:: python
+
+            import orjson
+
+            class OrjsonCodec(JSONCodec):
+                def dumps(self, obj):
+                    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+                def dumps_bytes(self, obj):
+                    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+                def loads(self, data):
+                    return orjson.loads(data)
+
+            set_json_codec(OrjsonCodec())
+
+    .. versionadded:: NEXT.VERSION
+    """
+
+    __slots__ = ()
+
+    def dumps(self, obj: object) -> str:
+        """Encodes an object to a JSON string.
+
+        Args:
+            obj (:obj:`object`): The object to encode. Can be any (possibly nested) composition
+                of :obj:`dict`, :obj:`list`, :obj:`tuple`, :obj:`str`, :obj:`int`,
+                :obj:`float`, :obj:`bool` and :obj:`None`.
+
+        Returns:
+            :obj:`str`: The JSON string.
+
+        Raises:
+            :exc:`TypeError`: If the object can not be encoded.
+        """
+        return json.dumps(obj)
+
+    def dumps_bytes(self, obj: object) -> bytes:
+        """Encodes an object to UTF-8 encoded JSON. Used for payloads that are sent over the
+        network. Override this method, if your library can produce :obj:`bytes` directly.
+
+        Args:
+            obj (:obj:`object`): The object to encode. See :meth:`dumps`.
+
+        Returns:
+            :obj:`bytes`: The UTF-8 encoded JSON.
+
+        Raises:
+            :exc:`TypeError`: If the object can not be encoded.
+        """
+        return self.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        """Decodes JSON data.
+
+        Note:
+            :obj:`bytes` input is decoded as UTF-8 with ``errors="replace"`` before being passed
+            to :func:`json.loads`. Libraries that can parse :obj:`bytes` directly should do so
+            instead.
+
+        Args:
+            data (:obj:`str` | :obj:`bytes` | :obj:`bytearray`): The JSON data. :obj:`bytes`
+                must be UTF-8 encoded.
+
+        Returns:
+            The decoded data.
+
+        Raises:
+            :exc:`ValueError`: If the data is not valid JSON.
+        """
+        if not isinstance(data, str):
+            data = data.decode("utf-8", "replace")
+        return json.loads(data)
+
+
+_JSON_CODEC: JSONCodec = JSONCodec()
+
+
+def get_json_codec() -> JSONCodec:
+    """Returns the codec that is currently used for JSON encoding and decoding.
+
+    .. versionadded:: NEXT.VERSION
+
+    Returns:
+        :class:`telegram.request.JSONCodec`
+    """
+    return _JSON_CODEC
+
+
+def set_json_codec(codec: JSONCodec) -> None:
+    """Sets the codec that is used for JSON encoding and decoding. This affects all bots in the
+    current process.
+
+    Tip:
+        Call this function once at the start of your program, before building the
+        :class:`telegram.ext.Application`. python-telegram-bot never calls it on its own.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        codec (:class:`telegram.request.JSONCodec`): The codec to use. Pass an instance of
+            :class:`telegram.request.JSONCodec` to restore the default behavior.
+    """
+    global _JSON_CODEC  # noqa: PLW0603  # pylint: disable=global-statement
+    _JSON_CODEC = codec
@@ -17,11 +17,11 @@
 #  You should have received a copy of the GNU Lesser Public License
 #  along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains a class that holds the parameters of a request to the Bot API."""
-import json
 from typing import Any, Dict, List, Optional, Union, final
 from urllib.parse import urlencode
 
 from telegram._utils.types import UploadFileDict
+from telegram.request._jsoncodec import get_json_codec
 from telegram.request._requestparameter import RequestParameter
 
 
@@ -42,11 +42,13 @@ class RequestData:
             ``multipart/form-data``.
     """
 
-    __slots__ = ("_parameters", "contains_files")
+    __slots__ = ("_json_values", "_parameters", "contains_files")
 
     def __init__(self, parameters: Optional[List[RequestParameter]] = None):
         self._parameters: List[RequestParameter] = parameters or []
         self.contains_files: bool = any(param.input_files for param in self._parameters)
+        # The JSON encoded values of the parameters, filled by the first call of json_parameters
+        self._json_values: Optional[Dict[str, Optional[str]]] = None
 
     @property
     def parameters(self) -> Dict[str, Union[str, int, List[Any], Dict[Any, Any]]]:
@@ -67,15 +69,49 @@ class RequestData:
         value.
 
         Tip:
-            By default, this property uses the standard library's :func:`json.dumps`.
-            To use a custom library for JSON encoding, you can directly encode the keys of
-            :attr:`parameters` - note that string valued keys should not be JSON encoded.
+            By default, this property uses the codec returned by
+            :func:`telegram.request.get_json_codec`.
+            To use a custom library for JSON encoding, you can register a custom codec or
+            directly encode the keys of :attr:`parameters` - note that string valued keys should
+            not be JSON encoded.
+
+        .. versionchanged:: NEXT.VERSION
+            The values are encoded only on the first access and reused afterwards.
         """
-        return {
-            param.name: param.json_value
-            for param in self._parameters
-            if param.json_value is not None
+        return {name: value for name, value in self._encode().items() if value is not None}
+
+    def with_parameters(self, parameters: List[RequestParameter]) -> "RequestData":
+        """Returns a copy of this object, in which the given parameters are added or replace the
+        parameters of the same name. The JSON encoded values of the remaining parameters are
+        shared with this object, so that they are encoded only once, no matter how many copies
+        are sent.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            parameters (List[``RequestParameter``]): The parameters to add or replace.
+
+        Returns:
+            :class:`telegram.request.RequestData`
+        """
+        names = {param.name for param in parameters}
+        json_values = {
+            name: value for name, value in self._encode().items() if name not in names
         }
+        request_data = RequestData(
+            [param for param in self._parameters if param.name not in names] + parameters
+        )
+        request_data._json_values = json_values
+        return request_data
+
+    def _encode(self) -> Dict[str, Optional[str]]:
+        json_values = self._json_values
+        if json_values is None:
+            json_values = self._json_values = {}
+        for param in self._parameters:
+            if param.name not in json_values:
+                json_values[param.name] = param.json_value
+        return json_values
 
     def url_encoded_parameters(self, encode_kwargs: Optional[Dict[str, Any]] = None) -> str:
         """Encodes the parameters with :func:`urllib.parse.urlencode`.
@@ -105,15 +141,20 @@ class RequestData:
         """The :attr:`parameters` as UTF-8 encoded JSON payload.
 
         Tip:
-            By default, this property uses the standard library's :func:`json.dumps`.
-            To use a custom library for JSON encoding, you can directly encode the keys of
-            :attr:`parameters` - note that string valued keys should not be JSON encoded.
+            By default, this property uses
+            :meth:`telegram.request.JSONCodec.dumps_bytes` of the codec returned by
+            :func:`telegram.request.get_json_codec`.
+            To use a custom library for JSON encoding, you can register a custom codec or
+            directly encode the keys of :attr:`parameters` - note that string valued keys should
+            not be JSON encoded.
         """
-        return json.dumps(self.json_parameters).encode("utf-8")
+        return get_json_codec().dumps_bytes(self.json_parameters)
 
     @property
     def multipart_data(self) -> UploadFileDict:
-        """Gives the files contained in this object as mapping of part name to encoded content."""
+        """Gives the files contained in this object as mapping of part name to encoded content or
+        file handle to read the content from.
+        """
         multipart_data: UploadFileDict = {}
         for param in self._parameters:
             m_data = param.multipart_data
@@ -0,0 +1,374 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains classes that collect metrics about the requests made to the Bot API."""
+import bisect
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, Final, Mapping, Optional, Tuple, final
+
+from telegram._utils.logging import get_logger
+from telegram.request._requestdata import RequestData
+
+_LOGGER = get_logger(__name__, "RequestMetrics")
+
+
+@final
+@dataclass(repr=True, eq=False, order=False, frozen=True)
+class RequestRecord:
+    """Describes a single finished request to the Bot API, see :class:`RequestMetrics`.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        endpoint (:obj:`str`): The name of the Bot API method, e.g. ``"sendMessage"``, or
+            :attr:`RequestMetrics.FILE_DOWNLOAD` for downloads of files.
+        duration (:obj:`float`): The time in seconds from passing the request to the
+            implementation until the response was received or an exception was raised.
+        status_code (:obj:`int` | :obj:`None`): The HTTP status code of the response.
+            :obj:`None`, if no response was received.
+        error (:exc:`BaseException` | :obj:`None`): The exception raised by the request, if
+            any. This is usually a :class:`telegram.error.TelegramError`, but may also be
+            :exc:`asyncio.CancelledError`.
+        bytes_sent (:obj:`int`): The approximate size of the parameters and files that were
+            sent.
+        bytes_received (:obj:`int`): The size of the received payload.
+
+    Attributes:
+        endpoint (:obj:`str`): The name of the Bot API method.
+        duration (:obj:`float`): The time in seconds the request took.
+        status_code (:obj:`int` | :obj:`None`): The HTTP status code of the response.
+        error (:exc:`BaseException` | :obj:`None`): The exception raised by the request, if any.
+        bytes_sent (:obj:`int`): The approximate size of the sent parameters and files.
+        bytes_received (:obj:`int`): The size of the received payload.
+    """
+
+    __slots__ = ("bytes_received", "bytes_sent", "duration", "endpoint", "error", "status_code")
+
+    endpoint: str
+    duration: float
+    status_code: Optional[int]
+    error: Optional[BaseException]
+    bytes_sent: int
+    bytes_received: int
+
+
+@final
+@dataclass(repr=True, eq=False, order=False, frozen=True)
+class EndpointMetrics:
+    """A snapshot of the metrics of the requests to one or more endpoints of the Bot API, see
+    :meth:`RequestMetrics.snapshot`.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        requests (:obj:`int`): The number of finished requests.
+        total_latency (:obj:`float`): The sum of the durations of the requests in seconds.
+        max_latency (:obj:`float`): The longest duration of a request in seconds.
+        latency_histogram (Tuple[:obj:`int`]): The number of requests per latency bucket, see
+            :attr:`RequestMetrics.LATENCY_BUCKETS`.
+        status_codes (Mapping[:obj:`int`, :obj:`int`]): The number of responses per HTTP status
+            code.
+        errors (Mapping[:obj:`str`, :obj:`int`]): The number of exceptions per class name, e.g.
+            ``"RetryAfter"`` or ``"TimedOut"``.
+        bytes_sent (:obj:`int`): The approximate size of the sent parameters and files.
+        bytes_received (:obj:`int`): The size of the received payloads.
+
+    Attributes:
+        requests (:obj:`int`): The number of finished requests.
+        total_latency (:obj:`float`): The sum of the durations of the requests in seconds.
+        max_latency (:obj:`float`): The longest duration of a request in seconds.
+        latency_histogram (Tuple[:obj:`int`]): The number of requests per latency bucket.
+        status_codes (Mapping[:obj:`int`, :obj:`int`]): The number of responses per HTTP status
+            code.
+        errors (Mapping[:obj:`str`, :obj:`int`]): The number of exceptions per class name.
+        bytes_sent (:obj:`int`): The approximate size of the sent parameters and files.
+        bytes_received (:obj:`int`): The size of the received payloads.
+    """
+
+    __slots__ = (
+        "bytes_received",
+        "bytes_sent",
+        "errors",
+        "latency_histogram",
+        "max_latency",
+        "requests",
+        "status_codes",
+        "total_latency",
+    )
+
+    requests: int
+    total_latency: float
+    max_latency: float
+    latency_histogram: Tuple[int, ...]
+    status_codes: Mapping[int, int]
+    errors: Mapping[str, int]
+    bytes_sent: int
+    bytes_received: int
+
+    @property
+    def mean_latency(self) -> float:
+        """:obj:`float`: The mean duration of the requests in seconds. ``0`` if no requests were
+        made."""
+        return self.total_latency / self.requests if self.requests else 0.0
+
+    def latency_quantile(self, quantile: float) -> float:
+        """Estimates a quantile of the durations of the requests from
+        :attr:`latency_histogram`.
+
+        Example:
+            ``metrics.latency_quantile(0.99)`` returns an upper bound for the durations of 99% of
+            the requests.
+
+        Args:
+            quantile (:obj:`float`): The quantile, between ``0`` and ``1``.
+
+        Returns:
+            :obj:`float`: The upper bound of the latency bucket containing the quantile, but at
+            most :attr:`max_latency`. ``0`` if no requests were made.
+
+        Raises:
+            :exc:`ValueError`: If :paramref:`quantile` is not between ``0`` and ``1``.
+        """
+        if not 0 <= quantile <= 1:
+            raise ValueError("`quantile` must be between 0 and 1.")
+        rank = quantile * self.requests
+        count = 0
+        for bound, bucket_count in zip(RequestMetrics.LATENCY_BUCKETS, self.latency_histogram):
+            count += bucket_count
+            if count >= rank and count:
+                return min(bound, self.max_latency)
+        return self.max_latency
+
+
+class _EndpointCounter:
+    __slots__ = (
+        "bytes_received",
+        "bytes_sent",
+        "errors",
+        "latency_histogram",
+        "max_latency",
+        "requests",
+        "status_codes",
+        "total_latency",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.latency_histogram = [0] * len(RequestMetrics.LATENCY_BUCKETS)
+        self.status_codes: Dict[int, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def add(self, record: RequestRecord) -> None:
+        self.requests += 1
+        self.total_latency += record.duration
+        self.max_latency = max(self.max_latency, record.duration)
+        self.latency_histogram[
+            bisect.bisect_left(RequestMetrics.LATENCY_BUCKETS, record.duration)
+        ] += 1
+        if record.status_code is not None:
+            self.status_codes[record.status_code] = (
+                self.status_codes.get(record.status_code, 0) + 1
+            )
+        if record.error is not None:
+            name = type(record.error).__name__
+            self.errors[name] = self.errors.get(name, 0) + 1
+        self.bytes_sent += record.bytes_sent
+        self.bytes_received += record.bytes_received
+
+    def merge(self, other: "_EndpointCounter") -> None:
+        self.requests += other.requests
+        self.total_latency += other.total_latency
+        self.max_latency = max(self.max_latency, other.max_latency)
+        for index, count in enumerate(other.latency_histogram):
+            self.latency_histogram[index] += count
+        for code, count in other.status_codes.items():
+            self.status_codes[code] = self.status_codes.get(code, 0) + count
+        for name, count in other.errors.items():
+            self.errors[name] = self.errors.get(name, 0) + count
+        self.bytes_sent += other.bytes_sent
+        self.bytes_received += other.bytes_received
+
+    def to_metrics(self) -> EndpointMetrics:
+        return EndpointMetrics(
+            requests=self.requests,
+            total_latency=self.total_latency,
+            max_latency=self.max_latency,
+            latency_histogram=tuple(self.latency_histogram),
+            status_codes=dict(self.status_codes),
+            errors=dict(self.errors),
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+        )
+
+
+class RequestMetrics:
+    """Collects metrics about the requests made by a :class:`telegram.request.BaseRequest`
+    per endpoint of the Bot API: latency histograms, the outcomes by HTTP status code and by
+    exception, and the amount of transferred data.
+
+    To collect metrics, assign an instance to :attr:`telegram.request.BaseRequest.metrics`.
+
+    Example:
+        .. code:: python
+
+            metrics = RequestMetrics()
+            application.bot.request.metrics = metrics
+            ...
+            for endpoint, endpoint_metrics in metrics.snapshot().items():
+                print(endpoint, endpoint_metrics.latency_quantile(0.99))
+
+    Note:
+        Calls to :meth:`telegram.Bot.get_updates` are answered by Telegram only once updates are
+        available or the long polling timeout passed. Their durations are therefore kept apart
+        from the other endpoints in :meth:`aggregate`.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        callback (Callable[[:class:`RequestRecord`], :obj:`object`], optional): A function that
+            is called with a :class:`RequestRecord` for every finished request, e.g. to forward
+            the metrics to a monitoring system. Exceptions raised by the callback are logged.
+    """
+
+    __slots__ = ("_callback", "_counters", "_in_flight")
+
+    LATENCY_BUCKETS: Final[Tuple[float, ...]] = (
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1,
+        2.5,
+        5,
+        10,
+        30,
+        math.inf,
+    )
+    """Tuple[:obj:`float`]: The upper bounds in seconds of the buckets of
+    :attr:`EndpointMetrics.latency_histogram`."""
+    FILE_DOWNLOAD: Final[str] = "<file download>"
+    """:obj:`str`: The endpoint under which downloads of files are recorded."""
+    LONG_POLLING_ENDPOINTS: Final[Tuple[str, ...]] = ("getUpdates",)
+    """Tuple[:obj:`str`]: The endpoints that are excluded from :meth:`aggregate` by default."""
+
+    def __init__(self, callback: Optional[Callable[[RequestRecord], object]] = None):
+        self._callback: Optional[Callable[[RequestRecord], object]] = callback
+        self._counters: Dict[str, _EndpointCounter] = {}
+        self._in_flight: int = 0
+
+    @property
+    def in_flight(self) -> int:
+        """:obj:`int`: The number of requests that are currently in flight."""
+        return self._in_flight
+
+    @staticmethod
+    def request_size(request_data: Optional[RequestData]) -> int:
+        """Approximates the number of bytes sent for a request.
+
+        Args:
+            request_data (:class:`telegram.request.RequestData` | :obj:`None`): The request
+                data.
+
+        Returns:
+            :obj:`int`: The UTF-8 encoded size of the parameters and the size of the files given
+            as :obj:`bytes`. Files given as file handles are not taken into account.
+        """
+        if request_data is None:
+            return 0
+        # The names of the parameters are ASCII. Values are only encoded if they are not, as
+        # UTF-8 encoding is the same as the string in that case
+        size = sum(
+            len(key) + (len(value) if value.isascii() else len(value.encode("utf-8"))) + 2
+            for key, value in request_data.json_parameters.items()
+        )
+        if request_data.contains_files:
+            size += sum(
+                len(content)
+                for _, content, _ in request_data.multipart_data.values()
+                if isinstance(content, bytes)
+            )
+        return size
+
+    def start_request(self) -> None:
+        """Marks the start of a request.
+
+        Warning:
+            This method is called by :class:`telegram.request.BaseRequest` and is not intended to
+            be called by users directly.
+        """
+        self._in_flight += 1
+
+    def finish_request(self, record: RequestRecord) -> None:
+        """Records a finished request started with :meth:`start_request`.
+
+        Warning:
+            This method is called by :class:`telegram.request.BaseRequest` and is not intended to
+            be called by users directly.
+
+        Args:
+            record (:class:`RequestRecord`): The description of the request.
+        """
+        self._in_flight -= 1
+        counter = self._counters.get(record.endpoint)
+        if counter is None:
+            counter = self._counters[record.endpoint] = _EndpointCounter()
+        counter.add(record)
+
+        if self._callback is not None:
+            try:
+                self._callback(record)
+            except Exception:
+                _LOGGER.exception("The callback of RequestMetrics raised an exception.")
+
+    def snapshot(self) -> Dict[str, EndpointMetrics]:
+        """Returns the metrics collected so far.
+
+        Returns:
+            Dict[:obj:`str`, :class:`EndpointMetrics`]: The metrics per endpoint, e.g.
+            ``"sendMessage"``.
+        """
+        return {endpoint: counter.to_metrics() for endpoint, counter in self._counters.items()}
+
+    def aggregate(self, exclude: Tuple[str, ...] = LONG_POLLING_ENDPOINTS) -> EndpointMetrics:
+        """Returns the metrics of all endpoints combined.
+
+        Args:
+            exclude (Tuple[:obj:`str`], optional): The endpoints to leave out. Defaults to
+                :attr:`LONG_POLLING_ENDPOINTS`, so that waiting for updates doesn't count as
+                latency.
+
+        Returns:
+            :class:`EndpointMetrics`
+        """
+        total = _EndpointCounter()
+        for endpoint, counter in self._counters.items():
+            if endpoint not in exclude:
+                total.merge(counter)
+        return total.to_metrics()
+
+    def reset(self) -> None:
+        """Discards the metrics collected so far. Requests currently in flight are still
+        counted by :attr:`in_flight`."""
+        self._counters.clear()
@@ -17,7 +17,6 @@
 #  You should have received a copy of the GNU Lesser Public License
 #  along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains a class that describes a single parameter of a request to the Bot API."""
-import json
 from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional, Sequence, Tuple, final
@@ -29,6 +28,7 @@ from telegram._telegramobject import TelegramObject
 from telegram._utils.datetime import to_timestamp
 from telegram._utils.enum import StringEnum
 from telegram._utils.types import UploadFileDict
+from telegram.request._jsoncodec import get_json_codec
 
 
 @final
@@ -73,7 +73,7 @@ class RequestParameter:
             return self.value
         if self.value is None:
             return None
-        return json.dumps(self.value)
+        return get_json_codec().dumps(self.value)
 
     @property
     def multipart_data(self) -> Optional[UploadFileDict]:
@@ -16,14 +16,16 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
+import io
 import os
+from io import BytesIO
 from pathlib import Path
 from tempfile import TemporaryFile, mkstemp
 
 import pytest
 
 from telegram import File, FileCredentials, Voice
-from telegram.error import TelegramError
+from telegram.error import NetworkError, TelegramError
 from tests.auxil.files import data_file
 from tests.auxil.slots import mro_slots
 
@@ -153,9 +155,10 @@ class TestFileWithoutRequest(TestFileBase):
 
     async def test_download(self, monkeypatch, file):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content[:5]
+            yield self.file_content[5:]
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
         out_file = await file.download_to_drive()
 
         try:
@@ -168,9 +171,10 @@ class TestFileWithoutRequest(TestFileBase):
     )
     async def test_download_custom_path(self, monkeypatch, file, custom_path_type):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content[:5]
+            yield self.file_content[5:]
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
         file_handle, custom_path = mkstemp()
         custom_path = Path(custom_path)
         try:
@@ -183,11 +187,12 @@ class TestFileWithoutRequest(TestFileBase):
 
     async def test_download_no_filename(self, monkeypatch, file):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content[:5]
+            yield self.file_content[5:]
 
         file.file_path = None
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
         out_file = await file.download_to_drive()
 
         assert str(out_file)[-len(file.file_id) :] == file.file_id
@@ -198,9 +203,10 @@ class TestFileWithoutRequest(TestFileBase):
 
     async def test_download_file_obj(self, monkeypatch, file):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content[:5]
+            yield self.file_content[5:]
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
         with TemporaryFile() as custom_fobj:
             await file.download_to_memory(out=custom_fobj)
             custom_fobj.seek(0)
@@ -208,9 +214,10 @@ class TestFileWithoutRequest(TestFileBase):
 
     async def test_download_bytearray(self, monkeypatch, file):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content[:5]
+            yield self.file_content[5:]
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
 
         # Check that a download to a newly allocated bytearray works.
         buf = await file.download_as_bytearray()
@@ -223,6 +230,117 @@ class TestFileWithoutRequest(TestFileBase):
         assert buf2[len(buf) :] == buf
         assert buf2[: len(buf)] == buf
 
+    async def test_download_failure_removes_file(self, monkeypatch, file, tmp_path):
+        async def test(*args, **kwargs):
+            yield self.file_content
+            raise NetworkError("connection lost")
+
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
+        custom_path = tmp_path / "file"
+        with pytest.raises(NetworkError, match="connection lost"):
+            await file.download_to_drive(custom_path)
+        assert not custom_path.exists()
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_download_failure_keeps_existing_file(self, monkeypatch, file, tmp_path):
+        async def test(*args, **kwargs):
+            yield self.file_content
+            raise NetworkError("connection lost")
+
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
+        custom_path = tmp_path / "file"
+        custom_path.write_bytes(b"existing content")
+        with pytest.raises(NetworkError, match="connection lost"):
+            await file.download_to_drive(custom_path)
+        assert custom_path.read_bytes() == b"existing content"
+        assert list(tmp_path.iterdir()) == [custom_path]
+
+    async def test_download_replaces_existing_file(self, monkeypatch, file, tmp_path):
+        async def test(*args, **kwargs):
+            yield self.file_content
+
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
+        custom_path = tmp_path / "file"
+        custom_path.write_bytes(b"existing content")
+        assert await file.download_to_drive(custom_path) == custom_path
+        assert custom_path.read_bytes() == self.file_content
+        assert list(tmp_path.iterdir()) == [custom_path]
+
+    @pytest.mark.skipif(os.name == "nt", reason="Symbolic links need privileges on Windows")
+    async def test_download_through_symlink(self, monkeypatch, file, tmp_path):
+        async def test(*args, **kwargs):
+            yield self.file_content
+
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
+        target = tmp_path / "target"
+        target.write_bytes(b"existing content")
+        target.chmod(0o600)
+        link = tmp_path / "link"
+        link.symlink_to(target)
+
+        assert await file.download_to_drive(link) == link
+        # The link is kept and the file it points to is replaced, keeping its permissions
+        assert link.is_symlink()
+        assert target.read_bytes() == self.file_content
+        assert target.stat().st_mode & 0o777 == 0o600
+        assert sorted(tmp_path.iterdir()) == [link, target]
+
+    @pytest.mark.parametrize("method", ["download_to_drive", "download_to_memory", "bytearray"])
+    async def test_download_closes_stream(self, monkeypatch, file, tmp_path, method):
+        closed = []
+
+        async def test(*args, **kwargs):
+            try:
+                yield self.file_content
+                yield self.file_content
+            finally:
+                closed.append(True)
+
+        class FailingBuffer(bytearray):
+            def extend(self, data):
+                raise OSError("write failed")
+
+        class FailingIO(BytesIO):
+            def write(self, data):
+                raise OSError("write failed")
+
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
+        with pytest.raises(OSError, match="write failed"):
+            if method == "download_to_drive":
+                monkeypatch.setattr(Path, "open", lambda *args, **kwargs: FailingIO())
+                await file.download_to_drive(tmp_path / "file")
+            elif method == "download_to_memory":
+                await file.download_to_memory(FailingIO())
+            else:
+                await file.download_as_bytearray(FailingBuffer())
+        # The stream is closed right away instead of when it is garbage collected
+        assert closed == [True]
+
+    async def test_download_bytearray_failure(self, monkeypatch, file):
+        async def test(*args, **kwargs):
+            yield self.file_content
+            raise NetworkError("connection lost")
+
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
+        buf = bytearray(b"existing content")
+        with pytest.raises(NetworkError, match="connection lost"):
+            await file.download_as_bytearray(buf)
+        # The chunks received before the failure are removed again
+        assert buf == b"existing content"
+
+    async def test_download_file_obj_failure(self, monkeypatch, file):
+        async def test(*args, **kwargs):
+            yield self.file_content
+            raise NetworkError("connection lost")
+
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
+        out = BytesIO(b"existing content")
+        out.seek(0, io.SEEK_END)
+        with pytest.raises(NetworkError, match="connection lost"):
+            await file.download_to_memory(out)
+        # As documented, the chunks received before the failure were written to out
+        assert out.getvalue() == b"existing content" + self.file_content
+
     async def test_download_encrypted(self, monkeypatch, bot, encrypted_file):
         async def test(*args, **kwargs):
             return data_file("image_encrypted.jpg").read_bytes()
@@ -24,6 +24,7 @@ from io import BytesIO
 import pytest
 
 from telegram import InputFile
+from telegram._utils.files import LazyFileReader
 from tests.auxil.files import data_file
 from tests.auxil.slots import mro_slots
 
@@ -55,6 +56,60 @@ class TestInputFileWithoutRequest:
             # This exception may be thrown if the process has finished before we had the chance
             # to kill it.
 
+    def test_read_file_handle(self, png_file):
+        with png_file.open("rb") as file:
+            input_file = InputFile(file, read_file_handle=False)
+            assert input_file.input_file_content is file
+            assert file.tell() == 0
+            assert input_file.filename == png_file.name
+            assert input_file.mimetype == "image/png"
+            assert input_file.field_tuple == (png_file.name, file, "image/png")
+
+        with png_file.open("rb") as file:
+            input_file = InputFile(file, filename="custom.jpg", read_file_handle=True)
+            assert input_file.input_file_content == png_file.read_bytes()
+            assert input_file.filename == "custom.jpg"
+
+        # bytes and strings are not affected
+        assert InputFile(b"bytes", read_file_handle=False).input_file_content == b"bytes"
+        assert InputFile("string", read_file_handle=False).input_file_content == b"string"
+
+    def test_path(self, png_file):
+        input_file = InputFile(png_file)
+        assert input_file.input_file_content == png_file.read_bytes()
+        assert input_file.filename == png_file.name
+        assert input_file.mimetype == "image/png"
+
+        input_file = InputFile(png_file, filename="custom.jpg", read_file_handle=False)
+        reader = input_file.input_file_content
+        assert isinstance(reader, LazyFileReader)
+        assert input_file.filename == "custom.jpg"
+        assert input_file.field_tuple == ("custom.jpg", reader, "image/jpeg")
+
+    def test_lazy_file_reader(self, png_file):
+        content = png_file.read_bytes()
+        reader = LazyFileReader(png_file)
+        assert reader.name == str(png_file)
+        # The file is only opened while it is read
+        assert reader._file is None
+        assert reader.seek(0, 2) == len(content)
+        assert reader.tell() == len(content)
+        assert reader._file is None
+
+        for _ in range(2):
+            reader.seek(0)
+            assert reader.read(10) == content[:10]
+            assert reader._file is not None
+            assert reader.read() == content[10:]
+            assert reader.read() == b""
+            assert reader._file is None
+
+        reader.seek(5)
+        assert reader.read(5) == content[5:10]
+        reader.close()
+        assert reader._file is None
+        assert reader.closed
+
     @pytest.mark.parametrize("attach", [True, False])
     def test_attach(self, attach):
         input_file = InputFile("contents", attach=attach)
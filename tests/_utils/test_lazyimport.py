@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import ast
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import telegram
+import telegram.ext
+
+
+def type_checking_imports(package):
+    """Returns the names imported in the `if TYPE_CHECKING:` block of the packages __init__"""
+    tree = ast.parse(Path(package.__file__).read_text(encoding="utf-8"))
+    (block,) = (
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+    )
+    return {alias.name for node in block.body for alias in node.names}
+
+
+@pytest.mark.parametrize("package", [telegram, telegram.ext], ids=["telegram", "telegram.ext"])
+class TestLazyNamespace:
+    def test_all_names_resolve(self, package):
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+            assert name in dir(package)
+
+    def test_type_checking_imports_match(self, package):
+        # type checkers only see the imports in the TYPE_CHECKING block. telegram.constants is
+        # imported eagerly
+        public_names = {name for name in package.__all__ if not name.startswith("__")}
+        assert type_checking_imports(package) | {"constants"} >= public_names
+
+    def test_resolved_objects(self, package):
+        for name in package.__all__:
+            obj = getattr(package, name)
+            if isinstance(obj, type):
+                assert obj is getattr(importlib.import_module(obj.__module__), name)
+
+    def test_unknown_attribute(self, package):
+        with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+            package.Unknown
+
+    def test_star_import(self, package):
+        namespace = {}
+        exec(f"from {package.__name__} import *", namespace)
+        assert set(package.__all__) <= set(namespace)
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, telegram, telegram.ext;"
+        "print(sorted(m for m in ('telegram._bot', 'httpx', 'tornado') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import pytest
+
+from telegram._utils.sparse import SparseAttribute
+from tests.auxil.slots import mro_slots
+
+
+class Sparse:
+    __slots__ = ("_sparse_values", "regular")
+
+    optional = SparseAttribute()
+    flag = SparseAttribute(False)
+    sequence = SparseAttribute(())
+
+
+class TestSparseAttribute:
+    def test_slot_behaviour(self):
+        inst = SparseAttribute()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_class_access(self):
+        assert isinstance(Sparse.optional, SparseAttribute)
+        assert Sparse.optional.name == "optional"
+
+    def test_defaults(self):
+        obj = Sparse()
+        # _sparse_values is not set at all, as is the case for unpickled objects
+        assert obj.optional is None
+        assert obj.flag is False
+        assert obj.sequence == ()
+
+        obj._sparse_values = None
+        assert obj.optional is None
+
+    def test_set_get(self):
+        obj = Sparse()
+        obj.flag = False
+        obj.sequence = ()
+        obj.optional = None
+        assert getattr(obj, "_sparse_values", None) is None
+
+        obj.optional = 0
+        obj.flag = True
+        obj.sequence = (1,)
+        assert obj._sparse_values == {"optional": 0, "flag": True, "sequence": (1,)}
+        assert (obj.optional, obj.flag, obj.sequence) == (0, True, (1,))
+
+        # Resetting to the default removes the entry
+        obj.optional = None
+        obj.sequence = ()
+        assert obj._sparse_values == {"flag": True}
+
+    def test_delete(self):
+        obj = Sparse()
+        with pytest.raises(AttributeError, match="optional"):
+            del obj.optional
+
+        obj.optional = "value"
+        del obj.optional
+        assert obj.optional is None
+        assert obj._sparse_values == {}
@@ -0,0 +1,491 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""An in-process stand-in for the Bot API, which allows to run bots end to end without network
+access, e.g. for load tests.
+
+Example:
+
+    async with FakeBotAPI(latency=0.05) as api:
+        application = (
+            ApplicationBuilder()
+            .token(api.token)
+            .base_url(api.base_url)
+            .base_file_url(api.base_file_url)
+            .build()
+        )
+        api.put_message("Hello there!")
+        api.inject_fault("sendMessage", Fault.retry_after(1))
+        ...
+        assert api.requests["sendMessage"] == 2
+"""
+import asyncio
+import itertools
+import json
+import random
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Union, cast
+
+from tornado.httpserver import HTTPServer
+from tornado.netutil import bind_sockets
+from tornado.web import Application, RequestHandler
+
+from telegram import Update
+from telegram._utils.types import JSONDict
+
+# The result of a Bot API method: A fixed value or a callable building it from the parameters
+Result = Union[object, Callable[[Dict[str, str]], object]]
+
+_MEDIA_FIELDS: Dict[str, JSONDict] = {
+    "animation": {"width": 1, "height": 1, "duration": 0},
+    "audio": {"duration": 0},
+    "document": {},
+    "photo": {"width": 1, "height": 1},
+    "sticker": {
+        "width": 1,
+        "height": 1,
+        "is_animated": False,
+        "is_video": False,
+        "type": "regular",
+    },
+    "video": {"width": 1, "height": 1, "duration": 0},
+    "video_note": {"length": 1, "duration": 0},
+    "voice": {"duration": 0},
+}
+
+
+@dataclass(frozen=True)
+class Fault:
+    """An error that the fake Bot API answers a request with, see
+    :meth:`FakeBotAPI.inject_fault`. If :attr:`status_code` is :obj:`None`, the request is not
+    answered at all, so that the client runs into its read timeout.
+    """
+
+    status_code: Optional[int]
+    description: str = ""
+    parameters: Optional[JSONDict] = None
+
+    @classmethod
+    def retry_after(cls, seconds: int) -> "Fault":
+        return cls(429, f"Too Many Requests: retry after {seconds}", {"retry_after": seconds})
+
+    @classmethod
+    def bad_gateway(cls) -> "Fault":
+        return cls(502, "Bad Gateway")
+
+    @classmethod
+    def bad_request(cls, description: str) -> "Fault":
+        return cls(400, f"Bad Request: {description}")
+
+    @classmethod
+    def timeout(cls) -> "Fault":
+        return cls(None)
+
+
+@dataclass(frozen=True)
+class RecordedCall:
+    """A request received by the fake Bot API."""
+
+    method: str
+    parameters: Dict[str, str]
+    files: Dict[str, bytes]
+    time: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _InjectedFault:
+    fault: Fault
+    times: Optional[int]
+    probability: float
+
+
+class FakeBotAPI:
+    """A local HTTP server that emulates the parts of the Bot API used by :class:`telegram.Bot`.
+
+    * ``getUpdates`` long polls the updates added via :meth:`put_update` and :meth:`put_message`
+      and respects ``offset``, ``limit`` and ``timeout``.
+    * ``getMe`` returns :attr:`bot_user`.
+    * The ``send*`` methods, ``forwardMessage`` and ``edit*`` methods return messages with
+      increasing ids. Uploaded files can be retrieved via ``getFile`` and downloaded.
+    * All other methods return :obj:`True`, unless a result is set via :meth:`set_result`.
+
+    Args:
+        token: The token that the bot should use. Requests with other tokens are answered with
+            ``401 Unauthorized``.
+        latency: Seconds that every request is delayed by, or a callable that returns the delay
+            for the name of the Bot API method.
+        hang_time: Seconds that requests with a :meth:`Fault.timeout` are left unanswered.
+    """
+
+    def __init__(
+        self,
+        token: str = "123456789:FakeBotAPIToken",
+        latency: Union[float, Callable[[str], float]] = 0,
+        hang_time: float = 60,
+    ):
+        self.token = token
+        self.latency = latency
+        self.hang_time = hang_time
+        self.bot_user: JSONDict = {
+            "id": int(token.split(":", 1)[0]),
+            "is_bot": True,
+            "first_name": "Fake Bot",
+            "username": "FakeBot",
+            "can_join_groups": True,
+            "can_read_all_group_messages": False,
+            "supports_inline_queries": False,
+        }
+        #: Number of requests per Bot API method. File downloads are counted as ``"file"``.
+        self.requests: Counter = Counter()
+        #: All requests received, in order
+        self.calls: List[RecordedCall] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+        self._results: Dict[str, Result] = {}
+        self._faults: Dict[str, List[_InjectedFault]] = {}
+        self._updates: List[JSONDict] = []
+        self._update_ids = itertools.count(1)
+        self._message_ids = itertools.count(1)
+        self._file_ids = itertools.count(1)
+        self._files: Dict[str, bytes] = {}
+        self._new_updates = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._server: Optional[HTTPServer] = None
+        self._handlers: Set[asyncio.Task] = set()
+        self._port = 0
+
+    async def __aenter__(self) -> "FakeBotAPI":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.stop()
+
+    @property
+    def base_url(self) -> str:
+        """To be passed as ``base_url`` to :class:`telegram.Bot` or the application builder."""
+        return f"http://127.0.0.1:{self._port}/bot"
+
+    @property
+    def base_file_url(self) -> str:
+        """To be passed as ``base_file_url`` to :class:`telegram.Bot` or the application
+        builder."""
+        return f"http://127.0.0.1:{self._port}/file/bot"
+
+    async def start(self) -> None:
+        self._closing.clear()
+        app = Application(
+            [
+                (r"/bot([^/]+)/(\w+)", _MethodHandler, {"api": self}),
+                (r"/file/bot([^/]+)/(.+)", _FileHandler, {"api": self}),
+            ]
+        )
+        self._server = HTTPServer(app)
+        sockets = bind_sockets(0, "127.0.0.1")
+        self._port = sockets[0].getsockname()[1]
+        self._server.add_sockets(sockets)
+
+    async def stop(self) -> None:
+        if self._server is None:
+            return
+        # Wakes up long polling and hanging requests
+        self._closing.set()
+        self._server.stop()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._server.close_all_connections()
+        self._server = None
+
+    def put_update(self, update: Union[Update, JSONDict]) -> int:
+        """Adds an update to the stream served by ``getUpdates``. If the update has no
+        ``update_id``, the next free one is assigned. Returns the ``update_id``.
+        """
+        data = update.to_dict() if isinstance(update, Update) else dict(update)
+        if not data.get("update_id"):
+            data["update_id"] = next(self._update_ids)
+        self._updates.append(data)
+        self._new_updates.set()
+        return data["update_id"]
+
+    def put_message(self, text: str, chat_id: int = 1, user_id: int = 1) -> int:
+        """Adds an update with a text message from a private chat. Returns the ``update_id``."""
+        user = {"id": user_id, "is_bot": False, "first_name": f"User {user_id}"}
+        return self.put_update(
+            {
+                "message": {
+                    "message_id": next(self._message_ids),
+                    "date": int(time.time()),
+                    "chat": {"id": chat_id, "type": "private"},
+                    "from": user,
+                    "text": text,
+                }
+            }
+        )
+
+    @property
+    def pending_updates(self) -> int:
+        """The number of updates not yet confirmed by the bot."""
+        return len(self._updates)
+
+    def add_file(self, content: bytes) -> str:
+        """Stores a file that can be retrieved via ``getFile`` and downloaded. Returns the
+        ``file_id``.
+        """
+        file_id = f"file-{next(self._file_ids)}"
+        self._files[file_id] = content
+        return file_id
+
+    def set_result(self, method: str, result: Result) -> None:
+        """Sets the result of a Bot API method. If ``result`` is callable, it is called with the
+        parameters of the request to build the result.
+        """
+        self._results[method] = result
+
+    def inject_fault(
+        self,
+        method: str,
+        fault: Fault,
+        times: Optional[int] = 1,
+        probability: float = 1,
+    ) -> None:
+        """Answers the next requests to a Bot API method (``"*"`` for all methods) with a fault.
+
+        Args:
+            method: The name of the Bot API method, e.g. ``"sendMessage"``.
+            fault: The error to answer with.
+            times: How many requests to answer with the fault. :obj:`None` for all of them.
+            probability: The probability that a request is answered with the fault.
+        """
+        self._faults.setdefault(method, []).append(_InjectedFault(fault, times, probability))
+
+    def clear_faults(self) -> None:
+        self._faults.clear()
+
+    def reset_accounting(self) -> None:
+        self.requests.clear()
+        self.calls.clear()
+        self.peak_in_flight = self.in_flight
+
+    def _pop_fault(self, method: str) -> Optional[Fault]:
+        for key in (method, "*"):
+            for injected in self._faults.get(key, []):
+                if injected.times == 0 or random.random() >= injected.probability:
+                    continue
+                if injected.times is not None:
+                    injected.times -= 1
+                return injected.fault
+        return None
+
+    def _delay(self, method: str) -> float:
+        return self.latency(method) if callable(self.latency) else self.latency
+
+    async def _wait(self, event: asyncio.Event, timeout: float) -> None:
+        waiters = [
+            asyncio.ensure_future(event.wait()),
+            asyncio.ensure_future(self._closing.wait()),
+        ]
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def _get_updates(self, parameters: Dict[str, str]) -> List[JSONDict]:
+        offset = int(parameters.get("offset", 0))
+        limit = int(parameters.get("limit", 100))
+        timeout = float(parameters.get("timeout", 0))
+
+        if offset < 0:
+            self._updates = self._updates[offset:]
+        else:
+            self._updates = [update for update in self._updates if update["update_id"] >= offset]
+        if not self._updates and timeout > 0:
+            self._new_updates.clear()
+            await self._wait(self._new_updates, timeout)
+        return self._updates[:limit]
+
+    def _build_message(self, parameters: Dict[str, str], **kwargs: Any) -> JSONDict:
+        chat_id = parameters.get("chat_id", "1")
+        chat: JSONDict = (
+            {"id": int(chat_id), "type": "private" if int(chat_id) > 0 else "supergroup"}
+            if re.fullmatch(r"-?\d+", chat_id)
+            else {"id": -1, "type": "channel", "username": chat_id.lstrip("@")}
+        )
+        message = {
+            "message_id": next(self._message_ids),
+            "date": int(time.time()),
+            "chat": chat,
+            "from": self.bot_user,
+            **kwargs,
+        }
+        for key in ("text", "caption"):
+            if key in parameters:
+                message[key] = parameters[key]
+        return message
+
+    def _build_media(self, kind: str, media: Optional[str], files: Dict[str, bytes]) -> object:
+        # Files are uploaded either directly as the parameter or attached under another name
+        if media is None:
+            content: Optional[bytes] = files[kind]
+        elif media.startswith("attach://"):
+            content = files[media[len("attach://") :]]
+        else:
+            content = None
+        file_id = self.add_file(content) if content is not None else media
+        medium = {
+            "file_id": file_id,
+            "file_unique_id": f"unique-{file_id}",
+            "file_size": len(content) if content is not None else 0,
+            **_MEDIA_FIELDS[kind],
+        }
+        return [medium] if kind == "photo" else medium
+
+    def _call_method(
+        self, method: str, parameters: Dict[str, str], files: Dict[str, bytes]
+    ) -> object:
+        if method in self._results:
+            result = self._results[method]
+            return result(parameters) if callable(result) else result
+        if method == "getMe":
+            return self.bot_user
+        if method == "getFile":
+            file_id = parameters["file_id"]
+            if file_id not in self._files:
+                raise _FaultError(Fault.bad_request("invalid file_id"))
+            return {
+                "file_id": file_id,
+                "file_unique_id": f"unique-{file_id}",
+                "file_size": len(self._files[file_id]),
+                "file_path": file_id,
+            }
+        if method == "sendChatAction":
+            return True
+        if method == "copyMessage":
+            return {"message_id": next(self._message_ids)}
+        if method == "sendMediaGroup":
+            return [
+                self._build_message(
+                    parameters,
+                    **{medium["type"]: self._build_media(medium["type"], medium["media"], files)},
+                )
+                for medium in json.loads(parameters["media"])
+            ]
+
+        kind = re.sub(r"(?<!^)(?=[A-Z])", "_", method[len("send") :]).lower()
+        if method.startswith("send") and kind in _MEDIA_FIELDS:
+            return self._build_message(
+                parameters, **{kind: self._build_media(kind, parameters.get(kind), files)}
+            )
+        if method.startswith(("send", "forward")) or (
+            method.startswith("edit") and "inline_message_id" not in parameters
+        ):
+            return self._build_message(parameters)
+        return True
+
+
+class _FaultError(Exception):
+    def __init__(self, fault: Fault):
+        super().__init__(fault.description)
+        self.fault = fault
+
+
+class _BaseHandler(RequestHandler):
+    # pylint: disable=abstract-method,attribute-defined-outside-init
+
+    def initialize(self, api: FakeBotAPI) -> None:
+        self.api = api
+
+    def write_fault(self, fault: Fault) -> None:
+        self.set_status(cast(int, fault.status_code))
+        body: JSONDict = {
+            "ok": False,
+            "error_code": fault.status_code,
+            "description": fault.description,
+        }
+        if fault.parameters:
+            body["parameters"] = fault.parameters
+        self.write(body)
+
+    async def answer(
+        self, method: str, token: str, respond: Callable[[], Awaitable[None]]
+    ) -> None:
+        api = self.api
+        api.requests[method] += 1
+        api.in_flight += 1
+        task = asyncio.current_task()
+        if task is not None:
+            api._handlers.add(task)
+        api.peak_in_flight = max(api.peak_in_flight, api.in_flight)
+        try:
+            delay = api._delay(method)
+            if delay:
+                await asyncio.sleep(delay)
+            if token != api.token:
+                self.write_fault(Fault(401, "Unauthorized"))
+                return
+            fault = api._pop_fault(method)
+            if fault is not None and fault.status_code is None:
+                await api._wait(asyncio.Event(), api.hang_time)
+                return
+            if fault is not None:
+                self.write_fault(fault)
+                return
+            try:
+                await respond()
+            except _FaultError as exc:
+                self.write_fault(exc.fault)
+        finally:
+            api.in_flight -= 1
+            api._handlers.discard(task)  # type: ignore[arg-type]
+
+
+class _MethodHandler(_BaseHandler):
+    # pylint: disable=abstract-method
+
+    async def post(self, token: str, method: str) -> None:
+        parameters = {
+            name: values[-1].decode() for name, values in self.request.body_arguments.items()
+        }
+        files = {name: values[-1].body for name, values in self.request.files.items()}
+        self.api.calls.append(RecordedCall(method, parameters, files))
+
+        async def respond() -> None:
+            if method == "getUpdates":
+                result: object = await self.api._get_updates(parameters)
+            else:
+                result = self.api._call_method(method, parameters, files)
+            self.write({"ok": True, "result": result})
+
+        await self.answer(method, token, respond)
+
+    get = post
+
+
+class _FileHandler(_BaseHandler):
+    # pylint: disable=abstract-method
+
+    async def get(self, token: str, file_path: str) -> None:
+        async def respond() -> None:
+            if file_path not in self.api._files:
+                raise _FaultError(Fault(404, "Not Found"))
+            self.write(self.api._files[file_path])
+
+        await self.answer("file", token, respond)
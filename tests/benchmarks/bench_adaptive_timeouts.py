@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Compares how calls of :meth:`telegram.Bot.get_chat` behave during an outage of the Bot API with
+fixed timeouts, with :class:`telegram.request.AdaptiveTimeouts` and additionally with a
+:class:`telegram.request.CircuitBreaker`. The network is replaced by a fake request that
+usually answers after a short latency, but doesn't answer at all during the outage, so that
+requests only end by running into the read timeout.
+
+Run with ``python -m tests.benchmarks.bench_adaptive_timeouts``.
+"""
+import asyncio
+import random
+import time
+from typing import Any, Optional
+
+from telegram import Bot
+from telegram.error import TelegramError, TimedOut
+from telegram.request import AdaptiveTimeouts, BaseRequest, CircuitBreaker
+
+CALLS = 600
+INTERVAL = 0.01
+LATENCY = 0.02
+READ_TIMEOUT = 2
+OUTAGE = (2, 4)
+
+
+class FakeRequest(BaseRequest):
+    def __init__(self) -> None:
+        self.requests = 0
+        self.start = time.perf_counter()
+
+    @property
+    def read_timeout(self) -> Optional[float]:
+        return READ_TIMEOUT
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def do_request(self, *args: Any, **kwargs: Any) -> tuple[int, bytes]:
+        self.requests += 1
+        read_timeout = kwargs["read_timeout"]
+        if read_timeout is BaseRequest.DEFAULT_NONE:
+            read_timeout = READ_TIMEOUT
+        now = time.perf_counter() - self.start
+        if OUTAGE[0] <= now < OUTAGE[1]:
+            await asyncio.sleep(read_timeout)
+            raise TimedOut
+        await asyncio.sleep(random.uniform(LATENCY / 2, LATENCY))
+        return 200, b'{"ok": true, "result": {"id": 1, "type": "private"}}'
+
+
+async def run(
+    adaptive_timeouts: Optional[AdaptiveTimeouts], circuit_breaker: Optional[CircuitBreaker]
+) -> tuple[int, int, float, float]:
+    random.seed(0)
+    request = FakeRequest()
+    request.adaptive_timeouts = adaptive_timeouts
+    request.circuit_breaker = circuit_breaker
+    bot = Bot("123456789:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi", request=request)
+    failures = []
+
+    async def call() -> None:
+        start = time.perf_counter()
+        try:
+            await bot.get_chat(1)
+        except TelegramError:
+            failures.append(time.perf_counter() - start)
+
+    tasks = []
+    for _ in range(CALLS):
+        tasks.append(asyncio.create_task(call()))
+        await asyncio.sleep(INTERVAL)
+    await asyncio.gather(*tasks)
+    return request.requests, len(failures), sum(failures), max(failures, default=0)
+
+
+async def main() -> None:
+    print(
+        f"{'mode':<12}{'requests':>10}{'failures':>10}{'time failing [s]':>18}"
+        f"{'max failure [s]':>17}"
+    )
+    for mode, adaptive_timeouts, circuit_breaker in (
+        ("fixed", None, None),
+        ("adaptive", AdaptiveTimeouts(min_timeout=0.1, max_timeout=READ_TIMEOUT), None),
+        (
+            "+breaker",
+            AdaptiveTimeouts(min_timeout=0.1, max_timeout=READ_TIMEOUT),
+            CircuitBreaker(recovery_time=0.5),
+        ),
+    ):
+        requests, failures, total, longest = await run(adaptive_timeouts, circuit_breaker)
+        print(f"{mode:<12}{requests:>10}{failures:>10}{total:>18.1f}{longest:>17.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Compares a hand-written loop over :meth:`telegram.Bot.send_message` with
+:class:`telegram.ext.Broadcaster` for a broadcast to many chats. The Bot API is simulated by a
+coroutine that answers after a fixed latency and occasionally times out. The loop stops at the
+first error, while the broadcaster retries and keeps going.
+
+Run with ``python -m tests.benchmarks.bench_broadcast``.
+"""
+import asyncio
+import random
+import time
+
+from telegram.error import TimedOut
+from telegram.ext import Broadcaster
+
+CHATS = 1_000
+LATENCY = 0.05
+ERROR_RATE = 0.01
+
+
+async def send(chat_id: int) -> int:
+    await asyncio.sleep(LATENCY)
+    if random.random() < ERROR_RATE:
+        raise TimedOut
+    return chat_id
+
+
+async def loop() -> int:
+    sent = 0
+    try:
+        for chat_id in range(CHATS):
+            await send(chat_id)
+            sent += 1
+    except TimedOut:
+        pass
+    return sent
+
+
+async def broadcast(max_concurrency: int, max_rate: float) -> int:
+    broadcaster = Broadcaster(
+        send,
+        range(CHATS),
+        max_concurrency=max_concurrency,
+        max_rate=max_rate,
+        retry_interval=0.1,
+    )
+    await broadcaster.run()
+    return broadcaster.counts["sent"]
+
+
+async def main() -> None:
+    print(f"{'mode':<32}{'sent':>8}{'time [s]':>10}{'msgs/s':>8}")
+    for name, run in (
+        ("loop", loop),
+        ("Broadcaster(8, max_rate=25)", lambda: broadcast(8, 25)),
+        ("Broadcaster(8, max_rate=0)", lambda: broadcast(8, 0)),
+        ("Broadcaster(32, max_rate=0)", lambda: broadcast(32, 0)),
+    ):
+        random.seed(0)
+        start = time.perf_counter()
+        sent = await run()
+        duration = time.perf_counter() - start
+        print(f"{name:<32}{sent:>8}{duration:>10.2f}{sent / duration:>8.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
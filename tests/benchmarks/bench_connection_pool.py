@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Sends bursts of concurrent requests through :class:`telegram.request.HTTPXRequest` with a
+fixed and an adaptive connection pool and reports the pool timeouts and the highest number of
+sockets open at once. The network is replaced by fake sockets that answer every request after a
+fixed latency, so the connection pool of httpx is still in effect.
+
+Note that with fake sockets, the run time of large bursts is dominated by the bookkeeping of the
+connection pool of httpcore, which grows with the number of open connections times the number of
+waiting requests. The adaptive pool can't be faster than a fixed pool of its maximal size.
+
+Run with ``python -m tests.benchmarks.bench_connection_pool``.
+"""
+import asyncio
+import time
+from typing import Any, Optional
+
+import httpcore
+from httpcore._backends.auto import AutoBackend
+
+from telegram.error import TimedOut
+from telegram.request import HTTPXRequest
+
+LATENCY = 0.05
+BURSTS = 5
+# Sizes of the bursts, e.g. the number of updates processed concurrently
+BURST_SIZES = (4, 16, 64)
+RESPONSE = b'HTTP/1.1 200 OK\r\nContent-Length: 28\r\n\r\n{"ok": true, "result": true}'
+
+
+class FakeStream(httpcore.AsyncNetworkStream):
+    open_streams = 0
+    peak = 0
+
+    def __init__(self) -> None:
+        FakeStream.open_streams += 1
+        FakeStream.peak = max(FakeStream.peak, FakeStream.open_streams)
+        self._pending = False
+
+    async def write(self, buffer: bytes, timeout: Optional[float] = None) -> None:
+        self._pending = True
+
+    async def read(self, max_bytes: int, timeout: Optional[float] = None) -> bytes:
+        if not self._pending:
+            return b""
+        self._pending = False
+        await asyncio.sleep(LATENCY)
+        return RESPONSE
+
+    async def aclose(self) -> None:
+        FakeStream.open_streams -= 1
+
+    def get_extra_info(self, info: str) -> Any:
+        return None
+
+
+async def connect_tcp(*args: Any, **kwargs: Any) -> FakeStream:
+    return FakeStream()
+
+
+async def run(
+    burst_size: int, connection_pool_size: int, max_connection_pool_size: Optional[int]
+) -> tuple[int, int, float]:
+    FakeStream.peak = 0
+    timeouts = 0
+    start = time.perf_counter()
+    async with HTTPXRequest(
+        connection_pool_size=connection_pool_size,
+        max_connection_pool_size=max_connection_pool_size,
+    ) as request:
+        for _ in range(BURSTS):
+            results = await asyncio.gather(
+                *(request.do_request("http://example.com", "POST") for _ in range(burst_size)),
+                return_exceptions=True,
+            )
+            timeouts += sum(isinstance(result, TimedOut) for result in results)
+    return timeouts, FakeStream.peak, time.perf_counter() - start
+
+
+async def main() -> None:
+    AutoBackend.connect_tcp = connect_tcp  # type: ignore[method-assign]
+    print(f"{'pool':<14}{'burst':>6}{'timeouts':>10}{'sockets':>9}{'time [s]':>10}")
+    for burst_size in BURST_SIZES:
+        for name, size, max_size in (
+            ("fixed 1", 1, None),
+            ("fixed 32", 32, None),
+            ("fixed 256", 256, None),
+            ("adaptive 1-32", 1, 32),
+        ):
+            timeouts, peak, duration = await run(burst_size, size, max_size)
+            print(f"{name:<14}{burst_size:>6}{timeouts:>10}{peak:>9}{duration:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
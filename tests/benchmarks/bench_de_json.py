@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Compares the cached per-class constructors of ``TelegramObject.de_json`` with the previous
+implementation, which called ``cls(**data)`` and handled the ``TypeError`` on unknown keys.
+
+Run with ``python -m tests.benchmarks.bench_de_json``.
+"""
+import inspect
+from contextlib import contextmanager
+from typing import Iterator
+
+from telegram import TelegramObject, Update
+from telegram._utils.types import JSONDict
+from tests.benchmarks.payloads import (
+    TEXT_MESSAGE_UPDATE,
+    UPDATES,
+    get_updates_batch,
+    make_bot,
+    measure,
+)
+
+_INIT_PARAMS = {}
+
+
+def _legacy_de_json(cls, data, bot, api_kwargs=None):
+    if data is None:
+        return None
+
+    try:
+        obj = cls(**data, api_kwargs=api_kwargs)
+    except TypeError as exc:
+        if "__init__() got an unexpected keyword argument" not in str(exc):
+            raise exc
+
+        if cls not in _INIT_PARAMS:
+            _INIT_PARAMS[cls] = set(inspect.signature(cls).parameters.keys())
+
+        api_kwargs = api_kwargs or {}
+        existing_kwargs = {}
+        for key, value in data.items():
+            (existing_kwargs if key in _INIT_PARAMS[cls] else api_kwargs)[key] = value
+
+        obj = cls(api_kwargs=api_kwargs, **existing_kwargs)
+
+    obj.set_bot(bot=bot)
+    return obj
+
+
+@contextmanager
+def legacy_de_json() -> Iterator[None]:
+    original = TelegramObject.__dict__["_de_json"]
+    TelegramObject._de_json = classmethod(_legacy_de_json)  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        TelegramObject._de_json = original  # type: ignore[method-assign]
+
+
+def _with_unknown_fields(update: JSONDict) -> JSONDict:
+    """Adds fields that this version of PTB doesn't know yet to the message, sender and chat.
+    This is the usual situation after the Bot API was updated."""
+    message = update["message"]
+    return {
+        **update,
+        "message": {
+            **message,
+            "new_message_field": True,
+            "from": {**message["from"], "new_user_field": "foo"},
+            "chat": {**message["chat"], "new_chat_field": 42},
+        },
+    }
+
+
+def main() -> None:
+    bot = make_bot()
+    payloads = {**UPDATES, "text msg, unknown fields": _with_unknown_fields(TEXT_MESSAGE_UPDATE)}
+    cases = {
+        name: (lambda payload=payload: Update.de_json(payload, bot), 2_000)
+        for name, payload in payloads.items()
+    }
+    batch = get_updates_batch(100)
+    cases["getUpdates batch of 100"] = (lambda: Update.de_list(batch, bot), 20)
+
+    print(f"{'payload':<26}{'legacy [us]':>14}{'cached [us]':>14}{'speedup':>10}")
+    for name, (run, number) in cases.items():
+        legacy = cached = float("inf")
+        # Alternate between the implementations to reduce the influence of noise
+        for _ in range(5):
+            with legacy_de_json():
+                legacy = min(legacy, measure(run, number, repeat=1))
+            cached = min(cached, measure(run, number, repeat=1))
+        print(f"{name:<26}{legacy:>14.1f}{cached:>14.1f}{legacy / cached:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures copying ``chat_data`` that stores received messages before handing it to the
+persistence, with the plain :func:`copy.deepcopy` and with the variant used when
+``BasePersistence.share_frozen_objects`` is enabled.
+
+Run with ``python -m tests.benchmarks.bench_deepcopy``.
+"""
+from copy import deepcopy
+
+from telegram import Update
+from telegram._utils.copying import deepcopy_sharing_frozen
+from tests.benchmarks.payloads import UPDATES, make_bot, measure
+
+
+def main() -> None:
+    bot = make_bot()
+    print(f"{'payload':<26}{'messages':>10}{'deepcopy [us]':>16}{'sharing [us]':>16}")
+    for name, payload in UPDATES.items():
+        message = Update.de_json(payload, bot).effective_message
+        if message is None:
+            continue
+        for count in (10, 100):
+            history = [Update.de_json(payload, bot).effective_message for _ in range(count)]
+            chat_data = {"history": history, "last": history[-1], "counter": count}
+            assert deepcopy_sharing_frozen(chat_data) == deepcopy(chat_data)
+            results = [
+                measure(lambda chat_data=chat_data: deepcopy(chat_data), 200),
+                measure(lambda chat_data=chat_data: deepcopy_sharing_frozen(chat_data), 200),
+            ]
+            print(f"{name:<26}{count:>10}" + "".join(f"{r:>16.1f}" for r in results))
+
+
+if __name__ == "__main__":
+    main()
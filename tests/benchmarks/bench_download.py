@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures the peak memory and the longest stall of the event loop while downloading a file to
+the drive with :meth:`telegram.File.download_to_drive`, compared to loading the whole file via
+:meth:`telegram.request.BaseRequest.retrieve` and writing it at once as before. The network is
+replaced by a transport that streams zeros.
+
+Run with ``python -m tests.benchmarks.bench_download``.
+"""
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from http import HTTPStatus
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable
+
+import httpx
+
+from telegram import Bot, File
+from telegram.request import HTTPXRequest
+
+CHUNK = b"\x00" * 64 * 1024
+
+
+class ZeroStream(httpx.AsyncByteStream):
+    def __init__(self, size: int):
+        self.size = size
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for _ in range(self.size // len(CHUNK)):
+            # Give control back to the event loop like a real connection would
+            await asyncio.sleep(0)
+            yield CHUNK
+
+
+def make_transport(size: int) -> Callable[..., Awaitable[httpx.Response]]:
+    async def handle_async_request(
+        _: httpx.AsyncHTTPTransport, request: httpx.Request
+    ) -> httpx.Response:
+        return httpx.Response(HTTPStatus.OK, stream=ZeroStream(size))
+
+    return handle_async_request
+
+
+async def max_stall(event: asyncio.Event) -> float:
+    longest = 0.0
+    last = time.perf_counter()
+    while not event.is_set():
+        await asyncio.sleep(0)
+        now = time.perf_counter()
+        longest = max(longest, now - last)
+        last = now
+    return longest
+
+
+async def run(download: Callable[[], Awaitable[object]]) -> tuple[float, float]:
+    done = asyncio.Event()
+    stall = asyncio.create_task(max_stall(done))
+    await asyncio.sleep(0)
+    tracemalloc.start()
+    await download()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    done.set()
+    return peak / 1024**2, await stall * 1000
+
+
+async def main() -> None:
+    bot = Bot("123:abc", request=HTTPXRequest())
+    print(f"{'size [MiB]':<12}{'mode':<12}{'peak [MiB]':>12}{'max stall [ms]':>16}")
+    async with bot.request:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "file.bin"
+            for size in (10, 100):
+                httpx.AsyncHTTPTransport.handle_async_request = make_transport(  # type: ignore
+                    size * 1024**2
+                )
+                file = File("id", "unique_id", file_path="https://example.com/file")
+                file.set_bot(bot)
+
+                async def buffered(file: File = file) -> None:
+                    path.write_bytes(await bot.request.retrieve(file.file_path))
+
+                async def streamed(file: File = file) -> None:
+                    await file.download_to_drive(path)
+
+                for mode, download in (("buffered", buffered), ("streamed", streamed)):
+                    peak, stall = await run(download)
+                    print(f"{size:<12}{mode:<12}{peak:>12.1f}{stall:>16.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures the end to end throughput of an echo bot, from fetching updates via the
+:class:`telegram.ext.Updater` to answering them with :meth:`telegram.Message.reply_text`. The
+Bot API is replaced by the fake server from ``tests/auxil/fake_bot_api.py``, which delays every
+request by a fixed latency. Since the fake server runs in the same event loop, the throughput is
+also limited by the CPU time that the server needs.
+
+Run with ``python -m tests.benchmarks.bench_end_to_end``.
+"""
+import asyncio
+import time
+from typing import Union
+
+from telegram import Update
+from telegram.ext import ApplicationBuilder, ContextTypes, MessageHandler, filters
+from telegram.request import HTTPXRequest
+from tests.auxil.fake_bot_api import FakeBotAPI
+
+UPDATES = 2_000
+LATENCY = 0.02
+
+
+async def echo(update: Update, _: ContextTypes.DEFAULT_TYPE) -> None:
+    await update.message.reply_text(update.message.text)  # type: ignore[union-attr,arg-type]
+
+
+async def run(concurrent_updates: Union[bool, int], pool_size: int) -> float:
+    async with FakeBotAPI(latency=LATENCY) as api:
+        application = (
+            ApplicationBuilder()
+            .token(api.token)
+            .base_url(api.base_url)
+            .base_file_url(api.base_file_url)
+            .request(HTTPXRequest(connection_pool_size=pool_size))
+            .concurrent_updates(concurrent_updates)
+            .build()
+        )
+        application.add_handler(MessageHandler(filters.TEXT, echo))
+        for i in range(UPDATES):
+            api.put_message(str(i), chat_id=i)
+
+        async with application:
+            start = time.perf_counter()
+            await application.start()
+            await application.updater.start_polling(poll_interval=0)  # type: ignore[union-attr]
+            while api.requests["sendMessage"] < UPDATES:
+                await asyncio.sleep(0.01)
+            elapsed = time.perf_counter() - start
+            await application.updater.stop()  # type: ignore[union-attr]
+            await application.stop()
+    return elapsed
+
+
+async def main() -> None:
+    print(f"{'concurrent updates':<20}{'pool size':>10}{'updates/s':>12}")
+    for concurrent_updates, pool_size in ((False, 1), (8, 8), (64, 8), (64, 32)):
+        elapsed = await run(concurrent_updates, pool_size)
+        print(f"{concurrent_updates!s:<20}{pool_size:>10}{UPDATES / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
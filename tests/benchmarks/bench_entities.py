@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures the typical pattern of several handlers inspecting the same message, i.e. calling
+``Message.parse_entities`` and ``Message.text_html`` three times each, for a message with many
+formatting entities. The time needed for ``Message.de_json`` is listed for comparison, as it is
+part of every measurement.
+
+Run with ``python -m tests.benchmarks.bench_entities``.
+"""
+from telegram import Message
+from tests.benchmarks.payloads import make_bot, measure
+
+
+def make_payload(entity_count: int) -> dict:
+    words = []
+    entities = []
+    offset = 0
+    for i in range(entity_count):
+        word = f"w\U0001f431rd{i}"
+        entities.append({"type": ("bold", "italic", "url")[i % 3], "offset": offset, "length": 6})
+        words.append(word)
+        # The emoji takes up two UTF-16 code units
+        offset += len(word) + 2
+    return {
+        "message_id": 1,
+        "date": 1700000000,
+        "chat": {"id": 1, "type": "private"},
+        "text": " ".join(words),
+        "entities": entities,
+    }
+
+
+def inspect(payload, bot) -> None:
+    message = Message.de_json(payload, bot)
+    for _ in range(3):
+        message.parse_entities()
+        message.text_html
+
+
+def main() -> None:
+    bot = make_bot()
+    print(f"{'entities':>8}{'de_json [us]':>16}{'3x parse + html [us]':>24}")
+    for entity_count in (5, 20, 100):
+        payload = make_payload(entity_count)
+        results = [
+            measure(lambda payload=payload: Message.de_json(payload, bot), 200),
+            measure(lambda payload=payload: inspect(payload, bot), 200),
+        ]
+        print(f"{entity_count:>8}{results[0]:>16.1f}{results[1]:>24.1f}")
+
+
+if __name__ == "__main__":
+    main()
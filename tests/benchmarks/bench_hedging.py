@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Compares the latency of :meth:`telegram.Bot.get_chat` with and without a
+:class:`telegram.request.HedgingPolicy`. The network is replaced by a fake request that usually
+answers after a short latency, but occasionally is much slower, e.g. due to a slow connection.
+
+Run with ``python -m tests.benchmarks.bench_hedging``.
+"""
+import asyncio
+import random
+import time
+from typing import Any, Optional
+
+from telegram import Bot
+from telegram.request import BaseRequest, HedgingPolicy
+
+CALLS = 1_000
+CONCURRENCY = 50
+LATENCY = 0.02
+SLOW_LATENCY = 0.5
+SLOW_PROBABILITY = 0.03
+
+
+class FakeRequest(BaseRequest):
+    def __init__(self) -> None:
+        self.requests = 0
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def do_request(self, *args: Any, **kwargs: Any) -> tuple[int, bytes]:
+        self.requests += 1
+        slow = random.random() < SLOW_PROBABILITY
+        await asyncio.sleep(SLOW_LATENCY if slow else random.uniform(LATENCY / 2, LATENCY))
+        return 200, b'{"ok": true, "result": {"id": 1, "type": "private"}}'
+
+
+async def run(hedging_policy: Optional[HedgingPolicy]) -> tuple[int, list[float]]:
+    random.seed(0)
+    request = FakeRequest()
+    request.hedging_policy = hedging_policy
+    bot = Bot("123456789:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi", request=request)
+    latencies = []
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def call() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await bot.get_chat(1)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(call() for _ in range(CALLS)))
+    return request.requests, sorted(latencies)
+
+
+async def main() -> None:
+    print(f"{'hedging':<10}{'requests':>10}{'p50 [ms]':>10}{'p99 [ms]':>10}{'max [ms]':>10}")
+    for hedging_policy in (None, HedgingPolicy(quantile=0.95)):
+        requests, latencies = await run(hedging_policy)
+        p50, p99 = latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+        print(
+            f"{hedging_policy is not None!s:<10}{requests:>10}{p50 * 1000:>10.1f}"
+            f"{p99 * 1000:>10.1f}{latencies[-1] * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures the time it takes to import :mod:`telegram` and :mod:`telegram.ext` and how many
+modules are loaded for some typical import statements. Every statement is executed in a fresh
+interpreter and the fastest of several runs is reported.
+
+Run with ``python -m tests.benchmarks.bench_import``.
+"""
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import telegram",
+    "from telegram import Update",
+    "from telegram import Bot",
+    "import telegram.ext",
+    "from telegram.ext import Application, CommandHandler",
+)
+RUNS = 10
+
+_CHILD = """
+import sys, time
+start = time.perf_counter()
+exec({statement!r})
+duration = time.perf_counter() - start
+print(duration * 1000, len(sys.modules))
+"""
+
+
+def run(statement: str) -> tuple[float, int]:
+    results = []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", _CHILD.format(statement=statement)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        results.append((float(output[0]), int(output[1])))
+    return min(results)
+
+
+def main() -> None:
+    print(f"{'statement':<54}{'time [ms]':>12}{'modules':>10}")
+    for statement in STATEMENTS:
+        duration, modules = run(statement)
+        print(f"{statement:<54}{duration:>12.1f}{modules:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures parsing a ``getUpdates`` batch and the memory held by the parsed updates, with and
+without interning users and chats (see ``ExtBot.intern_objects``). The updates of a batch are
+sent by a handful of users, as is the case for a busy group.
+
+Run with ``python -m tests.benchmarks.bench_intern``.
+"""
+import tracemalloc
+
+from telegram import Update
+from telegram.ext import ExtBot
+from tests.benchmarks.payloads import get_updates_batch, make_bot, measure
+
+
+def held_memory(batch, bot) -> int:
+    tracemalloc.start()
+    updates = [Update.de_json(payload, bot) for payload in batch]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del updates
+    return size
+
+
+def main() -> None:
+    bot = make_bot()
+    intern_bot = ExtBot(token=bot.token, intern_objects=True)
+
+    print(
+        f"{'updates':>8}{'plain [us]':>14}{'interned [us]':>16}{'plain [KiB]':>14}"
+        f"{'interned [KiB]':>16}"
+    )
+    for size in (100, 1_000):
+        batch = get_updates_batch(size)
+        results = [
+            measure(lambda batch=batch: [Update.de_json(p, bot) for p in batch], 5),
+            measure(lambda batch=batch: [Update.de_json(p, intern_bot) for p in batch], 5),
+        ]
+        memory = [held_memory(batch, bot) / 1024, held_memory(batch, intern_bot) / 1024]
+        print(
+            f"{size:>8}{results[0]:>14.0f}{results[1]:>16.0f}{memory[0]:>14.0f}{memory[1]:>16.0f}"
+        )
+
+    cache = intern_bot.intern_cache
+    print(f"intern cache: {len(cache)} objects, {cache.hits} hits, {cache.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Compares JSON codecs on the hot paths of the networking backend: decoding a ``getUpdates``
+response and encoding the payload of a ``sendMessage`` request.
+
+Third party codecs are only benchmarked if the respective library is installed.
+
+Run with ``python -m tests.benchmarks.bench_json_codec``.
+"""
+import json
+from typing import Any, Dict, Union
+
+from telegram import InlineKeyboardMarkup, MessageEntity
+from telegram.request import BaseRequest, JSONCodec, RequestData, set_json_codec
+from telegram.request._requestparameter import RequestParameter
+from tests.benchmarks.payloads import INLINE_KEYBOARD, get_updates_batch, make_bot, measure
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class OrjsonCodec(JSONCodec):
+    __slots__ = ()
+
+    def dumps(self, obj: object) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    def dumps_bytes(self, obj: object) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    __slots__ = ()
+
+    def dumps(self, obj: object) -> str:
+        return ujson.dumps(obj, ensure_ascii=False)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        return ujson.loads(data)
+
+
+def _send_message_data() -> RequestData:
+    bot = make_bot()
+    parameters = {
+        "chat_id": -1001234567890,
+        "text": "Hello *world*! Please vote below. " * 10,
+        "parse_mode": "MarkdownV2",
+        "entities": [MessageEntity(MessageEntity.BOLD, offset, 5) for offset in range(0, 300, 30)],
+        "reply_markup": InlineKeyboardMarkup.de_json(INLINE_KEYBOARD, bot),
+        "disable_notification": True,
+    }
+    return RequestData(
+        [RequestParameter.from_input(key, value) for key, value in parameters.items()]
+    )
+
+
+def main() -> None:
+    codecs: Dict[str, JSONCodec] = {"stdlib": JSONCodec()}
+    if orjson is not None:
+        codecs["orjson"] = OrjsonCodec()
+    if ujson is not None:
+        codecs["ujson"] = UjsonCodec()
+
+    get_updates_response = json.dumps({"ok": True, "result": get_updates_batch(100)}).encode()
+    request_data = _send_message_data()
+    cases = {
+        "getUpdates batch of 100": (
+            lambda: BaseRequest.parse_json_payload(get_updates_response),
+            200,
+        ),
+        "sendMessage payload": (lambda: request_data.json_payload, 5_000),
+    }
+
+    print(f"{'case':<26}" + "".join(f"{name + ' [us]':>16}" for name in codecs))
+    try:
+        for name, (run, number) in cases.items():
+            results = {codec_name: float("inf") for codec_name in codecs}
+            # Alternate between the codecs to reduce the influence of noise
+            for _ in range(5):
+                for codec_name, codec in codecs.items():
+                    set_json_codec(codec)
+                    results[codec_name] = min(results[codec_name], measure(run, number, repeat=1))
+            print(f"{name:<26}" + "".join(f"{result:>16.1f}" for result in results.values()))
+    finally:
+        set_json_codec(JSONCodec())
+
+
+if __name__ == "__main__":
+    main()
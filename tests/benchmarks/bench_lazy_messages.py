@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures the CPU time per :meth:`telegram.Bot.send_message` call with and without
+:attr:`telegram.ext.Defaults.lazy_messages`, if the returned message is never used. The response
+echoes the text, the entities and the inline keyboard of the sent message, as Telegram does. The
+network is replaced by a fake request that answers immediately.
+
+Run with ``python -m tests.benchmarks.bench_lazy_messages``.
+"""
+import asyncio
+import json
+import time
+from typing import Any
+
+from telegram import InlineKeyboardMarkup, MessageEntity, MessageTemplate
+from telegram.ext import Defaults, ExtBot
+from telegram.request import BaseRequest
+from tests.benchmarks.payloads import GROUP, INLINE_KEYBOARD, USER
+
+CHATS = 20_000
+TEXT = "We have a new feature! Read all about it in the documentation."
+ENTITIES = [
+    MessageEntity(MessageEntity.BOLD, 0, 22),
+    MessageEntity(MessageEntity.TEXT_LINK, 51, 13, url="https://ptb.org"),
+]
+RESPONSE = json.dumps(
+    {
+        "ok": True,
+        "result": {
+            "message_id": 4242,
+            "from": {**USER, "is_bot": True},
+            "chat": GROUP,
+            "date": 1700000000,
+            "text": TEXT,
+            "entities": [entity.to_dict() for entity in ENTITIES],
+            "reply_markup": INLINE_KEYBOARD,
+        },
+    }
+).encode()
+
+
+class FakeRequest(BaseRequest):
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def do_request(self, *args: Any, **kwargs: Any) -> tuple[int, bytes]:
+        return 200, RESPONSE
+
+
+async def measure(lazy_messages: bool, template: bool) -> float:
+    bot = ExtBot(
+        "123456789:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi",
+        request=FakeRequest(),
+        defaults=Defaults(lazy_messages=lazy_messages),
+    )
+    kwargs = {
+        "text": TEXT,
+        "entities": ENTITIES,
+        "reply_markup": InlineKeyboardMarkup.de_json(INLINE_KEYBOARD, bot),
+    }
+    if template:
+        send = (await MessageTemplate.create(bot.send_message, **kwargs)).send
+    else:
+
+        async def send(chat_id: int) -> Any:
+            return await bot.send_message(chat_id, **kwargs)
+
+    start = time.process_time()
+    for chat_id in range(CHATS):
+        await send(chat_id)
+    return (time.process_time() - start) / CHATS * 1e6
+
+
+async def main() -> None:
+    print(f"{'mode':<20}{'eager [us]':>12}{'lazy [us]':>12}")
+    for name, template in (("send_message", False), ("MessageTemplate", True)):
+        eager = await measure(lazy_messages=False, template=template)
+        lazy = await measure(lazy_messages=True, template=template)
+        print(f"{name:<20}{eager:>12.1f}{lazy:>12.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures the memory used by typical messages with the rarely set attributes of
+:class:`telegram.Message` stored in a shared mapping, compared to a dedicated slot per attribute
+as before. The latter is emulated by a subclass that declares these attributes as slots again.
+
+Run with ``python -m tests.benchmarks.bench_message_memory``.
+"""
+import sys
+import tracemalloc
+
+from telegram import Message
+from telegram._utils.sparse import SparseAttribute
+from tests.benchmarks.payloads import UPDATES, make_bot, measure
+
+SPARSE_NAMES = tuple(
+    name for name, value in vars(Message).items() if isinstance(value, SparseAttribute)
+)
+
+
+class DenseMessage(Message):
+    __slots__ = SPARSE_NAMES
+
+
+def bytes_per_message(cls, payload, bot, number=1_000) -> float:
+    # Warm up caches that are filled on first use, so they don't distort the result
+    for _ in range(number):
+        cls.de_json(payload, bot)
+    tracemalloc.start()
+    messages = [cls.de_json(payload, bot) for _ in range(number)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del messages
+    return size / number
+
+
+def main() -> None:
+    bot = make_bot()
+    print(f"{len(SPARSE_NAMES)} of {len(Message._get_slot_names()[0])} attributes are sparse")
+    print(
+        f"{'payload':<20}{'object [B]':>12}{'dense [B]':>12}{'total [B]':>12}{'dense [B]':>12}"
+        f"{'de_json [us]':>14}{'dense [us]':>12}"
+    )
+    for name, payload in UPDATES.items():
+        data = next((payload[key] for key in ("message", "channel_post") if key in payload), None)
+        if data is None:
+            continue
+        results = [
+            sys.getsizeof(Message.de_json(data, bot)),
+            sys.getsizeof(DenseMessage.de_json(data, bot)),
+            bytes_per_message(Message, data, bot),
+            bytes_per_message(DenseMessage, data, bot),
+            measure(lambda data=data: Message.de_json(data, bot), 2_000),
+            measure(lambda data=data: DenseMessage.de_json(data, bot), 2_000),
+        ]
+        print(
+            f"{name:<20}{results[0]:>12}{results[1]:>12}{results[2]:>12.0f}{results[3]:>12.0f}"
+            f"{results[4]:>14.1f}{results[5]:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
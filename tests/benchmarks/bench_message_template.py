@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Compares sending the same message to many chats with :meth:`telegram.Bot.send_message` and
+with a :class:`telegram.MessageTemplate`. The message has entities and an inline keyboard. The
+network is replaced by a fake request that answers immediately, so the numbers show the CPU time
+spent by the library per message, including the deserialization of the response.
+
+Run with ``python -m tests.benchmarks.bench_message_template``.
+"""
+import asyncio
+import time
+from typing import Any
+
+from telegram import InlineKeyboardMarkup, MessageEntity, MessageTemplate
+from telegram.ext import ExtBot
+from telegram.request import BaseRequest
+from tests.benchmarks.payloads import INLINE_KEYBOARD
+
+CHATS = 20_000
+RESPONSE = (
+    b'{"ok": true, "result": {"message_id": 1, "date": 0, "chat": {"id": 1, "type": "private"},'
+    b' "text": "We have a new feature!"}}'
+)
+
+
+class FakeRequest(BaseRequest):
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def do_request(self, *args: Any, **kwargs: Any) -> tuple[int, bytes]:
+        return 200, RESPONSE
+
+
+async def main() -> None:
+    bot = ExtBot("123456789:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi", request=FakeRequest())
+    kwargs = {
+        "text": "We have a new feature! Read all about it in the documentation.",
+        "entities": [
+            MessageEntity(MessageEntity.BOLD, 0, 22),
+            MessageEntity(MessageEntity.TEXT_LINK, 51, 13, url="https://ptb.org"),
+        ],
+        "reply_markup": InlineKeyboardMarkup.de_json(INLINE_KEYBOARD, bot),
+        "disable_notification": True,
+    }
+    template = await MessageTemplate.create(bot.send_message, **kwargs)
+
+    print(f"{'mode':<16}{'per message [us]':>18}")
+    for name, send in (
+        ("send_message", lambda chat_id: bot.send_message(chat_id, **kwargs)),
+        ("MessageTemplate", template.send),
+    ):
+        start = time.process_time()
+        for chat_id in range(CHATS):
+            await send(chat_id)
+        duration = time.process_time() - start
+        print(f"{name:<16}{duration / CHATS * 1e6:>18.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
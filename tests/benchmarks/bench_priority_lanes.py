@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures how long replies to users wait while a broadcast saturates the overall rate limit,
+with :class:`telegram.ext.AIORateLimiter` and with :class:`telegram.ext.PriorityRateLimiter`,
+where the broadcast is sent in the ``low`` lane. The network is replaced by a fake request that
+answers immediately. The rate limit is scaled up so that the benchmark finishes in a few seconds.
+
+Run with ``python -m tests.benchmarks.bench_priority_lanes``.
+"""
+import asyncio
+import statistics
+import time
+from typing import Any, Optional
+
+from telegram.ext import AIORateLimiter, BaseRateLimiter, ExtBot, PriorityRateLimiter
+from telegram.request import BaseRequest
+
+RATE = 300
+BROADCAST = 1_500
+REPLIES = 50
+RESPONSE = (
+    b'{"ok": true, "result": {"message_id": 1, "date": 0, "chat": {"id": 1, "type": "private"},'
+    b' "text": "text"}}'
+)
+
+
+class FakeRequest(BaseRequest):
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def do_request(self, *args: Any, **kwargs: Any) -> tuple[int, bytes]:
+        return 200, RESPONSE
+
+
+async def measure(rate_limiter: BaseRateLimiter, broadcast_args: Optional[str]) -> list[float]:
+    bot = ExtBot(
+        "123456789:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi",
+        request=FakeRequest(),
+        rate_limiter=rate_limiter,
+    )
+    broadcast = [
+        asyncio.create_task(
+            bot.send_message(chat_id, "broadcast", rate_limit_args=broadcast_args)
+        )
+        for chat_id in range(1, BROADCAST + 1)
+    ]
+
+    latencies = []
+
+    async def reply(chat_id: int) -> None:
+        start = time.perf_counter()
+        await bot.send_message(chat_id, "reply")
+        latencies.append(time.perf_counter() - start)
+
+    replies = []
+    for chat_id in range(REPLIES):
+        await asyncio.sleep(BROADCAST / RATE / 2 / REPLIES)
+        replies.append(asyncio.create_task(reply(BROADCAST + chat_id + 1)))
+    await asyncio.gather(*broadcast, *replies)
+    await rate_limiter.shutdown()
+    return latencies
+
+
+async def main() -> None:
+    print(f"{'rate limiter':<22}{'median [ms]':>14}{'p90 [ms]':>12}{'max [ms]':>12}")
+    for name, rate_limiter, broadcast_args in (
+        ("AIORateLimiter", AIORateLimiter(overall_max_rate=RATE), None),
+        ("PriorityRateLimiter", PriorityRateLimiter(overall_max_rate=RATE), "low"),
+    ):
+        latencies = await measure(rate_limiter, broadcast_args)
+        print(
+            f"{name:<22}{statistics.median(latencies) * 1e3:>14.1f}"
+            f"{statistics.quantiles(latencies, n=10)[-1] * 1e3:>12.1f}"
+            f"{max(latencies) * 1e3:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures archiving received updates as JSON, i.e. ``de_json`` followed by ``to_json``, with
+and without keeping the raw payloads (see ``ExtBot.keep_raw_payloads``). The last column combines
+this with ``ExtBot.lazy_updates``, such that the content of the update is never parsed.
+
+Run with ``python -m tests.benchmarks.bench_raw_payload``.
+"""
+import json
+
+from telegram import Update
+from telegram.ext import ExtBot
+from tests.benchmarks.payloads import UPDATES, make_bot, measure
+
+
+def main() -> None:
+    bot = make_bot()
+    raw_bot = ExtBot(token=bot.token, keep_raw_payloads=True)
+    lazy_raw_bot = ExtBot(token=bot.token, keep_raw_payloads=True, lazy_updates=True)
+
+    widths = (20, 16, 16, 18)
+    print(
+        f"{'payload':<26}{'re-serialize [us]':>20}{'raw dict [us]':>16}{'raw bytes [us]':>16}"
+        f"{'lazy + raw [us]':>18}"
+    )
+    for name, payload in UPDATES.items():
+        body = json.dumps(payload).encode("utf-8")
+
+        def raw_bytes(payload=payload, body=body):
+            # This is what the webhook handler does
+            update = Update.de_json(payload, raw_bot)
+            update._set_raw_payload(body)
+            return update.to_json()
+
+        results = [
+            measure(lambda payload=payload: Update.de_json(payload, bot).to_json(), 2_000),
+            measure(lambda payload=payload: Update.de_json(payload, raw_bot).to_json(), 2_000),
+            measure(raw_bytes, 2_000),
+            measure(
+                lambda payload=payload: Update.de_json(payload, lazy_raw_bot).to_json(), 2_000
+            ),
+        ]
+        print(f"{name:<26}" + "".join(f"{r:>{w}.1f}" for r, w in zip(results, widths)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Compares the throughput and the CPU time per request of :class:`telegram.request.HTTPXRequest`
+and :class:`telegram.request.AiohttpRequest`. Both send the same ``sendMessage`` calls to a
+minimal local stand-in for the Bot API, which runs in a separate process so that only the CPU
+time of the client is measured.
+
+Run with ``python -m tests.benchmarks.bench_request_backends``.
+"""
+import asyncio
+import multiprocessing
+import time
+
+from telegram.request import AiohttpRequest, BaseRequest, HTTPXRequest, RequestData
+from telegram.request._requestparameter import RequestParameter
+
+REQUESTS = 5_000
+CONCURRENCY = 8
+PORT = 8765
+RESPONSE = b'{"ok":true,"result":{"message_id":1,"date":0,"chat":{"id":1,"type":"private"}}}'
+
+
+async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(RESPONSE), RESPONSE)
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        writer.close()
+
+
+def serve() -> None:
+    async def main() -> None:
+        server = await asyncio.start_server(handle, "127.0.0.1", PORT)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
+
+
+async def run(request: BaseRequest) -> tuple[float, float]:
+    request_data = RequestData(
+        parameters=[
+            RequestParameter.from_input("chat_id", 123456789),
+            RequestParameter.from_input("text", "Hello there!"),
+        ]
+    )
+    url = f"http://127.0.0.1:{PORT}/botTOKEN/sendMessage"
+    queue = list(range(REQUESTS))
+
+    async def worker() -> None:
+        while queue:
+            queue.pop()
+            await request.post(url, request_data)
+
+    async with request:
+        # Warm up the connections
+        await asyncio.gather(*(request.post(url, request_data) for _ in range(CONCURRENCY)))
+        start, cpu_start = time.perf_counter(), time.process_time()
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+        return time.perf_counter() - start, time.process_time() - cpu_start
+
+
+async def main() -> None:
+    print(f"{'backend':<16}{'requests/s':>12}{'CPU/request [us]':>18}")
+    for name, request in (
+        ("HTTPXRequest", HTTPXRequest(connection_pool_size=CONCURRENCY)),
+        ("AiohttpRequest", AiohttpRequest(connection_pool_size=CONCURRENCY)),
+    ):
+        elapsed, cpu = await run(request)
+        print(f"{name:<16}{REQUESTS / elapsed:>12.0f}{cpu / REQUESTS * 1e6:>18.1f}")
+
+
+if __name__ == "__main__":
+    server_process = multiprocessing.Process(target=serve, daemon=True)
+    server_process.start()
+    time.sleep(0.5)
+    try:
+        asyncio.run(main())
+    finally:
+        server_process.terminate()
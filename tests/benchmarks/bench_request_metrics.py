@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures the overhead of collecting :class:`telegram.request.RequestMetrics` per request made
+through :meth:`telegram.request.BaseRequest.post`. The network is replaced by a fake request that
+answers immediately, so the numbers are an upper bound for the relative overhead.
+
+Run with ``python -m tests.benchmarks.bench_request_metrics``.
+"""
+import asyncio
+import time
+from typing import Any
+
+from telegram.request import BaseRequest, RequestData, RequestMetrics
+from telegram.request._requestparameter import RequestParameter
+
+REQUESTS = 50_000
+RESPONSE = (
+    b'{"ok": true, "result": {"message_id": 1, "date": 0, "chat": {"id": 1, "type": "private"}}}'
+)
+
+
+class FakeRequest(BaseRequest):
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def do_request(self, *args: Any, **kwargs: Any) -> tuple[int, bytes]:
+        return 200, RESPONSE
+
+
+async def measure(metrics: bool) -> float:
+    request = FakeRequest()
+    if metrics:
+        request.metrics = RequestMetrics()
+    request_data = RequestData(
+        [RequestParameter("chat_id", 123456789, []), RequestParameter("text", "Hello!", [])]
+    )
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await request.post("https://api.telegram.org/botTOKEN/sendMessage", request_data)
+    return (time.perf_counter() - start) / REQUESTS * 1e6
+
+
+async def main() -> None:
+    print(f"{'metrics':<10}{'per request [us]':>18}")
+    for metrics in (False, True):
+        print(f"{metrics!s:<10}{await measure(metrics):>18.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
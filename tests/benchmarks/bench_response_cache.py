@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Simulates a busy group, where the handler of every message calls
+:meth:`telegram.Bot.get_chat_member` for its sender, and counts the requests made to the Bot API
+with and without a :class:`telegram.ext.ResponseCache`. The messages arrive in waves, so
+coalescing concurrent calls alone only removes the duplicates within a wave. The network is
+replaced by a fake request that answers after a fixed latency.
+
+Run with ``python -m tests.benchmarks.bench_response_cache``.
+"""
+import asyncio
+import random
+import time
+from typing import Any, Optional
+
+from telegram.ext import ExtBot, ResponseCache
+from telegram.request import BaseRequest
+
+LATENCY = 0.05
+MESSAGES = 1_000
+SENDERS = 50
+WAVES = 20
+
+
+class FakeRequest(BaseRequest):
+    def __init__(self) -> None:
+        self.requests = 0
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def do_request(self, *args: Any, **kwargs: Any) -> tuple[int, bytes]:
+        self.requests += 1
+        await asyncio.sleep(LATENCY)
+        return (
+            200,
+            b'{"ok": true, "result": {"status": "member", "user": {"id": 1, '
+            b'"is_bot": false, "first_name": "user"}}}',
+        )
+
+
+async def session(
+    coalesce_requests: bool, response_cache: Optional[ResponseCache]
+) -> tuple[int, float]:
+    request = FakeRequest()
+    bot = ExtBot(
+        "123456789:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi",
+        request=request,
+        coalesce_requests=coalesce_requests,
+        response_cache=response_cache,
+    )
+    random.seed(0)
+    senders = [random.randrange(SENDERS) for _ in range(MESSAGES)]
+    start = time.perf_counter()
+    for wave in range(WAVES):
+        part = senders[wave * MESSAGES // WAVES : (wave + 1) * MESSAGES // WAVES]
+        await asyncio.gather(*(bot.get_chat_member(-100, sender) for sender in part))
+    return request.requests, time.perf_counter() - start
+
+
+async def main() -> None:
+    print(f"{'setup':<24}{'calls':>8}{'requests':>10}{'time [s]':>10}")
+    for name, coalesce_requests, response_cache in (
+        ("plain", False, None),
+        ("coalesce_requests", True, None),
+        ("response_cache", False, ResponseCache()),
+        ("both", True, ResponseCache()),
+    ):
+        requests, duration = await session(coalesce_requests, response_cache)
+        print(f"{name:<24}{MESSAGES:>8}{requests:>10}{duration:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
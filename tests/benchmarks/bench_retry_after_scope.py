@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures how long replies in private chats wait while one noisy group keeps hitting a
+:exc:`telegram.error.RetryAfter` with :class:`telegram.ext.AIORateLimiter`. The global pause on
+every :exc:`~telegram.error.RetryAfter` (``global_cooldown_threshold=1``) is compared to the
+default, where only the group cools down. The network is replaced by a fake request that answers
+immediately.
+
+Run with ``python -m tests.benchmarks.bench_retry_after_scope``.
+"""
+import asyncio
+import logging
+import statistics
+import time
+from typing import Any
+
+from telegram.error import RetryAfter
+from telegram.ext import AIORateLimiter, ExtBot
+from telegram.request import BaseRequest
+
+GROUP_ID = -100
+GROUP_MESSAGES = 3
+REPLIES = 200
+RESPONSE = (
+    b'{"ok": true, "result": {"message_id": 1, "date": 0, "chat": {"id": 1, "type": "private"},'
+    b' "text": "text"}}'
+)
+
+
+class FakeRequest(BaseRequest):
+    """Answers immediately, except for the first message to the group in every second"""
+
+    def __init__(self) -> None:
+        self.last_retry_after = 0.0
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def do_request(self, *args: Any, **kwargs: Any) -> tuple[int, bytes]:
+        if kwargs["request_data"].parameters.get("chat_id") == GROUP_ID:
+            now = time.perf_counter()
+            if now - self.last_retry_after > 1:
+                self.last_retry_after = now
+                raise RetryAfter(retry_after=1)
+        return 200, RESPONSE
+
+
+async def measure(global_cooldown_threshold: int) -> list[float]:
+    bot = ExtBot(
+        "123456789:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi",
+        request=FakeRequest(),
+        rate_limiter=AIORateLimiter(
+            overall_max_rate=0,
+            group_max_rate=0,
+            max_retries=GROUP_MESSAGES,
+            global_cooldown_threshold=global_cooldown_threshold,
+        ),
+    )
+    group = [
+        asyncio.create_task(bot.send_message(GROUP_ID, "noise")) for _ in range(GROUP_MESSAGES)
+    ]
+
+    latencies = []
+
+    async def reply(chat_id: int) -> None:
+        start = time.perf_counter()
+        await bot.send_message(chat_id, "reply")
+        latencies.append(time.perf_counter() - start)
+
+    replies = []
+    for chat_id in range(1, REPLIES + 1):
+        await asyncio.sleep(0.01)
+        replies.append(asyncio.create_task(reply(chat_id)))
+    await asyncio.gather(*replies)
+    # Some of the group messages may give up after the maximum number of retries
+    await asyncio.gather(*group, return_exceptions=True)
+    return latencies
+
+
+async def main() -> None:
+    # The group messages that give up are expected, don't log them
+    logging.getLogger("telegram.ext").setLevel(logging.CRITICAL)
+    print(f"{'cooldown':<12}{'median [ms]':>14}{'p90 [ms]':>12}{'max [ms]':>12}")
+    for name, threshold in (("global", 1), ("per chat", 5)):
+        latencies = await measure(threshold)
+        print(
+            f"{name:<12}{statistics.median(latencies) * 1e3:>14.1f}"
+            f"{statistics.quantiles(latencies, n=10)[-1] * 1e3:>12.1f}"
+            f"{max(latencies) * 1e3:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures ``TelegramObject.to_dict`` and ``TelegramObject.__getstate__`` for objects that are
+serialized on every outgoing request or when persisting data.
+
+Run with ``python -m tests.benchmarks.bench_to_dict``.
+"""
+from telegram import (
+    InlineKeyboardMarkup,
+    InlineQueryResultArticle,
+    InputMediaPhoto,
+    InputTextMessageContent,
+    MessageEntity,
+    Update,
+)
+from tests.benchmarks.payloads import INLINE_KEYBOARD, TEXT_MESSAGE_UPDATE, make_bot, measure
+
+
+def main() -> None:
+    bot = make_bot()
+    markup = InlineKeyboardMarkup.de_json(INLINE_KEYBOARD, bot)
+    objects = {
+        "InlineKeyboardMarkup": markup,
+        "InputMediaPhoto": InputMediaPhoto(
+            media="AgACAgIAAxkBAAIBY2X",
+            caption="Caption",
+            caption_entities=[MessageEntity(MessageEntity.BOLD, 0, 7)],
+        ),
+        "InlineQueryResultArticle": InlineQueryResultArticle(
+            id="1",
+            title="Title",
+            input_message_content=InputTextMessageContent("Hello *world*"),
+            reply_markup=markup,
+            description="Description",
+        ),
+        "Update (text message)": Update.de_json(TEXT_MESSAGE_UPDATE, bot),
+    }
+
+    print(f"{'object':<28}{'to_dict [us]':>14}{'__getstate__ [us]':>20}")
+    for name, obj in objects.items():
+        to_dict = measure(obj.to_dict, 5_000)
+        get_state = measure(obj.__getstate__, 5_000)
+        print(f"{name:<28}{to_dict:>14.2f}{get_state:>20.2f}")
+
+
+if __name__ == "__main__":
+    main()
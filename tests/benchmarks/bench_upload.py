@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures the peak memory used while uploading a file through :class:`~telegram.request.
+HTTPXRequest`, with the file read into memory up front and with the file handle passed on to
+httpx via ``InputFile(..., read_file_handle=False)``. The network is replaced by a transport that
+discards the request body.
+
+Run with ``python -m tests.benchmarks.bench_upload``.
+"""
+import asyncio
+import tempfile
+import tracemalloc
+from http import HTTPStatus
+from pathlib import Path
+
+import httpx
+
+from telegram import InputFile
+from telegram.request import HTTPXRequest, RequestData
+from telegram.request._requestparameter import RequestParameter
+
+
+async def discard_request(_: httpx.AsyncHTTPTransport, request: httpx.Request) -> httpx.Response:
+    async for _chunk in request.stream:
+        pass
+    return httpx.Response(HTTPStatus.OK, content=b'{"ok": true, "result": true}')
+
+
+async def peak_memory(path: Path, read_file_handle: bool) -> float:
+    async with HTTPXRequest() as request:
+        tracemalloc.start()
+        with path.open("rb") as file:
+            input_file = InputFile(file, read_file_handle=read_file_handle)
+            request_data = RequestData([RequestParameter.from_input("document", input_file)])
+            await request.post("https://example.com/bot/sendDocument", request_data)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return peak / 1024**2
+
+
+async def main() -> None:
+    httpx.AsyncHTTPTransport.handle_async_request = discard_request  # type: ignore[method-assign]
+    print(f"{'file size [MiB]':<18}{'read up front [MiB]':>22}{'streamed [MiB]':>18}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in (1, 10, 100):
+            path = Path(directory) / "file.bin"
+            path.write_bytes(b"\x00" * size * 1024**2)
+            results = [await peak_memory(path, read) for read in (True, False)]
+            print(f"{size:<18}" + "".join(f"{r:>{w}.1f}" for r, w in zip(results, (22, 18))))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
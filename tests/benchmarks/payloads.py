@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Realistic Bot API payloads shared by the benchmarks in this directory."""
+import copy
+import time
+import timeit
+from typing import Callable, Dict, List
+
+from telegram import Bot
+from telegram._utils.types import JSONDict
+
+USER = {
+    "id": 123456789,
+    "is_bot": False,
+    "first_name": "Jane",
+    "last_name": "Doe",
+    "username": "jane_doe",
+    "language_code": "en",
+}
+GROUP = {
+    "id": -1001234567890,
+    "title": "Python Telegram Bot Benchmarks",
+    "username": "ptb_benchmarks",
+    "type": "supergroup",
+    "is_forum": False,
+}
+INLINE_KEYBOARD = {
+    "inline_keyboard": [
+        [
+            {"text": "Yes", "callback_data": "vote:yes"},
+            {"text": "No", "callback_data": "vote:no"},
+        ],
+        [{"text": "Docs", "url": "https://docs.python-telegram-bot.org"}],
+    ]
+}
+
+TEXT_MESSAGE_UPDATE: JSONDict = {
+    "update_id": 10000001,
+    "message": {
+        "message_id": 4242,
+        "from": USER,
+        "chat": GROUP,
+        "date": 1700000000,
+        "text": "/start@ptb_bot hello *world*, see https://python-telegram-bot.org",
+        "entities": [
+            {"offset": 0, "length": 14, "type": "bot_command"},
+            {"offset": 21, "length": 7, "type": "bold"},
+            {"offset": 34, "length": 31, "type": "url"},
+        ],
+        "reply_to_message": {
+            "message_id": 4241,
+            "from": {**USER, "id": 987654321, "first_name": "John", "username": "john"},
+            "chat": GROUP,
+            "date": 1699999990,
+            "text": "Anyone here?",
+        },
+    },
+}
+FORWARDED_MESSAGE_UPDATE: JSONDict = {
+    "update_id": 10000002,
+    "message": {
+        "message_id": 4243,
+        "from": USER,
+        "chat": GROUP,
+        "date": 1700000005,
+        "forward_origin": {
+            "type": "user",
+            "sender_user": {**USER, "id": 555, "first_name": "Origin"},
+            "date": 1699990000,
+        },
+        # Deprecated fields that Telegram still sends along
+        "forward_from": {**USER, "id": 555, "first_name": "Origin"},
+        "forward_date": 1699990000,
+        "photo": [
+            {"file_id": "AgAD1", "file_unique_id": "u1", "width": 90, "height": 90},
+            {"file_id": "AgAD2", "file_unique_id": "u2", "width": 320, "height": 320},
+            {"file_id": "AgAD3", "file_unique_id": "u3", "width": 1280, "height": 1280},
+        ],
+        "caption": "forwarded photo",
+    },
+}
+CALLBACK_QUERY_UPDATE: JSONDict = {
+    "update_id": 10000003,
+    "callback_query": {
+        "id": "4382bfdwdsb323b2d9",
+        "from": USER,
+        "chat_instance": "-1234567890123456789",
+        "data": "vote:yes",
+        "message": {
+            "message_id": 4244,
+            "from": {"id": 1234, "is_bot": True, "first_name": "PTB", "username": "ptb_bot"},
+            "chat": GROUP,
+            "date": 1700000010,
+            "text": "Do you like benchmarks?",
+            "reply_markup": INLINE_KEYBOARD,
+        },
+    },
+}
+CHAT_MEMBER_UPDATE: JSONDict = {
+    "update_id": 10000004,
+    "chat_member": {
+        "chat": GROUP,
+        "from": USER,
+        "date": 1700000020,
+        "old_chat_member": {"user": USER, "status": "member"},
+        "new_chat_member": {
+            "user": USER,
+            "status": "restricted",
+            "is_member": True,
+            "can_send_messages": False,
+            "can_send_audios": False,
+            "can_send_documents": False,
+            "can_send_photos": False,
+            "can_send_videos": False,
+            "can_send_video_notes": False,
+            "can_send_voice_notes": False,
+            "can_send_polls": False,
+            "can_send_other_messages": False,
+            "can_add_web_page_previews": False,
+            "can_change_info": False,
+            "can_invite_users": False,
+            "can_pin_messages": False,
+            "can_manage_topics": False,
+            "until_date": 1700086400,
+        },
+    },
+}
+
+UPDATES: Dict[str, JSONDict] = {
+    "text message": TEXT_MESSAGE_UPDATE,
+    "forwarded photo": FORWARDED_MESSAGE_UPDATE,
+    "callback query": CALLBACK_QUERY_UPDATE,
+    "chat member": CHAT_MEMBER_UPDATE,
+}
+
+
+def get_updates_batch(size: int = 100) -> List[JSONDict]:
+    """Returns a list of update payloads, like the ``result`` of a ``getUpdates`` call."""
+    templates = list(UPDATES.values())
+    batch = []
+    for i in range(size):
+        update = copy.deepcopy(templates[i % len(templates)])
+        update["update_id"] = 20000000 + i
+        batch.append(update)
+    return batch
+
+
+def make_bot() -> Bot:
+    """Returns a bot that can be passed to ``de_json``. It never makes any requests."""
+    return Bot(token="123456789:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi")
+
+
+def measure(func: Callable[[], object], number: int, repeat: int = 5) -> float:
+    """Returns the best CPU time per call of ``func`` in microseconds."""
+    timings = timeit.repeat(func, number=number, repeat=repeat, timer=time.process_time)
+    return min(timings) / number * 1e6
@@ -50,6 +50,8 @@ from tests.auxil.timezones import BasicTimezone
 if TEST_WITH_OPT_DEPS:
     import pytz
 
+    from tests.auxil.fake_bot_api import FakeBotAPI
+
 
 # Don't collect `test_official.py` on Python 3.10- since it uses newer features like X | Y syntax.
 # Docs: https://docs.pytest.org/en/7.1.x/example/pythoncollection.html#customizing-test-collection
@@ -290,6 +292,13 @@ def timezone(tzinfo):
     return tzinfo
 
 
+@pytest.fixture()
+async def fake_bot_api():
+    """A running in-process stand-in for the Bot API. Requires tornado."""
+    async with FakeBotAPI() as api:
+        yield api
+
+
 @pytest.fixture()
 def tmp_file(tmp_path):
     with tmp_path / uuid4().hex as file:
@@ -50,6 +50,7 @@ from telegram.ext import (
     JobQueue,
     MessageHandler,
     PicklePersistence,
+    ResponseCache,
     SimpleUpdateProcessor,
     TypeHandler,
     Updater,
@@ -1103,6 +1104,23 @@ class TestApplication:
             await asyncio.sleep(0.15)
             assert self.count == 5
 
+    async def test_process_update_response_cache(self, bot_info):
+        response_cache = ResponseCache(ttls={"getChat": 60})
+        bot = make_bot(bot_info, response_cache=response_cache)
+        app = Application.builder().bot(bot).build()
+
+        async def fetch():
+            return {"id": 1, "type": "group"}
+
+        await response_cache.get_or_fetch("getChat", {"chat_id": "1"}, fetch)
+        async with app:
+            app.add_handler(TypeHandler(object, self.callback_set_count(5)))
+            await app.process_update(make_message_update("text", bot=bot))
+            assert len(response_cache) == 1
+            await app.process_update(make_message_update(None, bot=bot, new_chat_title="title"))
+            assert len(response_cache) == 0
+            assert self.count == 5
+
     @pytest.mark.parametrize("handler_block", [True, False])
     @pytest.mark.parametrize("error_handler_block", [True, False])
     async def test_nonblocking_handler_raises_and_non_blocking_error_handler_raises(
@@ -36,11 +36,12 @@ from telegram.ext import (
     ExtBot,
     JobQueue,
     PicklePersistence,
+    ResponseCache,
     Updater,
 )
 from telegram.ext._applicationbuilder import _BOT_CHECKS
 from telegram.ext._baseupdateprocessor import SimpleUpdateProcessor
-from telegram.request import HTTPXRequest
+from telegram.request import HTTPXRequest, get_json_codec
 from telegram.warnings import PTBDeprecationWarning
 from tests.auxil.constants import PRIVATE_KEY
 from tests.auxil.envvars import TEST_WITH_OPT_DEPS
@@ -79,6 +80,9 @@ class TestApplicationBuilder:
             if argument == "media_write_timeout" and get_updates:
                 # get_updates never makes media requests
                 continue
+            if argument == "max_connection_pool_size" and get_updates:
+                # get_updates never makes concurrent requests
+                continue
             assert hasattr(builder, prefix + argument), f"missing method {prefix}{argument}"
 
     @pytest.mark.parametrize("bot_class", [Bot, ExtBot])
@@ -148,6 +152,11 @@ class TestApplicationBuilder:
         assert app.bot.defaults is None
         assert app.bot.rate_limiter is None
         assert app.bot.local_mode is False
+        assert app.bot.lazy_updates is False
+        assert app.bot.keep_raw_payloads is False
+        assert app.bot.intern_cache is None
+        assert app.bot.coalesce_requests is False
+        assert app.bot.response_cache is None
 
         get_updates_client = app.bot._request[0]._client
         assert get_updates_client.limits == httpx.Limits(
@@ -201,6 +210,7 @@ class TestApplicationBuilder:
         "method",
         [
             "connection_pool_size",
+            "max_connection_pool_size",
             "connect_timeout",
             "pool_timeout",
             "read_timeout",
@@ -272,6 +282,7 @@ class TestApplicationBuilder:
             "get_updates_socket_options",
             "get_updates_http_version",
             "connection_pool_size",
+            "max_connection_pool_size",
             "connect_timeout",
             "pool_timeout",
             "read_timeout",
@@ -317,6 +328,7 @@ class TestApplicationBuilder:
             "get_updates_socket_options",
             "get_updates_http_version",
             "connection_pool_size",
+            "max_connection_pool_size",
             "connect_timeout",
             "pool_timeout",
             "read_timeout",
@@ -355,6 +367,7 @@ class TestApplicationBuilder:
         request = HTTPXRequest()
         get_updates_request = HTTPXRequest()
         rate_limiter = AIORateLimiter()
+        response_cache = ResponseCache()
         builder.token(bot.token).base_url("base_url").base_file_url("base_file_url").private_key(
             PRIVATE_KEY
         ).defaults(defaults).arbitrary_callback_data(42).request(request).get_updates_request(
@@ -363,6 +376,16 @@ class TestApplicationBuilder:
             rate_limiter
         ).local_mode(
             True
+        ).lazy_updates(
+            True
+        ).keep_raw_payloads(
+            True
+        ).intern_objects(
+            7
+        ).coalesce_requests(
+            True
+        ).response_cache(
+            response_cache
         )
         built_bot = builder.build().bot
 
@@ -380,6 +403,11 @@ class TestApplicationBuilder:
         assert built_bot.private_key
         assert built_bot.rate_limiter is rate_limiter
         assert built_bot.local_mode is True
+        assert built_bot.lazy_updates is True
+        assert built_bot.keep_raw_payloads is True
+        assert built_bot.intern_cache.maxsize == 7
+        assert built_bot.coalesce_requests is True
+        assert built_bot.response_cache is response_cache
 
         @dataclass
         class Client:
@@ -435,6 +463,23 @@ class TestApplicationBuilder:
         assert client.http2 is False
         assert media_write_timeout == [None, None]
 
+    @pytest.mark.parametrize(("connection_pool_size", "expected_size"), [(None, 256), (2, 2)])
+    def test_max_connection_pool_size(self, builder, bot, connection_pool_size, expected_size):
+        builder.token(bot.token).max_connection_pool_size(512)
+        if connection_pool_size:
+            builder.connection_pool_size(connection_pool_size)
+        app = builder.build()
+
+        assert app.bot.request.connection_pool_size == expected_size
+        assert app.bot.request.max_connection_pool_size == 512
+        assert app.bot._request[0].max_connection_pool_size is None
+
+    def test_max_connection_pool_size_below_default(self, builder, bot):
+        # The minimal size is not lowered behind the user's back
+        builder.token(bot.token).max_connection_pool_size(8)
+        with pytest.raises(ValueError, match="must not be smaller"):
+            builder.build()
+
     def test_custom_socket_options(self, builder, monkeypatch, bot):
         httpx_request_kwargs = []
         httpx_request_init = HTTPXRequest.__init__
@@ -577,6 +622,12 @@ class TestApplicationBuilder:
         assert isinstance(app.job_queue, JobQueue)
         assert app.job_queue.application is app
 
+    def test_build_keeps_json_codec(self, bot, builder):
+        # The codec is registered process-wide, so only users may change it
+        original = get_json_codec()
+        builder.token(bot.token).build()
+        assert get_json_codec() is original
+
     @pytest.mark.filterwarnings("ignore::telegram.warnings.PTBUserWarning")
     def test_no_job_queue(self, bot, builder):
         app = builder.token(bot.token).job_queue(None).build()
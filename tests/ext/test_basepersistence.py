@@ -74,8 +74,13 @@ class TrackingPersistence(BasePersistence):
         store_data: Optional[PersistenceInput] = None,
         update_interval: float = 60,
         fill_data: bool = False,
+        share_frozen_objects: bool = False,
     ):
-        super().__init__(store_data=store_data, update_interval=update_interval)
+        super().__init__(
+            store_data=store_data,
+            update_interval=update_interval,
+            share_frozen_objects=share_frozen_objects,
+        )
         self.updated_chat_ids = collections.Counter()
         self.updated_user_ids = collections.Counter()
         self.refreshed_chat_ids = collections.Counter()
@@ -921,6 +926,26 @@ class TestBasePersistence:
 
             assert not papp.persistence.conversations
 
+    @pytest.mark.parametrize("share_frozen_objects", [True, False])
+    async def test_update_persistence_share_frozen_objects(self, bot_info, share_frozen_objects):
+        persistence = TrackingPersistence(share_frozen_objects=share_frozen_objects)
+        assert persistence.share_frozen_objects is share_frozen_objects
+        app = ApplicationBuilder().bot(make_bot(bot_info)).persistence(persistence).build()
+        user = User(1, "first_name", False)
+
+        async with app:
+            app.bot_data["user"] = user
+            app.chat_data[1]["users"] = [user]
+            app.user_data[1]["user"] = user
+            app.mark_data_for_update_persistence(chat_ids=1, user_ids=1)
+            await app.update_persistence()
+
+        assert persistence.chat_data[1] == {"users": [user]}
+        assert persistence.chat_data[1]["users"] is not app.chat_data[1]["users"]
+        assert (persistence.bot_data["user"] is user) is share_frozen_objects
+        assert (persistence.chat_data[1]["users"][0] is user) is share_frozen_objects
+        assert (persistence.user_data[1]["user"] is user) is share_frozen_objects
+
     @default_papp
     @pytest.mark.parametrize("delay_type", ["job", "handler", "task"])
     async def test_update_persistence_loop_async_logic(
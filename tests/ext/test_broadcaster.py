@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import time
+
+import pytest
+
+from telegram import Bot
+from telegram.error import BadRequest, ChatMigrated, Forbidden, RetryAfter, TimedOut
+from telegram.ext import Broadcaster, BroadcastResult
+from tests.auxil.envvars import TEST_WITH_OPT_DEPS
+from tests.auxil.slots import mro_slots
+
+if TEST_WITH_OPT_DEPS:
+    from tests.auxil.fake_bot_api import Fault
+
+
+class Recipients:
+    """Records the sends and raises the queued exceptions for a chat id"""
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.sent = []
+        self.attempts = []
+        self.errors = {}
+        self.concurrent = 0
+        self.max_concurrent = 0
+
+    async def send(self, chat_id):
+        self.attempts.append(chat_id)
+        self.concurrent += 1
+        self.max_concurrent = max(self.max_concurrent, self.concurrent)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.concurrent -= 1
+        if self.errors.get(chat_id):
+            raise self.errors[chat_id].pop(0)
+        self.sent.append(chat_id)
+        return f"message to {chat_id}"
+
+
+@pytest.fixture()
+def recipients():
+    return Recipients()
+
+
+class TestBroadcaster:
+    def test_slot_behaviour(self, recipients):
+        broadcaster = Broadcaster(recipients.send, [])
+        for attr in broadcaster.__slots__:
+            assert getattr(broadcaster, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(broadcaster)) == len(set(mro_slots(broadcaster))), "duplicate slot"
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"max_concurrency": 0}, "positive integer"),
+            ({"max_rate": -1}, "must not be negative"),
+            ({"max_retries": -1}, "must not be negative"),
+            ({"retry_interval": -1}, "must not be negative"),
+        ],
+    )
+    def test_invalid_arguments(self, recipients, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            Broadcaster(recipients.send, [], **kwargs)
+
+    async def test_run(self, recipients):
+        results = []
+        broadcaster = Broadcaster(
+            recipients.send, range(20), max_rate=0, result_callback=results.append
+        )
+        assert broadcaster.done == 0
+        await broadcaster.run()
+
+        assert sorted(recipients.sent) == list(range(20))
+        assert sorted(result.chat_id for result in results) == list(range(20))
+        result = results[0]
+        assert result.status == BroadcastResult.SENT
+        assert result.attempts == 1
+        assert result.result == f"message to {result.chat_id}"
+        assert result.error is result.new_chat_id is None
+        assert broadcaster.counts == {"sent": 20, "forbidden": 0, "failed": 0}
+        assert broadcaster.done == 20
+        assert broadcaster.in_flight == 0
+        assert not broadcaster.running
+        assert broadcaster.checkpoint == {
+            "position": 20,
+            "completed": [],
+            "counts": {"sent": 20, "forbidden": 0, "failed": 0},
+        }
+
+    async def test_async_iterable(self, recipients):
+        async def chat_ids():
+            for chat_id in ("@channel", -100, 1):
+                await asyncio.sleep(0)
+                yield chat_id
+
+        await Broadcaster(recipients.send, chat_ids(), max_rate=0).run()
+        assert sorted(recipients.sent, key=str) == sorted(["@channel", -100, 1], key=str)
+
+    async def test_max_concurrency(self):
+        recipients = Recipients(delay=0.01)
+        await Broadcaster(recipients.send, range(20), max_concurrency=3, max_rate=0).run()
+        assert recipients.max_concurrent == 3
+        assert len(recipients.sent) == 20
+
+    async def test_max_rate(self, recipients):
+        start = time.perf_counter()
+        await Broadcaster(recipients.send, range(6), max_rate=50).run()
+        # The first message is sent immediately
+        assert time.perf_counter() - start == pytest.approx(0.1, abs=0.05)
+
+    async def test_errors(self, recipients):
+        results = {}
+        recipients.errors = {
+            1: [Forbidden("Forbidden: bot was blocked by the user")],
+            2: [BadRequest("Chat not found")],
+            3: [TimedOut(), TimedOut()],
+            4: [TimedOut()] * 3,
+            5: [ChatMigrated(-1005)],
+            6: [ValueError("programming error")],
+        }
+        broadcaster = Broadcaster(
+            recipients.send,
+            range(7),
+            max_rate=0,
+            max_retries=2,
+            retry_interval=0.01,
+            result_callback=lambda result: results.update({result.chat_id: result}),
+        )
+        await broadcaster.run()
+
+        assert results[0].status == BroadcastResult.SENT
+        assert results[1].status == BroadcastResult.FORBIDDEN
+        assert isinstance(results[1].error, Forbidden)
+        assert results[2].status == BroadcastResult.FAILED
+        assert results[2].attempts == 1
+        assert results[3].status == BroadcastResult.SENT
+        assert results[3].attempts == 3
+        assert results[4].status == BroadcastResult.FAILED
+        assert isinstance(results[4].error, TimedOut)
+        assert results[4].attempts == 3
+        assert results[5].status == BroadcastResult.SENT
+        assert results[5].new_chat_id == -1005
+        assert results[5].result == "message to -1005"
+        assert results[6].status == BroadcastResult.FAILED
+        assert isinstance(results[6].error, ValueError)
+        assert broadcaster.counts == {"sent": 3, "forbidden": 1, "failed": 3}
+
+    async def test_retry_after_pauses_all_sends(self, recipients):
+        recipients.errors = {0: [RetryAfter(1)]}
+        times = {}
+
+        async def send(chat_id):
+            times.setdefault(chat_id, time.perf_counter())
+            return await recipients.send(chat_id)
+
+        start = time.perf_counter()
+        await Broadcaster(send, range(4), max_concurrency=1, max_rate=0).run()
+        # chat 0 is retried and the remaining chats wait for the flood wait to pass
+        assert recipients.attempts == [0, 0, 1, 2, 3]
+        assert times[1] - start == pytest.approx(1.1, abs=0.1)
+
+    async def test_stop_and_resume(self):
+        recipients = Recipients(delay=0.01)
+        broadcaster = Broadcaster(
+            recipients.send,
+            range(10),
+            max_concurrency=2,
+            max_rate=0,
+            result_callback=lambda _: broadcaster.done >= 3 and broadcaster.stop(),
+        )
+        await broadcaster.run()
+        # The send that was in flight when stopping is finished
+        assert 3 <= broadcaster.done <= 4
+        checkpoint = broadcaster.checkpoint
+        assert checkpoint["position"] + len(checkpoint["completed"]) == broadcaster.done
+
+        resumed = Broadcaster(recipients.send, range(10), max_rate=0, checkpoint=checkpoint)
+        await resumed.run()
+        assert sorted(recipients.sent) == list(range(10))
+        assert resumed.counts["sent"] == 10
+        assert resumed.checkpoint["position"] == 10
+
+    async def test_checkpoint_with_gaps(self, recipients):
+        checkpoint = {"position": 2, "completed": [4], "counts": {"sent": 3}}
+        broadcaster = Broadcaster(recipients.send, range(6), max_rate=0, checkpoint=checkpoint)
+        await broadcaster.run()
+        assert sorted(recipients.sent) == [2, 3, 5]
+        assert broadcaster.counts["sent"] == 6
+
+    async def test_progress_callback(self, recipients):
+        progress = []
+
+        async def callback(broadcaster):
+            progress.append(broadcaster.done)
+
+        broadcaster = Broadcaster(
+            recipients.send,
+            range(5),
+            max_rate=0,
+            progress_callback=callback,
+            progress_interval=60,
+        )
+        await broadcaster.run()
+        # Once right away and once at the end
+        assert progress == [1, 5]
+
+    async def test_exceptions_in_callbacks_abort(self):
+        recipients = Recipients(delay=0.01)
+
+        def result_callback(_):
+            raise RuntimeError("database is down")
+
+        broadcaster = Broadcaster(
+            recipients.send, range(10), max_rate=0, result_callback=result_callback
+        )
+        with pytest.raises(RuntimeError, match="database is down"):
+            await broadcaster.run()
+        assert not broadcaster.running
+        assert broadcaster.in_flight == 0
+        assert len(recipients.sent) < 10
+
+    async def test_run_twice_concurrently(self):
+        recipients = Recipients(delay=0.05)
+        broadcaster = Broadcaster(recipients.send, range(2), max_rate=0)
+        task = asyncio.create_task(broadcaster.run())
+        await asyncio.sleep(0.01)
+        with pytest.raises(RuntimeError, match="already running"):
+            await broadcaster.run()
+        await task
+
+    @pytest.mark.skipif(not TEST_WITH_OPT_DEPS, reason="Requires the fake Bot API")
+    async def test_fake_bot_api(self, fake_bot_api):
+        fake_bot_api.inject_fault("sendMessage", Fault.retry_after(1))
+        fake_bot_api.inject_fault("sendMessage", Fault.bad_gateway())
+        results = []
+
+        async with Bot(fake_bot_api.token, base_url=fake_bot_api.base_url) as bot:
+            broadcaster = Broadcaster(
+                lambda chat_id: bot.send_message(chat_id, "announcement"),
+                range(1, 11),
+                max_rate=0,
+                retry_interval=0.01,
+                result_callback=results.append,
+            )
+            await broadcaster.run()
+
+        assert broadcaster.counts["sent"] == 10
+        assert sorted(result.result.chat.id for result in results) == list(range(1, 11))
+        assert fake_bot_api.requests["sendMessage"] == 12
@@ -58,6 +58,7 @@ class TestDefaults:
         e = User(123, "test_user", False)
         f = Defaults(parse_mode="HTML", disable_web_page_preview=True)
         g = Defaults(parse_mode="HTML", disable_web_page_preview=True)
+        h = Defaults(parse_mode="HTML", do_quote=True, lazy_messages=True)
 
         assert a == b
         assert hash(a) == hash(b)
@@ -75,6 +76,9 @@ class TestDefaults:
         assert f == g
         assert hash(f) == hash(g)
 
+        assert a != h
+        assert hash(a) != hash(h)
+
     def test_mutually_exclusive(self):
         with pytest.raises(ValueError, match="mutually exclusive"):
             Defaults(disable_web_page_preview=True, link_preview_options=LinkPreviewOptions(False))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import pytest
+
+from telegram import Chat, User
+from telegram.ext import ExtBot, InternCache
+from tests.auxil.slots import mro_slots
+
+
+@pytest.fixture()
+def intern_cache():
+    return InternCache(maxsize=2)
+
+
+class TestInternCache:
+    def test_slot_behaviour(self, intern_cache):
+        for attr in intern_cache.__slots__:
+            assert getattr(intern_cache, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(intern_cache)) == len(set(mro_slots(intern_cache))), "duplicate slot"
+
+    @pytest.mark.parametrize("maxsize", [0, -1])
+    def test_invalid_maxsize(self, maxsize):
+        with pytest.raises(ValueError, match="positive integer"):
+            InternCache(maxsize=maxsize)
+
+    def test_init(self):
+        intern_cache = InternCache()
+        assert intern_cache.maxsize == 1024
+        assert len(intern_cache) == 0
+        assert intern_cache.hits == intern_cache.misses == intern_cache.evictions == 0
+
+    def test_get_or_create(self, intern_cache):
+        data = {"id": 1, "first_name": "name", "is_bot": False}
+        user = intern_cache.get_or_create(User, data, lambda: User(**data))
+        assert intern_cache.get_or_create(User, dict(data), pytest.fail) is user
+        assert len(intern_cache) == 1
+        assert intern_cache.hits == 1
+        assert intern_cache.misses == 1
+
+        # The class is part of the key
+        other = intern_cache.get_or_create(Chat, data, lambda: Chat(id=1, type="private"))
+        assert isinstance(other, Chat)
+        assert intern_cache.misses == 2
+
+    def test_unhashable_data(self, intern_cache):
+        data = {"id": 1, "type": "private", "nested": {"a": 1}}
+        first = intern_cache.get_or_create(Chat, data, lambda: Chat(id=1, type="private"))
+        second = intern_cache.get_or_create(Chat, data, lambda: Chat(id=1, type="private"))
+        assert first is not second
+        assert len(intern_cache) == 0
+        assert intern_cache.hits == intern_cache.misses == 0
+
+    def test_factory_returns_none(self, intern_cache):
+        assert intern_cache.get_or_create(User, {"id": 1}, lambda: None) is None
+        assert len(intern_cache) == 0
+
+    def test_lru_eviction(self, intern_cache):
+        def get(user_id):
+            return intern_cache.get_or_create(
+                User, {"id": user_id}, lambda: User(user_id, "name", False)
+            )
+
+        user_1 = get(1)
+        get(2)
+        # Accessing 1 makes 2 the least recently used item
+        assert get(1) is user_1
+        get(3)
+        assert len(intern_cache) == 2
+        assert intern_cache.evictions == 1
+        assert get(1) is user_1
+        assert intern_cache.misses == 3
+        get(2)
+        assert intern_cache.misses == 4
+        assert intern_cache.evictions == 2
+
+    def test_clear(self, intern_cache):
+        data = {"id": 1}
+        user = intern_cache.get_or_create(User, data, lambda: User(1, "name", False))
+        intern_cache.clear()
+        assert len(intern_cache) == 0
+        assert intern_cache.misses == 1
+        assert intern_cache.get_or_create(User, data, lambda: User(1, "name", False)) is not user
+
+    @pytest.mark.parametrize(
+        ("intern_objects", "maxsize"), [(False, None), (True, 1024), (42, 42)]
+    )
+    def test_ext_bot(self, intern_objects, maxsize):
+        bot = ExtBot(token="TOKEN", intern_objects=intern_objects)
+        if maxsize is None:
+            assert bot.intern_cache is None
+        else:
+            assert bot.intern_cache.maxsize == maxsize
@@ -26,6 +26,8 @@ from telegram import (
     CallbackQuery,
     Chat,
     ChosenInlineResult,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
     InlineQuery,
     Message,
     PreCheckoutQuery,
@@ -33,8 +35,10 @@ from telegram import (
     Update,
     User,
 )
+from telegram.constants import ZERO_DATE
 from telegram.ext import CallbackContext, JobQueue, MessageHandler, filters
 from telegram.ext.filters import MessageFilter
+from tests.auxil.pytest_classes import make_bot
 from tests.auxil.slots import mro_slots
 
 message = Message(1, None, Chat(1, ""), from_user=User(1, "", False), text="Text")
@@ -163,6 +167,29 @@ class TestMessageHandler:
         assert not handler.check_update(Update(0, channel_post=message))
         assert handler.check_update(Update(0, edited_channel_post=message))
 
+    def test_lazy_update(self, bot_info):
+        lazy_bot = make_bot(bot_info, lazy_updates=True)
+        data = Message(
+            1,
+            ZERO_DATE,
+            Chat(1, ""),
+            from_user=User(1, "", False),
+            text="Text",
+            reply_markup=InlineKeyboardMarkup.from_button(InlineKeyboardButton("text", url="x")),
+        ).to_dict()
+        update = Update.de_json({"update_id": 1, "message": data}, lazy_bot)
+
+        # A handler rejecting the update doesn't parse the nested objects of the message
+        assert not MessageHandler(filters.PHOTO, self.callback).check_update(update)
+        assert update.effective_user.id == 1
+        assert update.message._lazy_data is not None
+        with pytest.raises(AttributeError):
+            object.__getattribute__(update.message, "reply_markup")
+
+        assert MessageHandler(filters.TEXT, self.callback).check_update(update)
+        assert update.message.reply_markup.inline_keyboard[0][0].text == "text"
+        assert update.message._lazy_data is None
+
     def test_other_update_types(self, false_update):
         handler = MessageHandler(None, self.callback)
         assert not handler.check_update(false_update)
@@ -16,6 +16,7 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
 import datetime
 import gzip
 import os
@@ -26,7 +27,7 @@ from pathlib import Path
 import pytest
 
 from telegram import Chat, Message, TelegramObject, Update, User
-from telegram.ext import ContextTypes, PersistenceInput, PicklePersistence
+from telegram.ext import ApplicationBuilder, ContextTypes, PersistenceInput, PicklePersistence
 from telegram.warnings import PTBUserWarning
 from tests.auxil.files import PROJECT_ROOT_PATH
 from tests.auxil.pytest_classes import make_bot
@@ -263,6 +264,36 @@ class TestPicklePersistence:
             assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
 
+    @pytest.mark.parametrize("share_frozen_objects", [True, False])
+    def test_share_frozen_objects(self, bot_info, share_frozen_objects):
+        persistence = PicklePersistence(
+            "pickletest", on_flush=True, share_frozen_objects=share_frozen_objects
+        )
+        assert persistence.share_frozen_objects is share_frozen_objects
+        assert PicklePersistence("pickletest").share_frozen_objects is False
+
+        app = ApplicationBuilder().bot(make_bot(bot_info)).persistence(persistence).build()
+        user = User(1, "first_name", False)
+        users = [user]
+
+        async def update_persistence():
+            async with app:
+                app.chat_data[1]["users"] = users
+                app.user_data[1]["user"] = user
+                app.mark_data_for_update_persistence(chat_ids=1, user_ids=1)
+                await app.update_persistence()
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(update_persistence())
+        loop.close()
+
+        # Mutable objects are always copied, frozen ones are shared only if requested
+        stored_users = persistence.chat_data[1]["users"]
+        assert stored_users == users
+        assert stored_users is not users
+        assert (stored_users[0] is user) is share_frozen_objects
+        assert (persistence.user_data[1]["user"] is user) is share_frozen_objects
+
     @pytest.mark.parametrize("on_flush", [True, False])
     async def test_on_flush(self, pickle_persistence, on_flush):
         pickle_persistence.on_flush = on_flush
@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import platform
+import time
+
+import pytest
+
+from telegram.error import RetryAfter
+from telegram.ext import PriorityRateLimiter
+from telegram.request import BaseRequest
+from tests.auxil.envvars import GITHUB_ACTION, TEST_WITH_OPT_DEPS
+from tests.auxil.pytest_classes import make_bot
+from tests.auxil.slots import mro_slots
+
+PERIOD = 0.02
+
+
+class Recorder:
+    """Callback for process_request that records the order in which requests are made"""
+
+    def __init__(self):
+        self.order = []
+        self.errors = []
+
+    def callback(self, name):
+        async def callback():
+            if self.errors:
+                raise self.errors.pop(0)
+            self.order.append(name)
+            return True
+
+        return callback
+
+
+async def process(rate_limiter, recorder, name, rate_limit_args=None, chat_id=1, endpoint="e"):
+    return await rate_limiter.process_request(
+        callback=recorder.callback(name),
+        args=(),
+        kwargs={},
+        endpoint=endpoint,
+        data={"chat_id": chat_id} if chat_id is not None else {},
+        rate_limit_args=rate_limit_args,
+    )
+
+
+@pytest.mark.skipif(
+    TEST_WITH_OPT_DEPS, reason="Only relevant if the optional dependency is not installed"
+)
+class TestNoPriorityRateLimiter:
+    def test_init(self):
+        with pytest.raises(RuntimeError, match=r"python-telegram-bot\[rate-limiter\]"):
+            PriorityRateLimiter()
+
+
+@pytest.mark.skipif(
+    not TEST_WITH_OPT_DEPS, reason="Only relevant if the optional dependency is installed"
+)
+@pytest.mark.skipif(
+    bool(GITHUB_ACTION and platform.system() == "Darwin"),
+    reason="The timings are apparently rather inaccurate on MacOS.",
+)
+@pytest.mark.flaky(10, 1)  # Timings aren't quite perfect
+class TestPriorityRateLimiter:
+    def test_slot_behaviour(self):
+        rate_limiter = PriorityRateLimiter()
+        for attr in rate_limiter.__slots__:
+            assert getattr(rate_limiter, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(rate_limiter)) == len(set(mro_slots(rate_limiter))), "duplicate slot"
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"default_lane": "urgent"}, "`urgent` is not one of the lanes"),
+            ({"endpoint_lanes": {"sendMessage": "urgent"}}, "`urgent` is not one of the lanes"),
+            ({"lanes": {"normal": 1, "low": 0}}, "must be positive"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            PriorityRateLimiter(**kwargs)
+
+    async def test_get_lane(self):
+        rate_limiter = PriorityRateLimiter(
+            endpoint_lanes={"answerCallbackQuery": PriorityRateLimiter.HIGH}
+        )
+        assert rate_limiter.get_lane("sendMessage", None) == PriorityRateLimiter.NORMAL
+        assert rate_limiter.get_lane("answerCallbackQuery", None) == PriorityRateLimiter.HIGH
+        assert rate_limiter.get_lane("answerCallbackQuery", "low") == PriorityRateLimiter.LOW
+        with pytest.raises(ValueError, match="`urgent` is not one of the lanes"):
+            await process(rate_limiter, Recorder(), "request", rate_limit_args="urgent")
+
+    async def test_strict_priority(self):
+        rate_limiter = PriorityRateLimiter(
+            strict_priority=True, overall_max_rate=1, overall_time_period=PERIOD
+        )
+        recorder = Recorder()
+        tasks = [asyncio.create_task(process(rate_limiter, recorder, "first"))]
+        tasks.extend(
+            asyncio.create_task(process(rate_limiter, recorder, lane, rate_limit_args=lane))
+            for lane in ["low", "normal", "low", "high", "normal", "high"]
+        )
+        await asyncio.sleep(0)
+        assert rate_limiter.queue_depths == {"high": 2, "normal": 2, "low": 2}
+
+        await asyncio.gather(*tasks)
+        assert recorder.order == ["first", "high", "high", "normal", "normal", "low", "low"]
+        assert rate_limiter.queue_depths == {"high": 0, "normal": 0, "low": 0}
+
+    async def test_weighted_fair(self):
+        rate_limiter = PriorityRateLimiter(
+            lanes={"a": 2, "b": 1},
+            default_lane="a",
+            overall_max_rate=1,
+            overall_time_period=PERIOD,
+        )
+        recorder = Recorder()
+        tasks = [asyncio.create_task(process(rate_limiter, recorder, "first"))]
+        tasks.extend(
+            asyncio.create_task(process(rate_limiter, recorder, lane, rate_limit_args=lane))
+            for lane in ["b"] * 3 + ["a"] * 6
+        )
+        await asyncio.gather(*tasks)
+        # Lane a gets twice the capacity of lane b, but lane b is not starved
+        assert recorder.order == ["first", "a", "b", "a", "a", "b", "a", "a", "b", "a"]
+
+    async def test_idle_lane_does_not_catch_up(self):
+        rate_limiter = PriorityRateLimiter(
+            lanes={"a": 1, "b": 1},
+            default_lane="a",
+            overall_max_rate=1,
+            overall_time_period=PERIOD,
+        )
+        recorder = Recorder()
+        tasks = [
+            asyncio.create_task(process(rate_limiter, recorder, "a", rate_limit_args="a"))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(PERIOD * 3.5)
+        # b was idle while a was served, so it doesn't get the capacity it didn't use
+        tasks.extend(
+            asyncio.create_task(process(rate_limiter, recorder, "b", rate_limit_args="b"))
+            for _ in range(2)
+        )
+        await asyncio.gather(*tasks)
+        assert recorder.order == ["a", "a", "a", "a", "b", "a", "b"]
+
+    async def test_cancelled_requests_are_skipped(self):
+        rate_limiter = PriorityRateLimiter(overall_max_rate=1, overall_time_period=PERIOD)
+        recorder = Recorder()
+        tasks = [
+            asyncio.create_task(process(rate_limiter, recorder, str(i), rate_limit_args="low"))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        tasks[1].cancel()
+        await asyncio.sleep(0)
+        assert rate_limiter.queue_depths["low"] == 1
+
+        start = time.perf_counter()
+        await asyncio.gather(tasks[0], tasks[2])
+        assert recorder.order == ["0", "2"]
+        assert time.perf_counter() - start == pytest.approx(PERIOD, abs=PERIOD)
+
+    async def test_no_chat_id(self):
+        rate_limiter = PriorityRateLimiter(overall_max_rate=1, overall_time_period=10)
+        recorder = Recorder()
+        await process(rate_limiter, recorder, "chat")
+        # Requests without chat_id are not limited by the overall rate limit
+        await asyncio.wait_for(process(rate_limiter, recorder, "no chat", chat_id=None), 1)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(process(rate_limiter, recorder, "chat"), PERIOD)
+        await rate_limiter.shutdown()
+
+    async def test_group_rate_limit(self):
+        rate_limiter = PriorityRateLimiter(
+            overall_max_rate=0, group_max_rate=1, group_time_period=10
+        )
+        recorder = Recorder()
+        await process(rate_limiter, recorder, "group", chat_id=-1)
+        await process(rate_limiter, recorder, "channel", chat_id="@channel")
+        await process(rate_limiter, recorder, "private", chat_id=1)
+        await process(rate_limiter, recorder, "private", chat_id=1)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(process(rate_limiter, recorder, "group", chat_id="-1"), PERIOD)
+
+    @pytest.mark.parametrize("max_retries", [0, 1])
+    async def test_retry_after(self, max_retries):
+        rate_limiter = PriorityRateLimiter(max_retries=max_retries)
+        recorder = Recorder()
+        recorder.errors = [RetryAfter(0)]
+        if max_retries:
+            assert await process(rate_limiter, recorder, "request") is True
+            assert recorder.order == ["request"]
+        else:
+            with pytest.raises(RetryAfter):
+                await process(rate_limiter, recorder, "request")
+
+    async def test_retry_after_pauses_queued_requests(self):
+        rate_limiter = PriorityRateLimiter(
+            strict_priority=True,
+            overall_max_rate=1,
+            overall_time_period=PERIOD,
+            max_retries=1,
+            global_cooldown_threshold=1,
+        )
+        recorder = Recorder()
+        recorder.errors = [RetryAfter(0)]
+        tasks = [asyncio.create_task(process(rate_limiter, recorder, "first"))]
+        tasks.extend(
+            asyncio.create_task(
+                process(rate_limiter, recorder, lane, rate_limit_args=lane, chat_id=chat_id)
+            )
+            for lane, chat_id in [("low", 2), ("high", 3)]
+        )
+        await asyncio.gather(*tasks)
+        # The requests that waited during the pause were let through in the order of their lanes
+        assert recorder.order == ["high", "first", "low"]
+
+    async def test_retry_after_per_chat(self):
+        rate_limiter = PriorityRateLimiter(overall_max_rate=0, max_retries=1)
+        recorder = Recorder()
+        recorder.errors = [RetryAfter(1)]
+        task = asyncio.create_task(process(rate_limiter, recorder, "chat 1"))
+        await asyncio.sleep(0)
+
+        # Only the requests for the chat that hit the rate limit are halted
+        await asyncio.wait_for(process(rate_limiter, recorder, "chat 2", chat_id=2), 0.5)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(process(rate_limiter, recorder, "chat 1"), PERIOD)
+        await task
+        assert recorder.order == ["chat 2", "chat 1"]
+        assert rate_limiter._cooldowns == {}
+
+    async def test_retry_after_not_lifted_by_other_requests(self):
+        rate_limiter = PriorityRateLimiter(
+            overall_max_rate=0, max_retries=1, global_cooldown_threshold=1
+        )
+        recorder = Recorder()
+
+        async def slow_callback():
+            await asyncio.sleep(PERIOD)
+            return True
+
+        slow_task = asyncio.create_task(
+            rate_limiter.process_request(
+                callback=slow_callback,
+                args=(),
+                kwargs={},
+                endpoint="e",
+                data={"chat_id": 2},
+                rate_limit_args=None,
+            )
+        )
+        await asyncio.sleep(0)
+        recorder.errors = [RetryAfter(1)]
+        task = asyncio.create_task(process(rate_limiter, recorder, "chat 1"))
+        await slow_task
+
+        # The request that was already running when the rate limit was hit doesn't lift the pause
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(process(rate_limiter, recorder, "chat 3", chat_id=3), PERIOD)
+        await task
+        assert recorder.order == ["chat 1"]
+
+    async def test_shutdown(self):
+        rate_limiter = PriorityRateLimiter(overall_max_rate=1, overall_time_period=10)
+        recorder = Recorder()
+        await rate_limiter.initialize()
+        await process(rate_limiter, recorder, "first")
+        task = asyncio.create_task(process(rate_limiter, recorder, "second"))
+        await asyncio.sleep(0)
+        await rate_limiter.shutdown()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert rate_limiter.queue_depths == {"high": 0, "normal": 0, "low": 0}
+
+    async def test_ext_bot(self, bot_info, monkeypatch):
+        rate_limiter = PriorityRateLimiter(strict_priority=True, overall_max_rate=1)
+        bot = make_bot(bot_info, rate_limiter=rate_limiter)
+        texts = []
+
+        async def post(_, url, request_data, *args, **kwargs):
+            texts.append(request_data.parameters.get("text"))
+            return True
+
+        monkeypatch.setattr(BaseRequest, "post", post)
+        monkeypatch.setattr(rate_limiter._base_limiter, "time_period", PERIOD)
+        monkeypatch.setattr(rate_limiter._base_limiter, "_rate_per_sec", 1 / PERIOD)
+        await asyncio.gather(
+            bot.send_chat_action(1, "typing"),
+            *(bot.send_message(1, "broadcast", rate_limit_args="low") for _ in range(2)),
+            bot.send_message(1, "reply"),
+        )
+        assert texts == [None, "reply", "broadcast", "broadcast"]
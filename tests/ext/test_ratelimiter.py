@@ -358,3 +358,62 @@ class TestAIORateLimiter:
         finally:
             TestAIORateLimiter.count = 0
             TestAIORateLimiter.call_times = []
+
+    class ChatRetryRequest(CountRequest):
+        """Raises RetryAfter once for each of the given chats"""
+
+        def __init__(self, chat_ids):
+            super().__init__()
+            self.chat_ids = set(chat_ids)
+
+        async def do_request(self, *args, **kwargs):
+            chat_id = kwargs["request_data"].parameters.get("chat_id")
+            if chat_id in self.chat_ids:
+                self.chat_ids.remove(chat_id)
+                TestAIORateLimiter.count += 1
+                raise RetryAfter(retry_after=1)
+            return await super().do_request(*args, **kwargs)
+
+    async def test_retry_after_only_delays_chat(self, bot):
+        rl_bot = ExtBot(
+            token=bot.token,
+            request=self.ChatRetryRequest(chat_ids=[-1]),
+            rate_limiter=AIORateLimiter(max_retries=1, overall_max_rate=0, group_max_rate=0),
+        )
+        task_1 = asyncio.create_task(rl_bot.send_message(chat_id=-1, text="test"))
+        await asyncio.sleep(0.1)
+        task_2 = asyncio.create_task(rl_bot.send_message(chat_id="-1", text="test"))
+
+        # Other chats are not affected by the RetryAfter
+        start = time.perf_counter()
+        await rl_bot.send_message(chat_id=2, text="test")
+        await rl_bot.get_me()
+        assert time.perf_counter() - start < 0.5
+        assert not task_1.done()
+        assert not task_2.done()
+
+        await asyncio.sleep(1.2)
+        assert task_1.done()
+        assert task_2.done()
+        assert TestAIORateLimiter.count == 5
+        assert rl_bot.rate_limiter._cooldowns == {}
+
+    async def test_retry_after_escalates_to_all_chats(self, bot):
+        rl_bot = ExtBot(
+            token=bot.token,
+            request=self.ChatRetryRequest(chat_ids=[-1, -2]),
+            rate_limiter=AIORateLimiter(
+                max_retries=1, overall_max_rate=0, group_max_rate=0, global_cooldown_threshold=2
+            ),
+        )
+        tasks = [
+            asyncio.create_task(rl_bot.send_message(chat_id=chat_id, text="test"))
+            for chat_id in (-1, -2)
+        ]
+        await asyncio.sleep(0.1)
+
+        # Two chats are cooling down at the same time, so all requests are delayed
+        start = time.perf_counter()
+        await rl_bot.send_message(chat_id=3, text="test")
+        assert time.perf_counter() - start == pytest.approx(1, abs=0.1)
+        await asyncio.gather(*tasks)
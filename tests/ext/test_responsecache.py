@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import datetime as dtm
+import time
+
+import pytest
+
+from telegram import (
+    Chat,
+    ChatMemberLeft,
+    ChatMemberMember,
+    ChatMemberUpdated,
+    Message,
+    Update,
+    User,
+)
+from telegram.ext import ResponseCache
+from tests.auxil.pytest_classes import make_bot
+from tests.auxil.slots import mro_slots
+
+USER = User(id=1, first_name="name", is_bot=False)
+DATE = dtm.datetime.now(tz=dtm.timezone.utc)
+
+
+@pytest.fixture()
+def response_cache():
+    return ResponseCache(ttls={"getChat": 10, "getMe": 10}, maxsize=2)
+
+
+def make_fetch(value):
+    calls = []
+
+    async def fetch():
+        calls.append(value)
+        return value
+
+    return fetch, calls
+
+
+def make_message(chat_id=1, **kwargs):
+    return Message(1, DATE, Chat(chat_id, Chat.SUPERGROUP), from_user=USER, **kwargs)
+
+
+class TestResponseCache:
+    def test_slot_behaviour(self, response_cache):
+        for attr in response_cache.__slots__:
+            assert getattr(response_cache, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(response_cache)) == len(
+            set(mro_slots(response_cache))
+        ), "duplicate slot"
+
+    def test_init(self):
+        response_cache = ResponseCache()
+        assert response_cache.maxsize == 1024
+        assert response_cache.ttls == ResponseCache.DEFAULT_TTLS
+        assert len(response_cache) == 0
+        assert response_cache.hits == response_cache.misses == 0
+        assert response_cache.evictions == response_cache.invalidations == 0
+        assert response_cache.caches("getChatMember")
+        assert not response_cache.caches("sendMessage")
+
+    @pytest.mark.parametrize("maxsize", [0, -1])
+    def test_invalid_maxsize(self, maxsize):
+        with pytest.raises(ValueError, match="positive integer"):
+            ResponseCache(maxsize=maxsize)
+
+    @pytest.mark.parametrize("endpoint", ["sendMessage", "getUpdates"])
+    def test_invalid_endpoint(self, endpoint):
+        with pytest.raises(ValueError, match=f"`{endpoint}` can not be cached"):
+            ResponseCache(ttls={endpoint: 10})
+
+    @pytest.mark.parametrize("ttl", [0, -1])
+    def test_invalid_ttl(self, ttl):
+        with pytest.raises(ValueError, match="must be positive"):
+            ResponseCache(ttls={"getChat": ttl})
+
+    def test_ttls_read_only(self):
+        ttls = {"getChat": 10}
+        response_cache = ResponseCache(ttls=ttls)
+        ttls["getMe"] = 10
+        assert not response_cache.caches("getMe")
+        with pytest.raises(TypeError):
+            response_cache.ttls["getMe"] = 10
+
+    async def test_get_or_fetch(self, response_cache):
+        fetch, calls = make_fetch("chat")
+        assert await response_cache.get_or_fetch("getChat", {"chat_id": "1"}, fetch) == "chat"
+        assert await response_cache.get_or_fetch("getChat", {"chat_id": "1"}, fetch) == "chat"
+        assert calls == ["chat"]
+        assert response_cache.hits == 1
+        assert response_cache.misses == 1
+        assert len(response_cache) == 1
+
+        # The parameters are part of the key
+        await response_cache.get_or_fetch("getChat", {"chat_id": "2"}, fetch)
+        assert len(calls) == 2
+        assert response_cache.misses == 2
+
+    async def test_expiry(self, response_cache, monkeypatch):
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        fetch, calls = make_fetch("me")
+        await response_cache.get_or_fetch("getMe", {}, fetch)
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 9)
+        await response_cache.get_or_fetch("getMe", {}, fetch)
+        assert len(calls) == 1
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 10)
+        await response_cache.get_or_fetch("getMe", {}, fetch)
+        assert len(calls) == 2
+        assert response_cache.hits == 1
+        assert response_cache.misses == 2
+        assert len(response_cache) == 1
+
+    async def test_exceptions_not_cached(self, response_cache):
+        async def fetch():
+            raise RuntimeError("failed")
+
+        with pytest.raises(RuntimeError, match="failed"):
+            await response_cache.get_or_fetch("getMe", {}, fetch)
+        assert len(response_cache) == 0
+
+    async def test_lru_eviction(self, response_cache):
+        fetch, calls = make_fetch("chat")
+        for chat_id in ("1", "2", "1", "3"):
+            await response_cache.get_or_fetch("getChat", {"chat_id": chat_id}, fetch)
+
+        assert len(response_cache) == 2
+        assert response_cache.evictions == 1
+        # chat 1 was used more recently than chat 2
+        await response_cache.get_or_fetch("getChat", {"chat_id": "1"}, fetch)
+        assert len(calls) == 3
+        await response_cache.get_or_fetch("getChat", {"chat_id": "2"}, fetch)
+        assert len(calls) == 4
+
+    async def test_invalidate_chat(self, response_cache):
+        fetch, calls = make_fetch("chat")
+        await response_cache.get_or_fetch("getChat", {"chat_id": "1"}, fetch)
+        await response_cache.get_or_fetch("getMe", {}, fetch)
+
+        response_cache.invalidate_chat(1)
+        assert len(response_cache) == 1
+        assert response_cache.invalidations == 1
+        await response_cache.get_or_fetch("getChat", {"chat_id": "1"}, fetch)
+        await response_cache.get_or_fetch("getMe", {}, fetch)
+        assert len(calls) == 3
+
+    async def test_invalidate_during_fetch(self, response_cache):
+        event = asyncio.Event()
+
+        async def fetch():
+            await event.wait()
+            return "chat"
+
+        task = asyncio.create_task(response_cache.get_or_fetch("getChat", {"chat_id": "1"}, fetch))
+        await asyncio.sleep(0)
+        response_cache.invalidate_chat(1)
+        event.set()
+        assert await task == "chat"
+        # The result may be outdated and is therefore not stored
+        assert len(response_cache) == 0
+
+    async def test_clear(self, response_cache):
+        fetch, _ = make_fetch("chat")
+        await response_cache.get_or_fetch("getChat", {"chat_id": "1"}, fetch)
+        await response_cache.get_or_fetch("getMe", {}, fetch)
+        response_cache.clear()
+        assert len(response_cache) == 0
+        assert response_cache.misses == 2
+
+    @pytest.mark.parametrize(
+        ("update", "invalidated"),
+        [
+            pytest.param(Update(1, message=make_message(text="text")), set(), id="text"),
+            pytest.param(
+                Update(1, message=make_message(new_chat_title="title")), {"1"}, id="new_title"
+            ),
+            pytest.param(
+                Update(1, channel_post=make_message(delete_chat_photo=True)),
+                {"1"},
+                id="channel_post",
+            ),
+            pytest.param(
+                Update(1, message=make_message(new_chat_members=[USER])), {"1"}, id="new_members"
+            ),
+            pytest.param(
+                Update(1, message=make_message(migrate_to_chat_id=2)), {"1", "2"}, id="migration"
+            ),
+            pytest.param(
+                Update(
+                    1,
+                    chat_member=ChatMemberUpdated(
+                        Chat(2, Chat.GROUP),
+                        USER,
+                        DATE,
+                        ChatMemberLeft(USER),
+                        ChatMemberMember(USER),
+                    ),
+                ),
+                {"2"},
+                id="chat_member",
+            ),
+            pytest.param(
+                Update(
+                    1,
+                    my_chat_member=ChatMemberUpdated(
+                        Chat(1, Chat.GROUP),
+                        USER,
+                        DATE,
+                        ChatMemberMember(USER),
+                        ChatMemberLeft(USER),
+                    ),
+                ),
+                {"1"},
+                id="my_chat_member",
+            ),
+            pytest.param(object(), set(), id="no_update"),
+        ],
+    )
+    async def test_process_update(self, update, invalidated):
+        response_cache = ResponseCache(ttls={"getChat": 10})
+        fetch, _ = make_fetch("chat")
+        for chat_id in ("1", "2", "3"):
+            await response_cache.get_or_fetch("getChat", {"chat_id": chat_id}, fetch)
+
+        response_cache.process_update(update)
+        assert response_cache.invalidations == len(invalidated)
+        assert {entry.chat_id for entry in response_cache._cache.values()} == {
+            "1",
+            "2",
+            "3",
+        } - invalidated
+
+    @pytest.mark.parametrize("access_message", [False, True])
+    @pytest.mark.parametrize(
+        ("update", "invalidated"),
+        [
+            pytest.param(Update(1, message=make_message(text="text")), set(), id="text"),
+            pytest.param(
+                Update(1, channel_post=make_message(new_chat_photo=[])), set(), id="empty_photo"
+            ),
+            pytest.param(
+                Update(1, message=make_message(migrate_to_chat_id=2)), {"1", "2"}, id="migration"
+            ),
+            pytest.param(
+                Update(
+                    1,
+                    chat_member=ChatMemberUpdated(
+                        Chat(2, Chat.GROUP),
+                        USER,
+                        DATE,
+                        ChatMemberLeft(USER),
+                        ChatMemberMember(USER),
+                    ),
+                ),
+                {"2"},
+                id="chat_member",
+            ),
+        ],
+    )
+    async def test_process_lazy_update(self, bot_info, update, invalidated, access_message):
+        response_cache = ResponseCache(ttls={"getChat": 10})
+        fetch, _ = make_fetch("chat")
+        for chat_id in ("1", "2", "3"):
+            await response_cache.get_or_fetch("getChat", {"chat_id": chat_id}, fetch)
+
+        lazy_update = Update.de_json(update.to_dict(), make_bot(bot_info, lazy_updates=True))
+        kind = next(iter(lazy_update._lazy_data))
+        if access_message and kind != "chat_member":
+            # Only parses message_id, date and chat of the message
+            assert getattr(lazy_update, kind).chat.id == 1
+
+        response_cache.process_update(lazy_update)
+        assert {entry.chat_id for entry in response_cache._cache.values()} == {
+            "1",
+            "2",
+            "3",
+        } - invalidated
+        # Processing the update didn't parse it
+        if access_message and kind != "chat_member":
+            assert getattr(lazy_update, kind)._lazy_data is not None
+        else:
+            assert kind in lazy_update._lazy_data
@@ -1024,6 +1024,30 @@ class TestUpdater:
             updater.bot.callback_data_cache.clear_callback_data()
             updater.bot.callback_data_cache.clear_callback_queries()
 
+    async def test_webhook_keep_raw_payloads(self, monkeypatch, bot_info):
+        updater = Updater(
+            bot=make_bot(bot_info, keep_raw_payloads=True), update_queue=asyncio.Queue()
+        )
+
+        async def return_true(*args, **kwargs):
+            return True
+
+        monkeypatch.setattr(updater.bot, "set_webhook", return_true)
+        monkeypatch.setattr(updater.bot, "delete_webhook", return_true)
+
+        ip = "127.0.0.1"
+        port = randrange(1024, 49152)  # Select random port
+        async with updater:
+            await updater.start_webhook(ip, port, url_path="TOKEN")
+            payload = make_message_update("test_webhook_keep_raw_payloads").to_json()
+            await send_webhook_message(ip, port, payload, "TOKEN")
+            received_update = await updater.update_queue.get()
+
+            # The body is kept as is
+            assert received_update._raw_payload == payload.encode("utf-8")
+            assert received_update.to_json() == payload
+            await updater.stop()
+
     async def test_webhook_invalid_ssl(self, monkeypatch, updater):
         async def return_true(*args, **kwargs):
             return True
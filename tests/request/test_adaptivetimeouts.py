@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import pytest
+
+from telegram.request import AdaptiveTimeouts
+from tests.auxil.slots import mro_slots
+
+
+@pytest.fixture()
+def adaptive_timeouts():
+    return AdaptiveTimeouts(quantile=0.9, factor=2, min_timeout=0.1, max_timeout=1)
+
+
+class TestAdaptiveTimeouts:
+    def test_slot_behaviour(self, adaptive_timeouts):
+        for attr in adaptive_timeouts.__slots__:
+            assert getattr(adaptive_timeouts, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(adaptive_timeouts)) == len(
+            set(mro_slots(adaptive_timeouts))
+        ), "duplicate slot"
+
+    def test_init(self):
+        adaptive_timeouts = AdaptiveTimeouts()
+        assert adaptive_timeouts.quantile == 0.99
+        assert adaptive_timeouts.factor == 3
+        assert adaptive_timeouts.min_timeout == 1
+        assert adaptive_timeouts.max_timeout == 5
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"quantile": -0.1}, "between 0 and 1"),
+            ({"quantile": 1.1}, "between 0 and 1"),
+            ({"factor": 0.5}, "at least 1"),
+            ({"min_timeout": 0}, "must be positive"),
+            ({"min_timeout": 6}, "at most `max_timeout`"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            AdaptiveTimeouts(**kwargs)
+
+    def test_read_timeout(self, adaptive_timeouts):
+        assert adaptive_timeouts.read_timeout("getChat") is None
+        for latency in range(1, AdaptiveTimeouts.MIN_SAMPLES):
+            adaptive_timeouts.record_latency("getChat", latency / 100)
+        # Not enough samples yet
+        assert adaptive_timeouts.read_timeout("getChat") is None
+
+        adaptive_timeouts.record_latency("getChat", 0.2)
+        assert adaptive_timeouts.read_timeout("getChat") == pytest.approx(0.36)
+        assert adaptive_timeouts.read_timeout("getMe") is None
+
+    def test_read_timeout_bounds(self, adaptive_timeouts):
+        for _ in range(AdaptiveTimeouts.MIN_SAMPLES):
+            adaptive_timeouts.record_latency("getChat", 0.001)
+            adaptive_timeouts.record_latency("getMe", 5)
+        assert adaptive_timeouts.read_timeout("getChat") == 0.1
+        assert adaptive_timeouts.read_timeout("getMe") == 1
+
+    def test_window(self, adaptive_timeouts):
+        for _ in range(AdaptiveTimeouts.WINDOW_SIZE):
+            adaptive_timeouts.record_latency("getChat", 0.4)
+        assert adaptive_timeouts.read_timeout("getChat") == 0.8
+        # Old latencies are forgotten
+        for _ in range(AdaptiveTimeouts.WINDOW_SIZE):
+            adaptive_timeouts.record_latency("getChat", 0.2)
+        assert adaptive_timeouts.read_timeout("getChat") == 0.4
+
+    def test_record_timeout(self, adaptive_timeouts):
+        for _ in range(AdaptiveTimeouts.WINDOW_SIZE):
+            adaptive_timeouts.record_latency("getChat", 0.1)
+        assert adaptive_timeouts.read_timeout("getChat") == 0.2
+
+        # Every consecutive timeout doubles the timeout
+        adaptive_timeouts.record_timeout("getChat", 0.2)
+        assert adaptive_timeouts.read_timeout("getChat") == 0.4
+        adaptive_timeouts.record_timeout("getChat", 0.4)
+        assert adaptive_timeouts.read_timeout("getChat") == 0.8
+        # Beyond max_timeout, the default timeout is used
+        adaptive_timeouts.record_timeout("getChat", 0.8)
+        assert adaptive_timeouts.read_timeout("getChat") is None
+        assert adaptive_timeouts.read_timeout("getMe") is None
+
+        # After a request succeeded, the timeout is based on the latencies again, which now
+        # include the timeouts
+        adaptive_timeouts.record_latency("getChat", 0.1)
+        assert adaptive_timeouts.read_timeout("getChat") == 0.2
+        for _ in range(AdaptiveTimeouts.WINDOW_SIZE // 10):
+            adaptive_timeouts.record_timeout("getChat", 0.4)
+            adaptive_timeouts.record_latency("getChat", 0.1)
+        assert adaptive_timeouts.read_timeout("getChat") == 0.8
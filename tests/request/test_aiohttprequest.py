@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Here we run tests directly with the AiohttpRequest class against a local server."""
+import asyncio
+
+import pytest
+
+from telegram import Bot, InputFile
+from telegram.error import NetworkError, TimedOut
+from telegram.request import AiohttpRequest, BaseRequest, RequestData
+from telegram.request import _aiohttprequest as aiohttprequest_module
+from telegram.request._requestparameter import RequestParameter
+from tests.auxil.envvars import TEST_WITH_OPT_DEPS
+from tests.auxil.slots import mro_slots
+
+if TEST_WITH_OPT_DEPS:
+    import aiohttp
+    from aiohttp import web
+
+pytestmark = pytest.mark.skipif(
+    not TEST_WITH_OPT_DEPS, reason="Only relevant if the optional dependency is installed"
+)
+
+
+async def echo(request):
+    data = await request.post()
+    fields = {}
+    for name, value in data.items():
+        if isinstance(value, web.FileField):
+            fields[name] = [value.filename, value.content_type, value.file.read().decode()]
+        else:
+            fields[name] = value
+    result = {
+        "content_type": request.content_type,
+        "user_agent": request.headers["User-Agent"],
+        "fields": fields,
+    }
+    return web.json_response({"ok": True, "result": result})
+
+
+async def sleep(request):
+    await asyncio.sleep(float(request.query.get("seconds", 1)))
+    return web.json_response({"ok": True, "result": True})
+
+
+async def get_me(request):
+    user = {
+        "id": 1,
+        "first_name": "Bot",
+        "is_bot": True,
+        "username": request.headers["User-Agent"],
+    }
+    return web.json_response({"ok": True, "result": user})
+
+
+async def file(request):
+    return web.Response(body=b"x" * 200_000)
+
+
+@pytest.fixture()
+async def server():
+    app = web.Application()
+    app.router.add_post("/echo", echo)
+    app.router.add_post("/sleep", sleep)
+    app.router.add_get("/file", file)
+    app.router.add_post("/botTOKEN/getMe", get_me)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.fixture()
+async def aiohttp_request():
+    async with AiohttpRequest(connection_pool_size=2) as rq:
+        yield rq
+
+
+class TestAiohttpRequestWithoutRequest:
+    def test_slot_behaviour(self):
+        inst = AiohttpRequest()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init(self):
+        inst = AiohttpRequest()
+        assert inst.read_timeout == 5
+        assert inst.connection_pool_size == 1
+
+        inst = AiohttpRequest(connection_pool_size=4, read_timeout=1)
+        assert inst.read_timeout == 1
+        assert inst.connection_pool_size == 4
+
+    def test_missing_dependencies(self, monkeypatch):
+        monkeypatch.setattr(aiohttprequest_module, "AIOHTTP_SOCKS_AVAILABLE", False)
+        AiohttpRequest(proxy="http://127.0.0.1:3128")
+        with pytest.raises(RuntimeError, match=r"python-telegram-bot\[aiohttp-socks\]"):
+            AiohttpRequest(proxy="socks5://127.0.0.1:1080")
+
+        monkeypatch.setattr(aiohttprequest_module, "AIOHTTP_AVAILABLE", False)
+        with pytest.raises(RuntimeError, match=r"python-telegram-bot\[aiohttp\]"):
+            AiohttpRequest()
+
+    async def test_not_initialized(self, server):
+        inst = AiohttpRequest()
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await inst.do_request(f"{server}/echo", "POST")
+
+        await inst.initialize()
+        await inst.shutdown()
+        # Shutting down twice is fine
+        await inst.shutdown()
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await inst.do_request(f"{server}/echo", "POST")
+        with pytest.raises(RuntimeError, match="not initialized"):
+            async with inst.do_stream_request(f"{server}/file", "GET"):
+                pass
+
+        # Can be initialized again after shutdown
+        async with inst:
+            assert await inst.post(f"{server}/sleep?seconds=0") is True
+
+    async def test_post_parameters(self, server, aiohttp_request):
+        request_data = RequestData(
+            parameters=[
+                RequestParameter.from_input("chat_id", 123),
+                RequestParameter.from_input("text", "Hällo"),
+            ]
+        )
+        result = await aiohttp_request.post(f"{server}/echo", request_data)
+        assert result == {
+            "content_type": "application/x-www-form-urlencoded",
+            "user_agent": BaseRequest.USER_AGENT,
+            "fields": {"chat_id": "123", "text": "Hällo"},
+        }
+
+    @pytest.mark.parametrize(
+        ("file_handle", "from_path"), [(False, False), (True, False), (True, True)]
+    )
+    async def test_post_multipart(
+        self, server, aiohttp_request, tmp_path, file_handle, from_path
+    ):
+        path = tmp_path / "file.txt"
+        path.write_bytes(b"file content")
+        with path.open("rb") as obj:
+            input_file = InputFile(
+                path if from_path else obj, attach=True, read_file_handle=not file_handle
+            )
+            request_data = RequestData(
+                parameters=[
+                    RequestParameter.from_input("chat_id", 123),
+                    RequestParameter("document", input_file.attach_uri, [input_file]),
+                ]
+            )
+            result = await aiohttp_request.post(f"{server}/echo", request_data)
+
+        assert result["content_type"] == "multipart/form-data"
+        assert result["fields"] == {
+            "chat_id": "123",
+            "document": input_file.attach_uri,
+            input_file.attach_name: ["file.txt", "text/plain", "file content"],
+        }
+
+    async def test_retrieve(self, server, aiohttp_request):
+        assert await aiohttp_request.retrieve(f"{server}/file") == b"x" * 200_000
+        chunks = [chunk async for chunk in aiohttp_request.retrieve_stream(f"{server}/file")]
+        assert len(chunks) > 1
+        assert b"".join(chunks) == b"x" * 200_000
+
+    async def test_read_timeout(self, server, aiohttp_request):
+        with pytest.raises(TimedOut):
+            await aiohttp_request.post(f"{server}/sleep?seconds=1", read_timeout=0.1)
+        assert await aiohttp_request.post(f"{server}/sleep?seconds=0.1", read_timeout=1) is True
+
+    async def test_pool_timeout(self, server):
+        async with AiohttpRequest(connection_pool_size=1, pool_timeout=0.1) as inst:
+            task = asyncio.create_task(inst.post(f"{server}/sleep?seconds=0.5"))
+            await asyncio.sleep(0.05)
+            with pytest.raises(TimedOut, match="Pool timeout"):
+                await inst.post(f"{server}/sleep?seconds=0")
+            assert await task is True
+            assert await inst.post(f"{server}/sleep?seconds=0") is True
+
+    async def test_connection_error(self, aiohttp_request):
+        with pytest.raises(NetworkError, match="aiohttp.ClientConnectorError"):
+            await aiohttp_request.post("http://127.0.0.1:1/echo")
+
+    @pytest.mark.parametrize(
+        ("has_files", "write_timeout", "expected_read_timeout"),
+        [(False, 2, 5), (True, 2, 7), (True, None, None), (True, BaseRequest.DEFAULT_NONE, 25)],
+    )
+    def test_build_timeout(self, has_files, write_timeout, expected_read_timeout):
+        inst = AiohttpRequest(connect_timeout=3)
+        timeout = inst._build_timeout(
+            read_timeout=BaseRequest.DEFAULT_NONE,
+            write_timeout=write_timeout,
+            connect_timeout=BaseRequest.DEFAULT_NONE,
+            has_files=has_files,
+        )
+        assert timeout.sock_read == expected_read_timeout
+        assert timeout.sock_connect == 3
+        assert timeout.total is None
+
+    async def test_proxy(self):
+        inst = AiohttpRequest(proxy="http://127.0.0.1:3128")
+        kwargs = inst._build_request_kwargs("https://api.org", "POST", None, 1, 1, 1)
+        assert kwargs["proxy"] == "http://127.0.0.1:3128"
+        async with inst:
+            assert not inst._session.trust_env
+
+        inst = AiohttpRequest(proxy="socks5://127.0.0.1:1080")
+        kwargs = inst._build_request_kwargs("https://api.org", "POST", None, 1, 1, 1)
+        assert kwargs["proxy"] is None
+        async with inst:
+            assert type(inst._session.connector).__name__ == "ProxyConnector"
+
+        async with AiohttpRequest() as inst:
+            assert inst._session.trust_env
+            assert isinstance(inst._session.connector, aiohttp.TCPConnector)
+
+    async def test_bot(self, server):
+        bot = Bot("TOKEN", base_url=f"{server}/bot", request=AiohttpRequest())
+        async with bot:
+            assert bot.bot.username == BaseRequest.USER_AGENT
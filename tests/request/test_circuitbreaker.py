@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import time
+
+import pytest
+
+from telegram.error import NetworkError
+from telegram.request import CircuitBreaker
+from tests.auxil.slots import mro_slots
+
+
+@pytest.fixture()
+def circuit_breaker():
+    return CircuitBreaker(failure_threshold=3, recovery_time=10)
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestCircuitBreaker:
+    def test_slot_behaviour(self, circuit_breaker):
+        for attr in circuit_breaker.__slots__:
+            assert getattr(circuit_breaker, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(circuit_breaker)) == len(
+            set(mro_slots(circuit_breaker))
+        ), "duplicate slot"
+
+    def test_init(self):
+        circuit_breaker = CircuitBreaker()
+        assert circuit_breaker.failure_threshold == 5
+        assert circuit_breaker.recovery_time == 30
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [({"failure_threshold": 0}, "failure_threshold"), ({"recovery_time": 0}, "recovery_time")],
+    )
+    def test_invalid_arguments(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            CircuitBreaker(**kwargs)
+
+    def test_opens_after_consecutive_failures(self, circuit_breaker, clock):
+        for _ in range(2):
+            circuit_breaker.before_request("getChat")
+            circuit_breaker.after_request("getChat", failed=True)
+        # A success resets the count
+        circuit_breaker.after_request("getChat", failed=False)
+        for _ in range(2):
+            circuit_breaker.before_request("getChat")
+            circuit_breaker.after_request("getChat", failed=True)
+        assert not circuit_breaker.is_open("getChat")
+
+        circuit_breaker.after_request("getChat", failed=True)
+        assert circuit_breaker.is_open("getChat")
+        with pytest.raises(NetworkError, match="Circuit breaker is open.*`getChat`"):
+            circuit_breaker.before_request("getChat")
+        # Other endpoints are not affected
+        circuit_breaker.before_request("getMe")
+        assert not circuit_breaker.is_open("getMe")
+
+    def test_probe(self, circuit_breaker, clock):
+        for _ in range(3):
+            circuit_breaker.after_request("getChat", failed=True)
+
+        clock[0] += 9.9
+        with pytest.raises(NetworkError):
+            circuit_breaker.before_request("getChat")
+        clock[0] += 0.1
+        circuit_breaker.before_request("getChat")
+        # Only a single probe at a time
+        with pytest.raises(NetworkError):
+            circuit_breaker.before_request("getChat")
+
+        # A failed probe opens the circuit for another recovery time
+        circuit_breaker.after_request("getChat", failed=True)
+        clock[0] += 9.9
+        with pytest.raises(NetworkError):
+            circuit_breaker.before_request("getChat")
+        clock[0] += 0.1
+        circuit_breaker.before_request("getChat")
+
+        # A successful probe closes the circuit
+        circuit_breaker.after_request("getChat", failed=False)
+        assert not circuit_breaker.is_open("getChat")
+        circuit_breaker.before_request("getChat")
+        circuit_breaker.before_request("getChat")
+
+    def test_late_failures_dont_extend_open_circuit(self, circuit_breaker, clock):
+        for _ in range(3):
+            circuit_breaker.after_request("getChat", failed=True)
+        # Requests sent before the circuit opened may still fail afterwards
+        clock[0] += 5
+        circuit_breaker.after_request("getChat", failed=True)
+        clock[0] += 5
+        circuit_breaker.before_request("getChat")
+
+    def test_aborted_probe(self, circuit_breaker, clock):
+        for _ in range(3):
+            circuit_breaker.after_request("getChat", failed=True)
+        clock[0] += 10
+        circuit_breaker.before_request("getChat")
+        circuit_breaker.abort_request("getChat")
+        assert circuit_breaker.is_open("getChat")
+        # Another probe may be sent right away
+        circuit_breaker.before_request("getChat")
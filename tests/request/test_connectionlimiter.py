@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import time
+
+import pytest
+
+from telegram.error import TimedOut
+from telegram.request._connectionlimiter import ConnectionLimiter
+from tests.auxil.slots import mro_slots
+
+
+@pytest.fixture()
+def limiter():
+    return ConnectionLimiter(min_size=1, max_size=2)
+
+
+class TestConnectionLimiter:
+    def test_slot_behaviour(self, limiter):
+        for attr in limiter.__slots__:
+            assert getattr(limiter, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(limiter)) == len(set(mro_slots(limiter))), "duplicate slot"
+
+    async def test_grow_and_wait(self, limiter):
+        await limiter.acquire(None)
+        assert limiter.size == 1
+        assert limiter.in_flight == 1
+
+        # The pool only grows once a request actually waited for a while
+        waiter = asyncio.create_task(limiter.acquire(None))
+        await asyncio.sleep(ConnectionLimiter.GROW_WAIT_TIME / 2)
+        assert not waiter.done()
+        assert limiter.size == 1
+        await asyncio.wait_for(waiter, 1)
+        assert limiter.size == 2
+        assert limiter.in_flight == 2
+        assert limiter.wait_time > 0
+
+        # Not beyond the maximal size
+        waiter = asyncio.create_task(limiter.acquire(None))
+        await asyncio.sleep(2 * ConnectionLimiter.GROW_WAIT_TIME)
+        assert not waiter.done()
+        assert limiter.size == 2
+
+        # The connection is handed to the waiting request
+        limiter.release()
+        await waiter
+        assert limiter.in_flight == 2
+
+        limiter.release()
+        limiter.release()
+        assert limiter.in_flight == 0
+
+    async def test_no_growth_without_waiting(self, limiter):
+        # A request that is served within GROW_WAIT_TIME doesn't grow the pool
+        await limiter.acquire(None)
+        waiter = asyncio.create_task(limiter.acquire(None))
+        await asyncio.sleep(0)
+        limiter.release()
+        await waiter
+        await asyncio.sleep(2 * ConnectionLimiter.GROW_WAIT_TIME)
+        assert limiter.size == 1
+        assert limiter.in_flight == 1
+
+    async def test_burst(self):
+        limiter = ConnectionLimiter(min_size=1, max_size=8)
+        tasks = [asyncio.create_task(limiter.acquire(None)) for _ in range(8)]
+        await asyncio.sleep(0)
+        assert limiter.size == 1
+        assert limiter.in_flight == 1
+
+        # Every request that waited for GROW_WAIT_TIME grows the pool by one
+        await asyncio.wait_for(asyncio.gather(*tasks), 1)
+        assert limiter.size == 8
+        assert limiter.in_flight == 8
+        assert limiter.wait_time > 0
+
+    async def test_timeout(self, limiter):
+        await limiter.acquire(None)
+        await limiter.acquire(None)
+        with pytest.raises(TimedOut, match="Pool timeout"):
+            await limiter.acquire(0.01)
+        assert not limiter._waiters
+        assert limiter.in_flight == 2
+
+    async def test_cancel_while_waiting(self, limiter):
+        await limiter.acquire(None)
+        await limiter.acquire(None)
+        first = asyncio.create_task(limiter.acquire(None))
+        second = asyncio.create_task(limiter.acquire(None))
+        await asyncio.sleep(0.01)
+
+        # The first waiter gets the connection, but is cancelled before it can use it, so it is
+        # passed on to the second waiter
+        limiter.release()
+        first.cancel()
+        await second
+        assert first.cancelled()
+        assert limiter.in_flight == 2
+        assert not limiter._waiters
+
+    async def test_cancel_before_release(self, limiter):
+        await limiter.acquire(None)
+        await limiter.acquire(None)
+        first = asyncio.create_task(limiter.acquire(None))
+        second = asyncio.create_task(limiter.acquire(None))
+        await asyncio.sleep(0.01)
+
+        # The first waiter is cancelled in the same tick as the connection is released, i.e.
+        # before it could remove itself from the waiters, so the second waiter gets it
+        first.cancel()
+        limiter.release()
+        await second
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert limiter.in_flight == 2
+        assert not limiter._waiters
+
+        limiter.release()
+        limiter.release()
+        assert limiter.in_flight == 0
+        await asyncio.wait_for(limiter.acquire(0.01), 1)
+
+    async def test_cancel_only_waiter_before_release(self, limiter):
+        await limiter.acquire(None)
+        await limiter.acquire(None)
+        waiter = asyncio.create_task(limiter.acquire(None))
+        await asyncio.sleep(0.01)
+
+        waiter.cancel()
+        limiter.release()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.in_flight == 1
+        assert not limiter._waiters
+        await limiter.acquire(0.01)
+        assert limiter.in_flight == 2
+
+    async def test_shrink(self, monkeypatch):
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        monkeypatch.setattr(ConnectionLimiter, "GROW_WAIT_TIME", 0)
+        limiter = ConnectionLimiter(min_size=1, max_size=4)
+        await asyncio.gather(*(limiter.acquire(None) for _ in range(3)))
+        for _ in range(3):
+            limiter.release()
+        assert limiter.size == 3
+
+        # In the next interval, at most two requests are made concurrently
+        monkeypatch.setattr(time, "monotonic", lambda: now + ConnectionLimiter.SHRINK_INTERVAL)
+        await limiter.acquire(None)
+        limiter.release()
+        await limiter.acquire(None)
+        await limiter.acquire(None)
+        limiter.release()
+        limiter.release()
+        assert limiter.size == 3
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 2 * ConnectionLimiter.SHRINK_INTERVAL)
+        await limiter.acquire(None)
+        limiter.release()
+        assert limiter.size == 2
+
+        # Never below the minimum
+        monkeypatch.setattr(time, "monotonic", lambda: now + 3 * ConnectionLimiter.SHRINK_INTERVAL)
+        await limiter.acquire(None)
+        limiter.release()
+        assert limiter.size == 1
+        assert limiter.in_flight == 0
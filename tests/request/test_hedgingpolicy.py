@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import pytest
+
+from telegram.request import HedgingPolicy
+from tests.auxil.slots import mro_slots
+
+
+@pytest.fixture()
+def hedging_policy():
+    return HedgingPolicy(quantile=0.9, min_delay=0.01, max_delay=1)
+
+
+class TestHedgingPolicy:
+    def test_slot_behaviour(self, hedging_policy):
+        for attr in hedging_policy.__slots__:
+            assert getattr(hedging_policy, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(hedging_policy)) == len(
+            set(mro_slots(hedging_policy))
+        ), "duplicate slot"
+
+    def test_init(self):
+        hedging_policy = HedgingPolicy()
+        assert hedging_policy.endpoints == HedgingPolicy.DEFAULT_ENDPOINTS
+        assert hedging_policy.quantile == 0.95
+        assert hedging_policy.min_delay == 0.05
+        assert hedging_policy.max_delay == 2
+        assert hedging_policy.hedges == hedging_policy.hedge_wins == 0
+
+        hedging_policy = HedgingPolicy(endpoints=["getChat"])
+        assert hedging_policy.endpoints == frozenset({"getChat"})
+
+    @pytest.mark.parametrize("endpoint", ["sendMessage", "getUpdates", "answerCallbackQuery"])
+    def test_invalid_endpoint(self, endpoint):
+        with pytest.raises(ValueError, match=f"`{endpoint}` can not be hedged"):
+            HedgingPolicy(endpoints=["getChat", endpoint])
+
+    @pytest.mark.parametrize("quantile", [-0.1, 1.1])
+    def test_invalid_quantile(self, quantile):
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            HedgingPolicy(quantile=quantile)
+
+    @pytest.mark.parametrize(("min_delay", "max_delay"), [(-1, 1), (2, 1)])
+    def test_invalid_delays(self, min_delay, max_delay):
+        with pytest.raises(ValueError, match="between 0 and `max_delay`"):
+            HedgingPolicy(min_delay=min_delay, max_delay=max_delay)
+
+    def test_delay(self, hedging_policy):
+        assert hedging_policy.delay("getChat") == 1
+        for latency in range(1, HedgingPolicy.MIN_SAMPLES):
+            hedging_policy.record_latency("getChat", latency / 100)
+        # Not enough samples yet
+        assert hedging_policy.delay("getChat") == 1
+
+        hedging_policy.record_latency("getChat", 0.2)
+        assert hedging_policy.delay("getChat") == 0.18
+        assert hedging_policy.delay("getMe") == 1
+
+    def test_delay_bounds(self, hedging_policy):
+        for _ in range(HedgingPolicy.MIN_SAMPLES):
+            hedging_policy.record_latency("getChat", 0.001)
+            hedging_policy.record_latency("getMe", 5)
+        assert hedging_policy.delay("getChat") == 0.01
+        assert hedging_policy.delay("getMe") == 1
+
+    def test_window(self, hedging_policy):
+        for _ in range(HedgingPolicy.WINDOW_SIZE):
+            hedging_policy.record_latency("getChat", 0.5)
+        for _ in range(HedgingPolicy.WINDOW_SIZE):
+            hedging_policy.record_latency("getChat", 0.1)
+        assert hedging_policy.delay("getChat") == 0.1
+
+    def test_counters(self, hedging_policy):
+        hedging_policy.record_hedge()
+        hedging_policy.record_hedge()
+        hedging_policy.record_latency("getChat", 0.1, hedge_won=True)
+        hedging_policy.record_latency("getChat", 0.1)
+        assert hedging_policy.hedges == 2
+        assert hedging_policy.hedge_wins == 1
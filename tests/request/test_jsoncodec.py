@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import json
+
+import pytest
+
+from telegram import MessageEntity, User
+from telegram.error import TelegramError
+from telegram.ext import DictPersistence
+from telegram.request import BaseRequest, JSONCodec, RequestData, get_json_codec, set_json_codec
+from telegram.request._requestparameter import RequestParameter
+from tests.auxil.slots import mro_slots
+
+
+class RecordingCodec(JSONCodec):
+    """Codec that records which of its methods were called"""
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append("dumps")
+        return super().dumps(obj)
+
+    def dumps_bytes(self, obj):
+        self.calls.append("dumps_bytes")
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data):
+        self.calls.append(("loads", type(data)))
+        return super().loads(data)
+
+
+@pytest.fixture()
+def recording_codec():
+    original = get_json_codec()
+    codec = RecordingCodec()
+    set_json_codec(codec)
+    try:
+        yield codec
+    finally:
+        set_json_codec(original)
+
+
+class TestJSONCodecWithoutRequest:
+    def test_slot_behaviour(self):
+        inst = JSONCodec()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_default_codec(self):
+        assert type(get_json_codec()) is JSONCodec
+
+    @pytest.mark.parametrize("data", ['{"a": [1, "ä"]}', b'{"a": [1, "\xc3\xa4"]}'])
+    def test_loads(self, data):
+        assert JSONCodec().loads(data) == {"a": [1, "ä"]}
+        if isinstance(data, bytes):
+            assert JSONCodec().loads(bytearray(data)) == {"a": [1, "ä"]}
+
+    def test_loads_invalid(self):
+        with pytest.raises(ValueError, match="Expecting value"):
+            JSONCodec().loads(b"not json")
+
+    def test_dumps(self):
+        obj = {1: [1, "ä", None, True]}
+        assert JSONCodec().dumps(obj) == json.dumps(obj)
+        assert JSONCodec().dumps_bytes(obj) == json.dumps(obj).encode("utf-8")
+
+    def test_set_json_codec(self, recording_codec):
+        assert get_json_codec() is recording_codec
+
+    def test_request_data(self, recording_codec):
+        request_data = RequestData(
+            [
+                RequestParameter("chat_id", 1, None),
+                RequestParameter("text", "text", None),
+                RequestParameter("entities", [{"type": "bold"}], None),
+            ]
+        )
+        assert request_data.json_payload == (
+            b'{"chat_id":"1","text":"text","entities":"[{\\"type\\": \\"bold\\"}]"}'
+        )
+        # json_value is computed once per parameter & strings are passed through
+        assert recording_codec.calls == ["dumps", "dumps", "dumps_bytes"]
+
+    def test_parse_json_payload(self, recording_codec):
+        assert BaseRequest.parse_json_payload(b'{"ok": true}') == {"ok": True}
+        assert recording_codec.calls == [("loads", bytes)]
+        with pytest.raises(TelegramError, match="Invalid server response"):
+            BaseRequest.parse_json_payload(b"not json")
+
+    def test_to_json(self, recording_codec):
+        user = User(1, "first name", False)
+        assert json.loads(user.to_json()) == user.to_dict()
+        assert recording_codec.calls == ["dumps"]
+
+    def test_dict_persistence(self, recording_codec):
+        persistence = DictPersistence(
+            user_data_json='{"1": {"key": "value"}}',
+            conversations_json='{"name": {"[1, 2]": "state"}}',
+        )
+        assert persistence.user_data == {1: {"key": "value"}}
+        assert persistence.conversations == {"name": {(1, 2): "state"}}
+        assert recording_codec.calls.count(("loads", str)) == 3
+
+        recording_codec.calls.clear()
+        assert json.loads(persistence.chat_data_json) is None
+        assert recording_codec.calls == ["dumps"]
+
+    def test_message_entity_parameter(self, recording_codec):
+        parameter = RequestParameter.from_input("entities", [MessageEntity("bold", 0, 1)])
+        assert json.loads(parameter.json_value) == [{"type": "bold", "offset": 0, "length": 1}]
+        assert recording_codec.calls == ["dumps"]
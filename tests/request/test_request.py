@@ -21,6 +21,7 @@ implementations for BaseRequest and we want to test HTTPXRequest anyway."""
 import asyncio
 import json
 import logging
+import time
 from collections import defaultdict
 from dataclasses import dataclass
 from http import HTTPStatus
@@ -30,7 +31,8 @@ import httpx
 import pytest
 from httpx import AsyncHTTPTransport
 
-from telegram._utils.defaultvalue import DEFAULT_NONE
+from telegram import InputFile
+from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
 from telegram.error import (
     BadRequest,
     ChatMigrated,
@@ -42,7 +44,15 @@ from telegram.error import (
     TelegramError,
     TimedOut,
 )
-from telegram.request import BaseRequest, RequestData
+from telegram.request import (
+    AdaptiveTimeouts,
+    BaseRequest,
+    CircuitBreaker,
+    HedgingPolicy,
+    RequestData,
+    RequestMetrics,
+)
+from telegram.request._connectionlimiter import ConnectionLimiter
 from telegram.request._httpxrequest import HTTPXRequest
 from telegram.request._requestparameter import RequestParameter
 from telegram.warnings import PTBDeprecationWarning
@@ -333,6 +343,344 @@ class TestRequestWithoutRequest:
 
         assert await httpx_request.retrieve(None, None) == server_response
 
+    async def test_retrieve_stream_default_implementation(self):
+        class SimpleRequest(BaseRequest):
+            async def do_request(self, *args, **kwargs):
+                return HTTPStatus.OK, b"content"
+
+            async def initialize(self) -> None:
+                pass
+
+            async def shutdown(self) -> None:
+                pass
+
+        chunks = [chunk async for chunk in SimpleRequest().retrieve_stream("url")]
+        assert chunks == [b"content"]
+
+    @pytest.mark.parametrize(
+        ("code", "exception_class"),
+        [
+            (HTTPStatus.FORBIDDEN, Forbidden),
+            (HTTPStatus.NOT_FOUND, InvalidToken),
+            (HTTPStatus.BAD_GATEWAY, NetworkError),
+        ],
+    )
+    async def test_retrieve_stream_error_response(
+        self, monkeypatch, httpx_request, code, exception_class
+    ):
+        async def handle_async_request(_, request):
+            return httpx.Response(code, content=b'{"ok": false, "description": "Error"}')
+
+        monkeypatch.setattr(AsyncHTTPTransport, "handle_async_request", handle_async_request)
+        stream = httpx_request.retrieve_stream("https://example.com/file")
+        with pytest.raises(exception_class, match="Error"):
+            await stream.__anext__()
+
+    async def test_metrics(self, monkeypatch, httpx_request):
+        assert httpx_request.metrics is None
+        records = []
+        httpx_request.metrics = RequestMetrics(callback=records.append)
+        responses = [
+            (HTTPStatus.OK, b'{"ok": true, "result": true}'),
+            (
+                HTTPStatus.TOO_MANY_REQUESTS,
+                b'{"ok": false, "description": "Flood", "parameters": {"retry_after": 3}}',
+            ),
+            TimedOut(),
+            (HTTPStatus.OK, b'{"ok": true, "result": []}'),
+            (HTTPStatus.OK, b"file content"),
+        ]
+
+        async def do_request(*args, **kwargs):
+            assert httpx_request.metrics.in_flight == 1
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        monkeypatch.setattr(httpx_request, "do_request", do_request)
+        request_data = RequestData([RequestParameter("chat_id", 1, [])])
+        await httpx_request.post("https://api.org/botTOKEN/sendMessage", request_data)
+        with pytest.raises(RetryAfter):
+            await httpx_request.post("https://api.org/botTOKEN/sendMessage", request_data)
+        with pytest.raises(TimedOut):
+            await httpx_request.post("https://api.org/botTOKEN/sendMessage", request_data)
+        await httpx_request.post("https://api.org/botTOKEN/getUpdates")
+        await httpx_request.retrieve("https://api.org/file/botTOKEN/photo.jpg")
+
+        snapshot = httpx_request.metrics.snapshot()
+        assert set(snapshot) == {"sendMessage", "getUpdates", RequestMetrics.FILE_DOWNLOAD}
+        send_message = snapshot["sendMessage"]
+        assert send_message.requests == 3
+        assert send_message.status_codes == {200: 1, 429: 1}
+        assert send_message.errors == {"RetryAfter": 1, "TimedOut": 1}
+        assert send_message.bytes_sent == 3 * len("chat_id1") + 6
+        assert snapshot[RequestMetrics.FILE_DOWNLOAD].bytes_received == len(b"file content")
+        assert httpx_request.metrics.aggregate().requests == 4
+        assert httpx_request.metrics.in_flight == 0
+
+        assert [record.endpoint for record in records] == [
+            "sendMessage",
+            "sendMessage",
+            "sendMessage",
+            "getUpdates",
+            RequestMetrics.FILE_DOWNLOAD,
+        ]
+        assert isinstance(records[1].error, RetryAfter)
+        assert records[2].status_code is None
+
+    async def test_metrics_retrieve_stream(self, monkeypatch, httpx_request):
+        httpx_request.metrics = RequestMetrics()
+        content = bytes(range(256)) * 1024
+
+        async def handle_async_request(_, request):
+            if request.url.path.endswith("missing"):
+                return httpx.Response(HTTPStatus.NOT_FOUND, content=b'{"ok": false}')
+            return httpx.Response(HTTPStatus.OK, content=content)
+
+        monkeypatch.setattr(AsyncHTTPTransport, "handle_async_request", handle_async_request)
+        chunks = [chunk async for chunk in httpx_request.retrieve_stream("https://example.com")]
+        assert b"".join(chunks) == content
+        with pytest.raises(InvalidToken):
+            await httpx_request.retrieve_stream("https://example.com/missing").__anext__()
+
+        downloads = httpx_request.metrics.snapshot()[RequestMetrics.FILE_DOWNLOAD]
+        assert downloads.requests == 2
+        assert downloads.status_codes == {200: 1, 404: 1}
+        assert downloads.errors == {"InvalidToken": 1}
+        assert downloads.bytes_received == len(content) + len(b'{"ok": false}')
+
+    @pytest.mark.parametrize(
+        ("delays", "hedges", "hedge_wins"),
+        [([0, 0], 0, 0), ([0.5, 0], 1, 1), ([0.1, 0.5], 1, 0)],
+        ids=["fast", "hedge_wins", "primary_wins"],
+    )
+    async def test_hedging(self, monkeypatch, httpx_request, delays, hedges, hedge_wins):
+        httpx_request.hedging_policy = HedgingPolicy(min_delay=0.05, max_delay=0.05)
+        httpx_request.metrics = RequestMetrics()
+        calls = []
+        cancelled = []
+
+        async def do_request(*args, **kwargs):
+            call = len(calls)
+            calls.append(kwargs["url"])
+            try:
+                await asyncio.sleep(delays[call])
+            except asyncio.CancelledError:
+                cancelled.append(call)
+                raise
+            return HTTPStatus.OK, f'{{"ok": true, "result": {call}}}'.encode()
+
+        monkeypatch.setattr(httpx_request, "do_request", do_request)
+        result = await httpx_request.post("https://api.org/botTOKEN/getChat")
+        await asyncio.sleep(0)
+
+        assert len(calls) == 1 + hedges
+        assert result == hedge_wins
+        assert cancelled == ([1 - hedge_wins] if hedges else [])
+        assert httpx_request.hedging_policy.hedges == hedges
+        assert httpx_request.hedging_policy.hedge_wins == hedge_wins
+        # A hedged call is one request for the metrics
+        assert httpx_request.metrics.snapshot()["getChat"].requests == 1
+
+    async def test_hedging_not_for_other_endpoints(self, monkeypatch, httpx_request):
+        httpx_request.hedging_policy = HedgingPolicy(min_delay=0, max_delay=0)
+        calls = []
+
+        async def do_request(*args, **kwargs):
+            calls.append(kwargs["url"])
+            await asyncio.sleep(0.05)
+            return HTTPStatus.OK, b'{"ok": true, "result": true}'
+
+        monkeypatch.setattr(httpx_request, "do_request", do_request)
+        await httpx_request.post("https://api.org/botTOKEN/sendMessage")
+        await httpx_request.retrieve("https://api.org/file/botTOKEN/getChat")
+        assert len(calls) == 2
+        assert httpx_request.hedging_policy.hedges == 0
+
+    async def test_hedging_errors(self, monkeypatch, httpx_request):
+        httpx_request.hedging_policy = HedgingPolicy(min_delay=0.01, max_delay=0.01)
+        responses = []
+
+        async def do_request(*args, **kwargs):
+            response = responses.pop(0)
+            await asyncio.sleep(response[0])
+            if isinstance(response[1], Exception):
+                raise response[1]
+            return HTTPStatus.OK, b'{"ok": true, "result": "hedge"}'
+
+        monkeypatch.setattr(httpx_request, "do_request", do_request)
+
+        # An error of the first request doesn't prevent the hedge from winning
+        responses[:] = [(0.05, TimedOut("first")), (0.06, None)]
+        assert await httpx_request.post("https://api.org/botTOKEN/getMe") == "hedge"
+
+        # If both fail, the first error is raised
+        responses[:] = [(0.05, TimedOut("first")), (0.02, NetworkError("second"))]
+        with pytest.raises(NetworkError, match="second"):
+            await httpx_request.post("https://api.org/botTOKEN/getMe")
+
+        # Errors before the delay are raised without hedging
+        responses[:] = [(0, BadRequest("Chat not found"))]
+        with pytest.raises(BadRequest, match="Chat not found"):
+            await httpx_request.post("https://api.org/botTOKEN/getMe")
+        assert httpx_request.hedging_policy.hedges == 2
+
+    async def test_adaptive_timeouts(self, monkeypatch, httpx_request):
+        httpx_request.adaptive_timeouts = AdaptiveTimeouts(factor=2, min_timeout=0.01)
+        read_timeouts = []
+
+        async def do_request(*args, **kwargs):
+            read_timeouts.append(kwargs["read_timeout"])
+            return HTTPStatus.OK, b'{"ok": true, "result": true}'
+
+        monkeypatch.setattr(httpx_request, "do_request", do_request)
+        for _ in range(AdaptiveTimeouts.MIN_SAMPLES):
+            await httpx_request.post("https://api.org/botTOKEN/getChat")
+        assert read_timeouts == [DEFAULT_NONE] * AdaptiveTimeouts.MIN_SAMPLES
+
+        read_timeouts.clear()
+        await httpx_request.post("https://api.org/botTOKEN/getChat")
+        await httpx_request.post("https://api.org/botTOKEN/getChat", read_timeout=3)
+        await httpx_request.post("https://api.org/botTOKEN/sendMessage")
+        assert read_timeouts[0] == httpx_request.adaptive_timeouts.read_timeout("getChat")
+        assert read_timeouts[0] < 1
+        assert read_timeouts[1:] == [3, DEFAULT_NONE]
+
+    async def test_adaptive_timeouts_latency_jump(self, monkeypatch, httpx_request):
+        adaptive_timeouts = httpx_request.adaptive_timeouts = AdaptiveTimeouts()
+        for _ in range(AdaptiveTimeouts.WINDOW_SIZE):
+            adaptive_timeouts.record_latency("getChat", 0.01)
+        assert adaptive_timeouts.read_timeout("getChat") == 1
+        latency = 1.5
+        now = [0.0]
+
+        async def do_request(*args, **kwargs):
+            read_timeout = kwargs["read_timeout"]
+            if isinstance(read_timeout, DefaultValue):
+                read_timeout = 5
+            if latency > read_timeout:
+                now[0] += read_timeout
+                raise TimedOut
+            now[0] += latency
+            return HTTPStatus.OK, b'{"ok": true, "result": true}'
+
+        monkeypatch.setattr(httpx_request, "do_request", do_request)
+        # Simulate the latencies without actually waiting
+        monkeypatch.setattr(time, "perf_counter", lambda: now[0])
+        failures = 0
+        for _ in range(500):
+            try:
+                await httpx_request.post("https://api.org/botTOKEN/getChat")
+            except TimedOut:
+                failures += 1
+
+        # The server became slower than the learned timeout, which must adapt
+        assert failures == 2
+        assert adaptive_timeouts.read_timeout("getChat") >= latency
+
+    async def test_adaptive_timeouts_pool_timeout(self, monkeypatch, httpx_request):
+        adaptive_timeouts = httpx_request.adaptive_timeouts = AdaptiveTimeouts()
+        for _ in range(AdaptiveTimeouts.WINDOW_SIZE):
+            adaptive_timeouts.record_latency("getChat", 0.01)
+
+        async def do_request(*args, **kwargs):
+            raise TimedOut("Pool timeout: All connections in the connection pool are occupied.")
+
+        monkeypatch.setattr(httpx_request, "do_request", do_request)
+        with pytest.raises(TimedOut, match="Pool timeout"):
+            await httpx_request.post("https://api.org/botTOKEN/getChat")
+        # The request wasn't sent, so it says nothing about the latency of the server
+        assert adaptive_timeouts.read_timeout("getChat") == 1
+
+    async def test_adaptive_timeouts_not_for_uploads_downloads_and_updates(
+        self, monkeypatch, httpx_request, mixed_rqs  # noqa: F811
+    ):
+        adaptive_timeouts = httpx_request.adaptive_timeouts = AdaptiveTimeouts()
+        for endpoint in ("sendPhoto", "getUpdates", RequestMetrics.FILE_DOWNLOAD):
+            for _ in range(AdaptiveTimeouts.MIN_SAMPLES):
+                adaptive_timeouts.record_latency(endpoint, 0.5)
+        read_timeouts = []
+
+        async def do_request(*args, **kwargs):
+            read_timeouts.append(kwargs["read_timeout"])
+            return HTTPStatus.OK, b'{"ok": true, "result": true}'
+
+        monkeypatch.setattr(httpx_request, "do_request", do_request)
+        await httpx_request.post("https://api.org/botTOKEN/sendPhoto", mixed_rqs)
+        await httpx_request.post("https://api.org/botTOKEN/getUpdates")
+        await httpx_request.retrieve("https://api.org/file/botTOKEN/photo.jpg")
+        assert read_timeouts == [DEFAULT_NONE] * 3
+
+    async def test_circuit_breaker(self, monkeypatch, httpx_request):
+        httpx_request.circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_time=0.05)
+        httpx_request.metrics = RequestMetrics()
+        responses = []
+
+        async def do_request(*args, **kwargs):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        monkeypatch.setattr(httpx_request, "do_request", do_request)
+
+        # Errors of the Bot API show that the server is reachable
+        responses[:] = [(HTTPStatus.BAD_REQUEST, b'{"ok": false, "description": "Bad"}')] * 3
+        for _ in range(3):
+            with pytest.raises(BadRequest):
+                await httpx_request.post("https://api.org/botTOKEN/getChat")
+        assert not httpx_request.circuit_breaker.is_open("getChat")
+
+        responses[:] = [
+            TimedOut("first"),
+            (HTTPStatus.BAD_GATEWAY, b'{"ok": false, "description": "Bad Gateway"}'),
+        ]
+        with pytest.raises(TimedOut, match="first"):
+            await httpx_request.post("https://api.org/botTOKEN/getChat")
+        with pytest.raises(NetworkError, match="Bad Gateway"):
+            await httpx_request.post("https://api.org/botTOKEN/getChat")
+        assert httpx_request.circuit_breaker.is_open("getChat")
+
+        # No request is sent while the circuit is open
+        with pytest.raises(NetworkError, match="Circuit breaker is open"):
+            await httpx_request.post("https://api.org/botTOKEN/getChat")
+        # Other endpoints are not affected
+        responses[:] = [(HTTPStatus.OK, b'{"ok": true, "result": true}')]
+        assert await httpx_request.post("https://api.org/botTOKEN/getMe") is True
+
+        await asyncio.sleep(0.05)
+        responses[:] = [(HTTPStatus.OK, b'{"ok": true, "result": true}')]
+        assert await httpx_request.post("https://api.org/botTOKEN/getChat") is True
+        assert not httpx_request.circuit_breaker.is_open("getChat")
+        assert httpx_request.metrics.snapshot()["getChat"].errors == {
+            "BadRequest": 3,
+            "TimedOut": 1,
+            "NetworkError": 2,
+        }
+
+    async def test_circuit_breaker_pool_timeout(self, monkeypatch, httpx_request):
+        httpx_request.circuit_breaker = CircuitBreaker(failure_threshold=1)
+        pool_timeout = httpx_request._convert_exception(httpx.PoolTimeout("pool"))
+
+        async def do_request(*args, **kwargs):
+            raise pool_timeout
+
+        monkeypatch.setattr(httpx_request, "do_request", do_request)
+        # The request wasn't sent, so it says nothing about the server
+        for _ in range(3):
+            with pytest.raises(TimedOut, match="Pool timeout"):
+                await httpx_request.post("https://api.org/botTOKEN/getChat")
+        assert not httpx_request.circuit_breaker.is_open("getChat")
+
+        async def do_request(*args, **kwargs):
+            raise TimedOut
+
+        monkeypatch.setattr(httpx_request, "do_request", do_request)
+        with pytest.raises(TimedOut):
+            await httpx_request.post("https://api.org/botTOKEN/getChat")
+        assert httpx_request.circuit_breaker.is_open("getChat")
+
     async def test_timeout_propagation_to_do_request(self, monkeypatch, httpx_request):
         async def make_assertion(*args, **kwargs):
             self.test_flag = (
@@ -771,6 +1119,63 @@ class TestHTTPXRequestWithoutRequest:
         # other than HTTPXRequest
         assert len(recwarn) == 0
 
+    @pytest.mark.parametrize("from_path", [False, True])
+    async def test_streaming_upload(self, monkeypatch, tmp_path, from_path):
+        content = bytes(range(256)) * 4096
+        path = tmp_path / "file.bin"
+        path.write_bytes(content)
+        chunks = []
+
+        async def handle_async_request(_, request):
+            chunks.extend([chunk async for chunk in request.stream])
+            return httpx.Response(HTTPStatus.OK, content=b'{"ok": "True", "result": {}}')
+
+        monkeypatch.setattr(AsyncHTTPTransport, "handle_async_request", handle_async_request)
+
+        with path.open("rb") as file:
+            input_file = InputFile(path if from_path else file, read_file_handle=False)
+            if not from_path:
+                assert input_file.input_file_content is file
+            request_data = RequestData(
+                parameters=[RequestParameter.from_input("document", input_file)]
+            )
+            async with HTTPXRequest() as httpx_request:
+                await httpx_request.post("https://example.com", request_data)
+                # sending the file a second time must work as well
+                chunks.clear()
+                await httpx_request.post("https://example.com", request_data)
+
+        body = b"".join(chunks)
+        assert content in body
+        assert b'filename="file.bin"' in body
+        # the file was not loaded into memory at once
+        assert max(len(chunk) for chunk in chunks) < len(content)
+
+    async def test_streaming_download(self, monkeypatch, httpx_request):
+        content = bytes(range(256)) * 1024
+
+        async def handle_async_request(_, request):
+            return httpx.Response(HTTPStatus.OK, content=content)
+
+        monkeypatch.setattr(AsyncHTTPTransport, "handle_async_request", handle_async_request)
+        chunks = [chunk async for chunk in httpx_request.retrieve_stream("https://example.com")]
+        assert b"".join(chunks) == content
+        assert len(chunks) > 1
+
+    async def test_streaming_download_exceptions(self, monkeypatch, httpx_request):
+        async def handle_async_request(_, request):
+            raise httpx.ReadTimeout("read timeout")
+
+        monkeypatch.setattr(AsyncHTTPTransport, "handle_async_request", handle_async_request)
+        stream = httpx_request.retrieve_stream("https://example.com")
+        with pytest.raises(TimedOut):
+            await stream.__anext__()
+
+    async def test_do_stream_request_after_shutdown(self, httpx_request):
+        await httpx_request.shutdown()
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await httpx_request.do_stream_request(url="url", method="GET").__aenter__()
+
     async def test_socket_opts(self, monkeypatch):
         transport_kwargs = {}
         transport_init = AsyncHTTPTransport.__init__
@@ -793,6 +1198,108 @@ class TestHTTPXRequestWithoutRequest:
     async def test_read_timeout_property(self, read_timeout):
         assert HTTPXRequest(read_timeout=read_timeout).read_timeout == read_timeout
 
+    def test_max_connection_pool_size_init(self):
+        request = HTTPXRequest(connection_pool_size=2)
+        assert request.connection_pool_size == 2
+        assert request.max_connection_pool_size is None
+        assert request.in_flight_requests is None
+        assert request.pool_wait_time is None
+
+        request = HTTPXRequest(connection_pool_size=2, max_connection_pool_size=8)
+        assert request._client._transport._pool._max_connections == 8
+        assert request.connection_pool_size == 2
+        assert request.max_connection_pool_size == 8
+        assert request.in_flight_requests == 0
+        assert request.pool_wait_time == 0
+
+    def test_max_connection_pool_size_errors(self):
+        with pytest.raises(ValueError, match="must not be smaller"):
+            HTTPXRequest(connection_pool_size=2, max_connection_pool_size=1)
+        with pytest.raises(ValueError, match="only available for HTTP/1.1"):
+            HTTPXRequest(max_connection_pool_size=2, http_version="2")
+
+    async def test_adaptive_connection_pool(self, monkeypatch):
+        event = asyncio.Event()
+
+        async def handle_async_request(_, request):
+            await event.wait()
+            return httpx.Response(HTTPStatus.OK, content=b"content")
+
+        monkeypatch.setattr(AsyncHTTPTransport, "handle_async_request", handle_async_request)
+        async with HTTPXRequest(max_connection_pool_size=3, pool_timeout=None) as httpx_request:
+            tasks = [
+                asyncio.create_task(
+                    httpx_request.do_request(url="https://example.com", method="GET")
+                )
+                for _ in range(5)
+            ]
+            await asyncio.sleep(0)
+            # The pool only grows once the requests actually waited
+            assert httpx_request.connection_pool_size == 1
+            assert httpx_request.in_flight_requests == 1
+            await asyncio.sleep(2 * ConnectionLimiter.GROW_WAIT_TIME)
+            assert httpx_request.connection_pool_size == 3
+            assert httpx_request.in_flight_requests == 3
+            event.set()
+            assert await asyncio.gather(*tasks) == [(HTTPStatus.OK, b"content")] * 5
+            assert httpx_request.in_flight_requests == 0
+            assert httpx_request.pool_wait_time > 0
+
+            # Streams hold their connection until they are closed
+            async with httpx_request.do_stream_request(url="https://example.com", method="GET"):
+                assert httpx_request.in_flight_requests == 1
+            assert httpx_request.in_flight_requests == 0
+
+    async def test_adaptive_connection_pool_shrink(self, monkeypatch):
+        async def handle_async_request(_, request):
+            if request.url.path == "/slow":
+                await asyncio.sleep(2 * ConnectionLimiter.GROW_WAIT_TIME)
+            return httpx.Response(HTTPStatus.OK)
+
+        monkeypatch.setattr(AsyncHTTPTransport, "handle_async_request", handle_async_request)
+        async with HTTPXRequest(max_connection_pool_size=3) as httpx_request:
+            await asyncio.gather(
+                *(
+                    httpx_request.do_request(url="https://example.com/slow", method="GET")
+                    for _ in range(3)
+                )
+            )
+            assert httpx_request.connection_pool_size == 3
+            client = httpx_request._client
+
+            # At most two requests are made concurrently in the next intervals
+            monkeypatch.setattr(ConnectionLimiter, "SHRINK_INTERVAL", 0)
+            slow_request = asyncio.create_task(
+                httpx_request.do_request(url="https://example.com/slow", method="GET")
+            )
+            await asyncio.sleep(0)
+            for _ in range(2):
+                await httpx_request.do_request(url="https://example.com", method="GET")
+
+            # The client is replaced to close the sockets that are no longer needed, but the old
+            # one is still used by the slow request
+            assert httpx_request.connection_pool_size == 2
+            assert httpx_request._client is not client
+            assert not client.is_closed
+
+            await slow_request
+            assert client.is_closed
+            assert not httpx_request._client.is_closed
+            assert client not in httpx_request._client_usage
+
+    async def test_adaptive_connection_pool_timeout(self, monkeypatch):
+        async def handle_async_request(_, request):
+            await asyncio.sleep(0.1)
+            return httpx.Response(HTTPStatus.OK)
+
+        monkeypatch.setattr(AsyncHTTPTransport, "handle_async_request", handle_async_request)
+        async with HTTPXRequest(max_connection_pool_size=1, pool_timeout=0.02) as httpx_request:
+            with pytest.raises(TimedOut, match="Pool timeout"):
+                await asyncio.gather(
+                    httpx_request.do_request(url="https://example.com", method="GET"),
+                    httpx_request.do_request(url="https://example.com", method="GET"),
+                )
+
 
 @pytest.mark.skipif(not TEST_WITH_OPT_DEPS, reason="No need to run this twice")
 class TestHTTPXRequestWithRequest:
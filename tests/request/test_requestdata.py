@@ -175,6 +175,38 @@ class TestRequestDataWithoutRequest:
         assert file_rqs.json_parameters == file_jsons
         assert mixed_rqs.json_parameters == mixed_jsons
 
+    def test_json_parameters_are_encoded_once(self, monkeypatch):
+        entity = MessageEntity(MessageEntity.BOLD, 0, 4)
+        data = RequestData([RequestParameter.from_input("entities", [entity])])
+        expected = data.json_parameters
+
+        def to_dict(*args, **kwargs):
+            pytest.fail("The parameter was encoded again")
+
+        monkeypatch.setattr(MessageEntity, "to_dict", to_dict)
+        assert data.json_parameters == expected
+        assert data.json_parameters is not data.json_parameters
+
+    def test_with_parameters(self, simple_rqs, simple_jsons, mixed_rqs, monkeypatch):
+        copy = simple_rqs.with_parameters(
+            [
+                RequestParameter.from_input("chat_id", 456),
+                RequestParameter.from_input("message_thread_id", 5),
+                RequestParameter.from_input("none", None),
+            ]
+        )
+        assert copy is not simple_rqs
+        assert simple_rqs.json_parameters == simple_jsons
+        assert copy.json_parameters == {**simple_jsons, "chat_id": "456", "message_thread_id": "5"}
+        assert copy.parameters["chat_id"] == 456
+        assert not copy.contains_files
+
+        # The untouched parameters are not encoded again
+        monkeypatch.setattr(MessageEntity, "to_dict", lambda *_: pytest.fail("encoded again"))
+        assert simple_rqs.with_parameters([]).json_parameters == simple_jsons
+
+        assert mixed_rqs.with_parameters([]).contains_files
+
     def test_json_payload(
         self, simple_rqs, file_rqs, mixed_rqs, simple_jsons, file_jsons, mixed_jsons
     ):
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import logging
+import math
+
+import pytest
+
+from telegram import InputFile
+from telegram.error import RetryAfter
+from telegram.request import EndpointMetrics, RequestData, RequestMetrics, RequestRecord
+from telegram.request._requestparameter import RequestParameter
+from tests.auxil.slots import mro_slots
+
+
+def make_record(endpoint="sendMessage", duration=0.03, status_code=200, error=None):
+    return RequestRecord(
+        endpoint=endpoint,
+        duration=duration,
+        status_code=status_code,
+        error=error,
+        bytes_sent=10,
+        bytes_received=20,
+    )
+
+
+def record(metrics, *args, **kwargs):
+    metrics.start_request()
+    metrics.finish_request(make_record(*args, **kwargs))
+
+
+@pytest.fixture()
+def metrics():
+    return RequestMetrics()
+
+
+class TestRequestMetrics:
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            RequestMetrics(),
+            make_record(),
+            EndpointMetrics(0, 0, 0, (), {}, {}, 0, 0),
+        ],
+        ids=["RequestMetrics", "RequestRecord", "EndpointMetrics"],
+    )
+    def test_slot_behaviour(self, obj):
+        for attr in obj.__slots__:
+            assert getattr(obj, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(obj)) == len(set(mro_slots(obj))), "duplicate slot"
+
+    def test_snapshot(self, metrics):
+        assert metrics.snapshot() == {}
+        metrics.start_request()
+        assert metrics.in_flight == 1
+
+        metrics.finish_request(make_record())
+        record(metrics, duration=0.2)
+        record(metrics, status_code=429, error=RetryAfter(3))
+        record(metrics, status_code=None, error=TimeoutError())
+        record(metrics, endpoint="getChat", duration=5)
+        assert metrics.in_flight == 0
+
+        snapshot = metrics.snapshot()
+        assert set(snapshot) == {"sendMessage", "getChat"}
+        send_message = snapshot["sendMessage"]
+        assert send_message.requests == 4
+        assert send_message.total_latency == pytest.approx(0.29)
+        assert send_message.mean_latency == pytest.approx(0.29 / 4)
+        assert send_message.max_latency == 0.2
+        assert send_message.status_codes == {200: 2, 429: 1}
+        assert send_message.errors == {"RetryAfter": 1, "TimeoutError": 1}
+        assert send_message.bytes_sent == 40
+        assert send_message.bytes_received == 80
+        assert sum(send_message.latency_histogram) == 4
+        assert send_message.latency_histogram[RequestMetrics.LATENCY_BUCKETS.index(0.05)] == 3
+
+        # snapshots are not affected by later requests
+        record(metrics)
+        assert send_message.requests == 4
+        assert metrics.snapshot()["sendMessage"].requests == 5
+
+    def test_latency_quantile(self, metrics):
+        assert EndpointMetrics(0, 0, 0, (0,) * 12, {}, {}, 0, 0).latency_quantile(0.5) == 0
+        for _ in range(98):
+            record(metrics, duration=0.03)
+        record(metrics, duration=0.7)
+        record(metrics, duration=42)
+
+        send_message = metrics.snapshot()["sendMessage"]
+        assert send_message.latency_quantile(0) == 0.05
+        assert send_message.latency_quantile(0.5) == 0.05
+        assert send_message.latency_quantile(0.99) == 1
+        assert send_message.latency_quantile(1) == 42
+        assert RequestMetrics.LATENCY_BUCKETS[-1] == math.inf
+
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            send_message.latency_quantile(1.5)
+
+    def test_aggregate(self, metrics):
+        record(metrics, endpoint="sendMessage", duration=0.1)
+        record(metrics, endpoint="getChat", duration=0.2, status_code=400)
+        record(metrics, endpoint="getUpdates", duration=10)
+
+        aggregate = metrics.aggregate()
+        assert aggregate.requests == 2
+        assert aggregate.max_latency == 0.2
+        assert aggregate.status_codes == {200: 1, 400: 1}
+        assert sum(aggregate.latency_histogram) == 2
+
+        assert metrics.aggregate(exclude=()).requests == 3
+        assert metrics.aggregate(exclude=()).max_latency == 10
+
+    def test_callback(self, caplog):
+        records = []
+
+        def callback(request_record):
+            records.append(request_record)
+            raise RuntimeError("callback error")
+
+        metrics = RequestMetrics(callback=callback)
+        with caplog.at_level(logging.ERROR):
+            record(metrics)
+
+        assert len(records) == 1
+        assert records[0].endpoint == "sendMessage"
+        assert caplog.records[-1].name == "telegram.request.RequestMetrics"
+        assert "callback of RequestMetrics raised" in caplog.records[-1].getMessage()
+        assert metrics.snapshot()["sendMessage"].requests == 1
+
+    def test_reset(self, metrics):
+        record(metrics)
+        metrics.start_request()
+        metrics.reset()
+        assert metrics.snapshot() == {}
+        assert metrics.in_flight == 1
+
+    def test_request_size(self):
+        assert RequestMetrics.request_size(None) == 0
+        request_data = RequestData([RequestParameter("chat_id", 1, [])])
+        assert RequestMetrics.request_size(request_data) == len("chat_id") + len("1") + 2
+        # Non-ASCII text is counted in encoded bytes, not in characters
+        request_data = RequestData([RequestParameter("text", "Grüße 👋", [])])
+        assert RequestMetrics.request_size(request_data) == len("text") + 12 + 2
+
+        input_file = InputFile(b"content", attach=True)
+        request_data = RequestData(
+            [
+                RequestParameter("chat_id", 1, []),
+                RequestParameter.from_input("photo", input_file),
+            ]
+        )
+        assert RequestMetrics.request_size(request_data) > len(b"content")
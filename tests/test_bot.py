@@ -87,7 +87,7 @@ from telegram.constants import (
     ReactionEmoji,
 )
 from telegram.error import BadRequest, EndPointNotFound, InvalidToken, NetworkError
-from telegram.ext import ExtBot, InvalidCallbackData
+from telegram.ext import Defaults, ExtBot, InvalidCallbackData, ResponseCache
 from telegram.helpers import escape_markdown
 from telegram.request import BaseRequest, HTTPXRequest, RequestData
 from telegram.warnings import PTBDeprecationWarning, PTBUserWarning
@@ -492,7 +492,19 @@ class TestBotWithoutRequest:
         # Some methods of ext.ExtBot
         global_extra_args = {"rate_limit_args"}
         extra_args_per_method = defaultdict(
-            set, {"__init__": {"arbitrary_callback_data", "defaults", "rate_limiter"}}
+            set,
+            {
+                "__init__": {
+                    "arbitrary_callback_data",
+                    "coalesce_requests",
+                    "defaults",
+                    "intern_objects",
+                    "keep_raw_payloads",
+                    "lazy_updates",
+                    "rate_limiter",
+                    "response_cache",
+                }
+            },
         )
         different_hints_per_method = defaultdict(set, {"__setattr__": {"ext_bot"}})
 
@@ -1559,6 +1571,158 @@ class TestBotWithoutRequest:
             bot.callback_data_cache.clear_callback_data()
             bot.callback_data_cache.clear_callback_queries()
 
+    @pytest.mark.parametrize("arbitrary_callback_data", [True, False])
+    def test_insert_callback_data_raw_payload(self, bot_info, arbitrary_callback_data):
+        """The raw payload would still contain the callback data as sent by Telegram"""
+        bot = make_bot(
+            bot_info, arbitrary_callback_data=arbitrary_callback_data, keep_raw_payloads=True
+        )
+        message = make_message("text")
+        update = Update.de_json({"update_id": 1, "message": message.to_dict()}, bot)
+        empty_update = Update.de_json({"update_id": 2}, bot)
+        assert update._raw_payload is not None
+
+        bot.insert_callback_data(update)
+        bot.insert_callback_data(empty_update)
+        assert (update._raw_payload is None) is arbitrary_callback_data
+        assert empty_update._raw_payload is not None
+
+    @pytest.mark.parametrize("lazy_messages", [True, False])
+    async def test_lazy_messages(self, monkeypatch, bot_info, lazy_messages):
+        bot = make_bot(bot_info, defaults=Defaults(lazy_messages=lazy_messages))
+        message = make_message(
+            "text",
+            reply_markup=InlineKeyboardMarkup.from_button(
+                InlineKeyboardButton("button", url="https://python-telegram-bot.org")
+            ),
+        )
+
+        async def post(_, url, request_data, *args, **kwargs):
+            if url.endswith("sendMediaGroup"):
+                return [message.to_dict(), message.to_dict()]
+            return message.to_dict()
+
+        monkeypatch.setattr(BaseRequest, "post", post)
+        sent = await bot.send_message(1, "text")
+        album = await bot.send_media_group(1, [InputMediaPhoto("id"), InputMediaPhoto("id")])
+
+        for result in (sent, *album):
+            assert isinstance(result, Message)
+            assert (result._lazy_data is not None) is lazy_messages
+            assert result.message_id == message.message_id
+            assert result.chat_id == message.chat_id
+            assert result.get_bot() is bot
+            assert result.reply_markup == message.reply_markup
+            assert result._lazy_data is None
+            assert result.to_dict() == message.to_dict()
+
+    async def test_lazy_messages_errors(self, monkeypatch, bot_info):
+        bot = make_bot(bot_info, defaults=Defaults(lazy_messages=True))
+
+        async def post(*args, **kwargs):
+            raise BadRequest("Chat not found")
+
+        monkeypatch.setattr(BaseRequest, "post", post)
+        with pytest.raises(BadRequest, match="Chat not found"):
+            await bot.send_message(1, "text")
+
+    @pytest.mark.parametrize("coalesce_requests", [True, False])
+    async def test_coalesce_requests(self, monkeypatch, bot_info, coalesce_requests):
+        bot = make_bot(bot_info, coalesce_requests=coalesce_requests)
+        assert bot.coalesce_requests is coalesce_requests
+        calls = []
+        event = asyncio.Event()
+
+        async def post(_, url, request_data, *args, **kwargs):
+            calls.append((url.rsplit("/", 1)[-1], request_data.parameters))
+            await event.wait()
+            return {"id": request_data.parameters["chat_id"], "type": "private"}
+
+        monkeypatch.setattr(BaseRequest, "post", post)
+        tasks = [asyncio.create_task(bot.get_chat(chat_id)) for chat_id in (1, 1, 1, 2)]
+        send_tasks = [asyncio.create_task(bot.send_chat_action(1, "typing")) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        event.set()
+        chats = await asyncio.gather(*tasks)
+        await asyncio.gather(*send_tasks)
+
+        assert [chat.id for chat in chats] == [1, 1, 1, 2]
+        assert chats[0] is not chats[1]
+        assert len([call for call in calls if call[0] == "sendChatAction"]) == 2
+        assert len([call for call in calls if call[0] == "getChat"]) == (
+            2 if coalesce_requests else 4
+        )
+
+        # No caching of results
+        calls.clear()
+        await bot.get_chat(1)
+        assert len(calls) == 1
+        if coalesce_requests:
+            assert not bot._coalesced_requests
+
+    async def test_coalesce_requests_cancel_and_error(self, monkeypatch, bot_info):
+        bot = make_bot(bot_info, coalesce_requests=True)
+        event = asyncio.Event()
+        response = {"id": 1, "type": "private"}
+
+        async def post(*args, **kwargs):
+            await event.wait()
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        monkeypatch.setattr(BaseRequest, "post", post)
+
+        # cancelling the caller that made the request doesn't affect the others
+        first = asyncio.create_task(bot.get_chat(1))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(bot.get_chat(1))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        event.set()
+        assert (await second).id == 1
+        assert first.cancelled()
+
+        # exceptions are passed to all callers
+        event.clear()
+        response = BadRequest("Chat not found")
+        tasks = [asyncio.create_task(bot.get_chat(1)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        event.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(result is response for result in results)
+
+    async def test_response_cache(self, monkeypatch, bot_info):
+        response_cache = ResponseCache(ttls={"getChat": 60})
+        bot = make_bot(bot_info, response_cache=response_cache, coalesce_requests=True)
+        assert bot.response_cache is response_cache
+        calls = []
+
+        async def post(_, url, request_data, *args, **kwargs):
+            calls.append(url.rsplit("/", 1)[-1])
+            if url.endswith("sendChatAction"):
+                return True
+            return {"id": request_data.parameters["chat_id"], "type": "private"}
+
+        monkeypatch.setattr(BaseRequest, "post", post)
+        first = await bot.get_chat(1)
+        second = await bot.get_chat(1)
+        assert first == second
+        assert first is not second
+        assert calls == ["getChat"]
+
+        # Only the configured endpoints are cached
+        await bot.send_chat_action(1, "typing")
+        await bot.send_chat_action(1, "typing")
+        await bot.get_chat(2)
+        assert calls == ["getChat", "sendChatAction", "sendChatAction", "getChat"]
+
+        response_cache.invalidate_chat(1)
+        await bot.get_chat(1)
+        assert calls[-1] == "getChat"
+        assert len(calls) == 5
+        assert response_cache.hits == 1
+
     @pytest.mark.parametrize(
         "message_type", ["channel_post", "edited_channel_post", "message", "edited_message"]
     )
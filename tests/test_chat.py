@@ -43,6 +43,7 @@ from tests.auxil.bot_method_checks import (
     check_shortcut_call,
     check_shortcut_signature,
 )
+from tests.auxil.pytest_classes import make_bot
 from tests.auxil.slots import mro_slots
 
 
@@ -251,6 +252,22 @@ class TestChatWithoutRequest(TestChatBase):
         assert chat_bot_raw.emoji_status_expiration_date.tzinfo == UTC
         assert emoji_expire_offset_tz == emoji_expire_offset
 
+    def test_de_json_interned(self, bot, bot_info):
+        intern_bot = make_bot(bot_info, intern_objects=True)
+        json_dict = {"id": self.id_, "type": self.type_, "title": self.title, "foo": "bar"}
+        chat = Chat.de_json(json_dict, intern_bot)
+        assert chat.api_kwargs == {"foo": "bar"}
+        assert Chat.de_json(dict(json_dict), intern_bot) is chat
+        assert Chat.de_json(json_dict, bot) is not chat
+        assert Chat.de_json({**json_dict, "title": "changed"}, intern_bot) is not chat
+
+        # Chats with nested objects are not interned
+        json_dict["permissions"] = self.permissions.to_dict()
+        chat = Chat.de_json(json_dict, intern_bot)
+        assert chat.permissions == self.permissions
+        assert Chat.de_json(json_dict, intern_bot) is not chat
+        assert len(intern_bot.intern_cache) == 2
+
     def test_to_dict(self, chat):
         chat_dict = chat.to_dict()
 
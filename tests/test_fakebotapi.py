@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Tests for the fake Bot API in tests/auxil/fake_bot_api.py, which double as end to end tests of
+Bot, Application, Updater, AIORateLimiter and HTTPXRequest without network access."""
+import asyncio
+
+import pytest
+
+from telegram import Bot, InputFile, Message, Update
+from telegram.error import BadRequest, InvalidToken, NetworkError, RetryAfter, TimedOut
+from telegram.ext import AIORateLimiter, ApplicationBuilder, MessageHandler, filters
+from telegram.request import HTTPXRequest
+from tests.auxil.envvars import TEST_WITH_OPT_DEPS
+
+if TEST_WITH_OPT_DEPS:
+    from tests.auxil.fake_bot_api import Fault
+
+pytestmark = pytest.mark.skipif(
+    not TEST_WITH_OPT_DEPS, reason="Only relevant if the optional dependency is installed"
+)
+
+
+@pytest.fixture()
+async def fake_bot(fake_bot_api):
+    async with Bot(
+        fake_bot_api.token,
+        base_url=fake_bot_api.base_url,
+        base_file_url=fake_bot_api.base_file_url,
+        request=HTTPXRequest(connection_pool_size=4),
+    ) as bot:
+        yield bot
+
+
+class TestFakeBotAPIWithoutRequest:
+    async def test_get_me(self, fake_bot_api, fake_bot):
+        assert fake_bot.bot.username == "FakeBot"
+        assert fake_bot.id == fake_bot_api.bot_user["id"]
+        assert fake_bot_api.requests["getMe"] == 1
+
+    async def test_invalid_token(self, fake_bot_api):
+        requests = HTTPXRequest(), HTTPXRequest()
+        bot = Bot(
+            "1:other",
+            base_url=fake_bot_api.base_url,
+            request=requests[0],
+            get_updates_request=requests[1],
+        )
+        try:
+            with pytest.raises(InvalidToken):
+                await bot.initialize()
+        finally:
+            for request in requests:
+                await request.shutdown()
+
+    async def test_get_updates(self, fake_bot_api, fake_bot):
+        first = fake_bot_api.put_message("first")
+        fake_bot_api.put_update(Update(update_id=100, message=None))
+        updates = await fake_bot.get_updates()
+        assert [update.update_id for update in updates] == [first, 100]
+        assert updates[0].message.text == "first"
+
+        # Confirmed updates are dropped
+        updates = await fake_bot.get_updates(offset=first + 1, limit=1)
+        assert [update.update_id for update in updates] == [100]
+        assert fake_bot_api.pending_updates == 1
+
+        # Long polling returns as soon as updates arrive
+        task = asyncio.create_task(fake_bot.get_updates(offset=101, timeout=5))
+        await asyncio.sleep(0.1)
+        assert not task.done()
+        fake_bot_api.put_message("second")
+        updates = await asyncio.wait_for(task, 1)
+        assert updates[0].message.text == "second"
+        assert fake_bot_api.pending_updates == 1
+
+    async def test_send_methods(self, fake_bot_api, fake_bot):
+        message = await fake_bot.send_message(123, "Hello")
+        assert isinstance(message, Message)
+        assert message.chat.id == 123
+        assert message.text == "Hello"
+        assert message.from_user.id == fake_bot.id
+
+        photo = await fake_bot.send_photo("@channel", b"photo", caption="caption")
+        assert photo.chat.username == "channel"
+        assert photo.caption == "caption"
+        assert photo.message_id > message.message_id
+        assert await fake_bot.send_chat_action(123, "typing") is True
+        assert await fake_bot.delete_message(123, message.message_id) is True
+
+        call = fake_bot_api.calls[-3]
+        assert call.method == "sendPhoto"
+        assert list(call.files.values()) == [b"photo"]
+
+    async def test_files(self, fake_bot_api, fake_bot):
+        document = await fake_bot.send_document(1, InputFile(b"content", filename="file.txt"))
+        file = await document.document.get_file()
+        assert file.file_size == len(b"content")
+        assert await file.download_as_bytearray() == bytearray(b"content")
+
+        file_id = fake_bot_api.add_file(b"added")
+        assert await (await fake_bot.get_file(file_id)).download_as_bytearray() == b"added"
+        with pytest.raises(BadRequest, match="Invalid file_id"):
+            await fake_bot.get_file("unknown")
+        assert fake_bot_api.requests["file"] == 2
+
+    async def test_set_result(self, fake_bot_api, fake_bot):
+        fake_bot_api.set_result("getChatMemberCount", 42)
+        fake_bot_api.set_result(
+            "getChat", lambda params: {"id": int(params["chat_id"]), "type": "x"}
+        )
+        assert await fake_bot.get_chat_member_count(1) == 42
+        assert (await fake_bot.get_chat(7)).id == 7
+
+    async def test_faults(self, fake_bot_api, fake_bot):
+        fake_bot_api.inject_fault("sendMessage", Fault.retry_after(3))
+        fake_bot_api.inject_fault("sendMessage", Fault.bad_gateway(), times=2)
+        with pytest.raises(RetryAfter) as exc_info:
+            await fake_bot.send_message(1, "text")
+        assert exc_info.value.retry_after == 3
+        for _ in range(2):
+            with pytest.raises(NetworkError, match="Bad Gateway"):
+                await fake_bot.send_message(1, "text")
+        await fake_bot.send_message(1, "text")
+
+        fake_bot_api.inject_fault("*", Fault.timeout(), times=None)
+        with pytest.raises(TimedOut):
+            await fake_bot.get_chat(1, read_timeout=0.1)
+        fake_bot_api.clear_faults()
+        await fake_bot.send_message(1, "text")
+        assert fake_bot_api.requests["sendMessage"] == 5
+
+    async def test_latency(self, fake_bot_api, fake_bot):
+        fake_bot_api.latency = lambda method: 0.2 if method == "sendMessage" else 0
+        fake_bot_api.reset_accounting()
+        await asyncio.gather(*(fake_bot.send_message(1, "text") for _ in range(3)))
+        assert fake_bot_api.peak_in_flight == 3
+        with pytest.raises(TimedOut):
+            await fake_bot.send_message(1, "text", read_timeout=0.05)
+
+    async def test_application_end_to_end(self, fake_bot_api):
+        received = []
+
+        async def echo(update, context):
+            received.append(update.message.text)
+            await update.message.reply_text(update.message.text)
+
+        application = (
+            ApplicationBuilder()
+            .token(fake_bot_api.token)
+            .base_url(fake_bot_api.base_url)
+            .base_file_url(fake_bot_api.base_file_url)
+            .request(HTTPXRequest(connection_pool_size=8))
+            .rate_limiter(AIORateLimiter(max_retries=1))
+            .concurrent_updates(True)
+            .build()
+        )
+        application.add_handler(MessageHandler(filters.TEXT, echo))
+        # The rate limiter retries after flood control
+        fake_bot_api.inject_fault("sendMessage", Fault.retry_after(1))
+        for i in range(20):
+            fake_bot_api.put_message(str(i), chat_id=i)
+
+        async with application:
+            await application.start()
+            await application.updater.start_polling(poll_interval=0, timeout=1)
+            for _ in range(100):
+                if len(received) == 20 and fake_bot_api.requests["sendMessage"] == 21:
+                    break
+                await asyncio.sleep(0.05)
+            await application.updater.stop()
+            await application.stop()
+
+        assert sorted(received, key=int) == [str(i) for i in range(20)]
+        assert fake_bot_api.requests["sendMessage"] == 21
+        assert fake_bot_api.pending_updates == 0
@@ -16,7 +16,8 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
-from copy import copy
+import pickle
+from copy import copy, deepcopy
 from datetime import datetime
 
 import pytest
@@ -71,7 +72,7 @@ from telegram import (
 from telegram._utils.datetime import UTC
 from telegram._utils.defaultvalue import DEFAULT_NONE
 from telegram._utils.types import ODVInput
-from telegram.constants import ChatAction, ParseMode
+from telegram.constants import ZERO_DATE, ChatAction, ParseMode
 from telegram.ext import Defaults
 from telegram.warnings import PTBDeprecationWarning
 from tests._passport.test_passport import RAW_PASSPORT_DATA
@@ -560,8 +561,108 @@ class TestMessageWithoutRequest(TestMessageBase):
         # Checking that none of the attributes are dicts is a best effort approach to ensure that
         # de_json converts everything to proper classes without having to write special tests for
         # every single case
-        for slot in new.__slots__:
-            assert not isinstance(new[slot], dict)
+        for attr in new._get_attrs_names(include_private=False):
+            assert not isinstance(new[attr], dict)
+
+    def test_sparse_attributes(self, bot):
+        message = Message.de_json(
+            {"message_id": 1, "date": 0, "chat": {"id": 1, "type": "private"}, "text": "Hi"}, bot
+        )
+        # Rarely used attributes don't take up any memory if they are not set
+        assert message._sparse_values is None
+        assert message.pinned_message is None
+        assert message.new_chat_members == ()
+        assert message.delete_chat_photo is False
+        assert "pinned_message" not in message.to_dict()
+        assert "pinned_message" in message._get_attrs_names(include_private=False)
+        assert "_sparse_values" not in message._get_attrs_names(include_private=True)
+
+        service_message = Message(
+            1,
+            self.date,
+            self.chat,
+            new_chat_members=[self.from_user],
+            pinned_message=message,
+            delete_chat_photo=True,
+        )
+        assert service_message.new_chat_members == (self.from_user,)
+        assert service_message.pinned_message is message
+        assert service_message.delete_chat_photo is True
+        assert len(service_message._sparse_values) == 3
+        with pytest.raises(AttributeError, match="can't be set"):
+            service_message.pinned_message = None
+
+        state = service_message.__getstate__()
+        assert state["pinned_message"] is message
+        assert "_sparse_values" not in state
+        copied = deepcopy(service_message)
+        assert copied.pinned_message == message
+        assert copied.new_chat_members == service_message.new_chat_members
+        assert copied._sparse_values is not service_message._sparse_values
+        assert copied.to_dict() == service_message.to_dict()
+
+    def test_de_json_lazy(self, bot, message_params):
+        data = message_params.to_dict()
+        message = Message._de_json_lazy(data, bot)
+        assert Message._de_json_lazy(None, bot) is None
+        assert message.message_id == message_params.message_id
+        assert message.chat == message_params.chat
+        assert message.date == Message.de_json(data, bot).date
+        assert message.get_bot() is bot
+        assert message == message_params
+        # The other attributes were not parsed yet
+        assert message._lazy_data == data
+        # Attributes that need no parsing are set individually
+        assert message.text == message_params.text
+        assert message.from_user == message_params.from_user
+        assert message._lazy_data == data
+        from_user = message.from_user
+        assert message.video == message_params.video
+        assert message.delete_chat_photo == message_params.delete_chat_photo
+        assert getattr(message, "api_kwargs", "err") != "err"
+        assert message._lazy_data is None
+        assert message.from_user is from_user
+        assert message.to_dict() == message_params.to_dict()
+        with pytest.raises(AttributeError, match="no attribute 'foo'"):
+            message.foo
+
+    def test_de_json_lazy_api_kwargs(self, bot, message_params):
+        data = {**message_params.to_dict(), "foo": "bar"}
+        message = Message._de_json_lazy(data, bot)
+        # Accessing api_kwargs parses the message
+        assert message.api_kwargs == {"foo": "bar"}
+        assert message._lazy_data is None
+        assert message.api_kwargs == Message.de_json(data, bot).api_kwargs
+
+    def test_de_json_lazy_sparse_attributes(self, bot):
+        data = {
+            "message_id": 1,
+            "date": 0,
+            "chat": {"id": 1, "type": "private"},
+            "new_chat_members": [{"id": 2, "is_bot": False, "first_name": "name"}],
+        }
+        message = Message._de_json_lazy(data, bot)
+        assert message.date == ZERO_DATE
+        assert message.new_chat_members[0].first_name == "name"
+        assert message.delete_chat_photo is False
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            lambda message: message.to_dict(),
+            lambda message: repr(message),
+            lambda message: deepcopy(message),
+            lambda message: pickle.loads(pickle.dumps(message)),
+        ],
+        ids=["to_dict", "repr", "deepcopy", "pickle"],
+    )
+    def test_de_json_lazy_materialized(self, bot, message_params, operation):
+        message = Message._de_json_lazy(message_params.to_dict(), bot)
+        result = operation(message)
+        assert message._lazy_data is None
+        if isinstance(result, Message):
+            assert result.to_dict() == message_params.to_dict()
+            assert result._lazy_data is None
 
     def test_de_json_localization(self, bot, raw_bot, tz_bot):
         json_dict = {
@@ -713,6 +814,62 @@ class TestMessageWithoutRequest(TestMessageBase):
             entity_2: "h",
         }
 
+    def test_parse_entities_no_text(self):
+        entity = MessageEntity(type=MessageEntity.URL, offset=0, length=1)
+        message = Message(1, self.date, self.chat, entities=[entity], caption_entities=[entity])
+        assert message.parse_entities(MessageEntity.BOLD) == {}
+        assert message.parse_caption_entities(MessageEntity.BOLD) == {}
+        with pytest.raises(RuntimeError, match="no 'text'"):
+            message.parse_entities()
+        with pytest.raises(RuntimeError, match="no 'caption'"):
+            message.parse_caption_entities()
+
+    @pytest.mark.parametrize("caption", [False, True])
+    def test_formatting_is_cached(self, caption):
+        text = "\U0001f431 bold http://google.com"
+        entities = [
+            MessageEntity(type=MessageEntity.BOLD, offset=3, length=4),
+            MessageEntity(type=MessageEntity.URL, offset=8, length=17),
+        ]
+        kwargs = (
+            {"caption": text, "caption_entities": entities}
+            if caption
+            else {"text": text, "entities": entities}
+        )
+        message = Message(1, self.date, self.chat, **kwargs)
+        prefix = "caption" if caption else "text"
+        attrs = [
+            f"{prefix}_{name}"
+            for name in (
+                "html",
+                "html_urled",
+                "markdown",
+                "markdown_urled",
+                "markdown_v2",
+                "markdown_v2_urled",
+            )
+        ]
+
+        results = {attr: getattr(message, attr) for attr in attrs}
+        assert results[f"{prefix}_html"] == "\U0001f431 <b>bold</b> http://google.com"
+        assert results[f"{prefix}_markdown_v2_urled"] == (
+            "\U0001f431 *bold* [http://google\\.com](http://google.com)"
+        )
+        # The formatted texts are computed only once
+        for attr in attrs:
+            assert getattr(message, attr) is results[attr]
+        parse = message.parse_caption_entities if caption else message.parse_entities
+        assert parse() == {entities[0]: "bold", entities[1]: "http://google.com"}
+        # The cache is not part of the state of the message
+        assert copy(message).to_dict() == message.to_dict()
+        assert "_sparse_values" not in message.__getstate__()
+        assert getattr(deepcopy(message), f"{prefix}_html") == results[f"{prefix}_html"]
+
+        # Changing the text of an unfrozen message invalidates the cache
+        with message._unfrozen():
+            setattr(message, prefix, "\U0001f431 text http://google.com")
+        assert getattr(message, f"{prefix}_html") == "\U0001f431 <b>text</b> http://google.com"
+
     def test_text_html_simple(self):
         test_html_string = (
             "<u>Test</u> for &lt;<b>bold</b>, <i>ita_lic</i>, "
@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import datetime as dtm
+
+import pytest
+
+from telegram import (
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    InputFile,
+    InputMediaPhoto,
+    Message,
+    MessageEntity,
+    MessageId,
+    MessageTemplate,
+)
+from telegram._utils.datetime import to_timestamp
+from telegram.constants import ParseMode
+from telegram.error import BadRequest
+from telegram.ext import BaseRateLimiter, Defaults
+from tests.auxil.pytest_classes import make_bot
+from tests.auxil.slots import mro_slots
+
+
+class RecordingRateLimiter(BaseRateLimiter):
+    def __init__(self):
+        self.calls = []
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def process_request(
+        self, callback, args, kwargs, endpoint, data, rate_limit_args
+    ):  # noqa: ARG002
+        self.calls.append((endpoint, dict(data), rate_limit_args))
+        return await callback(*args, **kwargs)
+
+
+def record_requests(monkeypatch, bot):
+    """Records the endpoint and JSON parameters of all requests and answers with a message."""
+    calls = []
+
+    async def post(url, request_data, *args, **kwargs):
+        endpoint = url.rsplit("/", 1)[-1]
+        parameters = request_data.json_parameters
+        calls.append((endpoint, parameters))
+        if endpoint == "sendChatAction":
+            return True
+        if endpoint == "copyMessage":
+            return {"message_id": 7}
+        message = {
+            "message_id": 7,
+            "date": 0,
+            "chat": {"id": 1, "type": "private"},
+        }
+        if "text" in parameters:
+            message["text"] = parameters["text"]
+        if "reply_markup" in parameters:
+            message["reply_markup"] = request_data.parameters["reply_markup"]
+        if endpoint == "sendMediaGroup":
+            return [message, {**message, "message_id": 8}]
+        return message
+
+    monkeypatch.setattr(bot.request, "post", post)
+    return calls
+
+
+@pytest.fixture()
+def keyboard():
+    return InlineKeyboardMarkup.from_button(InlineKeyboardButton("button", url="https://ptb.org"))
+
+
+class TestMessageTemplateWithoutRequest:
+    async def test_slot_behaviour(self, bot):
+        template = MessageTemplate(bot, "sendMessage", None)
+        for attr in template.__slots__:
+            assert getattr(template, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(template)) == len(set(mro_slots(template))), "duplicate slot"
+
+    async def test_repr(self, bot):
+        template = await MessageTemplate.create(bot.send_message, text="text")
+        assert repr(template) == "MessageTemplate[endpoint=sendMessage]"
+        assert template.bot is bot
+        assert template.endpoint == "sendMessage"
+
+    async def test_create_errors(self, bot):
+        with pytest.raises(TypeError, match="method of a bot"):
+            await MessageTemplate.create(print, text="text")
+        with pytest.raises(ValueError, match="passed to `MessageTemplate.send`"):
+            await MessageTemplate.create(bot.send_message, chat_id=1, text="text")
+        with pytest.raises(ValueError, match="doesn't send messages"):
+            await MessageTemplate.create(bot.get_chat)
+        with pytest.raises(ValueError, match="can't upload files"):
+            await MessageTemplate.create(bot.send_document, document=InputFile(b"content"))
+        # Errors of the bot method are raised as usual
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            await MessageTemplate.create(
+                bot.send_message, text="text", reply_to_message_id=1, reply_parameters=object()
+            )
+
+    async def test_create_makes_no_request(self, bot, monkeypatch):
+        requests = record_requests(monkeypatch, bot)
+        await MessageTemplate.create(bot.send_message, text="text")
+        assert requests == []
+
+    async def test_send_matches_bot_method(self, bot, keyboard, monkeypatch):
+        requests = record_requests(monkeypatch, bot)
+        kwargs = {
+            "text": "Hello",
+            "entities": [MessageEntity(MessageEntity.BOLD, 0, 5)],
+            "reply_markup": keyboard,
+            "disable_notification": True,
+        }
+        template = await MessageTemplate.create(bot.send_message, **kwargs)
+        message = await template.send(123)
+        await bot.send_message(123, **kwargs)
+
+        assert requests[0] == requests[1]
+        assert isinstance(message, Message)
+        assert message.text == "Hello"
+        assert message.get_bot() is bot
+
+        await template.send("@channel", api_kwargs={"message_thread_id": 5, "text": "Other"})
+        endpoint, parameters = requests[-1]
+        assert endpoint == "sendMessage"
+        assert parameters["chat_id"] == "@channel"
+        assert parameters["message_thread_id"] == "5"
+        assert parameters["text"] == "Other"
+        assert parameters["reply_markup"] == requests[0][1]["reply_markup"]
+
+    async def test_parameters_are_encoded_once(self, bot, keyboard, monkeypatch):
+        requests = record_requests(monkeypatch, bot)
+        template = await MessageTemplate.create(bot.send_message, text="a", reply_markup=keyboard)
+
+        def to_dict(*args, **kwargs):
+            pytest.fail("The template was encoded again")
+
+        monkeypatch.setattr(InlineKeyboardMarkup, "to_dict", to_dict)
+        for chat_id in range(3):
+            await template.send(chat_id)
+        assert [parameters["chat_id"] for _, parameters in requests] == ["0", "1", "2"]
+
+    async def test_other_methods(self, bot, monkeypatch):
+        requests = record_requests(monkeypatch, bot)
+        copy_template = await MessageTemplate.create(
+            bot.copy_message, from_chat_id=1, message_id=2
+        )
+        assert await copy_template.send(3) == MessageId(7)
+        assert requests[-1] == (
+            "copyMessage",
+            {"chat_id": "3", "from_chat_id": "1", "message_id": "2"},
+        )
+
+        album_template = await MessageTemplate.create(
+            bot.send_media_group, media=[InputMediaPhoto("file_id"), InputMediaPhoto("file_id")]
+        )
+        messages = await album_template.send(3)
+        assert isinstance(messages, tuple)
+        assert [message.message_id for message in messages] == [7, 8]
+
+        action_template = await MessageTemplate.create(bot.send_chat_action, action="typing")
+        assert await action_template.send(3) is True
+
+    async def test_errors_are_raised(self, bot, monkeypatch):
+        async def post(*args, **kwargs):
+            raise BadRequest("Chat not found")
+
+        monkeypatch.setattr(bot.request, "post", post)
+        template = await MessageTemplate.create(bot.send_message, text="text")
+        with pytest.raises(BadRequest, match="Chat not found"):
+            await template.send(1)
+
+    async def test_defaults(self, bot_info, monkeypatch):
+        bot = make_bot(bot_info, defaults=Defaults(parse_mode=ParseMode.HTML))
+        requests = record_requests(monkeypatch, bot)
+        template = await MessageTemplate.create(bot.send_message, text="<b>text</b>")
+        await template.send(1)
+        assert requests[-1][1]["parse_mode"] == "HTML"
+
+    async def test_tzinfo(self, tz_bot, monkeypatch):
+        requests = record_requests(monkeypatch, tz_bot)
+        template = await MessageTemplate.create(tz_bot.send_message, text="text")
+        date = dtm.datetime(2024, 1, 1)
+        await template.send(1, api_kwargs={"date": date})
+        # Naive datetimes passed for the individual chats are converted with the default tzinfo
+        assert requests[-1][1]["date"] == str(
+            to_timestamp(date, tzinfo=tz_bot.defaults.tzinfo)
+        )
+
+    async def test_rate_limit_args(self, bot_info, monkeypatch):
+        rate_limiter = RecordingRateLimiter()
+        bot = make_bot(bot_info, rate_limiter=rate_limiter)
+        requests = record_requests(monkeypatch, bot)
+        template = await MessageTemplate.create(
+            bot.send_message, text="text", rate_limit_args=(1, 2)
+        )
+        assert rate_limiter.calls == []
+
+        await template.send(42)
+        assert rate_limiter.calls == [("sendMessage", {"chat_id": 42}, (1, 2))]
+        assert requests[-1] == ("sendMessage", {"chat_id": "42", "text": "text"})
+
+    async def test_arbitrary_callback_data(self, cdc_bot, monkeypatch):
+        requests = record_requests(monkeypatch, cdc_bot)
+        keyboard = InlineKeyboardMarkup.from_button(
+            InlineKeyboardButton("button", callback_data={"some": "data"})
+        )
+        template = await MessageTemplate.create(
+            cdc_bot.send_message, text="text", reply_markup=keyboard
+        )
+        try:
+            message = await template.send(1)
+            button = message.reply_markup.inline_keyboard[0][0]
+            assert button.callback_data == {"some": "data"}
+        finally:
+            cdc_bot.callback_data_cache.clear_callback_data()
+            cdc_bot.callback_data_cache.clear_callback_queries()
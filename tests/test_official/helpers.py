@@ -32,7 +32,8 @@ if TYPE_CHECKING:
     from tests.test_official.scraper import TelegramParameter
 
 
-tg_objects = vars(telegram)
+# the classes of `telegram` are imported lazily, so they have to be resolved explicitly
+tg_objects = {**vars(telegram), **{name: getattr(telegram, name) for name in telegram.__all__}}
 tg_objects.update(vars(telegram._utils.types))
 tg_objects.update(vars(telegram._utils.defaultvalue))
 
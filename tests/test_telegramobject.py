@@ -27,6 +27,7 @@ from types import MappingProxyType
 import pytest
 
 from telegram import Bot, BotCommand, Chat, Message, PhotoSize, TelegramObject, User
+from telegram._utils.copying import deepcopy_sharing_frozen
 from telegram._utils.defaultvalue import DEFAULT_FALSE, DEFAULT_NONE, DefaultValue
 from telegram.ext import PicklePersistence
 from telegram.warnings import PTBUserWarning
@@ -90,6 +91,40 @@ class TestTelegramObject:
         assert to.api_kwargs == {"foo": "bar"}
         assert to.get_bot() is bot
 
+    def test_de_json_unknown_keys_single_init_call(self, bot):
+        class SubClass(TelegramObject):
+            init_calls = 0
+
+            def __init__(self, arg: int, *, api_kwargs=None):
+                super().__init__(api_kwargs=api_kwargs)
+                SubClass.init_calls += 1
+                self.arg = arg
+
+        to = SubClass.de_json({"arg": 1, "foo": "bar", "api_kwargs": "baz"}, bot)
+        assert SubClass.init_calls == 1
+        assert to.arg == 1
+        assert to.api_kwargs == {"foo": "bar", "api_kwargs": "baz"}
+        assert to.get_bot() is bot
+
+    def test_de_json_init_params_per_class(self, bot):
+        class Parent(TelegramObject):
+            def __init__(self, arg: int, *, api_kwargs=None):
+                super().__init__(api_kwargs=api_kwargs)
+                self.arg = arg
+
+        class Child(Parent):
+            def __init__(self, arg: int, arg2: int, *, api_kwargs=None):
+                super().__init__(arg=arg, api_kwargs=api_kwargs)
+                self.arg2 = arg2
+
+        data = {"arg": 1, "arg2": 2}
+        assert Parent.de_json(data, bot).api_kwargs == {"arg2": 2}
+        assert Child.de_json(data, bot).api_kwargs == {}
+        assert Parent._get_init_params() == {"arg"}
+        assert Child._get_init_params() == {"arg", "arg2"}
+        # the input must not be altered
+        assert data == {"arg": 1, "arg2": 2}
+
     def test_de_list(self, bot):
         class SubClass(TelegramObject):
             def __init__(self, arg: int, **kwargs):
@@ -219,6 +254,64 @@ class TestTelegramObject:
         assert "default_none" not in to_dict
         assert to_dict["default_false"] is False
 
+    def test_to_dict_slot_names_per_class(self):
+        class Parent(TelegramObject):
+            __slots__ = ("_private", "parent")
+
+            def __init__(self):
+                super().__init__()
+                self.parent = 1
+                self._private = 2
+
+        class Child(Parent):
+            __slots__ = ("child",)
+
+            def __init__(self):
+                super().__init__()
+                self.child = 3
+
+        class NoSlots(Child):
+            """Inherits the slots of Child, which must not lead to duplicates."""
+
+        assert Parent().to_dict() == {"parent": 1}
+        assert Child().to_dict() == {"child": 3, "parent": 1}
+        assert NoSlots().to_dict() == {"child": 3, "parent": 1}
+
+        all_slots, public_slots = NoSlots._get_slot_names()
+        assert all_slots == (
+            "child",
+            "_private",
+            "parent",
+            "_bot",
+            "_frozen",
+            "_id_attrs",
+            "api_kwargs",
+        )
+        assert public_slots == ("child", "parent", "api_kwargs")
+
+    def test_to_dict_mixed_values(self):
+        class SubClass(TelegramObject):
+            __slots__ = ("date", "empty", "nested", "none", "number")
+
+            def __init__(self):
+                super().__init__(api_kwargs={"unknown": "value"})
+                self.date = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+                self.empty = ()
+                self.nested = ((User(1, "first", False), 2),)
+                self.none = None
+                self.number = 1
+
+        to = SubClass()
+        assert to.to_dict() == {
+            "date": 1704067200,
+            "nested": [[{"id": 1, "first_name": "first", "is_bot": False}, 2]],
+            "number": 1,
+            "unknown": "value",
+        }
+        to_dict_no_recurse = to.to_dict(recursive=False)
+        assert to_dict_no_recurse["none"] is None
+        assert "empty" not in to_dict_no_recurse
+
     def test_slot_behaviour(self):
         inst = TelegramObject()
         for attr in inst.__slots__:
@@ -462,6 +555,56 @@ class PicklePropertyTest(TelegramObject):
         new_message.text = "new text"
         assert new_message.text == "new text"
 
+    def test_deepcopy_sharing_frozen(self, bot):
+        chat = Chat(2, Chat.PRIVATE)
+        user = User(3, "first_name", False)
+        date = datetime.datetime.now(tz=datetime.timezone.utc)
+        photo = PhotoSize("file_id", "unique", 21, 21)
+        msg = Message(1, date, chat, from_user=user, text="foobar", photo=[photo])
+        msg.set_bot(bot)
+        data = {"messages": [msg], "user": user}
+
+        new_data = deepcopy_sharing_frozen(data)
+        assert new_data == data
+        assert new_data is not data
+        assert new_data["messages"] is not data["messages"]
+        # Immutable objects are shared
+        assert new_data["messages"][0] is msg
+        assert new_data["user"] is user
+
+        # A mutable value in api_kwargs prevents sharing the object, but not its children
+        msg_with_list = Message(1, date, chat, from_user=user, api_kwargs={"foo": [1]})
+        new_msg = deepcopy_sharing_frozen(msg_with_list)
+        assert new_msg is not msg_with_list
+        assert new_msg.api_kwargs == {"foo": [1]}
+        assert new_msg.api_kwargs["foo"] is not msg_with_list.api_kwargs["foo"]
+        assert new_msg.chat is chat
+
+        # Unfrozen objects are copied, even if their children are shared
+        msg._unfreeze()
+        new_msg = deepcopy_sharing_frozen(msg)
+        assert new_msg is not msg
+        assert new_msg.get_bot() is bot
+        assert new_msg.from_user is user
+        assert new_msg.photo[0] is photo
+
+        # Regular deepcopy is not affected
+        assert deepcopy(user) is not user
+
+    def test_deepcopy_sharing_frozen_subclass(self):
+        class Frozen(TelegramObject):
+            __slots__ = ("value",)
+
+            def __init__(self, value):
+                super().__init__()
+                self.value = value
+                self._freeze()
+
+        immutable = Frozen((1, "string", datetime.timedelta(1), DEFAULT_NONE, Chat.PRIVATE))
+        assert deepcopy_sharing_frozen(immutable) is immutable
+        mutable = Frozen((1, {"key": "value"}))
+        assert deepcopy_sharing_frozen(mutable) is not mutable
+
     def test_deepcopy_subclass_telegram_obj(self, bot):
         s = self.Sub("private", "normal", bot)
         d = deepcopy(s)
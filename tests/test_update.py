@@ -16,6 +16,8 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
+import json
+import pickle
 import time
 from copy import deepcopy
 from datetime import datetime
@@ -52,6 +54,7 @@ from telegram import (
 )
 from telegram._utils.datetime import from_timestamp
 from telegram.warnings import PTBUserWarning
+from tests.auxil.pytest_classes import make_bot
 from tests.auxil.slots import mro_slots
 
 message = Message(
@@ -244,6 +247,103 @@ class TestUpdateWithoutRequest(TestUpdateBase):
                 assert getattr(update, _type) == paramdict[_type]
         assert i == 1
 
+    @pytest.mark.parametrize("paramdict", argvalues=params, ids=ids)
+    def test_de_json_lazy(self, bot_info, paramdict):
+        lazy_bot = make_bot(bot_info, lazy_updates=True)
+        json_dict = {"update_id": self.update_id}
+        json_dict.update({k: v.to_dict() for k, v in paramdict.items()})
+        update = Update.de_json(json_dict, lazy_bot)
+        assert update.api_kwargs == {}
+        assert update.update_id == self.update_id
+
+        (_type,) = paramdict
+        assert update._lazy_data == {_type: json_dict[_type]}
+        for other_type in all_types:
+            if other_type != _type:
+                assert getattr(update, other_type) is None
+        assert update._lazy_data == {_type: json_dict[_type]}
+
+        assert getattr(update, _type) == paramdict[_type]
+        assert getattr(update, _type).get_bot() is lazy_bot
+        assert getattr(update, _type) is getattr(update, _type)
+        assert update._lazy_data is None
+
+        with pytest.raises(AttributeError, match="can't be set"):
+            setattr(update, _type, None)
+
+    def test_de_json_lazy_materialized_by_serialization(self, bot, bot_info):
+        lazy_bot = make_bot(bot_info, lazy_updates=True)
+        json_dict = {"update_id": self.update_id, "message": message.to_dict()}
+        eager_update = Update.de_json(json_dict, bot)
+
+        assert Update.de_json(json_dict, lazy_bot).to_dict() == eager_update.to_dict()
+        assert repr(Update.de_json(json_dict, lazy_bot)) == repr(eager_update)
+
+        original = Update.de_json(json_dict, lazy_bot)
+        copied = deepcopy(original)
+        assert copied._lazy_data is None
+        assert copied.message == message
+        assert original.message.get_bot() is lazy_bot
+        assert copied.message.get_bot() is lazy_bot
+
+        unpickled = pickle.loads(pickle.dumps(Update.de_json(json_dict, lazy_bot)))
+        assert unpickled._lazy_data is None
+        assert unpickled.message == message
+        # The input data must not be altered
+        assert json_dict == {"update_id": self.update_id, "message": message.to_dict()}
+
+    def test_de_json_lazy_unknown_attribute(self, bot_info):
+        lazy_bot = make_bot(bot_info, lazy_updates=True)
+        update = Update.de_json({"update_id": 1, "message": message.to_dict()}, lazy_bot)
+        with pytest.raises(AttributeError, match="'Update' object has no attribute 'foo'"):
+            update.foo
+        assert update._lazy_data is not None
+
+    def test_de_json_keep_raw_payload(self, bot, bot_info):
+        raw_bot = make_bot(bot_info, keep_raw_payloads=True)
+        json_dict = {"update_id": self.update_id, "message": message.to_dict(), "new": "field"}
+        update = Update.de_json(json_dict, raw_bot)
+        assert update._raw_payload is json_dict
+        assert Update.de_json(json_dict, bot)._raw_payload is None
+
+        update_dict = update.to_dict()
+        assert update_dict == json_dict
+        assert update_dict == Update.de_json(json_dict, bot).to_dict()
+        # The returned dict must be a copy, so that changing it doesn't affect the update
+        assert update_dict is not json_dict
+        assert update_dict["message"] is not json_dict["message"]
+        assert update_dict["message"]["chat"] is not json_dict["message"]["chat"]
+
+        assert json.loads(update.to_json()) == json_dict
+        # recursive=False can't be served by the raw payload
+        assert update.to_dict(recursive=False)["message"] == message
+
+    def test_de_json_keep_raw_payload_lazy(self, bot_info):
+        raw_bot = make_bot(bot_info, keep_raw_payloads=True, lazy_updates=True)
+        json_dict = {"update_id": self.update_id, "message": message.to_dict()}
+        update = Update.de_json(json_dict, raw_bot)
+        assert update._raw_payload is json_dict
+
+        # Serializing doesn't need to parse the lazy attributes
+        assert update.to_dict() == json_dict
+        assert update._lazy_data is not None
+
+    def test_to_json_raw_payload_bytes(self, bot):
+        update = Update.de_json({"update_id": self.update_id}, bot)
+        update._set_raw_payload(b'{"update_id": 868573637, "unknown": "\u00e4"}')
+        assert update.to_json() == '{"update_id": 868573637, "unknown": "\\u00e4"}'
+        assert update.to_dict() == {"update_id": 868573637, "unknown": "ä"}
+
+        update._set_raw_payload(None)
+        assert update.to_dict() == {"update_id": self.update_id}
+
+    def test_raw_payload_pickle_and_deepcopy(self, bot_info):
+        raw_bot = make_bot(bot_info, keep_raw_payloads=True)
+        json_dict = {"update_id": self.update_id, "message": message.to_dict()}
+        update = Update.de_json(json_dict, raw_bot)
+        assert pickle.loads(pickle.dumps(update))._raw_payload == json_dict
+        assert deepcopy(update)._raw_payload == json_dict
+
     def test_update_de_json_empty(self, bot):
         update = Update.de_json(None, bot)
 
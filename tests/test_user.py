@@ -25,6 +25,7 @@ from tests.auxil.bot_method_checks import (
     check_shortcut_call,
     check_shortcut_signature,
 )
+from tests.auxil.pytest_classes import make_bot
 from tests.auxil.slots import mro_slots
 
 
@@ -105,6 +106,22 @@ class TestUserWithoutRequest(TestUserBase):
         assert user.added_to_attachment_menu == self.added_to_attachment_menu
         assert user.can_connect_to_business == self.can_connect_to_business
 
+    def test_de_json_interned(self, json_dict, bot, bot_info):
+        intern_bot = make_bot(bot_info, intern_objects=True)
+        user = User.de_json(json_dict, intern_bot)
+        assert User.de_json(dict(json_dict), intern_bot) is user
+        assert User.de_json(json_dict, bot) is not user
+        assert user.get_bot() is intern_bot
+
+        changed = User.de_json({**json_dict, "first_name": "changed"}, intern_bot)
+        assert changed is not user
+        assert changed.first_name == "changed"
+        assert User.de_json(json_dict, intern_bot) is user
+
+        assert intern_bot.intern_cache.hits == 2
+        assert intern_bot.intern_cache.misses == 2
+        assert User.de_json(None, intern_bot) is None
+
     def test_to_dict(self, user):
         user_dict = user.to_dict()
 